@@ -0,0 +1,98 @@
+# coding: utf-8
+"""Compares response deserialization paths on large responses.
+
+Without arguments, synthetic responses are generated from the model
+definitions: a DescribeInstances page of 100 instances and a ListBillDetail
+page of 1000 rows. A recorded response body can be used instead:
+
+    python benchmarks/bench_deserialize.py \\
+        --response recorded.json --type ListBillDetailResponse --service byteplussdkbilling
+
+Three paths are timed: the original recursive walk, compiled plans, and the
+raw dict mode (`configuration.raw_response = True`).
+"""
+import argparse
+import importlib
+import json
+import re
+import time
+
+from byteplussdkcore.interceptor import DeserializedResponseInterceptor
+
+_SAMPLES = {'str': 'sample', 'int': 7, 'long': 7, 'float': 1.5, 'bool': True, 'object': {'k': 'v'},
+            'date': '2024-01-01', 'datetime': '2024-01-01T00:00:00Z'}
+
+
+class RecordedResponse(object):
+    def __init__(self, data):
+        self.data = data
+
+
+def sample_data(type_str, models, list_size=2, depth=0):
+    """Builds JSON data shaped like `type_str` from the model definitions."""
+    if type_str in _SAMPLES:
+        return _SAMPLES[type_str]
+    m = re.match(r'list\[(.*)]', type_str)
+    if m:
+        return [sample_data(m.group(1), models, 2, depth + 1) for _ in range(list_size)]
+    m = re.match(r'dict\(([^,]*), (.*)\)', type_str)
+    if m:
+        return {'key': sample_data(m.group(2), models, 2, depth + 1)}
+    klass = getattr(models, type_str)
+    if depth > 6:
+        return {}
+    return {klass.attribute_map[attr]: sample_data(t, models, 2, depth + 1)
+            for attr, t in klass.swagger_types.items()}
+
+
+def synthetic_body(service, response_type, items_attr, items):
+    models = importlib.import_module(service + '.models')
+    result = sample_data(response_type, models)
+    klass = getattr(models, response_type)
+    result[klass.attribute_map[items_attr]] = sample_data(klass.swagger_types[items_attr], models, items)
+    return json.dumps({'ResponseMetadata': {'RequestId': 'r', 'Action': 'a', 'Version': 'v',
+                                            'Service': 's', 'Region': 'r'},
+                       'Result': result})
+
+
+def bench(label, body, response_type, service, seconds):
+    legacy = DeserializedResponseInterceptor(use_plans=False)
+    planned = DeserializedResponseInterceptor()
+    response = RecordedResponse(body)
+
+    expected = legacy.deserialize(response, response_type, service).to_dict()
+    assert planned.deserialize(response, response_type, service).to_dict() == expected
+
+    print("----- %s (%d KB) -----" % (label, len(body) // 1024))
+    for name, fn in [
+        ('recursive walk', lambda: legacy.deserialize(response, response_type, service)),
+        ('compiled plans', lambda: planned.deserialize(response, response_type, service)),
+        ('raw dicts', lambda: planned.deserialize(response, response_type, service, raw=True)),
+    ]:
+        count = 0
+        start = time.perf_counter()
+        while time.perf_counter() - start < seconds:
+            fn()
+            count += 1
+        elapsed = time.perf_counter() - start
+        print("%-16s %10.2f ms/response" % (name, elapsed * 1000 / count))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--seconds', type=float, default=2.0)
+    parser.add_argument('--response', help='recorded response body (JSON with ResponseMetadata and Result)')
+    parser.add_argument('--type', help='response model name, e.g. DescribeInstancesResponse')
+    parser.add_argument('--service', help='service package, e.g. byteplussdkecs')
+    args = parser.parse_args()
+
+    if args.response:
+        with open(args.response) as f:
+            bench(args.response, f.read(), args.type, args.service, args.seconds)
+    else:
+        bench('DescribeInstances, 100 instances',
+              synthetic_body('byteplussdkecs', 'DescribeInstancesResponse', 'instances', 100),
+              'DescribeInstancesResponse', 'byteplussdkecs', args.seconds)
+        bench('ListBillDetail, 1000 rows',
+              synthetic_body('byteplussdkbilling', 'ListBillDetailResponse', 'list', 1000),
+              'ListBillDetailResponse', 'byteplussdkbilling', args.seconds)
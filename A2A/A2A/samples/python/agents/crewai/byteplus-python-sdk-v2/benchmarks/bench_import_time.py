@@ -0,0 +1,71 @@
+# coding: utf-8
+"""Tracks cold-start import cost of the generated service packages.
+
+Every measurement runs in a fresh interpreter with ``python -X importtime``
+and reports the cumulative import time of the top level package. Pass
+``--max-ms`` to fail (exit code 1) when any statement exceeds the budget,
+which makes the script usable as a regression check in CI.
+
+Run from the SDK root:
+
+    python benchmarks/bench_import_time.py --repeat 5 --max-ms 150
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+
+STATEMENTS = [
+    ('import byteplussdkcore', 'byteplussdkcore'),
+    ('import byteplussdkecs', 'byteplussdkecs'),
+    ('import byteplussdkvpc', 'byteplussdkvpc'),
+    ('import byteplussdkbilling', 'byteplussdkbilling'),
+    ('from byteplussdkecs import ECSApi, DescribeInstancesRequest', 'byteplussdkecs'),
+    ('from byteplussdkvpc import VPCApi, DescribeVpcsRequest', 'byteplussdkvpc'),
+    ('from byteplussdkbilling import BILLINGApi, ListBillDetailRequest', 'byteplussdkbilling'),
+]
+
+_IMPORTTIME_LINE = re.compile(r'import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)')
+
+
+def measure(statement, package):
+    """Returns the cumulative import time in ms of ``package`` and the
+    total of all top level imports triggered by ``statement``."""
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [os.getcwd(), env.get('PYTHONPATH')]))
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', statement],
+                          stderr=subprocess.PIPE, stdout=subprocess.DEVNULL,
+                          env=env, universal_newlines=True, check=True)
+    package_us = 0
+    total_us = 0
+    for line in proc.stderr.splitlines():
+        m = _IMPORTTIME_LINE.match(line)
+        if not m:
+            continue
+        cumulative, indent, name = int(m.group(2)), len(m.group(3)), m.group(4)
+        if indent == 1:
+            total_us += cumulative
+        if name == package:
+            package_us = cumulative
+    return package_us / 1000.0, total_us / 1000.0
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--repeat', type=int, default=3, help='runs per statement, best is reported')
+    parser.add_argument('--max-ms', type=float, default=None, help='fail if a statement exceeds this')
+    args = parser.parse_args()
+
+    failed = False
+    print("%-64s %12s %12s" % ('statement', 'package ms', 'total ms'))
+    for statement, package in STATEMENTS:
+        runs = [measure(statement, package) for _ in range(args.repeat)]
+        package_ms, total_ms = min(runs, key=lambda r: r[1])
+        flag = ''
+        if args.max_ms is not None and total_ms > args.max_ms:
+            flag = '  <-- over budget'
+            failed = True
+        print("%-64s %12.1f %12.1f%s" % (statement, package_ms, total_ms, flag))
+
+    sys.exit(1 if failed else 0)
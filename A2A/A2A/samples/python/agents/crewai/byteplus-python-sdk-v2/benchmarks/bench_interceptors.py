@@ -0,0 +1,100 @@
+# coding: utf-8
+"""Reports where client-side time goes for small, frequent calls.
+
+Run from the SDK root:
+
+    python benchmarks/bench_interceptors.py --calls 20000
+
+DescribeInstances and DescribeVpcs are called through the generated api
+methods with the HTTP round trip replaced by a canned response, so only the
+SDK itself is measured. Each interceptor stage is recorded with a
+LatencyHistogram installed through InterceptorChain.set_stage_observer.
+"""
+import argparse
+import json
+import time
+
+from byteplussdkcore import ApiClient, Configuration
+from byteplussdkcore.endpoint import DefaultEndpointProvider
+from byteplussdkcore.interceptor import InterceptorContext, LatencyHistogram, Request
+from byteplussdkecs import DescribeInstancesRequest, ECSApi
+from byteplussdkvpc import DescribeVpcsRequest, VPCApi
+
+
+class CannedResponse(object):
+    def __init__(self, data):
+        self.data = data
+        self.status = 200
+
+    def getheaders(self):
+        return {'Content-Type': 'application/json'}
+
+
+class OfflineApiClient(ApiClient):
+    """Answers every call with the same body instead of going to the network."""
+
+    body = json.dumps({'ResponseMetadata': {'RequestId': 'r', 'Action': 'a', 'Version': 'v',
+                                            'Service': 's', 'Region': 'r'},
+                       'Result': {'Instances': [], 'Vpcs': [], 'TotalCount': 0}})
+
+    def request(self, method, url, query_params=None, headers=None, post_params=None, body=None,
+                _preload_content=True, _request_timeout=None):
+        return CannedResponse(self.body)
+
+
+def run_calls(calls, observer=None):
+    configuration = Configuration()
+    configuration.ak = 'AKLTexample'
+    configuration.sk = 'c2VjcmV0ZXhhbXBsZQ=='
+    configuration.region = 'ap-southeast-1'
+    api_client = OfflineApiClient(configuration)
+    api_client.interceptor_chain.set_stage_observer(observer)
+    ecs, vpc = ECSApi(api_client), VPCApi(api_client)
+
+    start = time.perf_counter()
+    for i in range(calls // 2):
+        ecs.describe_instances(DescribeInstancesRequest(instance_ids=['i-%d' % i], max_results=10))
+        vpc.describe_vpcs(DescribeVpcsRequest(vpc_ids=['vpc-%d' % i]))
+    return (time.perf_counter() - start) / (calls // 2 * 2)
+
+
+def time_per_call(fn, calls):
+    start = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - start) / calls
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--calls', type=int, default=20000)
+    args = parser.parse_args()
+
+    run_calls(1000)
+    plain = run_calls(args.calls)
+    histogram = LatencyHistogram()
+    observed = run_calls(args.calls, histogram)
+
+    print("----- per call, http round trip stubbed -----")
+    print("%-42s %10.1f us" % ('without observer', plain * 1e6))
+    print("%-42s %10.1f us" % ('with LatencyHistogram', observed * 1e6))
+    print()
+    print(histogram.summary())
+
+    configuration = Configuration()
+    provider = DefaultEndpointProvider()
+    args_ = ('/DescribeInstances/2020-04-01/ecs/get/text_plain/', 'GET', {}, [], {}, None)
+
+    def unmemoised():
+        provider.clear_cache()
+        return provider.endpoint_for('ecs', 'ap-southeast-1').url_for('https')
+
+    print()
+    print("----- pieces -----")
+    print("%-42s %10.2f us" % ('endpoint_for + url_for, memoised',
+                               time_per_call(lambda: provider.endpoint_for('ecs', 'ap-southeast-1').url_for('https'),
+                                             args.calls) * 1e6))
+    print("%-42s %10.2f us" % ('endpoint_for + url_for, resolved each call', time_per_call(unmemoised, args.calls) * 1e6))
+    print("%-42s %10.2f us" % ('Request + InterceptorContext allocation',
+                               time_per_call(lambda: InterceptorContext(request=Request(configuration, *args_)),
+                                             args.calls) * 1e6))
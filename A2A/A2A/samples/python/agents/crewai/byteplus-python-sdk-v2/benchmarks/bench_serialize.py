@@ -0,0 +1,87 @@
+# coding: utf-8
+"""Compares the two ways BuildRequestInterceptor flattens request models into
+query parameters.
+
+Run from the SDK root:
+
+    python benchmarks/bench_serialize.py --seconds 2
+
+"two pass" is sanitize_for_serialization followed by dict_to_params, "single
+pass" is model_to_params with its per-class attribute cache. Both are also
+timed through BuildRequestInterceptor.intercept, which includes sorting the
+parameters for the signer.
+"""
+import argparse
+import time
+
+from byteplussdkcore import Configuration
+from byteplussdkcore.interceptor import BuildRequestInterceptor, InterceptorContext, Request
+from byteplussdkcore.interceptor.interceptors.build_request_interceptor import (
+    dict_to_params, model_to_params, sanitize_for_serialization)
+from byteplussdkecs.models import (
+    DescribeInstancesRequest, NetworkInterfaceForRunInstancesInput, PlacementForRunInstancesInput,
+    RunInstancesRequest, TagFilterForDescribeInstancesInput, TagForRunInstancesInput,
+    VolumeForRunInstancesInput)
+
+
+def describe_instances_request():
+    return DescribeInstancesRequest(
+        instance_ids=['i-%016d' % i for i in range(100)],
+        instance_type_ids=['ecs.g3il.large', 'ecs.g3il.xlarge', 'ecs.c3il.2xlarge'],
+        tag_filters=[TagFilterForDescribeInstancesInput(key='team-%d' % i, values=['v%d' % j for j in range(10)])
+                     for i in range(20)],
+        max_results=100, vpc_id='vpc-example', zone_id='ap-southeast-1a')
+
+
+def run_instances_request():
+    return RunInstancesRequest(
+        image_id='image-example', instance_type='ecs.g3il.large', instance_name='bench', zone_id='ap-southeast-1a',
+        count=10, dry_run=True, password='Example-Passw0rd', description='x' * 200, user_data='e' * 4096,
+        placement=PlacementForRunInstancesInput(dedicated_host_id='dh-example', tenancy='Dedicated'),
+        network_interfaces=[NetworkInterfaceForRunInstancesInput(
+            subnet_id='subnet-%d' % i, security_group_ids=['sg-%d' % j for j in range(5)],
+            private_ip_addresses=['10.0.%d.%d' % (i, j) for j in range(4)]) for i in range(4)],
+        volumes=[VolumeForRunInstancesInput(size=40 + i, volume_type='ESSD_PL0', delete_with_instance='true')
+                 for i in range(16)],
+        tags=[TagForRunInstancesInput(key='key-%d' % i, value='value-%d' % i) for i in range(50)])
+
+
+def intercept(interceptor, model, configuration):
+    request = Request(configuration, '/DescribeInstances/2020-04-01/ecs/get/text_plain/', 'GET',
+                      path_params={}, query_params=[], header_params={'Content-Type': 'text/plain'},
+                      body=model, post_params=[], collection_formats={})
+    return interceptor.intercept(InterceptorContext(request=request)).request.query_params
+
+
+def bench(label, model, seconds):
+    configuration = Configuration()
+    two_pass = BuildRequestInterceptor(use_plans=False)
+    single_pass = BuildRequestInterceptor()
+
+    expected = dict_to_params(sanitize_for_serialization(model))
+    assert model_to_params(model) == expected
+    assert intercept(two_pass, model, configuration) == intercept(single_pass, model, configuration)
+
+    print("----- %s (%d params) -----" % (label, len(expected)))
+    for name, fn in [
+        ('two pass', lambda: dict_to_params(sanitize_for_serialization(model))),
+        ('single pass', lambda: model_to_params(model)),
+        ('intercept, two pass', lambda: intercept(two_pass, model, configuration)),
+        ('intercept, single pass', lambda: intercept(single_pass, model, configuration)),
+    ]:
+        count = 0
+        start = time.perf_counter()
+        while time.perf_counter() - start < seconds:
+            fn()
+            count += 1
+        elapsed = time.perf_counter() - start
+        print("%-24s %10.1f us/request" % (name, elapsed * 1e6 / count))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--seconds', type=float, default=2.0)
+    args = parser.parse_args()
+
+    bench('DescribeInstancesRequest', describe_instances_request(), args.seconds)
+    bench('RunInstancesRequest', run_instances_request(), args.seconds)
@@ -0,0 +1,50 @@
+# coding: utf-8
+"""Measures SignerV4 throughput in signatures per second.
+
+Run from the SDK root:
+
+    python benchmarks/bench_signer.py --seconds 3
+"""
+import argparse
+import json
+import time
+
+from byteplussdkcore.signv4 import SignerV4
+
+
+def _sign_once(method, body):
+    headers = {
+        'Host': 'open.ap-southeast-1.byteplusapi.com',
+        'Accept': 'application/json',
+        'Content-Type': 'text/plain' if method == 'GET' else 'application/json',
+    }
+    query = [('Action', 'DescribeInstances'), ('Version', '2020-04-01'), ('MaxResults', 100)]
+    query.extend(('InstanceIds.%d' % (i + 1), 'i-%016d' % i) for i in range(20))
+    SignerV4.sign('/', method, headers, body, None, query, 'AKLTexample', 'c2VjcmV0ZXhhbXBsZQ==',
+                  'ap-southeast-1', 'ecs', None)
+
+
+def run(label, method, body, seconds, cached):
+    count = 0
+    deadline = time.perf_counter() + seconds
+    start = time.perf_counter()
+    while time.perf_counter() < deadline:
+        if not cached:
+            SignerV4.signing_key_cache.clear()
+        _sign_once(method, body)
+        count += 1
+    elapsed = time.perf_counter() - start
+    print("%-32s %10.0f signatures/s" % (label, count / elapsed))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--seconds', type=float, default=2.0)
+    args = parser.parse_args()
+
+    large_body = json.dumps({'UserData': 'x' * (4 * 1024 * 1024)})
+
+    print("----- SignerV4 throughput -----")
+    run("GET, key derived per request", 'GET', '', args.seconds, cached=False)
+    run("GET, cached signing key", 'GET', '', args.seconds, cached=True)
+    run("POST 4MB body, cached key", 'POST', large_body, args.seconds, cached=True)
@@ -54,6 +54,21 @@ class ARKApi(object):
             (data) = self.create_batch_inference_job_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def create_batch_inference_job_async(self, body, **kwargs):  # noqa: E501
+        """create_batch_inference_job  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.create_batch_inference_job_async(body)
+
+        :param CreateBatchInferenceJobRequest body: (required)
+        :return: CreateBatchInferenceJobResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`create_batch_inference_job_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.create_batch_inference_job_with_http_info(body, **kwargs)  # noqa: E501
+
     def create_batch_inference_job_with_http_info(self, body, **kwargs):  # noqa: E501
         """create_batch_inference_job  # noqa: E501
 
@@ -151,6 +166,21 @@ class ARKApi(object):
             (data) = self.create_endpoint_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def create_endpoint_async(self, body, **kwargs):  # noqa: E501
+        """create_endpoint  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.create_endpoint_async(body)
+
+        :param CreateEndpointRequest body: (required)
+        :return: CreateEndpointResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`create_endpoint_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.create_endpoint_with_http_info(body, **kwargs)  # noqa: E501
+
     def create_endpoint_with_http_info(self, body, **kwargs):  # noqa: E501
         """create_endpoint  # noqa: E501
 
@@ -248,6 +278,21 @@ class ARKApi(object):
             (data) = self.create_evaluation_job_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def create_evaluation_job_async(self, body, **kwargs):  # noqa: E501
+        """create_evaluation_job  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.create_evaluation_job_async(body)
+
+        :param CreateEvaluationJobRequest body: (required)
+        :return: CreateEvaluationJobResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`create_evaluation_job_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.create_evaluation_job_with_http_info(body, **kwargs)  # noqa: E501
+
     def create_evaluation_job_with_http_info(self, body, **kwargs):  # noqa: E501
         """create_evaluation_job  # noqa: E501
 
@@ -345,6 +390,21 @@ class ARKApi(object):
             (data) = self.create_model_customization_job_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def create_model_customization_job_async(self, body, **kwargs):  # noqa: E501
+        """create_model_customization_job  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.create_model_customization_job_async(body)
+
+        :param CreateModelCustomizationJobRequest body: (required)
+        :return: CreateModelCustomizationJobResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`create_model_customization_job_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.create_model_customization_job_with_http_info(body, **kwargs)  # noqa: E501
+
     def create_model_customization_job_with_http_info(self, body, **kwargs):  # noqa: E501
         """create_model_customization_job  # noqa: E501
 
@@ -442,6 +502,21 @@ class ARKApi(object):
             (data) = self.delete_endpoint_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def delete_endpoint_async(self, body, **kwargs):  # noqa: E501
+        """delete_endpoint  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.delete_endpoint_async(body)
+
+        :param DeleteEndpointRequest body: (required)
+        :return: DeleteEndpointResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`delete_endpoint_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.delete_endpoint_with_http_info(body, **kwargs)  # noqa: E501
+
     def delete_endpoint_with_http_info(self, body, **kwargs):  # noqa: E501
         """delete_endpoint  # noqa: E501
 
@@ -539,6 +614,21 @@ class ARKApi(object):
             (data) = self.get_api_key_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def get_api_key_async(self, body, **kwargs):  # noqa: E501
+        """get_api_key  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.get_api_key_async(body)
+
+        :param GetApiKeyRequest body: (required)
+        :return: GetApiKeyResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`get_api_key_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.get_api_key_with_http_info(body, **kwargs)  # noqa: E501
+
     def get_api_key_with_http_info(self, body, **kwargs):  # noqa: E501
         """get_api_key  # noqa: E501
 
@@ -636,6 +726,21 @@ class ARKApi(object):
             (data) = self.get_endpoint_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def get_endpoint_async(self, body, **kwargs):  # noqa: E501
+        """get_endpoint  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.get_endpoint_async(body)
+
+        :param GetEndpointRequest body: (required)
+        :return: GetEndpointResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`get_endpoint_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.get_endpoint_with_http_info(body, **kwargs)  # noqa: E501
+
     def get_endpoint_with_http_info(self, body, **kwargs):  # noqa: E501
         """get_endpoint  # noqa: E501
 
@@ -733,6 +838,21 @@ class ARKApi(object):
             (data) = self.get_endpoint_certificate_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def get_endpoint_certificate_async(self, body, **kwargs):  # noqa: E501
+        """get_endpoint_certificate  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.get_endpoint_certificate_async(body)
+
+        :param GetEndpointCertificateRequest body: (required)
+        :return: GetEndpointCertificateResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`get_endpoint_certificate_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.get_endpoint_certificate_with_http_info(body, **kwargs)  # noqa: E501
+
     def get_endpoint_certificate_with_http_info(self, body, **kwargs):  # noqa: E501
         """get_endpoint_certificate  # noqa: E501
 
@@ -830,6 +950,21 @@ class ARKApi(object):
             (data) = self.get_model_customization_job_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def get_model_customization_job_async(self, body, **kwargs):  # noqa: E501
+        """get_model_customization_job  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.get_model_customization_job_async(body)
+
+        :param GetModelCustomizationJobRequest body: (required)
+        :return: GetModelCustomizationJobResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`get_model_customization_job_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.get_model_customization_job_with_http_info(body, **kwargs)  # noqa: E501
+
     def get_model_customization_job_with_http_info(self, body, **kwargs):  # noqa: E501
         """get_model_customization_job  # noqa: E501
 
@@ -927,6 +1062,21 @@ class ARKApi(object):
             (data) = self.list_batch_inference_jobs_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def list_batch_inference_jobs_async(self, body, **kwargs):  # noqa: E501
+        """list_batch_inference_jobs  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.list_batch_inference_jobs_async(body)
+
+        :param ListBatchInferenceJobsRequest body: (required)
+        :return: ListBatchInferenceJobsResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`list_batch_inference_jobs_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.list_batch_inference_jobs_with_http_info(body, **kwargs)  # noqa: E501
+
     def list_batch_inference_jobs_with_http_info(self, body, **kwargs):  # noqa: E501
         """list_batch_inference_jobs  # noqa: E501
 
@@ -1024,6 +1174,21 @@ class ARKApi(object):
             (data) = self.list_model_customization_jobs_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def list_model_customization_jobs_async(self, body, **kwargs):  # noqa: E501
+        """list_model_customization_jobs  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.list_model_customization_jobs_async(body)
+
+        :param ListModelCustomizationJobsRequest body: (required)
+        :return: ListModelCustomizationJobsResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`list_model_customization_jobs_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.list_model_customization_jobs_with_http_info(body, **kwargs)  # noqa: E501
+
     def list_model_customization_jobs_with_http_info(self, body, **kwargs):  # noqa: E501
         """list_model_customization_jobs  # noqa: E501
 
@@ -15,50 +15,59 @@
 
 from __future__ import absolute_import
 
-# import apis into sdk package
-from byteplussdkbilling.api.billing_api import BILLINGApi
+from byteplussdkcore.lazy import LazyImporter
 
-# import models into sdk package
-from byteplussdkbilling.models.auth_for_list_invitation_output import AuthForListInvitationOutput
-from byteplussdkbilling.models.auth_info_for_list_financial_relation_output import AuthInfoForListFinancialRelationOutput
-from byteplussdkbilling.models.auth_info_for_list_invitation_output import AuthInfoForListInvitationOutput
-from byteplussdkbilling.models.base_for_list_bill_detail_input import BaseForListBillDetailInput
-from byteplussdkbilling.models.base_for_list_bill_overview_by_category_input import BaseForListBillOverviewByCategoryInput
-from byteplussdkbilling.models.base_for_list_bill_overview_by_prod_input import BaseForListBillOverviewByProdInput
-from byteplussdkbilling.models.cancel_invitation_request import CancelInvitationRequest
-from byteplussdkbilling.models.cancel_invitation_response import CancelInvitationResponse
-from byteplussdkbilling.models.convert_list_for_list_bill_overview_by_category_output import ConvertListForListBillOverviewByCategoryOutput
-from byteplussdkbilling.models.create_financial_relation_request import CreateFinancialRelationRequest
-from byteplussdkbilling.models.create_financial_relation_response import CreateFinancialRelationResponse
-from byteplussdkbilling.models.delete_financial_relation_request import DeleteFinancialRelationRequest
-from byteplussdkbilling.models.delete_financial_relation_response import DeleteFinancialRelationResponse
-from byteplussdkbilling.models.handle_invitation_request import HandleInvitationRequest
-from byteplussdkbilling.models.handle_invitation_response import HandleInvitationResponse
-from byteplussdkbilling.models.instance_list_for_list_available_instances_output import InstanceListForListAvailableInstancesOutput
-from byteplussdkbilling.models.list_available_instances_request import ListAvailableInstancesRequest
-from byteplussdkbilling.models.list_available_instances_response import ListAvailableInstancesResponse
-from byteplussdkbilling.models.list_bill_detail_request import ListBillDetailRequest
-from byteplussdkbilling.models.list_bill_detail_response import ListBillDetailResponse
-from byteplussdkbilling.models.list_bill_overview_by_category_request import ListBillOverviewByCategoryRequest
-from byteplussdkbilling.models.list_bill_overview_by_category_response import ListBillOverviewByCategoryResponse
-from byteplussdkbilling.models.list_bill_overview_by_prod_request import ListBillOverviewByProdRequest
-from byteplussdkbilling.models.list_bill_overview_by_prod_response import ListBillOverviewByProdResponse
-from byteplussdkbilling.models.list_financial_relation_request import ListFinancialRelationRequest
-from byteplussdkbilling.models.list_financial_relation_response import ListFinancialRelationResponse
-from byteplussdkbilling.models.list_for_list_bill_detail_output import ListForListBillDetailOutput
-from byteplussdkbilling.models.list_for_list_bill_overview_by_category_output import ListForListBillOverviewByCategoryOutput
-from byteplussdkbilling.models.list_for_list_bill_overview_by_prod_output import ListForListBillOverviewByProdOutput
-from byteplussdkbilling.models.list_for_list_financial_relation_output import ListForListFinancialRelationOutput
-from byteplussdkbilling.models.list_for_list_invitation_output import ListForListInvitationOutput
-from byteplussdkbilling.models.list_for_list_split_bill_detail_output import ListForListSplitBillDetailOutput
-from byteplussdkbilling.models.list_invitation_request import ListInvitationRequest
-from byteplussdkbilling.models.list_invitation_response import ListInvitationResponse
-from byteplussdkbilling.models.list_split_bill_detail_request import ListSplitBillDetailRequest
-from byteplussdkbilling.models.list_split_bill_detail_response import ListSplitBillDetailResponse
-from byteplussdkbilling.models.relation_for_list_invitation_output import RelationForListInvitationOutput
-from byteplussdkbilling.models.success_instance_info_for_unsubscribe_instance_output import SuccessInstanceInfoForUnsubscribeInstanceOutput
-from byteplussdkbilling.models.traffic_env_for_list_bill_detail_input import TrafficEnvForListBillDetailInput
-from byteplussdkbilling.models.traffic_env_for_list_bill_overview_by_category_input import TrafficEnvForListBillOverviewByCategoryInput
-from byteplussdkbilling.models.traffic_env_for_list_bill_overview_by_prod_input import TrafficEnvForListBillOverviewByProdInput
-from byteplussdkbilling.models.unsubscribe_instance_request import UnsubscribeInstanceRequest
-from byteplussdkbilling.models.unsubscribe_instance_response import UnsubscribeInstanceResponse
+# generated modules are imported on first attribute access, see LazyImporter
+_importer = LazyImporter(__name__, {
+    # import apis into sdk package
+    'BILLINGApi': 'byteplussdkbilling.api.billing_api',
+    # import models into sdk package
+    'AuthForListInvitationOutput': 'byteplussdkbilling.models.auth_for_list_invitation_output',
+    'AuthInfoForListFinancialRelationOutput': 'byteplussdkbilling.models.auth_info_for_list_financial_relation_output',
+    'AuthInfoForListInvitationOutput': 'byteplussdkbilling.models.auth_info_for_list_invitation_output',
+    'BaseForListBillDetailInput': 'byteplussdkbilling.models.base_for_list_bill_detail_input',
+    'BaseForListBillOverviewByCategoryInput': 'byteplussdkbilling.models.base_for_list_bill_overview_by_category_input',
+    'BaseForListBillOverviewByProdInput': 'byteplussdkbilling.models.base_for_list_bill_overview_by_prod_input',
+    'CancelInvitationRequest': 'byteplussdkbilling.models.cancel_invitation_request',
+    'CancelInvitationResponse': 'byteplussdkbilling.models.cancel_invitation_response',
+    'ConvertListForListBillOverviewByCategoryOutput': 'byteplussdkbilling.models.convert_list_for_list_bill_overview_by_category_output',
+    'CreateFinancialRelationRequest': 'byteplussdkbilling.models.create_financial_relation_request',
+    'CreateFinancialRelationResponse': 'byteplussdkbilling.models.create_financial_relation_response',
+    'DeleteFinancialRelationRequest': 'byteplussdkbilling.models.delete_financial_relation_request',
+    'DeleteFinancialRelationResponse': 'byteplussdkbilling.models.delete_financial_relation_response',
+    'HandleInvitationRequest': 'byteplussdkbilling.models.handle_invitation_request',
+    'HandleInvitationResponse': 'byteplussdkbilling.models.handle_invitation_response',
+    'InstanceListForListAvailableInstancesOutput': 'byteplussdkbilling.models.instance_list_for_list_available_instances_output',
+    'ListAvailableInstancesRequest': 'byteplussdkbilling.models.list_available_instances_request',
+    'ListAvailableInstancesResponse': 'byteplussdkbilling.models.list_available_instances_response',
+    'ListBillDetailRequest': 'byteplussdkbilling.models.list_bill_detail_request',
+    'ListBillDetailResponse': 'byteplussdkbilling.models.list_bill_detail_response',
+    'ListBillOverviewByCategoryRequest': 'byteplussdkbilling.models.list_bill_overview_by_category_request',
+    'ListBillOverviewByCategoryResponse': 'byteplussdkbilling.models.list_bill_overview_by_category_response',
+    'ListBillOverviewByProdRequest': 'byteplussdkbilling.models.list_bill_overview_by_prod_request',
+    'ListBillOverviewByProdResponse': 'byteplussdkbilling.models.list_bill_overview_by_prod_response',
+    'ListFinancialRelationRequest': 'byteplussdkbilling.models.list_financial_relation_request',
+    'ListFinancialRelationResponse': 'byteplussdkbilling.models.list_financial_relation_response',
+    'ListForListBillDetailOutput': 'byteplussdkbilling.models.list_for_list_bill_detail_output',
+    'ListForListBillOverviewByCategoryOutput': 'byteplussdkbilling.models.list_for_list_bill_overview_by_category_output',
+    'ListForListBillOverviewByProdOutput': 'byteplussdkbilling.models.list_for_list_bill_overview_by_prod_output',
+    'ListForListFinancialRelationOutput': 'byteplussdkbilling.models.list_for_list_financial_relation_output',
+    'ListForListInvitationOutput': 'byteplussdkbilling.models.list_for_list_invitation_output',
+    'ListForListSplitBillDetailOutput': 'byteplussdkbilling.models.list_for_list_split_bill_detail_output',
+    'ListInvitationRequest': 'byteplussdkbilling.models.list_invitation_request',
+    'ListInvitationResponse': 'byteplussdkbilling.models.list_invitation_response',
+    'ListSplitBillDetailRequest': 'byteplussdkbilling.models.list_split_bill_detail_request',
+    'ListSplitBillDetailResponse': 'byteplussdkbilling.models.list_split_bill_detail_response',
+    'RelationForListInvitationOutput': 'byteplussdkbilling.models.relation_for_list_invitation_output',
+    'SuccessInstanceInfoForUnsubscribeInstanceOutput': 'byteplussdkbilling.models.success_instance_info_for_unsubscribe_instance_output',
+    'TrafficEnvForListBillDetailInput': 'byteplussdkbilling.models.traffic_env_for_list_bill_detail_input',
+    'TrafficEnvForListBillOverviewByCategoryInput': 'byteplussdkbilling.models.traffic_env_for_list_bill_overview_by_category_input',
+    'TrafficEnvForListBillOverviewByProdInput': 'byteplussdkbilling.models.traffic_env_for_list_bill_overview_by_prod_input',
+    'UnsubscribeInstanceRequest': 'byteplussdkbilling.models.unsubscribe_instance_request',
+    'UnsubscribeInstanceResponse': 'byteplussdkbilling.models.unsubscribe_instance_response',
+})
+
+__all__ = _importer.names
+__getattr__ = _importer.getattr
+__dir__ = _importer.dir
+_importer.load_all_if_unsupported()
@@ -54,6 +54,21 @@ class BILLINGApi(object):
             (data) = self.cancel_invitation_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def cancel_invitation_async(self, body, **kwargs):  # noqa: E501
+        """cancel_invitation  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.cancel_invitation_async(body)
+
+        :param CancelInvitationRequest body: (required)
+        :return: CancelInvitationResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`cancel_invitation_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.cancel_invitation_with_http_info(body, **kwargs)  # noqa: E501
+
     def cancel_invitation_with_http_info(self, body, **kwargs):  # noqa: E501
         """cancel_invitation  # noqa: E501
 
@@ -151,6 +166,21 @@ class BILLINGApi(object):
             (data) = self.create_financial_relation_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def create_financial_relation_async(self, body, **kwargs):  # noqa: E501
+        """create_financial_relation  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.create_financial_relation_async(body)
+
+        :param CreateFinancialRelationRequest body: (required)
+        :return: CreateFinancialRelationResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`create_financial_relation_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.create_financial_relation_with_http_info(body, **kwargs)  # noqa: E501
+
     def create_financial_relation_with_http_info(self, body, **kwargs):  # noqa: E501
         """create_financial_relation  # noqa: E501
 
@@ -248,6 +278,21 @@ class BILLINGApi(object):
             (data) = self.delete_financial_relation_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def delete_financial_relation_async(self, body, **kwargs):  # noqa: E501
+        """delete_financial_relation  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.delete_financial_relation_async(body)
+
+        :param DeleteFinancialRelationRequest body: (required)
+        :return: DeleteFinancialRelationResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`delete_financial_relation_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.delete_financial_relation_with_http_info(body, **kwargs)  # noqa: E501
+
     def delete_financial_relation_with_http_info(self, body, **kwargs):  # noqa: E501
         """delete_financial_relation  # noqa: E501
 
@@ -345,6 +390,21 @@ class BILLINGApi(object):
             (data) = self.handle_invitation_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def handle_invitation_async(self, body, **kwargs):  # noqa: E501
+        """handle_invitation  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.handle_invitation_async(body)
+
+        :param HandleInvitationRequest body: (required)
+        :return: HandleInvitationResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`handle_invitation_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.handle_invitation_with_http_info(body, **kwargs)  # noqa: E501
+
     def handle_invitation_with_http_info(self, body, **kwargs):  # noqa: E501
         """handle_invitation  # noqa: E501
 
@@ -442,6 +502,21 @@ class BILLINGApi(object):
             (data) = self.list_available_instances_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def list_available_instances_async(self, body, **kwargs):  # noqa: E501
+        """list_available_instances  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.list_available_instances_async(body)
+
+        :param ListAvailableInstancesRequest body: (required)
+        :return: ListAvailableInstancesResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`list_available_instances_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.list_available_instances_with_http_info(body, **kwargs)  # noqa: E501
+
     def list_available_instances_with_http_info(self, body, **kwargs):  # noqa: E501
         """list_available_instances  # noqa: E501
 
@@ -539,6 +614,21 @@ class BILLINGApi(object):
             (data) = self.list_bill_detail_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def list_bill_detail_async(self, body, **kwargs):  # noqa: E501
+        """list_bill_detail  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.list_bill_detail_async(body)
+
+        :param ListBillDetailRequest body: (required)
+        :return: ListBillDetailResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`list_bill_detail_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.list_bill_detail_with_http_info(body, **kwargs)  # noqa: E501
+
     def list_bill_detail_with_http_info(self, body, **kwargs):  # noqa: E501
         """list_bill_detail  # noqa: E501
 
@@ -636,6 +726,21 @@ class BILLINGApi(object):
             (data) = self.list_bill_overview_by_category_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def list_bill_overview_by_category_async(self, body, **kwargs):  # noqa: E501
+        """list_bill_overview_by_category  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.list_bill_overview_by_category_async(body)
+
+        :param ListBillOverviewByCategoryRequest body: (required)
+        :return: ListBillOverviewByCategoryResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`list_bill_overview_by_category_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.list_bill_overview_by_category_with_http_info(body, **kwargs)  # noqa: E501
+
     def list_bill_overview_by_category_with_http_info(self, body, **kwargs):  # noqa: E501
         """list_bill_overview_by_category  # noqa: E501
 
@@ -733,6 +838,21 @@ class BILLINGApi(object):
             (data) = self.list_bill_overview_by_prod_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def list_bill_overview_by_prod_async(self, body, **kwargs):  # noqa: E501
+        """list_bill_overview_by_prod  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.list_bill_overview_by_prod_async(body)
+
+        :param ListBillOverviewByProdRequest body: (required)
+        :return: ListBillOverviewByProdResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`list_bill_overview_by_prod_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.list_bill_overview_by_prod_with_http_info(body, **kwargs)  # noqa: E501
+
     def list_bill_overview_by_prod_with_http_info(self, body, **kwargs):  # noqa: E501
         """list_bill_overview_by_prod  # noqa: E501
 
@@ -830,6 +950,21 @@ class BILLINGApi(object):
             (data) = self.list_financial_relation_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def list_financial_relation_async(self, body, **kwargs):  # noqa: E501
+        """list_financial_relation  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.list_financial_relation_async(body)
+
+        :param ListFinancialRelationRequest body: (required)
+        :return: ListFinancialRelationResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`list_financial_relation_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.list_financial_relation_with_http_info(body, **kwargs)  # noqa: E501
+
     def list_financial_relation_with_http_info(self, body, **kwargs):  # noqa: E501
         """list_financial_relation  # noqa: E501
 
@@ -927,6 +1062,21 @@ class BILLINGApi(object):
             (data) = self.list_invitation_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def list_invitation_async(self, body, **kwargs):  # noqa: E501
+        """list_invitation  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.list_invitation_async(body)
+
+        :param ListInvitationRequest body: (required)
+        :return: ListInvitationResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`list_invitation_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.list_invitation_with_http_info(body, **kwargs)  # noqa: E501
+
     def list_invitation_with_http_info(self, body, **kwargs):  # noqa: E501
         """list_invitation  # noqa: E501
 
@@ -1024,6 +1174,21 @@ class BILLINGApi(object):
             (data) = self.list_split_bill_detail_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def list_split_bill_detail_async(self, body, **kwargs):  # noqa: E501
+        """list_split_bill_detail  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.list_split_bill_detail_async(body)
+
+        :param ListSplitBillDetailRequest body: (required)
+        :return: ListSplitBillDetailResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`list_split_bill_detail_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.list_split_bill_detail_with_http_info(body, **kwargs)  # noqa: E501
+
     def list_split_bill_detail_with_http_info(self, body, **kwargs):  # noqa: E501
         """list_split_bill_detail  # noqa: E501
 
@@ -1121,6 +1286,21 @@ class BILLINGApi(object):
             (data) = self.unsubscribe_instance_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def unsubscribe_instance_async(self, body, **kwargs):  # noqa: E501
+        """unsubscribe_instance  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.unsubscribe_instance_async(body)
+
+        :param UnsubscribeInstanceRequest body: (required)
+        :return: UnsubscribeInstanceResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`unsubscribe_instance_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.unsubscribe_instance_with_http_info(body, **kwargs)  # noqa: E501
+
     def unsubscribe_instance_with_http_info(self, body, **kwargs):  # noqa: E501
         """unsubscribe_instance  # noqa: E501
 
@@ -0,0 +1,391 @@
+# coding: utf-8
+
+"""Bulk export of billing line items to Parquet or CSV files.
+
+    >>> api = BILLINGApi(ApiClient(configuration))
+    >>> request = ListBillDetailRequest(bill_period='2024-05', limit=300, group_period=1,
+    ...                                 group_term=0, ignore_zero=0, need_record_num=1, offset=0)
+    >>> BillExporter(api.list_bill_detail, request, 'exports/2024-05').run()
+
+Pages are fetched concurrently through byteplussdkcore.Paginator under a
+request rate limit and written in order into part files of at most
+`rows_per_file` rows. A checkpoint is saved at least every
+`checkpoint_rows` rows and whenever a part file is complete, so an
+interrupted export resumes from the last checkpoint instead of starting
+over. Rows are deduplicated on their primary key, rows without one on
+their whole content.
+
+tests/mock_billing_server.py serves ListBillDetail locally, pass
+`--host 127.0.0.1:<port> --scheme http` to export from it.
+"""
+
+import argparse
+import copy
+import csv
+import hashlib
+import json
+import os
+import threading
+import time
+
+import six
+
+from byteplussdkcore import ApiClient, Configuration, Paginator
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+PARQUET = 'parquet'
+CSV = 'csv'
+
+# primary key columns per request model
+DEFAULT_KEY_FIELDS = {
+    'ListBillDetailRequest': ('BillDetailId',),
+    'ListSplitBillDetailRequest': ('SplitBillDetailId',),
+    'ListBillOverviewByProdRequest': ('BillPeriod', 'OwnerID', 'PayerID', 'Product', 'BillingMode',
+                                      'BillCategoryParent', 'BusinessMode', 'SubjectName'),
+}
+
+CHECKPOINT_FILE = '_checkpoint.json'
+
+
+class RateLimiter(object):
+    """Thread-safe token bucket allowing `rate` acquisitions per second."""
+
+    def __init__(self, rate, burst=1):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.burst = float(burst)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class ExportResult(object):
+    def __init__(self, rows_written, duplicates, files, resumed_from):
+        self.rows_written = rows_written
+        self.duplicates = duplicates
+        self.files = files
+        self.resumed_from = resumed_from
+
+    def __repr__(self):
+        return ('ExportResult(rows_written=%d, duplicates=%d, files=%d, resumed_from=%d)'
+                % (self.rows_written, self.duplicates, len(self.files), self.resumed_from))
+
+
+class _CsvPart(object):
+    # CSV parts can be continued after a checkpoint, Parquet parts cannot
+    resumable = True
+
+    def __init__(self, path, columns, append=False):
+        self.path = path
+        self.columns = columns
+        self._file = open(path, 'a' if append else 'w', newline='', encoding='utf-8')
+        self._writer = csv.writer(self._file)
+        if not append:
+            self._writer.writerow(columns)
+
+    def write(self, rows):
+        self._writer.writerows([['' if row.get(c) is None else row.get(c) for c in self.columns]
+                                for row in rows])
+
+    def flush(self):
+        """Flushes the rows written so far and returns the file size."""
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        return os.path.getsize(self.path)
+
+    def close(self):
+        self._file.close()
+
+
+class _ParquetPart(object):
+    resumable = False
+    _ARROW_TYPES = {'str': 'string', 'int': 'int64', 'long': 'int64', 'float': 'float64', 'bool': 'bool_'}
+
+    def __init__(self, path, columns, column_types, row_group_size):
+        self.columns = columns
+        self.schema = pyarrow.schema([(c, getattr(pyarrow, self._ARROW_TYPES.get(column_types[c], 'string'))())
+                                      for c in columns])
+        self.row_group_size = row_group_size
+        self._writer = pyarrow.parquet.ParquetWriter(path, self.schema)
+        self._pending = []
+
+    def write(self, rows):
+        self._pending.extend(rows)
+        if len(self._pending) >= self.row_group_size:
+            self._flush()
+
+    def _flush(self):
+        if self._pending:
+            self._writer.write_table(pyarrow.Table.from_pylist(self._pending, schema=self.schema))
+            self._pending = []
+
+    def close(self):
+        self._flush()
+        self._writer.close()
+
+
+class BillExporter(object):
+    """Exports every row of a billing list API into `output_dir`.
+
+    :param operation: BILLINGApi.list_bill_detail, list_split_bill_detail or
+        list_bill_overview_by_prod (any Offset/Limit list api works).
+    :param request: the request model; `offset` is where a fresh export starts.
+    :param output_dir: directory receiving part files and the checkpoint.
+    :param output_format: PARQUET or CSV. Defaults to Parquet when pyarrow is
+        installed, CSV otherwise.
+    :param key_fields: JSON keys forming the primary key used for dedup.
+    :param max_workers: pages fetched at the same time.
+    :param rate_limit: maximum requests per second.
+    :param rows_per_file: rows per part file.
+    :param checkpoint_rows: rows written between checkpoints, at most this
+        many rows (plus one page) are fetched again after a crash. A CSV part
+        is continued after a checkpoint; Parquet files cannot be appended to,
+        so a checkpoint also closes the Parquet part.
+    :param row_group_size: rows buffered per Parquet row group.
+    """
+
+    def __init__(self, operation, request, output_dir, output_format=None, key_fields=None,
+                 max_workers=4, rate_limit=5.0, rows_per_file=100000, checkpoint_rows=10000,
+                 row_group_size=10000):
+        if output_format is None:
+            output_format = PARQUET if pyarrow is not None else CSV
+        if output_format == PARQUET and pyarrow is None:
+            raise ImportError('Parquet export requires pyarrow, install it or use output_format="csv"')
+        if output_format not in (PARQUET, CSV):
+            raise ValueError('output_format must be "parquet" or "csv"')
+        if key_fields is None:
+            key_fields = DEFAULT_KEY_FIELDS.get(type(request).__name__)
+        if not key_fields:
+            raise ValueError('key_fields is required for %s' % type(request).__name__)
+
+        self.operation = operation
+        self.request = request
+        self.output_dir = output_dir
+        self.output_format = output_format
+        self.key_fields = tuple(key_fields)
+        self.max_workers = max_workers
+        self.rate_limiter = RateLimiter(rate_limit, burst=max_workers)
+        self.rows_per_file = rows_per_file
+        self.checkpoint_rows = checkpoint_rows
+        self.row_group_size = row_group_size
+        self.checkpoint_path = os.path.join(output_dir, CHECKPOINT_FILE)
+
+    def run(self):
+        """Runs or resumes the export and returns an ExportResult."""
+        if not os.path.isdir(self.output_dir):
+            os.makedirs(self.output_dir)
+        checkpoint = self._load_checkpoint()
+        files = list(checkpoint['files'])
+        rows_written = checkpoint['rows']
+        duplicates = checkpoint['duplicates']
+        resumed_from = checkpoint['offset']
+        if checkpoint['complete']:
+            return ExportResult(rows_written, duplicates, files, resumed_from)
+
+        # a CSV part left open at the last checkpoint, continued from its checkpointed size
+        open_part = checkpoint.get('part')
+        self._remove_unfinished_parts(files + ([open_part['name']] if open_part else []))
+        if open_part:
+            with open(os.path.join(self.output_dir, open_part['name']), 'r+b') as f:
+                f.truncate(open_part['size'])
+        seen = self._load_seen_keys(files + ([open_part['name']] if open_part else []))
+
+        request = self._copy_request(resumed_from)
+        paginator = Paginator(self._limited_operation, request, max_workers=self.max_workers)
+
+        offset = resumed_from
+        part, part_rows, columns = None, 0, None
+        since_checkpoint = 0
+        for page in paginator.pages():
+            items = paginator.page_items(page)
+            # pages arrive in order, each one covers `limit` offsets
+            offset += self.request.limit or len(items)
+            rows = []
+            for item in items:
+                if columns is None:
+                    columns, column_types = self._columns(item)
+                row = {json_key: getattr(item, attr) for attr, json_key in six.iteritems(item.attribute_map)}
+                key = self._key(row)
+                if key in seen:
+                    duplicates += 1
+                    continue
+                seen.add(key)
+                rows.append(row)
+            if not rows:
+                continue
+
+            if part is None and open_part:
+                name, part_rows = open_part['name'], open_part['rows']
+                part = _CsvPart(os.path.join(self.output_dir, name), columns, append=True)
+                open_part = None
+            elif part is None:
+                name = 'part-%05d.%s' % (len(files), self.output_format)
+                part = self._open_part(os.path.join(self.output_dir, name), columns, column_types)
+            part.write(rows)
+            part_rows += len(rows)
+            rows_written += len(rows)
+            since_checkpoint += len(rows)
+
+            if part_rows >= self.rows_per_file or (since_checkpoint >= self.checkpoint_rows and not part.resumable):
+                part.close()
+                files.append(name)
+                part, part_rows, since_checkpoint = None, 0, 0
+                self._save_checkpoint(offset, files, rows_written, duplicates, complete=False)
+            elif since_checkpoint >= self.checkpoint_rows:
+                since_checkpoint = 0
+                self._save_checkpoint(offset, files, rows_written, duplicates, complete=False,
+                                      part={'name': name, 'rows': part_rows, 'size': part.flush()})
+
+        if part is not None:
+            part.close()
+            files.append(name)
+        elif open_part:
+            # nothing was added after the checkpoint
+            files.append(open_part['name'])
+        self._save_checkpoint(offset, files, rows_written, duplicates, complete=True)
+        return ExportResult(rows_written, duplicates, files, resumed_from)
+
+    def _key(self, row):
+        """Primary key of a row as written, so live rows and rows read back from CSV or Parquet compare equal.
+
+        Rows whose key fields are all empty are keyed by a hash of the whole
+        row, so they are only dropped when the same row is served twice.
+        """
+        key = tuple(_key_value(row.get(k)) for k in self.key_fields)
+        if any(value is not None for value in key):
+            return key
+        content = json.dumps(sorted((k, _key_value(v)) for k, v in six.iteritems(row)))
+        return (None, hashlib.sha256(content.encode('utf-8')).hexdigest())
+
+    def _limited_operation(self, request, **kwargs):
+        self.rate_limiter.acquire()
+        return self.operation(request, **kwargs)
+
+    def _copy_request(self, offset):
+        request = copy.copy(self.request)
+        request.offset = offset
+        return request
+
+    def _columns(self, item):
+        columns = [item.attribute_map[attr] for attr in sorted(item.swagger_types)]
+        types = {item.attribute_map[attr]: t for attr, t in six.iteritems(item.swagger_types)}
+        return columns, types
+
+    def _open_part(self, path, columns, column_types):
+        if self.output_format == PARQUET:
+            return _ParquetPart(path, columns, column_types, self.row_group_size)
+        return _CsvPart(path, columns)
+
+    def _fingerprint(self):
+        return {'request': type(self.request).__name__,
+                'body': {self.request.attribute_map[attr]: getattr(self.request, attr)
+                         for attr in self.request.swagger_types
+                         if attr != 'offset' and _json_safe(getattr(self.request, attr))},
+                'format': self.output_format}
+
+    def _load_checkpoint(self):
+        empty = {'offset': self.request.offset or 0, 'files': [], 'rows': 0, 'duplicates': 0, 'complete': False}
+        if not os.path.exists(self.checkpoint_path):
+            return empty
+        with open(self.checkpoint_path) as f:
+            checkpoint = json.load(f)
+        if checkpoint.get('fingerprint') != self._fingerprint():
+            raise ValueError('%s belongs to a different export, use another output_dir' % self.checkpoint_path)
+        return checkpoint
+
+    def _save_checkpoint(self, offset, files, rows, duplicates, complete, part=None):
+        checkpoint = {'fingerprint': self._fingerprint(), 'offset': offset, 'files': files,
+                      'rows': rows, 'duplicates': duplicates, 'complete': complete}
+        if part is not None:
+            checkpoint['part'] = part
+        tmp = self.checkpoint_path + '.tmp'
+        with open(tmp, 'w') as f:
+            json.dump(checkpoint, f)
+        os.replace(tmp, self.checkpoint_path)
+
+    def _remove_unfinished_parts(self, files):
+        for name in os.listdir(self.output_dir):
+            if name.startswith('part-') and name not in files:
+                os.remove(os.path.join(self.output_dir, name))
+
+    def _load_seen_keys(self, files):
+        seen = set()
+        for name in files:
+            path = os.path.join(self.output_dir, name)
+            if name.endswith('.parquet'):
+                rows = pyarrow.parquet.read_table(path, columns=list(self.key_fields)).to_pylist()
+                if any(all(_key_value(v) is None for v in row.values()) for row in rows):
+                    # rows without a key are keyed by their whole content
+                    rows = pyarrow.parquet.read_table(path).to_pylist()
+                seen.update(self._key(row) for row in rows)
+            else:
+                with open(path, newline='', encoding='utf-8') as f:
+                    for row in csv.DictReader(f):
+                        seen.add(self._key(row))
+        return seen
+
+
+def _key_value(value):
+    # CSV turns every value into a string and None into ''
+    if value is None or value == '':
+        return None
+    return six.text_type(value)
+
+
+def _json_safe(value):
+    try:
+        json.dumps(value)
+        return True
+    except (TypeError, ValueError):
+        return False
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Export billing line items to Parquet or CSV.')
+    parser.add_argument('--bill-period', required=True, help='e.g. 2024-05')
+    parser.add_argument('--output', required=True, help='output directory')
+    parser.add_argument('--format', choices=[PARQUET, CSV], default=None)
+    parser.add_argument('--page-size', type=int, default=300)
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--rate', type=float, default=5.0, help='requests per second')
+    parser.add_argument('--host', default=None, help='override the endpoint, e.g. a local fake server')
+    parser.add_argument('--scheme', default='https')
+    args = parser.parse_args()
+
+    from byteplussdkbilling import BILLINGApi, ListBillDetailRequest
+
+    configuration = Configuration()
+    configuration.ak = os.environ.get('BYTEPLUS_ACCESSKEY', '')
+    configuration.sk = os.environ.get('BYTEPLUS_SECRETKEY', '')
+    configuration.region = os.environ.get('BYTEPLUS_REGION', 'ap-singapore-1')
+    configuration.scheme = args.scheme
+    configuration.host = args.host
+
+    api = BILLINGApi(ApiClient(configuration))
+    request = ListBillDetailRequest(bill_period=args.bill_period, limit=args.page_size, offset=0,
+                                    group_period=1, group_term=0, ignore_zero=0, need_record_num=1)
+    result = BillExporter(api.list_bill_detail, request, args.output, output_format=args.format,
+                          max_workers=args.workers, rate_limit=args.rate).run()
+    print(result)
+
+
+if __name__ == '__main__':
+    main()
@@ -3,4 +3,12 @@
 from byteplussdkcore.api_client import ApiClient
 from byteplussdkcore.configuration import Configuration
 from byteplussdkcore.flatten import Flatten
+from byteplussdkcore.lazy import LazyImporter
+from byteplussdkcore.paginator import Paginator
 from byteplussdkcore.universal import UniversalApi, UniversalInfo
+
+# AsyncApiClient needs the optional httpx dependency, import it on first use
+_importer = LazyImporter(__name__, {
+    'AsyncApiClient': 'byteplussdkcore.async_api_client',
+})
+__getattr__ = _importer.getattr
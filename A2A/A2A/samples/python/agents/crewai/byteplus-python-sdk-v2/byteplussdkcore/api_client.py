@@ -3,6 +3,7 @@
 from __future__ import absolute_import
 
 import datetime
+import time
 from multiprocessing.pool import ThreadPool
 
 # python 2 and python 3 compatibility library
@@ -103,16 +104,16 @@ class ApiClient(object):
             _return_http_data_only=None, collection_formats=None,
             _preload_content=True, _request_timeout=None):
 
-        interceptor_context = InterceptorContext(request=Request(
-            self.configuration,
+        interceptor_context = self._build_request_context(
             resource_path, method, path_params,
             query_params, header_params, body, post_params,
             files, response_type, auth_settings,
             _return_http_data_only, collection_formats,
-            _preload_content, _request_timeout,
-        ))
+            _preload_content, _request_timeout)
 
-        interceptor_context = self.interceptor_chain.execute_request(interceptor_context)
+        observer = self.interceptor_chain.stage_observer
+        if observer is not None:
+            start = time.perf_counter()
 
         # perform request and return response
         response_data = self.request(
@@ -121,6 +122,21 @@ class ApiClient(object):
             post_params=interceptor_context.request.post_params, body=interceptor_context.request.body,
             _preload_content=interceptor_context.request.preload_content,
             _request_timeout=interceptor_context.request.request_timeout)
+
+        if observer is not None:
+            observer.record('http-request', time.perf_counter() - start)
+
+        return self._handle_response(interceptor_context, response_data, _return_http_data_only)
+
+    def _build_request_context(self, *request_args):
+        """Runs the request interceptors (build, runtime options, resolve
+        endpoint, sign) and returns the resulting InterceptorContext."""
+        interceptor_context = InterceptorContext(request=Request(self.configuration, *request_args))
+        return self.interceptor_chain.execute_request(interceptor_context)
+
+    def _handle_response(self, interceptor_context, response_data, _return_http_data_only):
+        """Runs the response interceptors over the raw http response and
+        returns the deserialized result."""
         self.last_response = response_data
 
         interceptor_context.response = Response(response_data)
@@ -0,0 +1,91 @@
+# coding: utf-8
+
+import time
+
+from byteplussdkcore.api_client import ApiClient
+from byteplussdkcore.async_rest import AsyncRESTClientObject
+
+
+class AsyncApiClient(ApiClient):
+    """API client whose calls are coroutines.
+
+    Requests go through the same interceptor chain as ApiClient (build,
+    runtime options, resolve endpoint, sign, deserialize); only the HTTP
+    round trip is awaited, on a pooled `httpx.AsyncClient`. Every generated
+    api method has an `*_async` variant that must be used with this client:
+
+        >>> async with AsyncApiClient(configuration) as api_client:
+        ...     api = ECSApi(api_client)
+        ...     resp = await api.describe_instances_async(DescribeInstancesRequest())
+
+    Thousands of calls can be in flight with `asyncio.gather` without a
+    thread per request; `configuration.connection_pool_maxsize` bounds the
+    number of open connections.
+
+    :param configuration: .Configuration object for this client
+    """
+
+    is_async = True
+
+    def __init__(self, configuration=None, header_name=None, header_value=None,
+                 cookie=None):
+        super(AsyncApiClient, self).__init__(configuration, header_name, header_value, cookie)
+        self.async_rest_client = AsyncRESTClientObject(self.configuration)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):
+        """Closes the pooled connections."""
+        await self.async_rest_client.close()
+
+    def call_api(self, resource_path, method,
+                 path_params=None, query_params=None, header_params=None,
+                 body=None, post_params=None, files=None,
+                 response_type=None, auth_settings=None, async_req=None,
+                 _return_http_data_only=None, collection_formats=None,
+                 _preload_content=True, _request_timeout=None):
+        """Same as ApiClient.call_api but returns a coroutine.
+
+        `async_req` is ignored, every call is asynchronous.
+        """
+        return self.__call_api_async(resource_path, method,
+                                     path_params, query_params, header_params,
+                                     body, post_params, files,
+                                     response_type, auth_settings,
+                                     _return_http_data_only, collection_formats,
+                                     _preload_content, _request_timeout)
+
+    async def __call_api_async(
+            self, resource_path, method, path_params=None,
+            query_params=None, header_params=None, body=None, post_params=None,
+            files=None, response_type=None, auth_settings=None,
+            _return_http_data_only=None, collection_formats=None,
+            _preload_content=True, _request_timeout=None):
+
+        interceptor_context = self._build_request_context(
+            resource_path, method, path_params,
+            query_params, header_params, body, post_params,
+            files, response_type, auth_settings,
+            _return_http_data_only, collection_formats,
+            _preload_content, _request_timeout)
+
+        observer = self.interceptor_chain.stage_observer
+        if observer is not None:
+            start = time.perf_counter()
+
+        # perform request and return response
+        response_data = await self.async_rest_client.request(
+            method, interceptor_context.request.url, query_params=interceptor_context.request.query_params,
+            headers=interceptor_context.request.header_params,
+            post_params=interceptor_context.request.post_params, body=interceptor_context.request.body,
+            _preload_content=interceptor_context.request.preload_content,
+            _request_timeout=interceptor_context.request.request_timeout)
+
+        if observer is not None:
+            observer.record('http-request', time.perf_counter() - start)
+
+        return self._handle_response(interceptor_context, response_data, _return_http_data_only)
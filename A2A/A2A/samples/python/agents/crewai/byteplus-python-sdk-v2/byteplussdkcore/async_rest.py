@@ -0,0 +1,169 @@
+# coding: utf-8
+
+import json
+import logging
+import re
+import ssl
+
+import certifi
+from six.moves.urllib.parse import urlencode
+
+try:
+    import httpx
+except ImportError:
+    raise ImportError('AsyncApiClient requires httpx, install it with `pip install byteplus-python-sdk-v2[async]`.')
+
+import urllib3
+
+from byteplussdkcore.rest import ApiException
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncRESTResponse(object):
+    """Same interface as rest.RESTResponse, backed by an httpx response."""
+
+    def __init__(self, resp):
+        self.httpx_response = resp
+        self.status = resp.status_code
+        self.reason = resp.reason_phrase
+        self.data = resp.content
+
+    def getheaders(self):
+        """Returns a dictionary of the response headers."""
+        return dict(self.httpx_response.headers)
+
+    def getheader(self, name, default=None):
+        """Returns a given response header."""
+        return self.httpx_response.headers.get(name, default)
+
+
+class AsyncRESTClientObject(object):
+    """Coroutine counterpart of rest.RESTClientObject.
+
+    All requests share one `httpx.AsyncClient`, so connections are pooled
+    and kept alive across calls. `configuration.connection_pool_maxsize`
+    bounds the number of concurrent connections.
+    """
+
+    def __init__(self, configuration, maxsize=None):
+        if maxsize is None:
+            maxsize = configuration.connection_pool_maxsize or 4
+
+        ssl_context = ssl.create_default_context(cafile=configuration.ssl_ca_cert or certifi.where())
+        if configuration.cert_file:
+            ssl_context.load_cert_chain(configuration.cert_file, configuration.key_file)
+        if configuration.assert_hostname is False:
+            ssl_context.check_hostname = False
+        if not configuration.verify_ssl:
+            ssl_context.check_hostname = False
+            ssl_context.verify_mode = ssl.CERT_NONE
+
+        self.default_timeout = httpx.Timeout(configuration.read_timeout,
+                                             connect=configuration.connect_timeout)
+        client_args = dict(
+            verify=ssl_context,
+            timeout=self.default_timeout,
+            limits=httpx.Limits(max_connections=maxsize, max_keepalive_connections=maxsize),
+        )
+        if configuration.proxy:
+            client_args['proxy'] = configuration.proxy
+        try:
+            self.client = httpx.AsyncClient(**client_args)
+        except TypeError:
+            # httpx < 0.26 names the option `proxies`
+            client_args['proxies'] = client_args.pop('proxy')
+            self.client = httpx.AsyncClient(**client_args)
+
+    async def close(self):
+        await self.client.aclose()
+
+    def _timeout(self, _request_timeout):
+        if not _request_timeout:
+            return self.default_timeout
+        if isinstance(_request_timeout, (int, float)):
+            return httpx.Timeout(_request_timeout)
+        if isinstance(_request_timeout, tuple) and len(_request_timeout) == 2:
+            return httpx.Timeout(_request_timeout[1], connect=_request_timeout[0])
+        if isinstance(_request_timeout, urllib3.Timeout):
+            # RuntimeOptionsInterceptor uses -1 for "not set"
+            connect = _request_timeout.connect_timeout
+            read = _request_timeout.read_timeout
+            return httpx.Timeout(
+                read if isinstance(read, (int, float)) and read >= 0 else self.default_timeout.read,
+                connect=connect if isinstance(connect, (int, float)) and connect >= 0
+                else self.default_timeout.connect)
+        return self.default_timeout
+
+    async def request(self, method, url, query_params=None, headers=None,
+                      body=None, post_params=None, _preload_content=True,
+                      _request_timeout=None):
+        """Perform requests.
+
+        Takes the same arguments as rest.RESTClientObject.request. With
+        `_preload_content=False` the streaming `httpx.Response` is returned
+        and the caller is responsible for closing it.
+        """
+        method = method.upper()
+        assert method in ['GET', 'HEAD', 'DELETE', 'POST', 'PUT',
+                          'PATCH', 'OPTIONS']
+
+        if post_params and body:
+            raise ValueError(
+                "body parameter cannot be used with post_params parameter."
+            )
+
+        post_params = post_params or []
+        headers = headers or {}
+        timeout = self._timeout(_request_timeout)
+
+        if 'Content-Type' not in headers:
+            headers['Content-Type'] = 'application/json'
+
+        # encode the query the same way urllib3 does, so it matches what was signed
+        if query_params:
+            url += '?' + urlencode(query_params)
+
+        request_args = {}
+        if method in ['POST', 'PUT', 'PATCH', 'OPTIONS', 'DELETE']:
+            if re.search('json', headers['Content-Type'], re.IGNORECASE):
+                request_args['content'] = json.dumps(body) if body is not None else '{}'
+            elif headers['Content-Type'] == 'application/x-www-form-urlencoded':
+                # send exactly the string that SignerV4 hashed
+                request_args['content'] = urlencode(post_params)
+            elif headers['Content-Type'] == 'multipart/form-data':
+                # let httpx generate the boundary
+                del headers['Content-Type']
+                request_args['data'] = {k: v for k, v in post_params if not isinstance(v, tuple)}
+                request_args['files'] = [(k, v) for k, v in post_params if isinstance(v, tuple)]
+            elif isinstance(body, (str, bytes)):
+                request_args['content'] = body
+            else:
+                msg = """Cannot prepare a request message for provided
+                         arguments. Please check that your arguments match
+                         declared content type."""
+                raise ApiException(status=0, reason=msg)
+
+        try:
+            req = self.client.build_request(method, url, headers=headers, timeout=timeout, **request_args)
+            r = await self.client.send(req, stream=not _preload_content)
+        except httpx.HTTPError as e:
+            msg = "{0}\n{1}".format(type(e).__name__, str(e))
+            raise ApiException(status=0, reason=msg)
+
+        if not _preload_content:
+            if not 200 <= r.status_code <= 299:
+                await r.aread()
+                raise ApiException(http_resp=AsyncRESTResponse(r))
+            return r
+
+        r = AsyncRESTResponse(r)
+        r.data = r.data.decode('utf8')
+
+        # log response body
+        logger.debug("response body: %s", r.data)
+
+        if not 200 <= r.status <= 299:
+            raise ApiException(http_resp=r)
+
+        return r
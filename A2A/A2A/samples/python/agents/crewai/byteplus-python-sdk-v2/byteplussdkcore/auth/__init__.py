@@ -1,2 +1,2 @@
-from .credential import Credential
+from .credential import Credential, CredentialCache
 from .providers import StsCredentialProvider, StaticCredentialProvider
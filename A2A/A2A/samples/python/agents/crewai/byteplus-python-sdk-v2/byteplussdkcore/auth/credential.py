@@ -1,10 +1,166 @@
 # coding=utf-8
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class CredentialCache(object):
+    """Holds the credentials of one provider and renews them ahead of expiry.
+
+    With `expired_at` the expiry reported by the provider:
+
+    * before `expired_at - expired_buffer_seconds - refresh_ahead_seconds`
+      (at the latest half way through the credential lifetime) the cached
+      credentials are returned;
+    * after that a single background thread renews them while callers keep
+      getting the cached ones;
+    * after `expired_at - expired_buffer_seconds` the cached credentials are
+      still served (stale-while-revalidate) until `expired_at - safety_seconds`,
+      a failed background refresh is retried after `retry_seconds`;
+    * past that, or before the first fetch, callers block on the refresh.
+      Only one of them calls the provider, the others wait for its result.
+
+    Use `CredentialCache.shared(provider)` to get the instance shared by
+    every client built with an equivalent provider.
+
+    A provider whose `fetch` needs the credentials it is refreshing, e.g.
+    through a client that picked up the default configuration, gets a
+    RuntimeError instead of waiting on its own refresh forever.
+    """
+
+    _shared = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, provider, refresh_ahead_seconds=300, safety_seconds=5, retry_seconds=10):
+        self.provider = provider
+        self.refresh_ahead_seconds = refresh_ahead_seconds
+        self.safety_seconds = safety_seconds
+        self.retry_seconds = retry_seconds
+        self.expired_buffer_seconds = getattr(provider, 'expired_buffer_seconds', 0)
+
+        # (credentials, expired_at, refresh_at), replaced as a whole so readers need no lock
+        self._entry = (None, None, None)
+        self._refresh_lock = threading.Lock()
+        # thread holding _refresh_lock, to detect a provider asking for its own credentials
+        self._refreshing = None
+        self._state_lock = threading.Lock()
+        self._background = None
+
+    @classmethod
+    def shared(cls, provider):
+        key = provider.cache_key()
+        if key is None:
+            # shared only by the users of this provider instance, and freed with it
+            cache = getattr(provider, '_credential_cache', None)
+            if cache is None:
+                with cls._shared_lock:
+                    cache = getattr(provider, '_credential_cache', None)
+                    if cache is None:
+                        cache = provider._credential_cache = cls(provider)
+            return cache
+        cache = cls._shared.get(key)
+        if cache is None:
+            with cls._shared_lock:
+                cache = cls._shared.get(key)
+                if cache is None:
+                    cache = cls._shared[key] = cls(provider)
+        return cache
+
+    @classmethod
+    def clear_shared(cls):
+        with cls._shared_lock:
+            cls._shared.clear()
+
+    def get(self):
+        credentials, expired_at, refresh_at = self._entry
+        if credentials is None:
+            return self._refresh_blocking(None)
+        if expired_at is None:
+            return credentials
+
+        now = time.time()
+        if now >= expired_at - self.safety_seconds:
+            return self._refresh_blocking(credentials)
+        if now >= refresh_at:
+            self._refresh_in_background()
+        return credentials
+
+    def _locked(self):
+        if self._refreshing == threading.current_thread().ident:
+            raise RuntimeError('%s requested its own credentials while refreshing them, its api client must '
+                               'not use this credential' % type(self.provider).__name__)
+        return _RefreshLock(self)
+
+    def _fetch(self):
+        credentials, expired_at = self.provider.fetch()
+        refresh_at = None
+        if expired_at is not None:
+            now = time.time()
+            refresh_at = max(expired_at - self.expired_buffer_seconds - self.refresh_ahead_seconds,
+                             now + (expired_at - now) / 2)
+        self._entry = (credentials, expired_at, refresh_at)
+
+    def _refresh_blocking(self, seen):
+        with self._locked():
+            # another caller may have refreshed while this one waited
+            if self._entry[0] is not seen:
+                return self._entry[0]
+            self._fetch()
+            return self._entry[0]
+
+    def _refresh_in_background(self):
+        with self._state_lock:
+            if self._background is not None:
+                return
+            self._background = threading.Thread(target=self._background_refresh,
+                                                name='byteplus-credential-refresh')
+            self._background.daemon = True
+            self._background.start()
+
+    def _background_refresh(self):
+        try:
+            with self._locked():
+                credentials, expired_at, refresh_at = self._entry
+                if refresh_at is None or time.time() < refresh_at:
+                    return
+                try:
+                    self._fetch()
+                except Exception:
+                    # keep serving the cached credentials until the safety window
+                    logger.warning('background credential refresh failed', exc_info=True)
+                    self._entry = (credentials, expired_at, time.time() + self.retry_seconds)
+        finally:
+            with self._state_lock:
+                self._background = None
+
+
+class _RefreshLock(object):
+    """Holds `cache._refresh_lock` and records the thread holding it."""
+
+    def __init__(self, cache):
+        self.cache = cache
+
+    def __enter__(self):
+        self.cache._refresh_lock.acquire()
+        self.cache._refreshing = threading.current_thread().ident
+
+    def __exit__(self, *exc_info):
+        self.cache._refreshing = None
+        self.cache._refresh_lock.release()
+
+
 class Credential(object):
 
-    def __init__(self, provider):
+    def __init__(self, provider, shared=True):
         self.provider = provider
+        # shared=False keeps the original refresh-on-expiry behaviour
+        self.cache = CredentialCache.shared(provider) if shared else None
 
     def get(self):
+        if self.cache is not None:
+            return self.cache.get()
         if self.provider.is_expired():
             # refresh if expired
             self.provider.refresh()
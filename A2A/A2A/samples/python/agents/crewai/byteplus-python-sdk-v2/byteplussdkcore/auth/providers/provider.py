@@ -1,5 +1,6 @@
 # coding=utf-8
 import abc
+import hashlib
 
 
 class CredentialValue:
@@ -23,3 +24,21 @@ class Provider(object):
     @abc.abstractmethod
     def refresh(self):
         raise NotImplementedError()
+
+    def fetch(self):
+        """Returns fresh credentials and the epoch second they expire at,
+        None if they never expire. Used by the credential cache."""
+        self.refresh()
+        return self.retrieve(), None
+
+    def cache_key(self):
+        """Providers returning equal keys share one cached credential,
+        None shares only between users of this provider instance."""
+        return None
+
+
+def secret_digest(secret):
+    """Stands for a secret key in cache keys, which outlive the request."""
+    if secret is None:
+        return None
+    return hashlib.sha256(secret.encode('utf-8')).hexdigest()
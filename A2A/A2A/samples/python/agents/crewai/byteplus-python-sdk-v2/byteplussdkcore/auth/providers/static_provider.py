@@ -1,5 +1,5 @@
 # coding=utf-8
-from .provider import Provider, CredentialValue
+from .provider import Provider, CredentialValue, secret_digest
 
 
 class StaticCredentialProvider(Provider):
@@ -23,3 +23,7 @@ class StaticCredentialProvider(Provider):
 
     def refresh(self):
         return
+
+    def cache_key(self):
+        return ('static', self.credentials.ak, secret_digest(self.credentials.sk),
+                secret_digest(self.credentials.session_token))
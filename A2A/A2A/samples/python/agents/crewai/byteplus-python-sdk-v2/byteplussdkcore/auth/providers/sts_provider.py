@@ -6,7 +6,7 @@ from datetime import datetime
 import dateutil.parser
 
 from byteplussdkcore import UniversalApi, UniversalInfo, ApiClient, Configuration
-from .provider import Provider, CredentialValue
+from .provider import Provider, CredentialValue, secret_digest
 
 
 class AssumeRoleCredentials:
@@ -41,6 +41,7 @@ class StsCredentialProvider(Provider):
         self.credentials = None
 
         self._lock = threading.Lock()
+        self._api = None
 
     def retrieve(self):
         return self.credentials
@@ -54,24 +55,41 @@ class StsCredentialProvider(Provider):
             if self.is_expired():
                 self._assume_role()
 
+    def fetch(self):
+        with self._lock:
+            self._assume_role()
+            return self.credentials, self.expired_time
+
+    def cache_key(self):
+        return ('sts', self.ak, secret_digest(self.sk), self.account_id, self.role_name, self.duration_seconds,
+                self.scheme, self.host, self.region)
+
+    def _sts_api(self):
+        # one client for the lifetime of the provider, so refreshes reuse its connection pool
+        if self._api is None:
+            configuration = Configuration()
+            configuration.ak = self.ak
+            configuration.sk = self.sk
+            configuration.host = self.host
+            configuration.region = self.region
+            configuration.scheme = self.scheme
+            configuration.read_timeout = self.timeout
+            # Configuration() copies the default one, which may hold the credential this
+            # provider refreshes; AssumeRole is signed with the provider's own keys
+            configuration.credential = None
+            self._api = UniversalApi(ApiClient(configuration))
+        return self._api
+
     def _assume_role(self):
         params = {
             'DurationSeconds': self.duration_seconds,
             'RoleSessionName': uuid.uuid4().hex,
             'RoleTrn': 'trn:iam::' + self.account_id + ':role/' + self.role_name,
         }
-        configuration = Configuration()
-        configuration.ak = self.ak
-        configuration.sk = self.sk
-        configuration.host = self.host
-        configuration.region = self.region
-        configuration.scheme = self.scheme
-        configuration.read_timeout = self.timeout
-        c = UniversalApi(ApiClient(configuration))
         info = UniversalInfo(method='GET', service='sts', version='2018-01-01', action='AssumeRole',
                              content_type='text/plain')
 
-        resp, status_code, resp_header = c.do_call_with_http_info(info=info, body=params)
+        resp, status_code, resp_header = self._sts_api().do_call_with_http_info(info=info, body=params)
         if 'Credentials' not in resp:
             raise RuntimeError('failed to retrieve credentials from sts' + str(resp_header))
         resp_cred = resp['Credentials']
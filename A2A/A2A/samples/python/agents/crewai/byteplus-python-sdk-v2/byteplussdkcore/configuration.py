@@ -125,8 +125,16 @@ class Configuration(six.with_metaclass(TypeWithDefault, object)):
         # Disable client side validation
         self.client_side_validation = True
 
+        # Return the `Result` of responses as plain dicts and lists instead
+        # of models, skips model construction for bulk export
+        self.raw_response = False
+
         self.endpoint_provider = DefaultEndpointProvider()
 
+        # byteplussdkcore.auth.Credential supplying ak/sk/session_token per
+        # request, e.g. Credential(StsCredentialProvider(...))
+        self.credential = None
+
     @property
     def logger_file(self):
         """The logger file.
@@ -6,9 +6,13 @@ import abc
 class ResolvedEndpoint:
     def __init__(self, host):
         self.host = host
+        self._urls = {}
 
     def url_for(self, scheme='https'):
-        return scheme + '://' + self.host
+        url = self._urls.get(scheme)
+        if url is None:
+            url = self._urls[scheme] = scheme + '://' + self.host
+        return url
 
 
 class EndpointProvider(object):
@@ -33,6 +33,16 @@ class DefaultEndpointProvider(EndpointProvider):
 
     def __init__(self, custom_endpoints=None):
         self.custom_endpoints = custom_endpoints or {}
+        # (service, region) -> (custom ServiceEndpointInfo or None, ResolvedEndpoint)
+        self._resolved = {}
+
+    def clear_cache(self):
+        """Forgets resolved endpoints.
+
+        Replacing or adding entries in custom_endpoints is picked up on its own,
+        call this after editing a ServiceEndpointInfo that is already in use.
+        """
+        self._resolved = {}
 
     def get_default_endpoint(self, service, region):
         if service in self.default_endpoint:
@@ -41,18 +51,27 @@ class DefaultEndpointProvider(EndpointProvider):
         return fallback_endpoint
 
     def endpoint_for(self, service, region):
-        if service in self.custom_endpoints:
-            conf = self.custom_endpoints[service]
+        conf = self.custom_endpoints.get(service)
+        cached = self._resolved.get((service, region))
+        if cached is not None and cached[0] is conf:
+            return cached[1]
+
+        if conf is not None:
             host = conf.get_endpoint_for(region)
         else:
             host = self.get_default_endpoint(service=service, region=region)
 
-        return ResolvedEndpoint(host)
+        endpoint = ResolvedEndpoint(host)
+        self._resolved[(service, region)] = (conf, endpoint)
+        return endpoint
 
 
 class HostEndpointProvider(EndpointProvider):
     def __init__(self, host):
         self.host = host
+        self._endpoint = ResolvedEndpoint(host)
 
     def endpoint_for(self, service, region):
-        return ResolvedEndpoint(self.host)
+        if self._endpoint.host != self.host:
+            self._endpoint = ResolvedEndpoint(self.host)
+        return self._endpoint
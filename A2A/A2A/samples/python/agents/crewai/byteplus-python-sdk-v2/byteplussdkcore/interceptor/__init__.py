@@ -1,4 +1,5 @@
 from .chain import InterceptorChain
+from .metrics import LatencyHistogram
 from .interceptors import SignRequestInterceptor, BuildRequestInterceptor, ResolveEndpointInterceptor
 from .interceptors.context import InterceptorContext
 from .interceptors.deserialized_response_interceptor import DeserializedResponseInterceptor
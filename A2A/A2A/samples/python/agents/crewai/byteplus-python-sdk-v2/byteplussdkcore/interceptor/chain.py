@@ -1,4 +1,6 @@
 # coding=utf-8
+import time
+
 from .interceptors import RequestInterceptor, ResponseInterceptor
 
 
@@ -30,6 +32,12 @@ class InterceptorChain:
     def __init__(self):
         self.request_interceptors = []
         self.response_interceptors = []
+        # receives record(stage, seconds) for every interceptor call, see metrics.LatencyHistogram
+        self.stage_observer = None
+
+    def set_stage_observer(self, observer):
+        self.stage_observer = observer
+        return self
 
     def append_request_interceptor(self, interceptor):
         check_request_interceptor(interceptor)
@@ -51,13 +59,28 @@ class InterceptorChain:
         self.response_interceptors = insert_interceptor(self.response_interceptors, interceptor, after_name)
 
     def execute_request(self, context):
+        if self.stage_observer is not None:
+            return self._execute_observed(self.request_interceptors, context)
+
         for interceptor in self.request_interceptors:
             context = interceptor.intercept(context)
 
         return context
 
     def execute_response(self, context):
+        if self.stage_observer is not None:
+            return self._execute_observed(self.response_interceptors, context)
+
         for interceptor in self.response_interceptors:
             context = interceptor.intercept(context)
 
         return context
+
+    def _execute_observed(self, interceptors, context):
+        observer = self.stage_observer
+        for interceptor in interceptors:
+            start = time.perf_counter()
+            context = interceptor.intercept(context)
+            observer.record(interceptor.name(), time.perf_counter() - start)
+
+        return context
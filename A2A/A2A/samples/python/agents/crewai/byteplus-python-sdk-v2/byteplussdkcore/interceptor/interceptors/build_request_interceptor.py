@@ -1,6 +1,7 @@
 import datetime
 import mimetypes
 import os
+from operator import attrgetter, itemgetter
 from urllib.parse import quote
 
 import six
@@ -111,8 +112,101 @@ def sanitize_for_serialization(obj):
             for key, val in six.iteritems(obj_dict)}
 
 
+def dict_to_params(req, prefix="", params=None):
+    """Flattens a sanitized request dict into (key, value) tuples, e.g.
+    {"Filters": [{"Name": "a"}]} becomes [("Filters.1.Name", "a")].
+    """
+    if params is None:
+        params = []
+
+    for key, value in req.items():
+        if value is None:
+            continue
+        if isinstance(value, list):
+            for index in range(len(value)):
+                if isinstance(value[index], dict):
+                    dict_to_params(value[index], prefix + key + "." + str((index + 1)) + ".", params)
+                else:
+                    params.append((prefix + key + "." + str((index + 1)), value[index]))
+        elif isinstance(value, dict):
+            dict_to_params(value, prefix + key + ".", params)
+        else:
+            params.append((prefix + key, value))
+
+    return params
+
+
+_SCALAR_TYPES = (float, bool, bytes, six.text_type) + six.integer_types
+
+# model class -> (attrgetter of its attributes, json keys in the same order)
+_param_fields = {}
+
+
+def _fields(klass):
+    fields = _param_fields.get(klass)
+    if fields is None:
+        attrs = list(klass.swagger_types)
+        if len(attrs) > 1:
+            getter = attrgetter(*attrs)
+        elif attrs:
+            getter = lambda obj, get=attrgetter(attrs[0]): (get(obj),)  # noqa: E731
+        else:
+            getter = lambda obj: ()  # noqa: E731
+        fields = (getter, [klass.attribute_map[attr] for attr in attrs])
+        _param_fields[klass] = fields
+    return fields
+
+
+def _value_to_params(value, key, params):
+    if isinstance(value, _SCALAR_TYPES):
+        params.append((key, value))
+    elif isinstance(value, list):
+        prefix = key + "."
+        for index, item in enumerate(value, 1):
+            if isinstance(item, _SCALAR_TYPES):
+                params.append((prefix + str(index), item))
+            elif isinstance(item, dict) or hasattr(item, 'swagger_types'):
+                _value_to_params(item, prefix + str(index), params)
+            else:
+                params.append((prefix + str(index), sanitize_for_serialization(item)))
+    elif isinstance(value, dict):
+        for sub_key, sub_value in value.items():
+            if sub_value is not None:
+                _value_to_params(sub_value, key + "." + sub_key, params)
+    elif hasattr(value, 'swagger_types'):
+        getter, keys = _fields(type(value))
+        for json_key, sub_value in zip(keys, getter(value)):
+            if sub_value is not None:
+                _value_to_params(sub_value, key + "." + json_key, params)
+    else:
+        # tuples, dates, ...
+        params.append((key, sanitize_for_serialization(value)))
+
+
+def model_to_params(model, params=None):
+    """Turns a request model straight into the (key, value) tuples sent as
+    query or form parameters.
+
+    Gives the same result as `dict_to_params(sanitize_for_serialization(model))`
+    in a single walk, without the intermediate dicts. The attributes of each
+    model class are looked up once and cached.
+    """
+    if params is None:
+        params = []
+    getter, keys = _fields(type(model))
+    for json_key, value in zip(keys, getter(model)):
+        if value is not None:
+            _value_to_params(value, json_key, params)
+    return params
+
+
 class BuildRequestInterceptor(RequestInterceptor):
 
+    def __init__(self, use_plans=True):
+        # use_plans=False keeps the two pass sanitize_for_serialization +
+        # dict_to_params path for flattening request models
+        self.use_plans = use_plans
+
     def name(self):
         return 'byteplus-build-request-interceptor'
 
@@ -140,28 +234,43 @@ class BuildRequestInterceptor(RequestInterceptor):
         # request module name
         context.request.md = ""
 
+        method = context.request.method
+        query_from_body = method == "GET" and context.request.header_params.get("Content-Type") == "text/plain"
+        form_from_body = method == 'POST' and context.request.header_params.get('Content-Type').startswith(
+            'application/x-www-form-urlencoded')
+
         # body
+        body_params = None
         if context.request.body:
             if type(context.request.body) is not dict:
                 context.request.md = context.request.body.__module__.split(".")[0]
-            context.request.body = sanitize_for_serialization(context.request.body)
+            if (query_from_body or form_from_body) and self.use_plans \
+                    and hasattr(context.request.body, 'swagger_types') \
+                    and not isinstance(context.request.body, dict):
+                # flatten the model in one pass, the body itself is not sent
+                body_params = model_to_params(context.request.body)
+            else:
+                context.request.body = sanitize_for_serialization(context.request.body)
+        if body_params is None and (query_from_body or form_from_body):
+            body_params = dict_to_params(context.request.body)
 
         # query parameters
-        method = context.request.method
-        if method == "GET" and context.request.header_params.get("Content-Type") == "text/plain":
-            context.request.query_params = self.__req_to_params(context.request.body)
+        if query_from_body:
+            context.request.query_params = body_params
 
         context.request.query_params.append(("Action", context.request.resource_path.split("/")[1]))
         context.request.query_params.append(("Version", context.request.resource_path.split("/")[2]))
 
-        if context.request.query_params:
+        if query_from_body and not context.request.collection_formats:
+            # already flat and sanitized, sort once in the order the signer canonicalizes
+            context.request.query_params.sort(key=itemgetter(0))
+        elif context.request.query_params:
             context.request.query_params = sanitize_for_serialization(context.request.query_params)
             context.request.query_params = parameters_to_tuples(context.request.query_params,
                                                                 context.request.collection_formats)
 
-        if method == 'POST' and context.request.header_params.get('Content-Type').startswith(
-                'application/x-www-form-urlencoded'):
-            context.request.post_params = self.__req_to_params(context.request.body)
+        if form_from_body:
+            context.request.post_params = body_params
             context.request.body = None
 
         # post_params
@@ -176,23 +285,3 @@ class BuildRequestInterceptor(RequestInterceptor):
         context.request.service = context.request.resource_path.split("/")[3]
 
         return context
-
-    def __req_to_params(self, req, prefix="", params=None):
-        if params is None:
-            params = []
-
-        for key, value in req.items():
-            if value is None:
-                continue
-            if isinstance(value, list):
-                for index in range(len(value)):
-                    if isinstance(value[index], dict):
-                        self.__req_to_params(value[index], prefix + key + "." + str((index + 1)) + ".", params)
-                    else:
-                        params.append((prefix + key + "." + str((index + 1)), value[index]))
-            elif isinstance(value, dict):
-                self.__req_to_params(value, prefix + key + ".", params)
-            else:
-                params.append((prefix + key, value))
-
-        return params
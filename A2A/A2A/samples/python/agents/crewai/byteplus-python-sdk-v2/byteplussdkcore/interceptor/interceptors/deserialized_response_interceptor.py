@@ -1,5 +1,6 @@
 # coding=utf-8
 import datetime
+import importlib
 import json
 import os
 import re
@@ -9,11 +10,51 @@ import tempfile
 import six
 
 from byteplussdkcore import rest
+from byteplussdkcore.configuration import Configuration
 from byteplussdkcore.metadata import ResponseMetadata
 from .interceptor import ResponseInterceptor
 
+_LIST_TYPE = re.compile(r'list\[(.*)]')
+_DICT_TYPE = re.compile(r'dict\(([^,]*), (.*)\)')
+
+# compiled deserialization plans, keyed by (service, response type)
+_plans = {}
+
+
+class _ModelPlan(object):
+    """Deserializes one model class.
+
+    JSON keys are mapped straight to constructor kwargs and the plan of every
+    nested type is resolved once, when the plan is compiled.
+    """
+
+    def __init__(self, klass):
+        self.klass = klass
+        self.fields = []
+        init = getattr(klass.__init__, '__code__', None)
+        self.takes_configuration = init is not None and '_configuration' in init.co_varnames
+
+    def __call__(self, data, configuration):
+        kwargs = {}
+        if isinstance(data, dict):
+            for json_key, attr, plan in self.fields:
+                if json_key in data:
+                    value = data[json_key]
+                    kwargs[attr] = None if value is None else plan(value, configuration)
+        if self.takes_configuration:
+            kwargs['_configuration'] = configuration
+        return self.klass(**kwargs)
+
 
 class DeserializedResponseInterceptor(ResponseInterceptor):
+    """Turns the `Result` of a response into the generated response model.
+
+    :param use_plans: deserialize through compiled, cached per-class plans.
+        When False the original recursive type-string walk is used.
+    """
+
+    def __init__(self, use_plans=True):
+        self.use_plans = use_plans
 
     def name(self):
         return 'byteplus-deserialized-response-interceptor'
@@ -23,12 +64,15 @@ class DeserializedResponseInterceptor(ResponseInterceptor):
             # deserialize response data
             if context.request.response_type:
                 dresponse = self.deserialize(context.response.http_response, context.request.response_type,
-                                             context.request.md)
+                                             context.request.md, raw=context.request.raw_response)
                 context.response.result = dresponse
                 if hasattr(dresponse, "_metadata"):
                     context.response.metadata = dresponse._metadata
             else:
                 context.result = None
+        else:
+            # hand the undecoded http response to the caller, e.g. for streaming
+            context.response.result = context.response.http_response
 
         return context
 
@@ -44,13 +88,15 @@ class DeserializedResponseInterceptor(ResponseInterceptor):
         'object': object,
     }
 
-    def deserialize(self, response, response_type, service):
+    def deserialize(self, response, response_type, service, raw=False):
         """Deserializes response into an object.
 
         :param service: the target service
         :param response: RESTResponse object to be deserialized.
         :param response_type: class literal for
             deserialized object, or string of class name.
+        :param raw: return the `Result` as plain dicts and lists without
+            building models, for bulk export.
 
         :return: deserialized object.
         """
@@ -75,7 +121,10 @@ class DeserializedResponseInterceptor(ResponseInterceptor):
         else:
             raise rest.ApiException(status=200, reason="InternalServiceError")
 
-        resp_model = self.__deserialize(data, response_type, service)
+        if raw:
+            return data
+
+        resp_model = self.deserialize_data(data, response_type, service)
         if (resp_model is None) or (type(resp_model) is dict):
             return resp_model
 
@@ -94,6 +143,75 @@ class DeserializedResponseInterceptor(ResponseInterceptor):
         resp_model.metadata = metadata.__get__(resp_model)
         return resp_model
 
+    def deserialize_data(self, data, klass, service):
+        """Deserializes the decoded `Result` of a response.
+
+        :param data: dict, list or str.
+        :param klass: class literal, or string of class name.
+        :param service: the target service
+        :return: object.
+        """
+        if data is None:
+            return None
+        if not self.use_plans:
+            return self.__deserialize(data, klass, service)
+        # models built from one response share a single Configuration copy
+        return self.__plan(klass, service)(data, Configuration())
+
+    def __plan(self, klass, service, compiling=None):
+        """Returns the cached plan for a type, compiling it on first use.
+
+        A plan is a callable `plan(data, configuration)` that expects `data`
+        not to be None. The plans compiled for a type and its nested types
+        are published to `_plans` together, once all of them are complete,
+        so other threads never use a model plan whose fields are missing.
+        """
+        key = (service, klass)
+        plan = _plans.get(key)
+        if plan is not None:
+            return plan
+        if compiling is None:
+            compiling = {}
+            plan = self.__plan(klass, service, compiling)
+            _plans.update(compiling)
+            return plan
+        plan = compiling.get(key)
+        if plan is not None:
+            return plan
+
+        if type(klass) == str:
+            if klass.startswith('list['):
+                sub_plan = self.__plan(_LIST_TYPE.match(klass).group(1), service, compiling)
+                plan = _list_plan(sub_plan)
+            elif klass.startswith('dict('):
+                sub_plan = self.__plan(_DICT_TYPE.match(klass).group(2), service, compiling)
+                plan = _dict_plan(sub_plan)
+            elif klass in self.NATIVE_TYPES_MAPPING:
+                plan = self.__plan(self.NATIVE_TYPES_MAPPING[klass], service, compiling)
+            else:
+                plan = self.__plan(getattr(self.__models_module(service), klass), service, compiling)
+        elif klass in self.PRIMITIVE_TYPES:
+            plan = _primitive_plan(klass, self.__deserialize_primitive)
+        elif klass == object:
+            plan = _identity_plan
+        elif klass == datetime.date:
+            plan = _legacy_plan(self.__deserialize_date)
+        elif klass == datetime.datetime:
+            plan = _legacy_plan(self.__deserialize_datatime)
+        elif (not klass.swagger_types or issubclass(klass, dict) or
+              self.__hasattr(klass, 'get_real_child_model')):
+            # raw passthrough, dict models and polymorphic models keep the original path
+            plan = _legacy_model_plan(self.__deserialize_model, klass, service)
+        else:
+            plan = _ModelPlan(klass)
+            # register before compiling fields so recursive models terminate
+            compiling[key] = plan
+            plan.fields = [(klass.attribute_map[attr], attr, self.__plan(attr_type, service, compiling))
+                           for attr, attr_type in six.iteritems(klass.swagger_types)]
+
+        compiling[key] = plan
+        return plan
+
     def __deserialize_file(self, response):
         """Deserializes body to file
 
@@ -144,7 +262,7 @@ class DeserializedResponseInterceptor(ResponseInterceptor):
             if klass in self.NATIVE_TYPES_MAPPING:
                 klass = self.NATIVE_TYPES_MAPPING[klass]
             else:
-                klass = getattr(sys.modules[service + ".models"], klass)
+                klass = getattr(self.__models_module(service), klass)
 
         if klass in self.PRIMITIVE_TYPES:
             return self.__deserialize_primitive(data, klass)
@@ -157,6 +275,18 @@ class DeserializedResponseInterceptor(ResponseInterceptor):
         else:
             return self.__deserialize_model(data, klass, service)
 
+    def __models_module(self, service):
+        """Returns the models package of a service, importing it on first use.
+
+        Service packages load their models lazily, so the models package may
+        not be in `sys.modules` yet when the first response arrives.
+        """
+        module_name = service + ".models"
+        module = sys.modules.get(module_name)
+        if module is None:
+            module = importlib.import_module(module_name)
+        return module
+
     def __deserialize_primitive(self, data, klass):
         """Deserializes string to primitive type.
 
@@ -256,5 +386,41 @@ class DeserializedResponseInterceptor(ResponseInterceptor):
         return instance
 
 
+def _list_plan(sub_plan):
+    def plan(data, configuration):
+        return [None if item is None else sub_plan(item, configuration) for item in data]
+    return plan
+
+
+def _dict_plan(sub_plan):
+    def plan(data, configuration):
+        return {k: None if v is None else sub_plan(v, configuration) for k, v in six.iteritems(data)}
+    return plan
+
+
+def _primitive_plan(klass, deserialize_primitive):
+    def plan(data, configuration):
+        if type(data) is klass:
+            return data
+        return deserialize_primitive(data, klass)
+    return plan
+
+
+def _identity_plan(data, configuration):
+    return data
+
+
+def _legacy_plan(deserialize):
+    def plan(data, configuration):
+        return deserialize(data)
+    return plan
+
+
+def _legacy_model_plan(deserialize_model, klass, service):
+    def plan(data, configuration):
+        return deserialize_model(data, klass, service)
+    return plan
+
+
 def metadata(self):
     return self._metadata
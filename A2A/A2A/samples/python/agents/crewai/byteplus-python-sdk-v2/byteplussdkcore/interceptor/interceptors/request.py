@@ -40,12 +40,19 @@ class Request(object):
         self.service = ''
         self.md = ''
 
-        self.ak = configuration.ak
-        self.sk = configuration.sk
-        self.session_token = configuration.session_token
+        if configuration.credential is not None:
+            credentials = configuration.credential.get()
+            self.ak = credentials.ak
+            self.sk = credentials.sk
+            self.session_token = credentials.session_token
+        else:
+            self.ak = configuration.ak
+            self.sk = configuration.sk
+            self.session_token = configuration.session_token
         self.region = configuration.region
         self.scheme = configuration.scheme
         self.endpoint_provider = configuration.endpoint_provider
+        self.raw_response = configuration.raw_response
 
         self.runtime_options = None
         if hasattr(body, '_configuration') and isinstance(body._configuration, RuntimeOption):
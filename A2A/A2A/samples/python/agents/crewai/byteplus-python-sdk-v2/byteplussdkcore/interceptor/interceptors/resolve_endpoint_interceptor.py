@@ -10,7 +10,8 @@ class ResolveEndpointInterceptor(RequestInterceptor):
         host = context.request.host
         scheme = context.request.scheme
         if not host:
-            service = context.request.resource_path.split('/')[3]
+            # set by BuildRequestInterceptor
+            service = context.request.service or context.request.resource_path.split('/')[3]
             endpoint_resolver = context.request.endpoint_provider.endpoint_for(
                 service, context.request.region)
             context.request.host = endpoint_resolver.host
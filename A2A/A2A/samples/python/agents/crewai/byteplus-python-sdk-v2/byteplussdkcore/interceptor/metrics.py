@@ -0,0 +1,78 @@
+# coding=utf-8
+import bisect
+import threading
+
+# bucket upper bounds in seconds, four per power of two from 1us to ~70s
+_BOUNDS = [1e-6 * 2 ** (i / 4.0) for i in range(105)]
+
+
+class _Stage(object):
+    def __init__(self):
+        self.buckets = [0] * (len(_BOUNDS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+
+class LatencyHistogram(object):
+    """Per-stage latency histogram for InterceptorChain.set_stage_observer.
+
+        >>> histogram = LatencyHistogram()
+        >>> api_client.interceptor_chain.set_stage_observer(histogram)
+        >>> ...
+        >>> print(histogram.summary())
+
+    Stages are interceptor names plus `http-request` for the round trip made
+    by ApiClient. Percentiles are bucket upper bounds, within 19% of the
+    real value.
+    """
+
+    def __init__(self):
+        self._stages = {}
+        self._lock = threading.Lock()
+
+    def record(self, stage, seconds):
+        with self._lock:
+            s = self._stages.get(stage)
+            if s is None:
+                s = self._stages[stage] = _Stage()
+            s.buckets[bisect.bisect_left(_BOUNDS, seconds)] += 1
+            s.count += 1
+            s.total += seconds
+            if seconds > s.max:
+                s.max = seconds
+
+    def stages(self):
+        """Stage names in the order they were first recorded."""
+        return list(self._stages)
+
+    def count(self, stage):
+        return self._stages[stage].count
+
+    def mean(self, stage):
+        s = self._stages[stage]
+        return s.total / s.count
+
+    def percentile(self, stage, p):
+        """Latency in seconds below which `p` percent of the calls fell."""
+        s = self._stages[stage]
+        rank = max(1, int(round(s.count * p / 100.0)))
+        seen = 0
+        for index, n in enumerate(s.buckets):
+            seen += n
+            if seen >= rank:
+                return _BOUNDS[index] if index < len(_BOUNDS) else s.max
+        return s.max
+
+    def reset(self):
+        with self._lock:
+            self._stages = {}
+
+    def summary(self):
+        lines = ['%-42s %8s %10s %10s %10s %10s' % ('stage', 'count', 'mean us', 'p50 us', 'p99 us', 'max us')]
+        for stage in self.stages():
+            s = self._stages[stage]
+            lines.append('%-42s %8d %10.1f %10.1f %10.1f %10.1f' % (
+                stage, s.count, self.mean(stage) * 1e6, self.percentile(stage, 50) * 1e6,
+                self.percentile(stage, 99) * 1e6, s.max * 1e6))
+        return '\n'.join(lines)
@@ -0,0 +1,56 @@
+# coding: utf-8
+
+import importlib
+import sys
+
+
+class LazyImporter(object):
+    """Resolves package attributes on first access (PEP 562).
+
+    Generated service packages export hundreds of model classes. Instead of
+    importing every model module when the package is imported, the package
+    keeps a name -> module table and loads a module the first time one of
+    its names is looked up. The resolved value is stored in the package
+    namespace so later lookups do not go through ``__getattr__`` again.
+
+    Usage in a package ``__init__``::
+
+        _importer = LazyImporter(__name__, {'ECSApi': 'byteplussdkecs.api.ecs_api'})
+        __all__ = _importer.names
+        __getattr__ = _importer.getattr
+        __dir__ = _importer.dir
+        _importer.load_all_if_unsupported()
+    """
+
+    def __init__(self, module_name, lazy_imports):
+        self.module_name = module_name
+        self.lazy_imports = lazy_imports
+        self.names = list(lazy_imports)
+
+    def getattr(self, name):
+        source = self.lazy_imports.get(name)
+        if source is None:
+            return self._submodule(name)
+        value = getattr(importlib.import_module(source), name)
+        setattr(sys.modules[self.module_name], name, value)
+        return value
+
+    def _submodule(self, name):
+        # subpackages such as ``byteplussdkecs.models`` used to be bound by
+        # the eager imports, ``package.models`` still has to work
+        full_name = "%s.%s" % (self.module_name, name)
+        try:
+            return importlib.import_module(full_name)
+        except ImportError as e:
+            if getattr(e, 'name', None) != full_name:
+                raise
+        raise AttributeError("module '%s' has no attribute '%s'" % (self.module_name, name))
+
+    def dir(self):
+        return sorted(set(vars(sys.modules[self.module_name])) | set(self.names))
+
+    def load_all_if_unsupported(self):
+        # module level __getattr__ only exists since python 3.7
+        if sys.version_info < (3, 7):
+            for name in self.names:
+                self.getattr(name)
@@ -0,0 +1,234 @@
+# coding: utf-8
+
+import collections
+import copy
+from multiprocessing.pool import ThreadPool
+
+import six
+
+TOKEN = 'token'
+OFFSET = 'offset'
+PAGE_NUMBER = 'page_number'
+
+# request fields of each style, in the order styles are tried
+_STYLE_KEYS = collections.OrderedDict([
+    (TOKEN, ('NextToken', 'MaxResults')),
+    (OFFSET, ('Offset', 'Limit')),
+    (PAGE_NUMBER, ('PageNumber', 'PageSize')),
+])
+
+
+def _attr_for(model, json_key):
+    """Returns the python attribute name mapped to `json_key`, or None."""
+    for attr, key in six.iteritems(model.attribute_map):
+        if key == json_key:
+            return attr
+    return None
+
+
+def _response_value(page, json_key):
+    attr = _attr_for(page, json_key)
+    if attr is None:
+        return None
+    return getattr(page, attr, None)
+
+
+def _total(page):
+    total = _response_value(page, 'Total')
+    if total is None:
+        total = _response_value(page, 'TotalCount')
+    return total
+
+
+def pagination_styles(request):
+    """Lists the styles a request model supports, from its `attribute_map`."""
+    keys = set(six.itervalues(request.attribute_map))
+    styles = []
+    if 'NextToken' in keys:
+        styles.append(TOKEN)
+    for style in (OFFSET, PAGE_NUMBER):
+        if set(_STYLE_KEYS[style]) <= keys:
+            styles.append(style)
+    return styles
+
+
+def _styles_set(request):
+    """The supported styles whose fields the caller set on `request`."""
+    return [style for style in pagination_styles(request)
+            if any(getattr(request, _attr_for(request, key) or '', None) is not None for key in _STYLE_KEYS[style])]
+
+
+def pagination_style(request):
+    """Detects how a request model pages.
+
+    Many list requests, e.g. the VPC ``Describe*`` ones, accept both
+    NextToken/MaxResults and PageNumber/PageSize. The style whose fields
+    the caller set wins, otherwise the first supported one in the order
+    TOKEN, OFFSET, PAGE_NUMBER.
+
+    :param request: a generated request model.
+    :return: TOKEN (NextToken/MaxResults), OFFSET (Offset/Limit),
+        PAGE_NUMBER (PageNumber/PageSize) or None when it does not page.
+    """
+    styles = _styles_set(request) or pagination_styles(request)
+    return styles[0] if styles else None
+
+
+class Paginator(object):
+    """Iterates over every page or item of a paginated list API.
+
+    The pagination style is detected from the request model. NextToken APIs
+    are walked page by page. For Offset/Limit and PageNumber/PageSize APIs
+    the first page reports the total, after which the remaining pages are
+    fetched concurrently by at most `max_workers` threads and yielded in
+    order, with no more than `max_workers` pages fetched ahead of the
+    caller. Requests supporting NextToken and numbered pages, with neither
+    set, switch to numbered pages when the first response reports a total.
+
+        >>> paginator = Paginator(api.describe_instances,
+        ...                       DescribeInstancesRequest(max_results=100))
+        >>> for instance in paginator:
+        ...     print(instance.instance_id)
+
+    Nothing is requested until iteration starts.
+
+    :param operation: a generated api method, e.g. `ECSApi.describe_instances`.
+    :param request: the request model of the first page. It is not modified.
+    :param items_attr: the response attribute holding the page items. Detected
+        from the response model when it has exactly one list attribute.
+    :param max_workers: maximum number of pages fetched at the same time.
+    :param kwargs: extra keyword arguments passed to every `operation` call.
+    """
+
+    def __init__(self, operation, request, items_attr=None, max_workers=4, **kwargs):
+        self.style = pagination_style(request)
+        # token requests that may also fan out numbered pages once a total is known
+        self._numbered_fallback = None
+        if self.style == TOKEN and not _styles_set(request):
+            self._numbered_fallback = next((s for s in pagination_styles(request) if s != TOKEN), None)
+        if self.style is None:
+            raise ValueError("%s does not support pagination" % type(request).__name__)
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.operation = operation
+        self.request = request
+        self.items_attr = items_attr
+        self.max_workers = max_workers
+        self.kwargs = kwargs
+
+    def __iter__(self):
+        return self.items()
+
+    def items(self):
+        """Yields the items of every page."""
+        for page in self.pages():
+            for item in self.page_items(page):
+                yield item
+
+    def page_items(self, page):
+        """Returns the item list of a page returned by `pages()`."""
+        return getattr(page, self._items_attr(page)) or []
+
+    def pages(self):
+        """Yields the response model of every page."""
+        if self.style == TOKEN and self._numbered_fallback is not None:
+            return self._detected_pages()
+        if self.style == TOKEN:
+            return self._token_pages()
+        return self._numbered_pages(self.style)
+
+    def _call(self, **changes):
+        request = copy.copy(self.request)
+        for attr, value in six.iteritems(changes):
+            setattr(request, attr, value)
+        return self.operation(request, **self.kwargs)
+
+    def _items_attr(self, page):
+        if self.items_attr is None:
+            candidates = [attr for attr, kind in six.iteritems(page.swagger_types) if kind.startswith('list[')]
+            if len(candidates) != 1:
+                raise ValueError("cannot detect the item list of %s, pass items_attr (one of %s)"
+                                 % (type(page).__name__, candidates))
+            self.items_attr = candidates[0]
+        return self.items_attr
+
+    def _detected_pages(self):
+        first = self._call()
+        if _total(first) is not None:
+            pages = self._numbered_pages(self._numbered_fallback, first)
+        else:
+            pages = self._token_pages(first)
+        for page in pages:
+            yield page
+
+    def _token_pages(self, first=None):
+        token_attr = _attr_for(self.request, 'NextToken')
+        page = self._call() if first is None else first
+        seen = set()
+        while True:
+            yield page
+            token = getattr(page, _attr_for(page, 'NextToken') or token_attr, None)
+            if not token or token in seen:
+                return
+            seen.add(token)
+            page = self._call(**{token_attr: token})
+
+    def _numbered_pages(self, style, first=None):
+        if style == OFFSET:
+            position_key, size_key, step_by_size = 'Offset', 'Limit', True
+        else:
+            position_key, size_key, step_by_size = 'PageNumber', 'PageSize', False
+        position_attr = _attr_for(self.request, position_key)
+        size_attr = _attr_for(self.request, size_key)
+        start = getattr(self.request, position_attr)
+        if start is None:
+            start = 0 if step_by_size else 1
+
+        if first is None:
+            first_changes = {position_attr: start}
+            record_num_attr = _attr_for(self.request, 'NeedRecordNum')
+            if record_num_attr is not None:
+                # ask the server to report the total so later pages can be fanned out
+                first_changes[record_num_attr] = 1
+            first = self._call(**first_changes)
+        yield first
+
+        first_items = getattr(first, self._items_attr(first)) or []
+        size = getattr(self.request, size_attr) or _response_value(first, size_key) or len(first_items)
+        if not size or len(first_items) < size:
+            return
+
+        total = _total(first)
+        if total is None:
+            # no total reported, walk sequentially until a short page
+            position = start
+            while True:
+                position += size if step_by_size else 1
+                page = self._call(**{position_attr: position, size_attr: size})
+                yield page
+                if len(getattr(page, self._items_attr(page)) or []) < size:
+                    return
+
+        if step_by_size:
+            positions = list(range(start + size, total, size))
+        else:
+            positions = list(range(start + 1, (total + size - 1) // size + 1))
+        if not positions:
+            return
+
+        def fetch(position):
+            return self._call(**{position_attr: position, size_attr: size})
+
+        workers = min(self.max_workers, len(positions))
+        pool = ThreadPool(workers)
+        # pages requested but not yielded yet, ThreadPool.imap would request them all
+        window = collections.deque()
+        try:
+            for position in positions:
+                window.append(pool.apply_async(fetch, (position,)))
+                if len(window) >= workers:
+                    yield window.popleft().get()
+            while window:
+                yield window.popleft().get()
+        finally:
+            pool.terminate()
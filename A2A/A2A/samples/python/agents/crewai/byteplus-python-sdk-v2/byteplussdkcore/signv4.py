@@ -3,11 +3,67 @@
 import datetime
 import hashlib
 import hmac
+import threading
 
+import six
 from six.moves.urllib.parse import quote, urlencode
 
+# bodies larger than this are hashed chunk by chunk instead of being
+# encoded into a single temporary bytes object first
+_HASH_CHUNK_SIZE = 1 << 20
+
+_SIGNED_HEADER_NAMES = ('Content-Type', 'Content-Md5', 'Host')
+
+
+def _utcnow():
+    if six.PY2:
+        return datetime.datetime.utcnow()
+    return datetime.datetime.now(datetime.timezone.utc)
+
+
+class SigningKeyCache(object):
+    """Caches derived V4 signing keys for the current UTC day.
+
+    A signing key only depends on (sk, date, region, service), so it is
+    derived once per day and reused. The whole cache is dropped when the
+    date rolls over at UTC midnight, which also bounds the number of
+    entries kept for rotating STS credentials.
+    """
+
+    def __init__(self, max_size=256):
+        self.max_size = max_size
+        self._date = None
+        self._keys = {}
+        self._lock = threading.Lock()
+
+    def get(self, sk, date, region, service):
+        cache_key = (sk, region, service)
+        if date == self._date:
+            key = self._keys.get(cache_key)
+            if key is not None:
+                return key
+
+        key = SignerV4.get_signing_secret_key_v4(sk, date, region, service)
+        with self._lock:
+            if date != self._date:
+                if self._date is not None and date < self._date:
+                    # a request signed just before midnight, do not roll back
+                    return key
+                self._date = date
+                self._keys = {}
+            elif len(self._keys) >= self.max_size:
+                self._keys.clear()
+            self._keys[cache_key] = key
+        return key
+
+    def clear(self):
+        with self._lock:
+            self._date = None
+            self._keys = {}
+
 
 class SignerV4(object):
+    signing_key_cache = SigningKeyCache()
 
     @staticmethod
     def sign(path, method, headers, body, post_params, query, ak, sk, region, service,
@@ -16,62 +72,83 @@ class SignerV4(object):
             path = '/'
         if method != 'GET' and not ('Content-Type' in headers):
             headers['Content-Type'] = 'application/x-www-form-urlencoded; charset=utf-8'
-        format_date = datetime.datetime.utcnow().strftime("%Y%m%dT%H%M%SZ")
+        format_date = _utcnow().strftime("%Y%m%dT%H%M%SZ")
+        short_date = format_date[:8]
         headers['X-Date'] = format_date
 
         if (method == 'POST' and headers.get('Content-Type').startswith('application/x-www-form-urlencoded')
                 and post_params):
             body = urlencode(post_params)
 
-        body_hash = hashlib.sha256(body.encode('utf-8')).hexdigest()
+        body_hash = SignerV4.hash_body(body)
         headers['X-Content-Sha256'] = body_hash
         if session_token:
             headers['X-Security-Token'] = session_token
 
-        signed_headers = dict()
-        for key in headers:
-            if key in ['Content-Type', 'Content-Md5', 'Host'] or key.startswith('X-'):
-                signed_headers[key.lower()] = headers[key]
+        signed_headers = {}
+        for key, value in headers.items():
+            if key in _SIGNED_HEADER_NAMES or key.startswith('X-'):
+                signed_headers[key.lower()] = value
 
-        if 'host' in signed_headers:
-            v = signed_headers['host']
-            if v.find(':') != -1:
-                split = v.split(':')
-                port = split[1]
-                if str(port) == '80' or str(port) == '443':
-                    signed_headers['host'] = split[0]
+        host = signed_headers.get('host')
+        if host and ':' in host:
+            split = host.split(':')
+            if str(split[1]) in ('80', '443'):
+                signed_headers['host'] = split[0]
 
-        signed_str = ''
-        for key in sorted(signed_headers.keys()):
-            signed_str += key + ':' + signed_headers[key] + '\n'
-
-        signed_headers_string = ';'.join(sorted(signed_headers.keys()))
+        signed_keys = sorted(signed_headers)
+        signed_str = ''.join([key + ':' + signed_headers[key] + '\n' for key in signed_keys])
+        signed_headers_string = ';'.join(signed_keys)
 
         canonical_request = '\n'.join(
             [method, path, SignerV4.canonical_query(dict(query)), signed_str, signed_headers_string, body_hash])
-        credential_scope = '/'.join([format_date[:8], region, service, 'request'])
+        credential_scope = short_date + '/' + region + '/' + service + '/request'
         signing_str = '\n'.join(['HMAC-SHA256', format_date, credential_scope,
                                  hashlib.sha256(canonical_request.encode('utf-8')).hexdigest()])
-        signing_key = SignerV4.get_signing_secret_key_v4(sk, format_date[:8], region, service)
+        signing_key = SignerV4.signing_key_cache.get(sk, short_date, region, service)
 
         signature = hmac.new(signing_key, signing_str.encode('utf-8'), hashlib.sha256).hexdigest()
 
-        credential = ak + '/' + credential_scope
-        headers[
-            'Authorization'] = 'HMAC-SHA256' + ' Credential=' + credential + ', SignedHeaders=' + \
-                               signed_headers_string + ', Signature=' + signature
+        headers['Authorization'] = 'HMAC-SHA256 Credential=' + ak + '/' + credential_scope + \
+                                   ', SignedHeaders=' + signed_headers_string + ', Signature=' + signature
         return
 
+    @staticmethod
+    def hash_body(body):
+        """Returns the hex SHA-256 of a request body.
+
+        bytes-like bodies are hashed in place, file-like bodies are read in
+        chunks and large text bodies are encoded chunk by chunk, so no full
+        size copy of the payload is made just to compute the digest.
+        """
+        h = hashlib.sha256()
+        if body is None:
+            pass
+        elif isinstance(body, (bytes, bytearray, memoryview)):
+            h.update(body)
+        elif hasattr(body, 'read'):
+            position = body.tell() if hasattr(body, 'tell') else None
+            while True:
+                chunk = body.read(_HASH_CHUNK_SIZE)
+                if not chunk:
+                    break
+                if isinstance(chunk, six.text_type):
+                    chunk = chunk.encode('utf-8')
+                h.update(chunk)
+            if position is not None:
+                body.seek(position)
+        elif len(body) <= _HASH_CHUNK_SIZE:
+            h.update(body.encode('utf-8'))
+        else:
+            for start in range(0, len(body), _HASH_CHUNK_SIZE):
+                h.update(body[start:start + _HASH_CHUNK_SIZE].encode('utf-8'))
+        return h.hexdigest()
+
     @staticmethod
     def canonical_query(query):
-        res = []
-        for key in query:
-            value = str(query[key])
-            res.append((quote(key, safe='-_.~'), quote(value, safe='-_.~')))
-        sorted_key_vals = []
-        for key, value in sorted(res):
-            sorted_key_vals.append('%s=%s' % (key, value))
-        return '&'.join(sorted_key_vals)
+        res = sorted([(quote(key, safe='-_.~'), quote(str(value), safe='-_.~'))
+                      for key, value in six.iteritems(query)])
+        return '&'.join([key + '=' + value for key, value in res])
 
     @staticmethod
     def get_signing_secret_key_v4(sk, date, region, service):
@@ -0,0 +1,195 @@
+# coding: utf-8
+
+import codecs
+import importlib
+import json
+
+from byteplussdkcore import rest
+from byteplussdkcore.interceptor import DeserializedResponseInterceptor
+
+_WHITESPACE = ' \t\n\r'
+_DELIMITERS = ',]}:' + _WHITESPACE
+# values whose end raw_decode can tell without looking past them
+_SELF_DELIMITED = '{["'
+
+
+class JsonArrayStream(object):
+    """Incrementally parses a JSON document and yields the elements of one
+    nested array, reading the source in chunks.
+
+    Only the element being decoded and one chunk are held in memory, so a
+    response with thousands of rows is processed in constant memory. Values
+    of the top level keys listed in `capture` are decoded whole and stored
+    in `captured`.
+
+    :param stream: file-like object with `read(size)` returning bytes or str,
+        e.g. the urllib3 response returned with `_preload_content=False`.
+    :param path: object keys leading to the array, e.g. ('Result', 'List').
+    :param capture: top level keys whose values are kept in `captured`.
+    :param chunk_size: number of bytes read at a time.
+    """
+
+    def __init__(self, stream, path, capture=(), chunk_size=64 * 1024):
+        self.stream = stream
+        self.path = tuple(path)
+        self.capture = set(capture)
+        self.captured = {}
+        self.chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._text_decoder = codecs.getincrementaldecoder('utf-8')()
+        self._buf = ''
+        self._pos = 0
+        self._eof = False
+
+    def __iter__(self):
+        return self._parse_object(self.path, top_level=True)
+
+    def _fill(self):
+        if self._eof:
+            return False
+        chunk = self.stream.read(self.chunk_size)
+        if not chunk:
+            self._eof = True
+            self._buf += self._text_decoder.decode(b'', final=True)
+            return False
+        if isinstance(chunk, bytes):
+            chunk = self._text_decoder.decode(chunk)
+        if self._pos > self.chunk_size:
+            # drop what was consumed so the buffer stays around one chunk
+            self._buf = self._buf[self._pos:]
+            self._pos = 0
+        self._buf += chunk
+        return True
+
+    def _peek(self):
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                raise ValueError('unexpected end of JSON document')
+
+    def _expect(self, char):
+        if self._peek() != char:
+            raise ValueError('expected %r at offset %d' % (char, self._pos))
+        self._pos += 1
+
+    def _value(self):
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except ValueError:
+                if self._fill():
+                    continue
+                raise
+            # a number is only complete once a delimiter follows it: '1.5e10' cut after
+            # '1.5e' decodes as 1.5, and a value ending at the buffer end may continue
+            if self._buf[self._pos] not in _SELF_DELIMITED and \
+                    (end == len(self._buf) or self._buf[end] not in _DELIMITERS) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def _parse_object(self, path, top_level=False):
+        self._expect('{')
+        if self._peek() == '}':
+            self._pos += 1
+            return
+        while True:
+            key = self._value()
+            self._expect(':')
+            if path and key == path[0]:
+                if len(path) == 1:
+                    for item in self._parse_array():
+                        yield item
+                elif self._peek() == '{':
+                    for item in self._parse_object(path[1:]):
+                        yield item
+                else:
+                    self._value()
+            else:
+                value = self._value()
+                if top_level and key in self.capture:
+                    self.captured[key] = value
+            separator = self._peek()
+            self._pos += 1
+            if separator == '}':
+                return
+            if separator != ',':
+                raise ValueError('expected "," or "}" at offset %d' % (self._pos - 1))
+
+    def _parse_array(self):
+        if self._peek() != '[':
+            # null or a scalar where the array was expected
+            self._value()
+            return
+        self._pos += 1
+        if self._peek() == ']':
+            self._pos += 1
+            return
+        while True:
+            yield self._value()
+            separator = self._peek()
+            self._pos += 1
+            if separator == ']':
+                return
+            if separator != ',':
+                raise ValueError('expected "," or "]" at offset %d' % (self._pos - 1))
+
+
+def iter_result_items(operation, request, items_key='List', as_model=True, chunk_size=64 * 1024, **kwargs):
+    """Calls a list API and yields the items of `Result.<items_key>` one by one
+    while the response body is still being read.
+
+        >>> for row in iter_result_items(billing_api.list_bill_detail, request):
+        ...     writer.writerow(row.to_dict())
+
+    :param operation: a generated api method, e.g. `BILLINGApi.list_bill_detail`.
+    :param request: its request model.
+    :param items_key: JSON key of the array inside `Result`.
+    :param as_model: yield model objects (the item type is looked up on the
+        response model matching the request), or plain dicts when False.
+    :param kwargs: extra keyword arguments passed to `operation`.
+    """
+    kwargs['_preload_content'] = False
+    response = operation(request, **kwargs)
+
+    item_type = None
+    service = type(request).__module__.split('.')[0]
+    if as_model:
+        item_type = _item_type(request, service, items_key)
+        deserializer = DeserializedResponseInterceptor()
+
+    stream = JsonArrayStream(response, ('Result', items_key), capture=('ResponseMetadata',),
+                             chunk_size=chunk_size)
+    try:
+        for item in stream:
+            if item_type is not None and item is not None:
+                item = deserializer.deserialize_data(item, item_type, service)
+            yield item
+    finally:
+        if hasattr(response, 'release_conn'):
+            response.release_conn()
+
+    meta = stream.captured.get('ResponseMetadata')
+    if meta is None:
+        raise rest.ApiException(status=200, reason="InternalServiceError")
+    if meta.get('Error') is not None:
+        raise rest.ApiException(status=200, reason=str(meta['Error']))
+
+
+def _item_type(request, service, items_key):
+    models = importlib.import_module(service + '.models')
+    request_name = type(request).__name__
+    if not request_name.endswith('Request'):
+        raise ValueError('cannot derive the response model of %s' % request_name)
+    response_klass = getattr(models, request_name[:-len('Request')] + 'Response')
+    for attr, json_key in response_klass.attribute_map.items():
+        if json_key == items_key:
+            item_type = response_klass.swagger_types[attr]
+            if item_type.startswith('list['):
+                return item_type[len('list['):-1]
+            return item_type
+    raise ValueError('%s has no field %s' % (response_klass.__name__, items_key))
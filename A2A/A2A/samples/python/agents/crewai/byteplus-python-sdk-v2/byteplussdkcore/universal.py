@@ -29,6 +29,13 @@ class UniversalApi(object):
             (data) = self.do_call_with_http_info(info, body, **kwargs)  # noqa: E501
             return data
 
+    def do_call_async(self, info, body, **kwargs):  # noqa: E501
+        """Returns an awaitable, requires a byteplussdkcore.AsyncApiClient."""
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`do_call_async` requires a byteplussdkcore.AsyncApiClient")
+        kwargs['_return_http_data_only'] = True
+        return self.do_call_with_http_info(info, body, **kwargs)  # noqa: E501
+
     def do_call_with_http_info(self, info, body, **kwargs):  # noqa: E501
         all_params = ['body', 'async_req', '_return_http_data_only', '_preload_content',
                       '_request_timeout']  # noqa: E501
@@ -15,342 +15,351 @@
 
 from __future__ import absolute_import
 
-# import apis into sdk package
-from byteplussdkecs.api.ecs_api import ECSApi
+from byteplussdkcore.lazy import LazyImporter
 
-# import models into sdk package
-from byteplussdkecs.models.account_for_describe_image_share_permission_output import AccountForDescribeImageSharePermissionOutput
-from byteplussdkecs.models.allocate_dedicated_hosts_request import AllocateDedicatedHostsRequest
-from byteplussdkecs.models.allocate_dedicated_hosts_response import AllocateDedicatedHostsResponse
-from byteplussdkecs.models.associate_instances_iam_role_request import AssociateInstancesIamRoleRequest
-from byteplussdkecs.models.associate_instances_iam_role_response import AssociateInstancesIamRoleResponse
-from byteplussdkecs.models.attach_key_pair_request import AttachKeyPairRequest
-from byteplussdkecs.models.attach_key_pair_response import AttachKeyPairResponse
-from byteplussdkecs.models.available_instance_type_for_describe_dedicated_host_clusters_output import AvailableInstanceTypeForDescribeDedicatedHostClustersOutput
-from byteplussdkecs.models.available_resource_for_describe_available_resource_output import AvailableResourceForDescribeAvailableResourceOutput
-from byteplussdkecs.models.available_spot_resource_for_describe_spot_advice_output import AvailableSpotResourceForDescribeSpotAdviceOutput
-from byteplussdkecs.models.available_zone_for_describe_available_resource_output import AvailableZoneForDescribeAvailableResourceOutput
-from byteplussdkecs.models.capacity_for_describe_dedicated_hosts_output import CapacityForDescribeDedicatedHostsOutput
-from byteplussdkecs.models.capacity_for_describe_deployment_sets_output import CapacityForDescribeDeploymentSetsOutput
-from byteplussdkecs.models.command_for_describe_commands_output import CommandForDescribeCommandsOutput
-from byteplussdkecs.models.configuration_for_modify_reserved_instances_input import ConfigurationForModifyReservedInstancesInput
-from byteplussdkecs.models.convert_network_interface_for_run_instances_input import ConvertNetworkInterfaceForRunInstancesInput
-from byteplussdkecs.models.copy_image_request import CopyImageRequest
-from byteplussdkecs.models.copy_image_response import CopyImageResponse
-from byteplussdkecs.models.cpu_options_for_describe_instances_output import CpuOptionsForDescribeInstancesOutput
-from byteplussdkecs.models.create_command_request import CreateCommandRequest
-from byteplussdkecs.models.create_command_response import CreateCommandResponse
-from byteplussdkecs.models.create_dedicated_host_cluster_request import CreateDedicatedHostClusterRequest
-from byteplussdkecs.models.create_dedicated_host_cluster_response import CreateDedicatedHostClusterResponse
-from byteplussdkecs.models.create_deployment_set_request import CreateDeploymentSetRequest
-from byteplussdkecs.models.create_deployment_set_response import CreateDeploymentSetResponse
-from byteplussdkecs.models.create_image_request import CreateImageRequest
-from byteplussdkecs.models.create_image_response import CreateImageResponse
-from byteplussdkecs.models.create_key_pair_request import CreateKeyPairRequest
-from byteplussdkecs.models.create_key_pair_response import CreateKeyPairResponse
-from byteplussdkecs.models.create_scheduled_instances_request import CreateScheduledInstancesRequest
-from byteplussdkecs.models.create_scheduled_instances_response import CreateScheduledInstancesResponse
-from byteplussdkecs.models.create_subscription_request import CreateSubscriptionRequest
-from byteplussdkecs.models.create_subscription_response import CreateSubscriptionResponse
-from byteplussdkecs.models.create_tags_request import CreateTagsRequest
-from byteplussdkecs.models.create_tags_response import CreateTagsResponse
-from byteplussdkecs.models.dedicated_host_cluster_capacity_for_describe_dedicated_host_clusters_output import DedicatedHostClusterCapacityForDescribeDedicatedHostClustersOutput
-from byteplussdkecs.models.dedicated_host_cluster_for_describe_dedicated_host_clusters_output import DedicatedHostClusterForDescribeDedicatedHostClustersOutput
-from byteplussdkecs.models.dedicated_host_for_describe_dedicated_hosts_output import DedicatedHostForDescribeDedicatedHostsOutput
-from byteplussdkecs.models.dedicated_host_type_for_describe_dedicated_host_types_output import DedicatedHostTypeForDescribeDedicatedHostTypesOutput
-from byteplussdkecs.models.delete_command_request import DeleteCommandRequest
-from byteplussdkecs.models.delete_command_response import DeleteCommandResponse
-from byteplussdkecs.models.delete_dedicated_host_cluster_request import DeleteDedicatedHostClusterRequest
-from byteplussdkecs.models.delete_dedicated_host_cluster_response import DeleteDedicatedHostClusterResponse
-from byteplussdkecs.models.delete_deployment_set_request import DeleteDeploymentSetRequest
-from byteplussdkecs.models.delete_deployment_set_response import DeleteDeploymentSetResponse
-from byteplussdkecs.models.delete_images_request import DeleteImagesRequest
-from byteplussdkecs.models.delete_images_response import DeleteImagesResponse
-from byteplussdkecs.models.delete_instance_request import DeleteInstanceRequest
-from byteplussdkecs.models.delete_instance_response import DeleteInstanceResponse
-from byteplussdkecs.models.delete_instances_request import DeleteInstancesRequest
-from byteplussdkecs.models.delete_instances_response import DeleteInstancesResponse
-from byteplussdkecs.models.delete_invocation_request import DeleteInvocationRequest
-from byteplussdkecs.models.delete_invocation_response import DeleteInvocationResponse
-from byteplussdkecs.models.delete_key_pairs_request import DeleteKeyPairsRequest
-from byteplussdkecs.models.delete_key_pairs_response import DeleteKeyPairsResponse
-from byteplussdkecs.models.delete_scheduled_instance_request import DeleteScheduledInstanceRequest
-from byteplussdkecs.models.delete_scheduled_instance_response import DeleteScheduledInstanceResponse
-from byteplussdkecs.models.delete_tags_request import DeleteTagsRequest
-from byteplussdkecs.models.delete_tags_response import DeleteTagsResponse
-from byteplussdkecs.models.deployment_set_for_describe_deployment_sets_output import DeploymentSetForDescribeDeploymentSetsOutput
-from byteplussdkecs.models.describe_available_resource_request import DescribeAvailableResourceRequest
-from byteplussdkecs.models.describe_available_resource_response import DescribeAvailableResourceResponse
-from byteplussdkecs.models.describe_cloud_assistant_status_request import DescribeCloudAssistantStatusRequest
-from byteplussdkecs.models.describe_cloud_assistant_status_response import DescribeCloudAssistantStatusResponse
-from byteplussdkecs.models.describe_commands_request import DescribeCommandsRequest
-from byteplussdkecs.models.describe_commands_response import DescribeCommandsResponse
-from byteplussdkecs.models.describe_dedicated_host_clusters_request import DescribeDedicatedHostClustersRequest
-from byteplussdkecs.models.describe_dedicated_host_clusters_response import DescribeDedicatedHostClustersResponse
-from byteplussdkecs.models.describe_dedicated_host_types_request import DescribeDedicatedHostTypesRequest
-from byteplussdkecs.models.describe_dedicated_host_types_response import DescribeDedicatedHostTypesResponse
-from byteplussdkecs.models.describe_dedicated_hosts_request import DescribeDedicatedHostsRequest
-from byteplussdkecs.models.describe_dedicated_hosts_response import DescribeDedicatedHostsResponse
-from byteplussdkecs.models.describe_deployment_set_supported_instance_type_family_request import DescribeDeploymentSetSupportedInstanceTypeFamilyRequest
-from byteplussdkecs.models.describe_deployment_set_supported_instance_type_family_response import DescribeDeploymentSetSupportedInstanceTypeFamilyResponse
-from byteplussdkecs.models.describe_deployment_sets_request import DescribeDeploymentSetsRequest
-from byteplussdkecs.models.describe_deployment_sets_response import DescribeDeploymentSetsResponse
-from byteplussdkecs.models.describe_event_types_request import DescribeEventTypesRequest
-from byteplussdkecs.models.describe_event_types_response import DescribeEventTypesResponse
-from byteplussdkecs.models.describe_image_share_permission_request import DescribeImageSharePermissionRequest
-from byteplussdkecs.models.describe_image_share_permission_response import DescribeImageSharePermissionResponse
-from byteplussdkecs.models.describe_images_request import DescribeImagesRequest
-from byteplussdkecs.models.describe_images_response import DescribeImagesResponse
-from byteplussdkecs.models.describe_instance_ecs_terminal_url_request import DescribeInstanceECSTerminalUrlRequest
-from byteplussdkecs.models.describe_instance_ecs_terminal_url_response import DescribeInstanceECSTerminalUrlResponse
-from byteplussdkecs.models.describe_instance_type_families_request import DescribeInstanceTypeFamiliesRequest
-from byteplussdkecs.models.describe_instance_type_families_response import DescribeInstanceTypeFamiliesResponse
-from byteplussdkecs.models.describe_instance_types_request import DescribeInstanceTypesRequest
-from byteplussdkecs.models.describe_instance_types_response import DescribeInstanceTypesResponse
-from byteplussdkecs.models.describe_instance_vnc_url_request import DescribeInstanceVncUrlRequest
-from byteplussdkecs.models.describe_instance_vnc_url_response import DescribeInstanceVncUrlResponse
-from byteplussdkecs.models.describe_instances_iam_roles_request import DescribeInstancesIamRolesRequest
-from byteplussdkecs.models.describe_instances_iam_roles_response import DescribeInstancesIamRolesResponse
-from byteplussdkecs.models.describe_instances_request import DescribeInstancesRequest
-from byteplussdkecs.models.describe_instances_response import DescribeInstancesResponse
-from byteplussdkecs.models.describe_invocation_instances_request import DescribeInvocationInstancesRequest
-from byteplussdkecs.models.describe_invocation_instances_response import DescribeInvocationInstancesResponse
-from byteplussdkecs.models.describe_invocation_results_request import DescribeInvocationResultsRequest
-from byteplussdkecs.models.describe_invocation_results_response import DescribeInvocationResultsResponse
-from byteplussdkecs.models.describe_invocations_request import DescribeInvocationsRequest
-from byteplussdkecs.models.describe_invocations_response import DescribeInvocationsResponse
-from byteplussdkecs.models.describe_key_pairs_request import DescribeKeyPairsRequest
-from byteplussdkecs.models.describe_key_pairs_response import DescribeKeyPairsResponse
-from byteplussdkecs.models.describe_regions_request import DescribeRegionsRequest
-from byteplussdkecs.models.describe_regions_response import DescribeRegionsResponse
-from byteplussdkecs.models.describe_reserved_instances_request import DescribeReservedInstancesRequest
-from byteplussdkecs.models.describe_reserved_instances_response import DescribeReservedInstancesResponse
-from byteplussdkecs.models.describe_scheduled_instance_stock_request import DescribeScheduledInstanceStockRequest
-from byteplussdkecs.models.describe_scheduled_instance_stock_response import DescribeScheduledInstanceStockResponse
-from byteplussdkecs.models.describe_scheduled_instances_request import DescribeScheduledInstancesRequest
-from byteplussdkecs.models.describe_scheduled_instances_response import DescribeScheduledInstancesResponse
-from byteplussdkecs.models.describe_spot_advice_request import DescribeSpotAdviceRequest
-from byteplussdkecs.models.describe_spot_advice_response import DescribeSpotAdviceResponse
-from byteplussdkecs.models.describe_spot_price_history_request import DescribeSpotPriceHistoryRequest
-from byteplussdkecs.models.describe_spot_price_history_response import DescribeSpotPriceHistoryResponse
-from byteplussdkecs.models.describe_subscriptions_request import DescribeSubscriptionsRequest
-from byteplussdkecs.models.describe_subscriptions_response import DescribeSubscriptionsResponse
-from byteplussdkecs.models.describe_system_events_request import DescribeSystemEventsRequest
-from byteplussdkecs.models.describe_system_events_response import DescribeSystemEventsResponse
-from byteplussdkecs.models.describe_tags_request import DescribeTagsRequest
-from byteplussdkecs.models.describe_tags_response import DescribeTagsResponse
-from byteplussdkecs.models.describe_tasks_request import DescribeTasksRequest
-from byteplussdkecs.models.describe_tasks_response import DescribeTasksResponse
-from byteplussdkecs.models.describe_user_data_request import DescribeUserDataRequest
-from byteplussdkecs.models.describe_user_data_response import DescribeUserDataResponse
-from byteplussdkecs.models.describe_zones_request import DescribeZonesRequest
-from byteplussdkecs.models.describe_zones_response import DescribeZonesResponse
-from byteplussdkecs.models.detach_key_pair_request import DetachKeyPairRequest
-from byteplussdkecs.models.detach_key_pair_response import DetachKeyPairResponse
-from byteplussdkecs.models.detect_image_request import DetectImageRequest
-from byteplussdkecs.models.detect_image_response import DetectImageResponse
-from byteplussdkecs.models.detection_results_for_describe_images_output import DetectionResultsForDescribeImagesOutput
-from byteplussdkecs.models.disassociate_instances_iam_role_request import DisassociateInstancesIamRoleRequest
-from byteplussdkecs.models.disassociate_instances_iam_role_response import DisassociateInstancesIamRoleResponse
-from byteplussdkecs.models.eip_address_for_create_scheduled_instances_input import EipAddressForCreateScheduledInstancesInput
-from byteplussdkecs.models.eip_address_for_describe_instances_output import EipAddressForDescribeInstancesOutput
-from byteplussdkecs.models.eip_address_for_describe_scheduled_instances_output import EipAddressForDescribeScheduledInstancesOutput
-from byteplussdkecs.models.eip_address_for_run_instances_input import EipAddressForRunInstancesInput
-from byteplussdkecs.models.error_for_associate_instances_iam_role_output import ErrorForAssociateInstancesIamRoleOutput
-from byteplussdkecs.models.error_for_attach_key_pair_output import ErrorForAttachKeyPairOutput
-from byteplussdkecs.models.error_for_create_tags_output import ErrorForCreateTagsOutput
-from byteplussdkecs.models.error_for_delete_images_output import ErrorForDeleteImagesOutput
-from byteplussdkecs.models.error_for_delete_instances_output import ErrorForDeleteInstancesOutput
-from byteplussdkecs.models.error_for_delete_key_pairs_output import ErrorForDeleteKeyPairsOutput
-from byteplussdkecs.models.error_for_delete_tags_output import ErrorForDeleteTagsOutput
-from byteplussdkecs.models.error_for_detach_key_pair_output import ErrorForDetachKeyPairOutput
-from byteplussdkecs.models.error_for_disassociate_instances_iam_role_output import ErrorForDisassociateInstancesIamRoleOutput
-from byteplussdkecs.models.error_for_reboot_instances_output import ErrorForRebootInstancesOutput
-from byteplussdkecs.models.error_for_start_instances_output import ErrorForStartInstancesOutput
-from byteplussdkecs.models.error_for_stop_instances_output import ErrorForStopInstancesOutput
-from byteplussdkecs.models.error_for_update_system_events_output import ErrorForUpdateSystemEventsOutput
-from byteplussdkecs.models.event_type_for_describe_event_types_output import EventTypeForDescribeEventTypesOutput
-from byteplussdkecs.models.export_image_request import ExportImageRequest
-from byteplussdkecs.models.export_image_response import ExportImageResponse
-from byteplussdkecs.models.failed_instance_for_install_cloud_assistant_output import FailedInstanceForInstallCloudAssistantOutput
-from byteplussdkecs.models.failed_instance_for_uninstall_cloud_assistants_output import FailedInstanceForUninstallCloudAssistantsOutput
-from byteplussdkecs.models.failed_instance_for_upgrade_cloud_assistants_output import FailedInstanceForUpgradeCloudAssistantsOutput
-from byteplussdkecs.models.get_console_output_request import GetConsoleOutputRequest
-from byteplussdkecs.models.get_console_output_response import GetConsoleOutputResponse
-from byteplussdkecs.models.get_console_screenshot_request import GetConsoleScreenshotRequest
-from byteplussdkecs.models.get_console_screenshot_response import GetConsoleScreenshotResponse
-from byteplussdkecs.models.get_scheduled_instance_latest_release_at_request import GetScheduledInstanceLatestReleaseAtRequest
-from byteplussdkecs.models.get_scheduled_instance_latest_release_at_response import GetScheduledInstanceLatestReleaseAtResponse
-from byteplussdkecs.models.gpu_device_for_describe_instance_types_output import GpuDeviceForDescribeInstanceTypesOutput
-from byteplussdkecs.models.gpu_for_describe_instance_types_output import GpuForDescribeInstanceTypesOutput
-from byteplussdkecs.models.gpu_for_describe_spot_advice_input import GpuForDescribeSpotAdviceInput
-from byteplussdkecs.models.image_for_describe_images_output import ImageForDescribeImagesOutput
-from byteplussdkecs.models.import_image_request import ImportImageRequest
-from byteplussdkecs.models.import_image_response import ImportImageResponse
-from byteplussdkecs.models.import_key_pair_request import ImportKeyPairRequest
-from byteplussdkecs.models.import_key_pair_response import ImportKeyPairResponse
-from byteplussdkecs.models.install_cloud_assistant_request import InstallCloudAssistantRequest
-from byteplussdkecs.models.install_cloud_assistant_response import InstallCloudAssistantResponse
-from byteplussdkecs.models.instance_config_for_describe_scheduled_instances_output import InstanceConfigForDescribeScheduledInstancesOutput
-from byteplussdkecs.models.instance_for_describe_cloud_assistant_status_output import InstanceForDescribeCloudAssistantStatusOutput
-from byteplussdkecs.models.instance_for_describe_dedicated_hosts_output import InstanceForDescribeDedicatedHostsOutput
-from byteplussdkecs.models.instance_for_describe_instances_output import InstanceForDescribeInstancesOutput
-from byteplussdkecs.models.instance_type_family_for_describe_instance_type_families_output import InstanceTypeFamilyForDescribeInstanceTypeFamiliesOutput
-from byteplussdkecs.models.instance_type_for_describe_instance_types_output import InstanceTypeForDescribeInstanceTypesOutput
-from byteplussdkecs.models.instances_iam_role_for_describe_instances_iam_roles_output import InstancesIamRoleForDescribeInstancesIamRolesOutput
-from byteplussdkecs.models.invocation_for_describe_invocations_output import InvocationForDescribeInvocationsOutput
-from byteplussdkecs.models.invocation_instance_for_describe_invocation_instances_output import InvocationInstanceForDescribeInvocationInstancesOutput
-from byteplussdkecs.models.invocation_result_for_describe_invocation_results_output import InvocationResultForDescribeInvocationResultsOutput
-from byteplussdkecs.models.invoke_command_request import InvokeCommandRequest
-from byteplussdkecs.models.invoke_command_response import InvokeCommandResponse
-from byteplussdkecs.models.item_for_describe_images_output import ItemForDescribeImagesOutput
-from byteplussdkecs.models.key_pair_for_describe_key_pairs_output import KeyPairForDescribeKeyPairsOutput
-from byteplussdkecs.models.list_tags_for_resources_request import ListTagsForResourcesRequest
-from byteplussdkecs.models.list_tags_for_resources_response import ListTagsForResourcesResponse
-from byteplussdkecs.models.local_volume_capacity_for_describe_dedicated_host_clusters_output import LocalVolumeCapacityForDescribeDedicatedHostClustersOutput
-from byteplussdkecs.models.local_volume_capacity_for_describe_dedicated_hosts_output import LocalVolumeCapacityForDescribeDedicatedHostsOutput
-from byteplussdkecs.models.local_volume_for_describe_dedicated_host_types_output import LocalVolumeForDescribeDedicatedHostTypesOutput
-from byteplussdkecs.models.local_volume_for_describe_instance_types_output import LocalVolumeForDescribeInstanceTypesOutput
-from byteplussdkecs.models.local_volume_for_describe_instances_output import LocalVolumeForDescribeInstancesOutput
-from byteplussdkecs.models.memory_for_describe_instance_types_output import MemoryForDescribeInstanceTypesOutput
-from byteplussdkecs.models.modify_command_request import ModifyCommandRequest
-from byteplussdkecs.models.modify_command_response import ModifyCommandResponse
-from byteplussdkecs.models.modify_dedicated_host_attribute_request import ModifyDedicatedHostAttributeRequest
-from byteplussdkecs.models.modify_dedicated_host_attribute_response import ModifyDedicatedHostAttributeResponse
-from byteplussdkecs.models.modify_dedicated_host_cluster_attribute_request import ModifyDedicatedHostClusterAttributeRequest
-from byteplussdkecs.models.modify_dedicated_host_cluster_attribute_response import ModifyDedicatedHostClusterAttributeResponse
-from byteplussdkecs.models.modify_deployment_set_attribute_request import ModifyDeploymentSetAttributeRequest
-from byteplussdkecs.models.modify_deployment_set_attribute_response import ModifyDeploymentSetAttributeResponse
-from byteplussdkecs.models.modify_image_attribute_request import ModifyImageAttributeRequest
-from byteplussdkecs.models.modify_image_attribute_response import ModifyImageAttributeResponse
-from byteplussdkecs.models.modify_image_share_permission_request import ModifyImageSharePermissionRequest
-from byteplussdkecs.models.modify_image_share_permission_response import ModifyImageSharePermissionResponse
-from byteplussdkecs.models.modify_instance_attribute_request import ModifyInstanceAttributeRequest
-from byteplussdkecs.models.modify_instance_attribute_response import ModifyInstanceAttributeResponse
-from byteplussdkecs.models.modify_instance_charge_type_request import ModifyInstanceChargeTypeRequest
-from byteplussdkecs.models.modify_instance_charge_type_response import ModifyInstanceChargeTypeResponse
-from byteplussdkecs.models.modify_instance_deployment_request import ModifyInstanceDeploymentRequest
-from byteplussdkecs.models.modify_instance_deployment_response import ModifyInstanceDeploymentResponse
-from byteplussdkecs.models.modify_instance_placement_request import ModifyInstancePlacementRequest
-from byteplussdkecs.models.modify_instance_placement_response import ModifyInstancePlacementResponse
-from byteplussdkecs.models.modify_instance_spec_request import ModifyInstanceSpecRequest
-from byteplussdkecs.models.modify_instance_spec_response import ModifyInstanceSpecResponse
-from byteplussdkecs.models.modify_instance_vpc_attribute_request import ModifyInstanceVpcAttributeRequest
-from byteplussdkecs.models.modify_instance_vpc_attribute_response import ModifyInstanceVpcAttributeResponse
-from byteplussdkecs.models.modify_key_pair_attribute_request import ModifyKeyPairAttributeRequest
-from byteplussdkecs.models.modify_key_pair_attribute_response import ModifyKeyPairAttributeResponse
-from byteplussdkecs.models.modify_reserved_instances_request import ModifyReservedInstancesRequest
-from byteplussdkecs.models.modify_reserved_instances_response import ModifyReservedInstancesResponse
-from byteplussdkecs.models.modify_subscription_event_types_request import ModifySubscriptionEventTypesRequest
-from byteplussdkecs.models.modify_subscription_event_types_response import ModifySubscriptionEventTypesResponse
-from byteplussdkecs.models.network_for_describe_instance_types_output import NetworkForDescribeInstanceTypesOutput
-from byteplussdkecs.models.network_interface_for_create_scheduled_instances_input import NetworkInterfaceForCreateScheduledInstancesInput
-from byteplussdkecs.models.network_interface_for_describe_instances_output import NetworkInterfaceForDescribeInstancesOutput
-from byteplussdkecs.models.network_interface_for_run_instances_input import NetworkInterfaceForRunInstancesInput
-from byteplussdkecs.models.network_interfaces_re_for_describe_scheduled_instances_output import NetworkInterfacesReForDescribeScheduledInstancesOutput
-from byteplussdkecs.models.operation_detail_for_associate_instances_iam_role_output import OperationDetailForAssociateInstancesIamRoleOutput
-from byteplussdkecs.models.operation_detail_for_attach_key_pair_output import OperationDetailForAttachKeyPairOutput
-from byteplussdkecs.models.operation_detail_for_create_tags_output import OperationDetailForCreateTagsOutput
-from byteplussdkecs.models.operation_detail_for_delete_images_output import OperationDetailForDeleteImagesOutput
-from byteplussdkecs.models.operation_detail_for_delete_instances_output import OperationDetailForDeleteInstancesOutput
-from byteplussdkecs.models.operation_detail_for_delete_key_pairs_output import OperationDetailForDeleteKeyPairsOutput
-from byteplussdkecs.models.operation_detail_for_delete_tags_output import OperationDetailForDeleteTagsOutput
-from byteplussdkecs.models.operation_detail_for_detach_key_pair_output import OperationDetailForDetachKeyPairOutput
-from byteplussdkecs.models.operation_detail_for_disassociate_instances_iam_role_output import OperationDetailForDisassociateInstancesIamRoleOutput
-from byteplussdkecs.models.operation_detail_for_reboot_instances_output import OperationDetailForRebootInstancesOutput
-from byteplussdkecs.models.operation_detail_for_start_instances_output import OperationDetailForStartInstancesOutput
-from byteplussdkecs.models.operation_detail_for_stop_instances_output import OperationDetailForStopInstancesOutput
-from byteplussdkecs.models.operation_detail_for_update_system_events_output import OperationDetailForUpdateSystemEventsOutput
-from byteplussdkecs.models.parameter_definition_for_create_command_input import ParameterDefinitionForCreateCommandInput
-from byteplussdkecs.models.parameter_definition_for_describe_commands_output import ParameterDefinitionForDescribeCommandsOutput
-from byteplussdkecs.models.parameter_definition_for_describe_invocations_output import ParameterDefinitionForDescribeInvocationsOutput
-from byteplussdkecs.models.parameter_definition_for_modify_command_input import ParameterDefinitionForModifyCommandInput
-from byteplussdkecs.models.parameter_definition_for_run_command_input import ParameterDefinitionForRunCommandInput
-from byteplussdkecs.models.placement_for_describe_instances_output import PlacementForDescribeInstancesOutput
-from byteplussdkecs.models.placement_for_run_instances_input import PlacementForRunInstancesInput
-from byteplussdkecs.models.processor_for_describe_instance_types_output import ProcessorForDescribeInstanceTypesOutput
-from byteplussdkecs.models.purchase_reserved_instances_request import PurchaseReservedInstancesRequest
-from byteplussdkecs.models.purchase_reserved_instances_response import PurchaseReservedInstancesResponse
-from byteplussdkecs.models.rdma_for_describe_instance_types_output import RdmaForDescribeInstanceTypesOutput
-from byteplussdkecs.models.reboot_instance_request import RebootInstanceRequest
-from byteplussdkecs.models.reboot_instance_response import RebootInstanceResponse
-from byteplussdkecs.models.reboot_instances_request import RebootInstancesRequest
-from byteplussdkecs.models.reboot_instances_response import RebootInstancesResponse
-from byteplussdkecs.models.redeploy_dedicated_host_request import RedeployDedicatedHostRequest
-from byteplussdkecs.models.redeploy_dedicated_host_response import RedeployDedicatedHostResponse
-from byteplussdkecs.models.region_for_describe_regions_output import RegionForDescribeRegionsOutput
-from byteplussdkecs.models.renew_dedicated_host_request import RenewDedicatedHostRequest
-from byteplussdkecs.models.renew_dedicated_host_response import RenewDedicatedHostResponse
-from byteplussdkecs.models.renew_instance_request import RenewInstanceRequest
-from byteplussdkecs.models.renew_instance_response import RenewInstanceResponse
-from byteplussdkecs.models.replace_system_volume_request import ReplaceSystemVolumeRequest
-from byteplussdkecs.models.replace_system_volume_response import ReplaceSystemVolumeResponse
-from byteplussdkecs.models.reserved_instance_for_describe_reserved_instances_output import ReservedInstanceForDescribeReservedInstancesOutput
-from byteplussdkecs.models.run_command_request import RunCommandRequest
-from byteplussdkecs.models.run_command_response import RunCommandResponse
-from byteplussdkecs.models.run_instances_request import RunInstancesRequest
-from byteplussdkecs.models.run_instances_response import RunInstancesResponse
-from byteplussdkecs.models.scheduled_instance_info_for_describe_scheduled_instances_output import ScheduledInstanceInfoForDescribeScheduledInstancesOutput
-from byteplussdkecs.models.scheduled_instance_stock_for_describe_scheduled_instance_stock_output import ScheduledInstanceStockForDescribeScheduledInstanceStockOutput
-from byteplussdkecs.models.snapshot_for_describe_images_output import SnapshotForDescribeImagesOutput
-from byteplussdkecs.models.spot_price_for_describe_spot_price_history_output import SpotPriceForDescribeSpotPriceHistoryOutput
-from byteplussdkecs.models.start_instance_request import StartInstanceRequest
-from byteplussdkecs.models.start_instance_response import StartInstanceResponse
-from byteplussdkecs.models.start_instances_request import StartInstancesRequest
-from byteplussdkecs.models.start_instances_response import StartInstancesResponse
-from byteplussdkecs.models.stop_instance_request import StopInstanceRequest
-from byteplussdkecs.models.stop_instance_response import StopInstanceResponse
-from byteplussdkecs.models.stop_instances_request import StopInstancesRequest
-from byteplussdkecs.models.stop_instances_response import StopInstancesResponse
-from byteplussdkecs.models.stop_invocation_request import StopInvocationRequest
-from byteplussdkecs.models.stop_invocation_response import StopInvocationResponse
-from byteplussdkecs.models.subscription_for_describe_subscriptions_output import SubscriptionForDescribeSubscriptionsOutput
-from byteplussdkecs.models.supported_resource_for_describe_available_resource_output import SupportedResourceForDescribeAvailableResourceOutput
-from byteplussdkecs.models.system_event_for_describe_system_events_output import SystemEventForDescribeSystemEventsOutput
-from byteplussdkecs.models.tag_filter_for_describe_commands_input import TagFilterForDescribeCommandsInput
-from byteplussdkecs.models.tag_filter_for_describe_images_input import TagFilterForDescribeImagesInput
-from byteplussdkecs.models.tag_filter_for_describe_instances_input import TagFilterForDescribeInstancesInput
-from byteplussdkecs.models.tag_filter_for_describe_invocations_input import TagFilterForDescribeInvocationsInput
-from byteplussdkecs.models.tag_filter_for_describe_key_pairs_input import TagFilterForDescribeKeyPairsInput
-from byteplussdkecs.models.tag_filter_for_describe_reserved_instances_input import TagFilterForDescribeReservedInstancesInput
-from byteplussdkecs.models.tag_filter_for_describe_scheduled_instances_input import TagFilterForDescribeScheduledInstancesInput
-from byteplussdkecs.models.tag_filter_for_describe_tags_input import TagFilterForDescribeTagsInput
-from byteplussdkecs.models.tag_filter_for_list_tags_for_resources_input import TagFilterForListTagsForResourcesInput
-from byteplussdkecs.models.tag_for_create_command_input import TagForCreateCommandInput
-from byteplussdkecs.models.tag_for_create_image_input import TagForCreateImageInput
-from byteplussdkecs.models.tag_for_create_key_pair_input import TagForCreateKeyPairInput
-from byteplussdkecs.models.tag_for_create_scheduled_instances_input import TagForCreateScheduledInstancesInput
-from byteplussdkecs.models.tag_for_create_tags_input import TagForCreateTagsInput
-from byteplussdkecs.models.tag_for_describe_commands_output import TagForDescribeCommandsOutput
-from byteplussdkecs.models.tag_for_describe_images_output import TagForDescribeImagesOutput
-from byteplussdkecs.models.tag_for_describe_instances_output import TagForDescribeInstancesOutput
-from byteplussdkecs.models.tag_for_describe_invocations_output import TagForDescribeInvocationsOutput
-from byteplussdkecs.models.tag_for_describe_key_pairs_output import TagForDescribeKeyPairsOutput
-from byteplussdkecs.models.tag_for_describe_reserved_instances_output import TagForDescribeReservedInstancesOutput
-from byteplussdkecs.models.tag_for_describe_scheduled_instances_output import TagForDescribeScheduledInstancesOutput
-from byteplussdkecs.models.tag_for_import_image_input import TagForImportImageInput
-from byteplussdkecs.models.tag_for_import_key_pair_input import TagForImportKeyPairInput
-from byteplussdkecs.models.tag_for_invoke_command_input import TagForInvokeCommandInput
-from byteplussdkecs.models.tag_for_modify_reserved_instances_input import TagForModifyReservedInstancesInput
-from byteplussdkecs.models.tag_for_purchase_reserved_instances_input import TagForPurchaseReservedInstancesInput
-from byteplussdkecs.models.tag_for_run_command_input import TagForRunCommandInput
-from byteplussdkecs.models.tag_for_run_instances_input import TagForRunInstancesInput
-from byteplussdkecs.models.tag_for_tag_resources_input import TagForTagResourcesInput
-from byteplussdkecs.models.tag_resource_for_describe_tags_output import TagResourceForDescribeTagsOutput
-from byteplussdkecs.models.tag_resource_for_list_tags_for_resources_output import TagResourceForListTagsForResourcesOutput
-from byteplussdkecs.models.tag_resources_request import TagResourcesRequest
-from byteplussdkecs.models.tag_resources_response import TagResourcesResponse
-from byteplussdkecs.models.task_for_describe_tasks_output import TaskForDescribeTasksOutput
-from byteplussdkecs.models.uninstall_cloud_assistants_request import UninstallCloudAssistantsRequest
-from byteplussdkecs.models.uninstall_cloud_assistants_response import UninstallCloudAssistantsResponse
-from byteplussdkecs.models.untag_resources_request import UntagResourcesRequest
-from byteplussdkecs.models.untag_resources_response import UntagResourcesResponse
-from byteplussdkecs.models.update_system_events_request import UpdateSystemEventsRequest
-from byteplussdkecs.models.update_system_events_response import UpdateSystemEventsResponse
-from byteplussdkecs.models.upgrade_cloud_assistants_request import UpgradeCloudAssistantsRequest
-from byteplussdkecs.models.upgrade_cloud_assistants_response import UpgradeCloudAssistantsResponse
-from byteplussdkecs.models.volume_for_create_scheduled_instances_input import VolumeForCreateScheduledInstancesInput
-from byteplussdkecs.models.volume_for_describe_instance_types_output import VolumeForDescribeInstanceTypesOutput
-from byteplussdkecs.models.volume_for_describe_scheduled_instances_output import VolumeForDescribeScheduledInstancesOutput
-from byteplussdkecs.models.volume_for_run_instances_input import VolumeForRunInstancesInput
-from byteplussdkecs.models.zone_for_describe_zones_output import ZoneForDescribeZonesOutput
+# generated modules are imported on first attribute access, see LazyImporter
+_importer = LazyImporter(__name__, {
+    # import apis into sdk package
+    'ECSApi': 'byteplussdkecs.api.ecs_api',
+    # import models into sdk package
+    'AccountForDescribeImageSharePermissionOutput': 'byteplussdkecs.models.account_for_describe_image_share_permission_output',
+    'AllocateDedicatedHostsRequest': 'byteplussdkecs.models.allocate_dedicated_hosts_request',
+    'AllocateDedicatedHostsResponse': 'byteplussdkecs.models.allocate_dedicated_hosts_response',
+    'AssociateInstancesIamRoleRequest': 'byteplussdkecs.models.associate_instances_iam_role_request',
+    'AssociateInstancesIamRoleResponse': 'byteplussdkecs.models.associate_instances_iam_role_response',
+    'AttachKeyPairRequest': 'byteplussdkecs.models.attach_key_pair_request',
+    'AttachKeyPairResponse': 'byteplussdkecs.models.attach_key_pair_response',
+    'AvailableInstanceTypeForDescribeDedicatedHostClustersOutput': 'byteplussdkecs.models.available_instance_type_for_describe_dedicated_host_clusters_output',
+    'AvailableResourceForDescribeAvailableResourceOutput': 'byteplussdkecs.models.available_resource_for_describe_available_resource_output',
+    'AvailableSpotResourceForDescribeSpotAdviceOutput': 'byteplussdkecs.models.available_spot_resource_for_describe_spot_advice_output',
+    'AvailableZoneForDescribeAvailableResourceOutput': 'byteplussdkecs.models.available_zone_for_describe_available_resource_output',
+    'CapacityForDescribeDedicatedHostsOutput': 'byteplussdkecs.models.capacity_for_describe_dedicated_hosts_output',
+    'CapacityForDescribeDeploymentSetsOutput': 'byteplussdkecs.models.capacity_for_describe_deployment_sets_output',
+    'CommandForDescribeCommandsOutput': 'byteplussdkecs.models.command_for_describe_commands_output',
+    'ConfigurationForModifyReservedInstancesInput': 'byteplussdkecs.models.configuration_for_modify_reserved_instances_input',
+    'ConvertNetworkInterfaceForRunInstancesInput': 'byteplussdkecs.models.convert_network_interface_for_run_instances_input',
+    'CopyImageRequest': 'byteplussdkecs.models.copy_image_request',
+    'CopyImageResponse': 'byteplussdkecs.models.copy_image_response',
+    'CpuOptionsForDescribeInstancesOutput': 'byteplussdkecs.models.cpu_options_for_describe_instances_output',
+    'CreateCommandRequest': 'byteplussdkecs.models.create_command_request',
+    'CreateCommandResponse': 'byteplussdkecs.models.create_command_response',
+    'CreateDedicatedHostClusterRequest': 'byteplussdkecs.models.create_dedicated_host_cluster_request',
+    'CreateDedicatedHostClusterResponse': 'byteplussdkecs.models.create_dedicated_host_cluster_response',
+    'CreateDeploymentSetRequest': 'byteplussdkecs.models.create_deployment_set_request',
+    'CreateDeploymentSetResponse': 'byteplussdkecs.models.create_deployment_set_response',
+    'CreateImageRequest': 'byteplussdkecs.models.create_image_request',
+    'CreateImageResponse': 'byteplussdkecs.models.create_image_response',
+    'CreateKeyPairRequest': 'byteplussdkecs.models.create_key_pair_request',
+    'CreateKeyPairResponse': 'byteplussdkecs.models.create_key_pair_response',
+    'CreateScheduledInstancesRequest': 'byteplussdkecs.models.create_scheduled_instances_request',
+    'CreateScheduledInstancesResponse': 'byteplussdkecs.models.create_scheduled_instances_response',
+    'CreateSubscriptionRequest': 'byteplussdkecs.models.create_subscription_request',
+    'CreateSubscriptionResponse': 'byteplussdkecs.models.create_subscription_response',
+    'CreateTagsRequest': 'byteplussdkecs.models.create_tags_request',
+    'CreateTagsResponse': 'byteplussdkecs.models.create_tags_response',
+    'DedicatedHostClusterCapacityForDescribeDedicatedHostClustersOutput': 'byteplussdkecs.models.dedicated_host_cluster_capacity_for_describe_dedicated_host_clusters_output',
+    'DedicatedHostClusterForDescribeDedicatedHostClustersOutput': 'byteplussdkecs.models.dedicated_host_cluster_for_describe_dedicated_host_clusters_output',
+    'DedicatedHostForDescribeDedicatedHostsOutput': 'byteplussdkecs.models.dedicated_host_for_describe_dedicated_hosts_output',
+    'DedicatedHostTypeForDescribeDedicatedHostTypesOutput': 'byteplussdkecs.models.dedicated_host_type_for_describe_dedicated_host_types_output',
+    'DeleteCommandRequest': 'byteplussdkecs.models.delete_command_request',
+    'DeleteCommandResponse': 'byteplussdkecs.models.delete_command_response',
+    'DeleteDedicatedHostClusterRequest': 'byteplussdkecs.models.delete_dedicated_host_cluster_request',
+    'DeleteDedicatedHostClusterResponse': 'byteplussdkecs.models.delete_dedicated_host_cluster_response',
+    'DeleteDeploymentSetRequest': 'byteplussdkecs.models.delete_deployment_set_request',
+    'DeleteDeploymentSetResponse': 'byteplussdkecs.models.delete_deployment_set_response',
+    'DeleteImagesRequest': 'byteplussdkecs.models.delete_images_request',
+    'DeleteImagesResponse': 'byteplussdkecs.models.delete_images_response',
+    'DeleteInstanceRequest': 'byteplussdkecs.models.delete_instance_request',
+    'DeleteInstanceResponse': 'byteplussdkecs.models.delete_instance_response',
+    'DeleteInstancesRequest': 'byteplussdkecs.models.delete_instances_request',
+    'DeleteInstancesResponse': 'byteplussdkecs.models.delete_instances_response',
+    'DeleteInvocationRequest': 'byteplussdkecs.models.delete_invocation_request',
+    'DeleteInvocationResponse': 'byteplussdkecs.models.delete_invocation_response',
+    'DeleteKeyPairsRequest': 'byteplussdkecs.models.delete_key_pairs_request',
+    'DeleteKeyPairsResponse': 'byteplussdkecs.models.delete_key_pairs_response',
+    'DeleteScheduledInstanceRequest': 'byteplussdkecs.models.delete_scheduled_instance_request',
+    'DeleteScheduledInstanceResponse': 'byteplussdkecs.models.delete_scheduled_instance_response',
+    'DeleteTagsRequest': 'byteplussdkecs.models.delete_tags_request',
+    'DeleteTagsResponse': 'byteplussdkecs.models.delete_tags_response',
+    'DeploymentSetForDescribeDeploymentSetsOutput': 'byteplussdkecs.models.deployment_set_for_describe_deployment_sets_output',
+    'DescribeAvailableResourceRequest': 'byteplussdkecs.models.describe_available_resource_request',
+    'DescribeAvailableResourceResponse': 'byteplussdkecs.models.describe_available_resource_response',
+    'DescribeCloudAssistantStatusRequest': 'byteplussdkecs.models.describe_cloud_assistant_status_request',
+    'DescribeCloudAssistantStatusResponse': 'byteplussdkecs.models.describe_cloud_assistant_status_response',
+    'DescribeCommandsRequest': 'byteplussdkecs.models.describe_commands_request',
+    'DescribeCommandsResponse': 'byteplussdkecs.models.describe_commands_response',
+    'DescribeDedicatedHostClustersRequest': 'byteplussdkecs.models.describe_dedicated_host_clusters_request',
+    'DescribeDedicatedHostClustersResponse': 'byteplussdkecs.models.describe_dedicated_host_clusters_response',
+    'DescribeDedicatedHostTypesRequest': 'byteplussdkecs.models.describe_dedicated_host_types_request',
+    'DescribeDedicatedHostTypesResponse': 'byteplussdkecs.models.describe_dedicated_host_types_response',
+    'DescribeDedicatedHostsRequest': 'byteplussdkecs.models.describe_dedicated_hosts_request',
+    'DescribeDedicatedHostsResponse': 'byteplussdkecs.models.describe_dedicated_hosts_response',
+    'DescribeDeploymentSetSupportedInstanceTypeFamilyRequest': 'byteplussdkecs.models.describe_deployment_set_supported_instance_type_family_request',
+    'DescribeDeploymentSetSupportedInstanceTypeFamilyResponse': 'byteplussdkecs.models.describe_deployment_set_supported_instance_type_family_response',
+    'DescribeDeploymentSetsRequest': 'byteplussdkecs.models.describe_deployment_sets_request',
+    'DescribeDeploymentSetsResponse': 'byteplussdkecs.models.describe_deployment_sets_response',
+    'DescribeEventTypesRequest': 'byteplussdkecs.models.describe_event_types_request',
+    'DescribeEventTypesResponse': 'byteplussdkecs.models.describe_event_types_response',
+    'DescribeImageSharePermissionRequest': 'byteplussdkecs.models.describe_image_share_permission_request',
+    'DescribeImageSharePermissionResponse': 'byteplussdkecs.models.describe_image_share_permission_response',
+    'DescribeImagesRequest': 'byteplussdkecs.models.describe_images_request',
+    'DescribeImagesResponse': 'byteplussdkecs.models.describe_images_response',
+    'DescribeInstanceECSTerminalUrlRequest': 'byteplussdkecs.models.describe_instance_ecs_terminal_url_request',
+    'DescribeInstanceECSTerminalUrlResponse': 'byteplussdkecs.models.describe_instance_ecs_terminal_url_response',
+    'DescribeInstanceTypeFamiliesRequest': 'byteplussdkecs.models.describe_instance_type_families_request',
+    'DescribeInstanceTypeFamiliesResponse': 'byteplussdkecs.models.describe_instance_type_families_response',
+    'DescribeInstanceTypesRequest': 'byteplussdkecs.models.describe_instance_types_request',
+    'DescribeInstanceTypesResponse': 'byteplussdkecs.models.describe_instance_types_response',
+    'DescribeInstanceVncUrlRequest': 'byteplussdkecs.models.describe_instance_vnc_url_request',
+    'DescribeInstanceVncUrlResponse': 'byteplussdkecs.models.describe_instance_vnc_url_response',
+    'DescribeInstancesIamRolesRequest': 'byteplussdkecs.models.describe_instances_iam_roles_request',
+    'DescribeInstancesIamRolesResponse': 'byteplussdkecs.models.describe_instances_iam_roles_response',
+    'DescribeInstancesRequest': 'byteplussdkecs.models.describe_instances_request',
+    'DescribeInstancesResponse': 'byteplussdkecs.models.describe_instances_response',
+    'DescribeInvocationInstancesRequest': 'byteplussdkecs.models.describe_invocation_instances_request',
+    'DescribeInvocationInstancesResponse': 'byteplussdkecs.models.describe_invocation_instances_response',
+    'DescribeInvocationResultsRequest': 'byteplussdkecs.models.describe_invocation_results_request',
+    'DescribeInvocationResultsResponse': 'byteplussdkecs.models.describe_invocation_results_response',
+    'DescribeInvocationsRequest': 'byteplussdkecs.models.describe_invocations_request',
+    'DescribeInvocationsResponse': 'byteplussdkecs.models.describe_invocations_response',
+    'DescribeKeyPairsRequest': 'byteplussdkecs.models.describe_key_pairs_request',
+    'DescribeKeyPairsResponse': 'byteplussdkecs.models.describe_key_pairs_response',
+    'DescribeRegionsRequest': 'byteplussdkecs.models.describe_regions_request',
+    'DescribeRegionsResponse': 'byteplussdkecs.models.describe_regions_response',
+    'DescribeReservedInstancesRequest': 'byteplussdkecs.models.describe_reserved_instances_request',
+    'DescribeReservedInstancesResponse': 'byteplussdkecs.models.describe_reserved_instances_response',
+    'DescribeScheduledInstanceStockRequest': 'byteplussdkecs.models.describe_scheduled_instance_stock_request',
+    'DescribeScheduledInstanceStockResponse': 'byteplussdkecs.models.describe_scheduled_instance_stock_response',
+    'DescribeScheduledInstancesRequest': 'byteplussdkecs.models.describe_scheduled_instances_request',
+    'DescribeScheduledInstancesResponse': 'byteplussdkecs.models.describe_scheduled_instances_response',
+    'DescribeSpotAdviceRequest': 'byteplussdkecs.models.describe_spot_advice_request',
+    'DescribeSpotAdviceResponse': 'byteplussdkecs.models.describe_spot_advice_response',
+    'DescribeSpotPriceHistoryRequest': 'byteplussdkecs.models.describe_spot_price_history_request',
+    'DescribeSpotPriceHistoryResponse': 'byteplussdkecs.models.describe_spot_price_history_response',
+    'DescribeSubscriptionsRequest': 'byteplussdkecs.models.describe_subscriptions_request',
+    'DescribeSubscriptionsResponse': 'byteplussdkecs.models.describe_subscriptions_response',
+    'DescribeSystemEventsRequest': 'byteplussdkecs.models.describe_system_events_request',
+    'DescribeSystemEventsResponse': 'byteplussdkecs.models.describe_system_events_response',
+    'DescribeTagsRequest': 'byteplussdkecs.models.describe_tags_request',
+    'DescribeTagsResponse': 'byteplussdkecs.models.describe_tags_response',
+    'DescribeTasksRequest': 'byteplussdkecs.models.describe_tasks_request',
+    'DescribeTasksResponse': 'byteplussdkecs.models.describe_tasks_response',
+    'DescribeUserDataRequest': 'byteplussdkecs.models.describe_user_data_request',
+    'DescribeUserDataResponse': 'byteplussdkecs.models.describe_user_data_response',
+    'DescribeZonesRequest': 'byteplussdkecs.models.describe_zones_request',
+    'DescribeZonesResponse': 'byteplussdkecs.models.describe_zones_response',
+    'DetachKeyPairRequest': 'byteplussdkecs.models.detach_key_pair_request',
+    'DetachKeyPairResponse': 'byteplussdkecs.models.detach_key_pair_response',
+    'DetectImageRequest': 'byteplussdkecs.models.detect_image_request',
+    'DetectImageResponse': 'byteplussdkecs.models.detect_image_response',
+    'DetectionResultsForDescribeImagesOutput': 'byteplussdkecs.models.detection_results_for_describe_images_output',
+    'DisassociateInstancesIamRoleRequest': 'byteplussdkecs.models.disassociate_instances_iam_role_request',
+    'DisassociateInstancesIamRoleResponse': 'byteplussdkecs.models.disassociate_instances_iam_role_response',
+    'EipAddressForCreateScheduledInstancesInput': 'byteplussdkecs.models.eip_address_for_create_scheduled_instances_input',
+    'EipAddressForDescribeInstancesOutput': 'byteplussdkecs.models.eip_address_for_describe_instances_output',
+    'EipAddressForDescribeScheduledInstancesOutput': 'byteplussdkecs.models.eip_address_for_describe_scheduled_instances_output',
+    'EipAddressForRunInstancesInput': 'byteplussdkecs.models.eip_address_for_run_instances_input',
+    'ErrorForAssociateInstancesIamRoleOutput': 'byteplussdkecs.models.error_for_associate_instances_iam_role_output',
+    'ErrorForAttachKeyPairOutput': 'byteplussdkecs.models.error_for_attach_key_pair_output',
+    'ErrorForCreateTagsOutput': 'byteplussdkecs.models.error_for_create_tags_output',
+    'ErrorForDeleteImagesOutput': 'byteplussdkecs.models.error_for_delete_images_output',
+    'ErrorForDeleteInstancesOutput': 'byteplussdkecs.models.error_for_delete_instances_output',
+    'ErrorForDeleteKeyPairsOutput': 'byteplussdkecs.models.error_for_delete_key_pairs_output',
+    'ErrorForDeleteTagsOutput': 'byteplussdkecs.models.error_for_delete_tags_output',
+    'ErrorForDetachKeyPairOutput': 'byteplussdkecs.models.error_for_detach_key_pair_output',
+    'ErrorForDisassociateInstancesIamRoleOutput': 'byteplussdkecs.models.error_for_disassociate_instances_iam_role_output',
+    'ErrorForRebootInstancesOutput': 'byteplussdkecs.models.error_for_reboot_instances_output',
+    'ErrorForStartInstancesOutput': 'byteplussdkecs.models.error_for_start_instances_output',
+    'ErrorForStopInstancesOutput': 'byteplussdkecs.models.error_for_stop_instances_output',
+    'ErrorForUpdateSystemEventsOutput': 'byteplussdkecs.models.error_for_update_system_events_output',
+    'EventTypeForDescribeEventTypesOutput': 'byteplussdkecs.models.event_type_for_describe_event_types_output',
+    'ExportImageRequest': 'byteplussdkecs.models.export_image_request',
+    'ExportImageResponse': 'byteplussdkecs.models.export_image_response',
+    'FailedInstanceForInstallCloudAssistantOutput': 'byteplussdkecs.models.failed_instance_for_install_cloud_assistant_output',
+    'FailedInstanceForUninstallCloudAssistantsOutput': 'byteplussdkecs.models.failed_instance_for_uninstall_cloud_assistants_output',
+    'FailedInstanceForUpgradeCloudAssistantsOutput': 'byteplussdkecs.models.failed_instance_for_upgrade_cloud_assistants_output',
+    'GetConsoleOutputRequest': 'byteplussdkecs.models.get_console_output_request',
+    'GetConsoleOutputResponse': 'byteplussdkecs.models.get_console_output_response',
+    'GetConsoleScreenshotRequest': 'byteplussdkecs.models.get_console_screenshot_request',
+    'GetConsoleScreenshotResponse': 'byteplussdkecs.models.get_console_screenshot_response',
+    'GetScheduledInstanceLatestReleaseAtRequest': 'byteplussdkecs.models.get_scheduled_instance_latest_release_at_request',
+    'GetScheduledInstanceLatestReleaseAtResponse': 'byteplussdkecs.models.get_scheduled_instance_latest_release_at_response',
+    'GpuDeviceForDescribeInstanceTypesOutput': 'byteplussdkecs.models.gpu_device_for_describe_instance_types_output',
+    'GpuForDescribeInstanceTypesOutput': 'byteplussdkecs.models.gpu_for_describe_instance_types_output',
+    'GpuForDescribeSpotAdviceInput': 'byteplussdkecs.models.gpu_for_describe_spot_advice_input',
+    'ImageForDescribeImagesOutput': 'byteplussdkecs.models.image_for_describe_images_output',
+    'ImportImageRequest': 'byteplussdkecs.models.import_image_request',
+    'ImportImageResponse': 'byteplussdkecs.models.import_image_response',
+    'ImportKeyPairRequest': 'byteplussdkecs.models.import_key_pair_request',
+    'ImportKeyPairResponse': 'byteplussdkecs.models.import_key_pair_response',
+    'InstallCloudAssistantRequest': 'byteplussdkecs.models.install_cloud_assistant_request',
+    'InstallCloudAssistantResponse': 'byteplussdkecs.models.install_cloud_assistant_response',
+    'InstanceConfigForDescribeScheduledInstancesOutput': 'byteplussdkecs.models.instance_config_for_describe_scheduled_instances_output',
+    'InstanceForDescribeCloudAssistantStatusOutput': 'byteplussdkecs.models.instance_for_describe_cloud_assistant_status_output',
+    'InstanceForDescribeDedicatedHostsOutput': 'byteplussdkecs.models.instance_for_describe_dedicated_hosts_output',
+    'InstanceForDescribeInstancesOutput': 'byteplussdkecs.models.instance_for_describe_instances_output',
+    'InstanceTypeFamilyForDescribeInstanceTypeFamiliesOutput': 'byteplussdkecs.models.instance_type_family_for_describe_instance_type_families_output',
+    'InstanceTypeForDescribeInstanceTypesOutput': 'byteplussdkecs.models.instance_type_for_describe_instance_types_output',
+    'InstancesIamRoleForDescribeInstancesIamRolesOutput': 'byteplussdkecs.models.instances_iam_role_for_describe_instances_iam_roles_output',
+    'InvocationForDescribeInvocationsOutput': 'byteplussdkecs.models.invocation_for_describe_invocations_output',
+    'InvocationInstanceForDescribeInvocationInstancesOutput': 'byteplussdkecs.models.invocation_instance_for_describe_invocation_instances_output',
+    'InvocationResultForDescribeInvocationResultsOutput': 'byteplussdkecs.models.invocation_result_for_describe_invocation_results_output',
+    'InvokeCommandRequest': 'byteplussdkecs.models.invoke_command_request',
+    'InvokeCommandResponse': 'byteplussdkecs.models.invoke_command_response',
+    'ItemForDescribeImagesOutput': 'byteplussdkecs.models.item_for_describe_images_output',
+    'KeyPairForDescribeKeyPairsOutput': 'byteplussdkecs.models.key_pair_for_describe_key_pairs_output',
+    'ListTagsForResourcesRequest': 'byteplussdkecs.models.list_tags_for_resources_request',
+    'ListTagsForResourcesResponse': 'byteplussdkecs.models.list_tags_for_resources_response',
+    'LocalVolumeCapacityForDescribeDedicatedHostClustersOutput': 'byteplussdkecs.models.local_volume_capacity_for_describe_dedicated_host_clusters_output',
+    'LocalVolumeCapacityForDescribeDedicatedHostsOutput': 'byteplussdkecs.models.local_volume_capacity_for_describe_dedicated_hosts_output',
+    'LocalVolumeForDescribeDedicatedHostTypesOutput': 'byteplussdkecs.models.local_volume_for_describe_dedicated_host_types_output',
+    'LocalVolumeForDescribeInstanceTypesOutput': 'byteplussdkecs.models.local_volume_for_describe_instance_types_output',
+    'LocalVolumeForDescribeInstancesOutput': 'byteplussdkecs.models.local_volume_for_describe_instances_output',
+    'MemoryForDescribeInstanceTypesOutput': 'byteplussdkecs.models.memory_for_describe_instance_types_output',
+    'ModifyCommandRequest': 'byteplussdkecs.models.modify_command_request',
+    'ModifyCommandResponse': 'byteplussdkecs.models.modify_command_response',
+    'ModifyDedicatedHostAttributeRequest': 'byteplussdkecs.models.modify_dedicated_host_attribute_request',
+    'ModifyDedicatedHostAttributeResponse': 'byteplussdkecs.models.modify_dedicated_host_attribute_response',
+    'ModifyDedicatedHostClusterAttributeRequest': 'byteplussdkecs.models.modify_dedicated_host_cluster_attribute_request',
+    'ModifyDedicatedHostClusterAttributeResponse': 'byteplussdkecs.models.modify_dedicated_host_cluster_attribute_response',
+    'ModifyDeploymentSetAttributeRequest': 'byteplussdkecs.models.modify_deployment_set_attribute_request',
+    'ModifyDeploymentSetAttributeResponse': 'byteplussdkecs.models.modify_deployment_set_attribute_response',
+    'ModifyImageAttributeRequest': 'byteplussdkecs.models.modify_image_attribute_request',
+    'ModifyImageAttributeResponse': 'byteplussdkecs.models.modify_image_attribute_response',
+    'ModifyImageSharePermissionRequest': 'byteplussdkecs.models.modify_image_share_permission_request',
+    'ModifyImageSharePermissionResponse': 'byteplussdkecs.models.modify_image_share_permission_response',
+    'ModifyInstanceAttributeRequest': 'byteplussdkecs.models.modify_instance_attribute_request',
+    'ModifyInstanceAttributeResponse': 'byteplussdkecs.models.modify_instance_attribute_response',
+    'ModifyInstanceChargeTypeRequest': 'byteplussdkecs.models.modify_instance_charge_type_request',
+    'ModifyInstanceChargeTypeResponse': 'byteplussdkecs.models.modify_instance_charge_type_response',
+    'ModifyInstanceDeploymentRequest': 'byteplussdkecs.models.modify_instance_deployment_request',
+    'ModifyInstanceDeploymentResponse': 'byteplussdkecs.models.modify_instance_deployment_response',
+    'ModifyInstancePlacementRequest': 'byteplussdkecs.models.modify_instance_placement_request',
+    'ModifyInstancePlacementResponse': 'byteplussdkecs.models.modify_instance_placement_response',
+    'ModifyInstanceSpecRequest': 'byteplussdkecs.models.modify_instance_spec_request',
+    'ModifyInstanceSpecResponse': 'byteplussdkecs.models.modify_instance_spec_response',
+    'ModifyInstanceVpcAttributeRequest': 'byteplussdkecs.models.modify_instance_vpc_attribute_request',
+    'ModifyInstanceVpcAttributeResponse': 'byteplussdkecs.models.modify_instance_vpc_attribute_response',
+    'ModifyKeyPairAttributeRequest': 'byteplussdkecs.models.modify_key_pair_attribute_request',
+    'ModifyKeyPairAttributeResponse': 'byteplussdkecs.models.modify_key_pair_attribute_response',
+    'ModifyReservedInstancesRequest': 'byteplussdkecs.models.modify_reserved_instances_request',
+    'ModifyReservedInstancesResponse': 'byteplussdkecs.models.modify_reserved_instances_response',
+    'ModifySubscriptionEventTypesRequest': 'byteplussdkecs.models.modify_subscription_event_types_request',
+    'ModifySubscriptionEventTypesResponse': 'byteplussdkecs.models.modify_subscription_event_types_response',
+    'NetworkForDescribeInstanceTypesOutput': 'byteplussdkecs.models.network_for_describe_instance_types_output',
+    'NetworkInterfaceForCreateScheduledInstancesInput': 'byteplussdkecs.models.network_interface_for_create_scheduled_instances_input',
+    'NetworkInterfaceForDescribeInstancesOutput': 'byteplussdkecs.models.network_interface_for_describe_instances_output',
+    'NetworkInterfaceForRunInstancesInput': 'byteplussdkecs.models.network_interface_for_run_instances_input',
+    'NetworkInterfacesReForDescribeScheduledInstancesOutput': 'byteplussdkecs.models.network_interfaces_re_for_describe_scheduled_instances_output',
+    'OperationDetailForAssociateInstancesIamRoleOutput': 'byteplussdkecs.models.operation_detail_for_associate_instances_iam_role_output',
+    'OperationDetailForAttachKeyPairOutput': 'byteplussdkecs.models.operation_detail_for_attach_key_pair_output',
+    'OperationDetailForCreateTagsOutput': 'byteplussdkecs.models.operation_detail_for_create_tags_output',
+    'OperationDetailForDeleteImagesOutput': 'byteplussdkecs.models.operation_detail_for_delete_images_output',
+    'OperationDetailForDeleteInstancesOutput': 'byteplussdkecs.models.operation_detail_for_delete_instances_output',
+    'OperationDetailForDeleteKeyPairsOutput': 'byteplussdkecs.models.operation_detail_for_delete_key_pairs_output',
+    'OperationDetailForDeleteTagsOutput': 'byteplussdkecs.models.operation_detail_for_delete_tags_output',
+    'OperationDetailForDetachKeyPairOutput': 'byteplussdkecs.models.operation_detail_for_detach_key_pair_output',
+    'OperationDetailForDisassociateInstancesIamRoleOutput': 'byteplussdkecs.models.operation_detail_for_disassociate_instances_iam_role_output',
+    'OperationDetailForRebootInstancesOutput': 'byteplussdkecs.models.operation_detail_for_reboot_instances_output',
+    'OperationDetailForStartInstancesOutput': 'byteplussdkecs.models.operation_detail_for_start_instances_output',
+    'OperationDetailForStopInstancesOutput': 'byteplussdkecs.models.operation_detail_for_stop_instances_output',
+    'OperationDetailForUpdateSystemEventsOutput': 'byteplussdkecs.models.operation_detail_for_update_system_events_output',
+    'ParameterDefinitionForCreateCommandInput': 'byteplussdkecs.models.parameter_definition_for_create_command_input',
+    'ParameterDefinitionForDescribeCommandsOutput': 'byteplussdkecs.models.parameter_definition_for_describe_commands_output',
+    'ParameterDefinitionForDescribeInvocationsOutput': 'byteplussdkecs.models.parameter_definition_for_describe_invocations_output',
+    'ParameterDefinitionForModifyCommandInput': 'byteplussdkecs.models.parameter_definition_for_modify_command_input',
+    'ParameterDefinitionForRunCommandInput': 'byteplussdkecs.models.parameter_definition_for_run_command_input',
+    'PlacementForDescribeInstancesOutput': 'byteplussdkecs.models.placement_for_describe_instances_output',
+    'PlacementForRunInstancesInput': 'byteplussdkecs.models.placement_for_run_instances_input',
+    'ProcessorForDescribeInstanceTypesOutput': 'byteplussdkecs.models.processor_for_describe_instance_types_output',
+    'PurchaseReservedInstancesRequest': 'byteplussdkecs.models.purchase_reserved_instances_request',
+    'PurchaseReservedInstancesResponse': 'byteplussdkecs.models.purchase_reserved_instances_response',
+    'RdmaForDescribeInstanceTypesOutput': 'byteplussdkecs.models.rdma_for_describe_instance_types_output',
+    'RebootInstanceRequest': 'byteplussdkecs.models.reboot_instance_request',
+    'RebootInstanceResponse': 'byteplussdkecs.models.reboot_instance_response',
+    'RebootInstancesRequest': 'byteplussdkecs.models.reboot_instances_request',
+    'RebootInstancesResponse': 'byteplussdkecs.models.reboot_instances_response',
+    'RedeployDedicatedHostRequest': 'byteplussdkecs.models.redeploy_dedicated_host_request',
+    'RedeployDedicatedHostResponse': 'byteplussdkecs.models.redeploy_dedicated_host_response',
+    'RegionForDescribeRegionsOutput': 'byteplussdkecs.models.region_for_describe_regions_output',
+    'RenewDedicatedHostRequest': 'byteplussdkecs.models.renew_dedicated_host_request',
+    'RenewDedicatedHostResponse': 'byteplussdkecs.models.renew_dedicated_host_response',
+    'RenewInstanceRequest': 'byteplussdkecs.models.renew_instance_request',
+    'RenewInstanceResponse': 'byteplussdkecs.models.renew_instance_response',
+    'ReplaceSystemVolumeRequest': 'byteplussdkecs.models.replace_system_volume_request',
+    'ReplaceSystemVolumeResponse': 'byteplussdkecs.models.replace_system_volume_response',
+    'ReservedInstanceForDescribeReservedInstancesOutput': 'byteplussdkecs.models.reserved_instance_for_describe_reserved_instances_output',
+    'RunCommandRequest': 'byteplussdkecs.models.run_command_request',
+    'RunCommandResponse': 'byteplussdkecs.models.run_command_response',
+    'RunInstancesRequest': 'byteplussdkecs.models.run_instances_request',
+    'RunInstancesResponse': 'byteplussdkecs.models.run_instances_response',
+    'ScheduledInstanceInfoForDescribeScheduledInstancesOutput': 'byteplussdkecs.models.scheduled_instance_info_for_describe_scheduled_instances_output',
+    'ScheduledInstanceStockForDescribeScheduledInstanceStockOutput': 'byteplussdkecs.models.scheduled_instance_stock_for_describe_scheduled_instance_stock_output',
+    'SnapshotForDescribeImagesOutput': 'byteplussdkecs.models.snapshot_for_describe_images_output',
+    'SpotPriceForDescribeSpotPriceHistoryOutput': 'byteplussdkecs.models.spot_price_for_describe_spot_price_history_output',
+    'StartInstanceRequest': 'byteplussdkecs.models.start_instance_request',
+    'StartInstanceResponse': 'byteplussdkecs.models.start_instance_response',
+    'StartInstancesRequest': 'byteplussdkecs.models.start_instances_request',
+    'StartInstancesResponse': 'byteplussdkecs.models.start_instances_response',
+    'StopInstanceRequest': 'byteplussdkecs.models.stop_instance_request',
+    'StopInstanceResponse': 'byteplussdkecs.models.stop_instance_response',
+    'StopInstancesRequest': 'byteplussdkecs.models.stop_instances_request',
+    'StopInstancesResponse': 'byteplussdkecs.models.stop_instances_response',
+    'StopInvocationRequest': 'byteplussdkecs.models.stop_invocation_request',
+    'StopInvocationResponse': 'byteplussdkecs.models.stop_invocation_response',
+    'SubscriptionForDescribeSubscriptionsOutput': 'byteplussdkecs.models.subscription_for_describe_subscriptions_output',
+    'SupportedResourceForDescribeAvailableResourceOutput': 'byteplussdkecs.models.supported_resource_for_describe_available_resource_output',
+    'SystemEventForDescribeSystemEventsOutput': 'byteplussdkecs.models.system_event_for_describe_system_events_output',
+    'TagFilterForDescribeCommandsInput': 'byteplussdkecs.models.tag_filter_for_describe_commands_input',
+    'TagFilterForDescribeImagesInput': 'byteplussdkecs.models.tag_filter_for_describe_images_input',
+    'TagFilterForDescribeInstancesInput': 'byteplussdkecs.models.tag_filter_for_describe_instances_input',
+    'TagFilterForDescribeInvocationsInput': 'byteplussdkecs.models.tag_filter_for_describe_invocations_input',
+    'TagFilterForDescribeKeyPairsInput': 'byteplussdkecs.models.tag_filter_for_describe_key_pairs_input',
+    'TagFilterForDescribeReservedInstancesInput': 'byteplussdkecs.models.tag_filter_for_describe_reserved_instances_input',
+    'TagFilterForDescribeScheduledInstancesInput': 'byteplussdkecs.models.tag_filter_for_describe_scheduled_instances_input',
+    'TagFilterForDescribeTagsInput': 'byteplussdkecs.models.tag_filter_for_describe_tags_input',
+    'TagFilterForListTagsForResourcesInput': 'byteplussdkecs.models.tag_filter_for_list_tags_for_resources_input',
+    'TagForCreateCommandInput': 'byteplussdkecs.models.tag_for_create_command_input',
+    'TagForCreateImageInput': 'byteplussdkecs.models.tag_for_create_image_input',
+    'TagForCreateKeyPairInput': 'byteplussdkecs.models.tag_for_create_key_pair_input',
+    'TagForCreateScheduledInstancesInput': 'byteplussdkecs.models.tag_for_create_scheduled_instances_input',
+    'TagForCreateTagsInput': 'byteplussdkecs.models.tag_for_create_tags_input',
+    'TagForDescribeCommandsOutput': 'byteplussdkecs.models.tag_for_describe_commands_output',
+    'TagForDescribeImagesOutput': 'byteplussdkecs.models.tag_for_describe_images_output',
+    'TagForDescribeInstancesOutput': 'byteplussdkecs.models.tag_for_describe_instances_output',
+    'TagForDescribeInvocationsOutput': 'byteplussdkecs.models.tag_for_describe_invocations_output',
+    'TagForDescribeKeyPairsOutput': 'byteplussdkecs.models.tag_for_describe_key_pairs_output',
+    'TagForDescribeReservedInstancesOutput': 'byteplussdkecs.models.tag_for_describe_reserved_instances_output',
+    'TagForDescribeScheduledInstancesOutput': 'byteplussdkecs.models.tag_for_describe_scheduled_instances_output',
+    'TagForImportImageInput': 'byteplussdkecs.models.tag_for_import_image_input',
+    'TagForImportKeyPairInput': 'byteplussdkecs.models.tag_for_import_key_pair_input',
+    'TagForInvokeCommandInput': 'byteplussdkecs.models.tag_for_invoke_command_input',
+    'TagForModifyReservedInstancesInput': 'byteplussdkecs.models.tag_for_modify_reserved_instances_input',
+    'TagForPurchaseReservedInstancesInput': 'byteplussdkecs.models.tag_for_purchase_reserved_instances_input',
+    'TagForRunCommandInput': 'byteplussdkecs.models.tag_for_run_command_input',
+    'TagForRunInstancesInput': 'byteplussdkecs.models.tag_for_run_instances_input',
+    'TagForTagResourcesInput': 'byteplussdkecs.models.tag_for_tag_resources_input',
+    'TagResourceForDescribeTagsOutput': 'byteplussdkecs.models.tag_resource_for_describe_tags_output',
+    'TagResourceForListTagsForResourcesOutput': 'byteplussdkecs.models.tag_resource_for_list_tags_for_resources_output',
+    'TagResourcesRequest': 'byteplussdkecs.models.tag_resources_request',
+    'TagResourcesResponse': 'byteplussdkecs.models.tag_resources_response',
+    'TaskForDescribeTasksOutput': 'byteplussdkecs.models.task_for_describe_tasks_output',
+    'UninstallCloudAssistantsRequest': 'byteplussdkecs.models.uninstall_cloud_assistants_request',
+    'UninstallCloudAssistantsResponse': 'byteplussdkecs.models.uninstall_cloud_assistants_response',
+    'UntagResourcesRequest': 'byteplussdkecs.models.untag_resources_request',
+    'UntagResourcesResponse': 'byteplussdkecs.models.untag_resources_response',
+    'UpdateSystemEventsRequest': 'byteplussdkecs.models.update_system_events_request',
+    'UpdateSystemEventsResponse': 'byteplussdkecs.models.update_system_events_response',
+    'UpgradeCloudAssistantsRequest': 'byteplussdkecs.models.upgrade_cloud_assistants_request',
+    'UpgradeCloudAssistantsResponse': 'byteplussdkecs.models.upgrade_cloud_assistants_response',
+    'VolumeForCreateScheduledInstancesInput': 'byteplussdkecs.models.volume_for_create_scheduled_instances_input',
+    'VolumeForDescribeInstanceTypesOutput': 'byteplussdkecs.models.volume_for_describe_instance_types_output',
+    'VolumeForDescribeScheduledInstancesOutput': 'byteplussdkecs.models.volume_for_describe_scheduled_instances_output',
+    'VolumeForRunInstancesInput': 'byteplussdkecs.models.volume_for_run_instances_input',
+    'ZoneForDescribeZonesOutput': 'byteplussdkecs.models.zone_for_describe_zones_output',
+})
+
+__all__ = _importer.names
+__getattr__ = _importer.getattr
+__dir__ = _importer.dir
+_importer.load_all_if_unsupported()
@@ -54,6 +54,21 @@ class ECSApi(object):
             (data) = self.allocate_dedicated_hosts_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def allocate_dedicated_hosts_async(self, body, **kwargs):  # noqa: E501
+        """allocate_dedicated_hosts  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.allocate_dedicated_hosts_async(body)
+
+        :param AllocateDedicatedHostsRequest body: (required)
+        :return: AllocateDedicatedHostsResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`allocate_dedicated_hosts_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.allocate_dedicated_hosts_with_http_info(body, **kwargs)  # noqa: E501
+
     def allocate_dedicated_hosts_with_http_info(self, body, **kwargs):  # noqa: E501
         """allocate_dedicated_hosts  # noqa: E501
 
@@ -151,6 +166,21 @@ class ECSApi(object):
             (data) = self.associate_instances_iam_role_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def associate_instances_iam_role_async(self, body, **kwargs):  # noqa: E501
+        """associate_instances_iam_role  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.associate_instances_iam_role_async(body)
+
+        :param AssociateInstancesIamRoleRequest body: (required)
+        :return: AssociateInstancesIamRoleResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`associate_instances_iam_role_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.associate_instances_iam_role_with_http_info(body, **kwargs)  # noqa: E501
+
     def associate_instances_iam_role_with_http_info(self, body, **kwargs):  # noqa: E501
         """associate_instances_iam_role  # noqa: E501
 
@@ -248,6 +278,21 @@ class ECSApi(object):
             (data) = self.attach_key_pair_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def attach_key_pair_async(self, body, **kwargs):  # noqa: E501
+        """attach_key_pair  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.attach_key_pair_async(body)
+
+        :param AttachKeyPairRequest body: (required)
+        :return: AttachKeyPairResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`attach_key_pair_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.attach_key_pair_with_http_info(body, **kwargs)  # noqa: E501
+
     def attach_key_pair_with_http_info(self, body, **kwargs):  # noqa: E501
         """attach_key_pair  # noqa: E501
 
@@ -345,6 +390,21 @@ class ECSApi(object):
             (data) = self.copy_image_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def copy_image_async(self, body, **kwargs):  # noqa: E501
+        """copy_image  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.copy_image_async(body)
+
+        :param CopyImageRequest body: (required)
+        :return: CopyImageResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`copy_image_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.copy_image_with_http_info(body, **kwargs)  # noqa: E501
+
     def copy_image_with_http_info(self, body, **kwargs):  # noqa: E501
         """copy_image  # noqa: E501
 
@@ -442,6 +502,21 @@ class ECSApi(object):
             (data) = self.create_command_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def create_command_async(self, body, **kwargs):  # noqa: E501
+        """create_command  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.create_command_async(body)
+
+        :param CreateCommandRequest body: (required)
+        :return: CreateCommandResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`create_command_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.create_command_with_http_info(body, **kwargs)  # noqa: E501
+
     def create_command_with_http_info(self, body, **kwargs):  # noqa: E501
         """create_command  # noqa: E501
 
@@ -539,6 +614,21 @@ class ECSApi(object):
             (data) = self.create_dedicated_host_cluster_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def create_dedicated_host_cluster_async(self, body, **kwargs):  # noqa: E501
+        """create_dedicated_host_cluster  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.create_dedicated_host_cluster_async(body)
+
+        :param CreateDedicatedHostClusterRequest body: (required)
+        :return: CreateDedicatedHostClusterResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`create_dedicated_host_cluster_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.create_dedicated_host_cluster_with_http_info(body, **kwargs)  # noqa: E501
+
     def create_dedicated_host_cluster_with_http_info(self, body, **kwargs):  # noqa: E501
         """create_dedicated_host_cluster  # noqa: E501
 
@@ -636,6 +726,21 @@ class ECSApi(object):
             (data) = self.create_deployment_set_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def create_deployment_set_async(self, body, **kwargs):  # noqa: E501
+        """create_deployment_set  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.create_deployment_set_async(body)
+
+        :param CreateDeploymentSetRequest body: (required)
+        :return: CreateDeploymentSetResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`create_deployment_set_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.create_deployment_set_with_http_info(body, **kwargs)  # noqa: E501
+
     def create_deployment_set_with_http_info(self, body, **kwargs):  # noqa: E501
         """create_deployment_set  # noqa: E501
 
@@ -733,6 +838,21 @@ class ECSApi(object):
             (data) = self.create_image_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def create_image_async(self, body, **kwargs):  # noqa: E501
+        """create_image  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.create_image_async(body)
+
+        :param CreateImageRequest body: (required)
+        :return: CreateImageResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`create_image_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.create_image_with_http_info(body, **kwargs)  # noqa: E501
+
     def create_image_with_http_info(self, body, **kwargs):  # noqa: E501
         """create_image  # noqa: E501
 
@@ -830,6 +950,21 @@ class ECSApi(object):
             (data) = self.create_key_pair_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def create_key_pair_async(self, body, **kwargs):  # noqa: E501
+        """create_key_pair  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.create_key_pair_async(body)
+
+        :param CreateKeyPairRequest body: (required)
+        :return: CreateKeyPairResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`create_key_pair_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.create_key_pair_with_http_info(body, **kwargs)  # noqa: E501
+
     def create_key_pair_with_http_info(self, body, **kwargs):  # noqa: E501
         """create_key_pair  # noqa: E501
 
@@ -927,6 +1062,21 @@ class ECSApi(object):
             (data) = self.create_scheduled_instances_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def create_scheduled_instances_async(self, body, **kwargs):  # noqa: E501
+        """create_scheduled_instances  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.create_scheduled_instances_async(body)
+
+        :param CreateScheduledInstancesRequest body: (required)
+        :return: CreateScheduledInstancesResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`create_scheduled_instances_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.create_scheduled_instances_with_http_info(body, **kwargs)  # noqa: E501
+
     def create_scheduled_instances_with_http_info(self, body, **kwargs):  # noqa: E501
         """create_scheduled_instances  # noqa: E501
 
@@ -1024,6 +1174,21 @@ class ECSApi(object):
             (data) = self.create_subscription_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def create_subscription_async(self, body, **kwargs):  # noqa: E501
+        """create_subscription  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.create_subscription_async(body)
+
+        :param CreateSubscriptionRequest body: (required)
+        :return: CreateSubscriptionResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`create_subscription_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.create_subscription_with_http_info(body, **kwargs)  # noqa: E501
+
     def create_subscription_with_http_info(self, body, **kwargs):  # noqa: E501
         """create_subscription  # noqa: E501
 
@@ -1121,6 +1286,21 @@ class ECSApi(object):
             (data) = self.create_tags_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def create_tags_async(self, body, **kwargs):  # noqa: E501
+        """create_tags  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.create_tags_async(body)
+
+        :param CreateTagsRequest body: (required)
+        :return: CreateTagsResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`create_tags_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.create_tags_with_http_info(body, **kwargs)  # noqa: E501
+
     def create_tags_with_http_info(self, body, **kwargs):  # noqa: E501
         """create_tags  # noqa: E501
 
@@ -1218,6 +1398,21 @@ class ECSApi(object):
             (data) = self.delete_command_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def delete_command_async(self, body, **kwargs):  # noqa: E501
+        """delete_command  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.delete_command_async(body)
+
+        :param DeleteCommandRequest body: (required)
+        :return: DeleteCommandResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`delete_command_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.delete_command_with_http_info(body, **kwargs)  # noqa: E501
+
     def delete_command_with_http_info(self, body, **kwargs):  # noqa: E501
         """delete_command  # noqa: E501
 
@@ -1315,6 +1510,21 @@ class ECSApi(object):
             (data) = self.delete_dedicated_host_cluster_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def delete_dedicated_host_cluster_async(self, body, **kwargs):  # noqa: E501
+        """delete_dedicated_host_cluster  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.delete_dedicated_host_cluster_async(body)
+
+        :param DeleteDedicatedHostClusterRequest body: (required)
+        :return: DeleteDedicatedHostClusterResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`delete_dedicated_host_cluster_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.delete_dedicated_host_cluster_with_http_info(body, **kwargs)  # noqa: E501
+
     def delete_dedicated_host_cluster_with_http_info(self, body, **kwargs):  # noqa: E501
         """delete_dedicated_host_cluster  # noqa: E501
 
@@ -1412,6 +1622,21 @@ class ECSApi(object):
             (data) = self.delete_deployment_set_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def delete_deployment_set_async(self, body, **kwargs):  # noqa: E501
+        """delete_deployment_set  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.delete_deployment_set_async(body)
+
+        :param DeleteDeploymentSetRequest body: (required)
+        :return: DeleteDeploymentSetResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`delete_deployment_set_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.delete_deployment_set_with_http_info(body, **kwargs)  # noqa: E501
+
     def delete_deployment_set_with_http_info(self, body, **kwargs):  # noqa: E501
         """delete_deployment_set  # noqa: E501
 
@@ -1509,6 +1734,21 @@ class ECSApi(object):
             (data) = self.delete_images_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def delete_images_async(self, body, **kwargs):  # noqa: E501
+        """delete_images  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.delete_images_async(body)
+
+        :param DeleteImagesRequest body: (required)
+        :return: DeleteImagesResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`delete_images_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.delete_images_with_http_info(body, **kwargs)  # noqa: E501
+
     def delete_images_with_http_info(self, body, **kwargs):  # noqa: E501
         """delete_images  # noqa: E501
 
@@ -1606,6 +1846,21 @@ class ECSApi(object):
             (data) = self.delete_instance_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def delete_instance_async(self, body, **kwargs):  # noqa: E501
+        """delete_instance  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.delete_instance_async(body)
+
+        :param DeleteInstanceRequest body: (required)
+        :return: DeleteInstanceResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`delete_instance_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.delete_instance_with_http_info(body, **kwargs)  # noqa: E501
+
     def delete_instance_with_http_info(self, body, **kwargs):  # noqa: E501
         """delete_instance  # noqa: E501
 
@@ -1703,6 +1958,21 @@ class ECSApi(object):
             (data) = self.delete_instances_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def delete_instances_async(self, body, **kwargs):  # noqa: E501
+        """delete_instances  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.delete_instances_async(body)
+
+        :param DeleteInstancesRequest body: (required)
+        :return: DeleteInstancesResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`delete_instances_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.delete_instances_with_http_info(body, **kwargs)  # noqa: E501
+
     def delete_instances_with_http_info(self, body, **kwargs):  # noqa: E501
         """delete_instances  # noqa: E501
 
@@ -1800,6 +2070,21 @@ class ECSApi(object):
             (data) = self.delete_invocation_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def delete_invocation_async(self, body, **kwargs):  # noqa: E501
+        """delete_invocation  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.delete_invocation_async(body)
+
+        :param DeleteInvocationRequest body: (required)
+        :return: DeleteInvocationResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`delete_invocation_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.delete_invocation_with_http_info(body, **kwargs)  # noqa: E501
+
     def delete_invocation_with_http_info(self, body, **kwargs):  # noqa: E501
         """delete_invocation  # noqa: E501
 
@@ -1897,6 +2182,21 @@ class ECSApi(object):
             (data) = self.delete_key_pairs_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def delete_key_pairs_async(self, body, **kwargs):  # noqa: E501
+        """delete_key_pairs  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.delete_key_pairs_async(body)
+
+        :param DeleteKeyPairsRequest body: (required)
+        :return: DeleteKeyPairsResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`delete_key_pairs_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.delete_key_pairs_with_http_info(body, **kwargs)  # noqa: E501
+
     def delete_key_pairs_with_http_info(self, body, **kwargs):  # noqa: E501
         """delete_key_pairs  # noqa: E501
 
@@ -1994,6 +2294,21 @@ class ECSApi(object):
             (data) = self.delete_scheduled_instance_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def delete_scheduled_instance_async(self, body, **kwargs):  # noqa: E501
+        """delete_scheduled_instance  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.delete_scheduled_instance_async(body)
+
+        :param DeleteScheduledInstanceRequest body: (required)
+        :return: DeleteScheduledInstanceResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`delete_scheduled_instance_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.delete_scheduled_instance_with_http_info(body, **kwargs)  # noqa: E501
+
     def delete_scheduled_instance_with_http_info(self, body, **kwargs):  # noqa: E501
         """delete_scheduled_instance  # noqa: E501
 
@@ -2091,6 +2406,21 @@ class ECSApi(object):
             (data) = self.delete_tags_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def delete_tags_async(self, body, **kwargs):  # noqa: E501
+        """delete_tags  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.delete_tags_async(body)
+
+        :param DeleteTagsRequest body: (required)
+        :return: DeleteTagsResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`delete_tags_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.delete_tags_with_http_info(body, **kwargs)  # noqa: E501
+
     def delete_tags_with_http_info(self, body, **kwargs):  # noqa: E501
         """delete_tags  # noqa: E501
 
@@ -2188,6 +2518,21 @@ class ECSApi(object):
             (data) = self.describe_available_resource_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def describe_available_resource_async(self, body, **kwargs):  # noqa: E501
+        """describe_available_resource  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.describe_available_resource_async(body)
+
+        :param DescribeAvailableResourceRequest body: (required)
+        :return: DescribeAvailableResourceResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`describe_available_resource_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.describe_available_resource_with_http_info(body, **kwargs)  # noqa: E501
+
     def describe_available_resource_with_http_info(self, body, **kwargs):  # noqa: E501
         """describe_available_resource  # noqa: E501
 
@@ -2285,6 +2630,21 @@ class ECSApi(object):
             (data) = self.describe_cloud_assistant_status_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def describe_cloud_assistant_status_async(self, body, **kwargs):  # noqa: E501
+        """describe_cloud_assistant_status  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.describe_cloud_assistant_status_async(body)
+
+        :param DescribeCloudAssistantStatusRequest body: (required)
+        :return: DescribeCloudAssistantStatusResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`describe_cloud_assistant_status_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.describe_cloud_assistant_status_with_http_info(body, **kwargs)  # noqa: E501
+
     def describe_cloud_assistant_status_with_http_info(self, body, **kwargs):  # noqa: E501
         """describe_cloud_assistant_status  # noqa: E501
 
@@ -2382,6 +2742,21 @@ class ECSApi(object):
             (data) = self.describe_commands_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def describe_commands_async(self, body, **kwargs):  # noqa: E501
+        """describe_commands  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.describe_commands_async(body)
+
+        :param DescribeCommandsRequest body: (required)
+        :return: DescribeCommandsResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`describe_commands_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.describe_commands_with_http_info(body, **kwargs)  # noqa: E501
+
     def describe_commands_with_http_info(self, body, **kwargs):  # noqa: E501
         """describe_commands  # noqa: E501
 
@@ -2479,6 +2854,21 @@ class ECSApi(object):
             (data) = self.describe_dedicated_host_clusters_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def describe_dedicated_host_clusters_async(self, body, **kwargs):  # noqa: E501
+        """describe_dedicated_host_clusters  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.describe_dedicated_host_clusters_async(body)
+
+        :param DescribeDedicatedHostClustersRequest body: (required)
+        :return: DescribeDedicatedHostClustersResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`describe_dedicated_host_clusters_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.describe_dedicated_host_clusters_with_http_info(body, **kwargs)  # noqa: E501
+
     def describe_dedicated_host_clusters_with_http_info(self, body, **kwargs):  # noqa: E501
         """describe_dedicated_host_clusters  # noqa: E501
 
@@ -2576,6 +2966,21 @@ class ECSApi(object):
             (data) = self.describe_dedicated_host_types_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def describe_dedicated_host_types_async(self, body, **kwargs):  # noqa: E501
+        """describe_dedicated_host_types  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.describe_dedicated_host_types_async(body)
+
+        :param DescribeDedicatedHostTypesRequest body: (required)
+        :return: DescribeDedicatedHostTypesResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`describe_dedicated_host_types_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.describe_dedicated_host_types_with_http_info(body, **kwargs)  # noqa: E501
+
     def describe_dedicated_host_types_with_http_info(self, body, **kwargs):  # noqa: E501
         """describe_dedicated_host_types  # noqa: E501
 
@@ -2673,6 +3078,21 @@ class ECSApi(object):
             (data) = self.describe_dedicated_hosts_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def describe_dedicated_hosts_async(self, body, **kwargs):  # noqa: E501
+        """describe_dedicated_hosts  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.describe_dedicated_hosts_async(body)
+
+        :param DescribeDedicatedHostsRequest body: (required)
+        :return: DescribeDedicatedHostsResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`describe_dedicated_hosts_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.describe_dedicated_hosts_with_http_info(body, **kwargs)  # noqa: E501
+
     def describe_dedicated_hosts_with_http_info(self, body, **kwargs):  # noqa: E501
         """describe_dedicated_hosts  # noqa: E501
 
@@ -2770,6 +3190,21 @@ class ECSApi(object):
             (data) = self.describe_deployment_set_supported_instance_type_family_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def describe_deployment_set_supported_instance_type_family_async(self, body, **kwargs):  # noqa: E501
+        """describe_deployment_set_supported_instance_type_family  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.describe_deployment_set_supported_instance_type_family_async(body)
+
+        :param DescribeDeploymentSetSupportedInstanceTypeFamilyRequest body: (required)
+        :return: DescribeDeploymentSetSupportedInstanceTypeFamilyResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`describe_deployment_set_supported_instance_type_family_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.describe_deployment_set_supported_instance_type_family_with_http_info(body, **kwargs)  # noqa: E501
+
     def describe_deployment_set_supported_instance_type_family_with_http_info(self, body, **kwargs):  # noqa: E501
         """describe_deployment_set_supported_instance_type_family  # noqa: E501
 
@@ -2867,6 +3302,21 @@ class ECSApi(object):
             (data) = self.describe_deployment_sets_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def describe_deployment_sets_async(self, body, **kwargs):  # noqa: E501
+        """describe_deployment_sets  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.describe_deployment_sets_async(body)
+
+        :param DescribeDeploymentSetsRequest body: (required)
+        :return: DescribeDeploymentSetsResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`describe_deployment_sets_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.describe_deployment_sets_with_http_info(body, **kwargs)  # noqa: E501
+
     def describe_deployment_sets_with_http_info(self, body, **kwargs):  # noqa: E501
         """describe_deployment_sets  # noqa: E501
 
@@ -2964,6 +3414,21 @@ class ECSApi(object):
             (data) = self.describe_event_types_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def describe_event_types_async(self, body, **kwargs):  # noqa: E501
+        """describe_event_types  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.describe_event_types_async(body)
+
+        :param DescribeEventTypesRequest body: (required)
+        :return: DescribeEventTypesResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`describe_event_types_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.describe_event_types_with_http_info(body, **kwargs)  # noqa: E501
+
     def describe_event_types_with_http_info(self, body, **kwargs):  # noqa: E501
         """describe_event_types  # noqa: E501
 
@@ -3061,6 +3526,21 @@ class ECSApi(object):
             (data) = self.describe_image_share_permission_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def describe_image_share_permission_async(self, body, **kwargs):  # noqa: E501
+        """describe_image_share_permission  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.describe_image_share_permission_async(body)
+
+        :param DescribeImageSharePermissionRequest body: (required)
+        :return: DescribeImageSharePermissionResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`describe_image_share_permission_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.describe_image_share_permission_with_http_info(body, **kwargs)  # noqa: E501
+
     def describe_image_share_permission_with_http_info(self, body, **kwargs):  # noqa: E501
         """describe_image_share_permission  # noqa: E501
 
@@ -3158,6 +3638,21 @@ class ECSApi(object):
             (data) = self.describe_images_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def describe_images_async(self, body, **kwargs):  # noqa: E501
+        """describe_images  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.describe_images_async(body)
+
+        :param DescribeImagesRequest body: (required)
+        :return: DescribeImagesResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`describe_images_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.describe_images_with_http_info(body, **kwargs)  # noqa: E501
+
     def describe_images_with_http_info(self, body, **kwargs):  # noqa: E501
         """describe_images  # noqa: E501
 
@@ -3255,6 +3750,21 @@ class ECSApi(object):
             (data) = self.describe_instance_ecs_terminal_url_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def describe_instance_ecs_terminal_url_async(self, body, **kwargs):  # noqa: E501
+        """describe_instance_ecs_terminal_url  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.describe_instance_ecs_terminal_url_async(body)
+
+        :param DescribeInstanceECSTerminalUrlRequest body: (required)
+        :return: DescribeInstanceECSTerminalUrlResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`describe_instance_ecs_terminal_url_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.describe_instance_ecs_terminal_url_with_http_info(body, **kwargs)  # noqa: E501
+
     def describe_instance_ecs_terminal_url_with_http_info(self, body, **kwargs):  # noqa: E501
         """describe_instance_ecs_terminal_url  # noqa: E501
 
@@ -3352,6 +3862,21 @@ class ECSApi(object):
             (data) = self.describe_instance_type_families_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def describe_instance_type_families_async(self, body, **kwargs):  # noqa: E501
+        """describe_instance_type_families  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.describe_instance_type_families_async(body)
+
+        :param DescribeInstanceTypeFamiliesRequest body: (required)
+        :return: DescribeInstanceTypeFamiliesResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`describe_instance_type_families_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.describe_instance_type_families_with_http_info(body, **kwargs)  # noqa: E501
+
     def describe_instance_type_families_with_http_info(self, body, **kwargs):  # noqa: E501
         """describe_instance_type_families  # noqa: E501
 
@@ -3449,6 +3974,21 @@ class ECSApi(object):
             (data) = self.describe_instance_types_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def describe_instance_types_async(self, body, **kwargs):  # noqa: E501
+        """describe_instance_types  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.describe_instance_types_async(body)
+
+        :param DescribeInstanceTypesRequest body: (required)
+        :return: DescribeInstanceTypesResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`describe_instance_types_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.describe_instance_types_with_http_info(body, **kwargs)  # noqa: E501
+
     def describe_instance_types_with_http_info(self, body, **kwargs):  # noqa: E501
         """describe_instance_types  # noqa: E501
 
@@ -3546,6 +4086,21 @@ class ECSApi(object):
             (data) = self.describe_instance_vnc_url_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def describe_instance_vnc_url_async(self, body, **kwargs):  # noqa: E501
+        """describe_instance_vnc_url  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.describe_instance_vnc_url_async(body)
+
+        :param DescribeInstanceVncUrlRequest body: (required)
+        :return: DescribeInstanceVncUrlResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`describe_instance_vnc_url_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.describe_instance_vnc_url_with_http_info(body, **kwargs)  # noqa: E501
+
     def describe_instance_vnc_url_with_http_info(self, body, **kwargs):  # noqa: E501
         """describe_instance_vnc_url  # noqa: E501
 
@@ -3643,6 +4198,21 @@ class ECSApi(object):
             (data) = self.describe_instances_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def describe_instances_async(self, body, **kwargs):  # noqa: E501
+        """describe_instances  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.describe_instances_async(body)
+
+        :param DescribeInstancesRequest body: (required)
+        :return: DescribeInstancesResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`describe_instances_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.describe_instances_with_http_info(body, **kwargs)  # noqa: E501
+
     def describe_instances_with_http_info(self, body, **kwargs):  # noqa: E501
         """describe_instances  # noqa: E501
 
@@ -3740,6 +4310,21 @@ class ECSApi(object):
             (data) = self.describe_instances_iam_roles_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def describe_instances_iam_roles_async(self, body, **kwargs):  # noqa: E501
+        """describe_instances_iam_roles  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.describe_instances_iam_roles_async(body)
+
+        :param DescribeInstancesIamRolesRequest body: (required)
+        :return: DescribeInstancesIamRolesResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`describe_instances_iam_roles_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.describe_instances_iam_roles_with_http_info(body, **kwargs)  # noqa: E501
+
     def describe_instances_iam_roles_with_http_info(self, body, **kwargs):  # noqa: E501
         """describe_instances_iam_roles  # noqa: E501
 
@@ -3837,6 +4422,21 @@ class ECSApi(object):
             (data) = self.describe_invocation_instances_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def describe_invocation_instances_async(self, body, **kwargs):  # noqa: E501
+        """describe_invocation_instances  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.describe_invocation_instances_async(body)
+
+        :param DescribeInvocationInstancesRequest body: (required)
+        :return: DescribeInvocationInstancesResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`describe_invocation_instances_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.describe_invocation_instances_with_http_info(body, **kwargs)  # noqa: E501
+
     def describe_invocation_instances_with_http_info(self, body, **kwargs):  # noqa: E501
         """describe_invocation_instances  # noqa: E501
 
@@ -3934,6 +4534,21 @@ class ECSApi(object):
             (data) = self.describe_invocation_results_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def describe_invocation_results_async(self, body, **kwargs):  # noqa: E501
+        """describe_invocation_results  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.describe_invocation_results_async(body)
+
+        :param DescribeInvocationResultsRequest body: (required)
+        :return: DescribeInvocationResultsResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`describe_invocation_results_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.describe_invocation_results_with_http_info(body, **kwargs)  # noqa: E501
+
     def describe_invocation_results_with_http_info(self, body, **kwargs):  # noqa: E501
         """describe_invocation_results  # noqa: E501
 
@@ -4031,6 +4646,21 @@ class ECSApi(object):
             (data) = self.describe_invocations_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def describe_invocations_async(self, body, **kwargs):  # noqa: E501
+        """describe_invocations  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.describe_invocations_async(body)
+
+        :param DescribeInvocationsRequest body: (required)
+        :return: DescribeInvocationsResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`describe_invocations_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.describe_invocations_with_http_info(body, **kwargs)  # noqa: E501
+
     def describe_invocations_with_http_info(self, body, **kwargs):  # noqa: E501
         """describe_invocations  # noqa: E501
 
@@ -4128,6 +4758,21 @@ class ECSApi(object):
             (data) = self.describe_key_pairs_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def describe_key_pairs_async(self, body, **kwargs):  # noqa: E501
+        """describe_key_pairs  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.describe_key_pairs_async(body)
+
+        :param DescribeKeyPairsRequest body: (required)
+        :return: DescribeKeyPairsResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`describe_key_pairs_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.describe_key_pairs_with_http_info(body, **kwargs)  # noqa: E501
+
     def describe_key_pairs_with_http_info(self, body, **kwargs):  # noqa: E501
         """describe_key_pairs  # noqa: E501
 
@@ -4225,6 +4870,21 @@ class ECSApi(object):
             (data) = self.describe_regions_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def describe_regions_async(self, body, **kwargs):  # noqa: E501
+        """describe_regions  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.describe_regions_async(body)
+
+        :param DescribeRegionsRequest body: (required)
+        :return: DescribeRegionsResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`describe_regions_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.describe_regions_with_http_info(body, **kwargs)  # noqa: E501
+
     def describe_regions_with_http_info(self, body, **kwargs):  # noqa: E501
         """describe_regions  # noqa: E501
 
@@ -4322,6 +4982,21 @@ class ECSApi(object):
             (data) = self.describe_reserved_instances_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def describe_reserved_instances_async(self, body, **kwargs):  # noqa: E501
+        """describe_reserved_instances  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.describe_reserved_instances_async(body)
+
+        :param DescribeReservedInstancesRequest body: (required)
+        :return: DescribeReservedInstancesResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`describe_reserved_instances_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.describe_reserved_instances_with_http_info(body, **kwargs)  # noqa: E501
+
     def describe_reserved_instances_with_http_info(self, body, **kwargs):  # noqa: E501
         """describe_reserved_instances  # noqa: E501
 
@@ -4419,6 +5094,21 @@ class ECSApi(object):
             (data) = self.describe_scheduled_instance_stock_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def describe_scheduled_instance_stock_async(self, body, **kwargs):  # noqa: E501
+        """describe_scheduled_instance_stock  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.describe_scheduled_instance_stock_async(body)
+
+        :param DescribeScheduledInstanceStockRequest body: (required)
+        :return: DescribeScheduledInstanceStockResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`describe_scheduled_instance_stock_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.describe_scheduled_instance_stock_with_http_info(body, **kwargs)  # noqa: E501
+
     def describe_scheduled_instance_stock_with_http_info(self, body, **kwargs):  # noqa: E501
         """describe_scheduled_instance_stock  # noqa: E501
 
@@ -4516,6 +5206,21 @@ class ECSApi(object):
             (data) = self.describe_scheduled_instances_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def describe_scheduled_instances_async(self, body, **kwargs):  # noqa: E501
+        """describe_scheduled_instances  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.describe_scheduled_instances_async(body)
+
+        :param DescribeScheduledInstancesRequest body: (required)
+        :return: DescribeScheduledInstancesResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`describe_scheduled_instances_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.describe_scheduled_instances_with_http_info(body, **kwargs)  # noqa: E501
+
     def describe_scheduled_instances_with_http_info(self, body, **kwargs):  # noqa: E501
         """describe_scheduled_instances  # noqa: E501
 
@@ -4613,6 +5318,21 @@ class ECSApi(object):
             (data) = self.describe_spot_advice_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def describe_spot_advice_async(self, body, **kwargs):  # noqa: E501
+        """describe_spot_advice  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.describe_spot_advice_async(body)
+
+        :param DescribeSpotAdviceRequest body: (required)
+        :return: DescribeSpotAdviceResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`describe_spot_advice_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.describe_spot_advice_with_http_info(body, **kwargs)  # noqa: E501
+
     def describe_spot_advice_with_http_info(self, body, **kwargs):  # noqa: E501
         """describe_spot_advice  # noqa: E501
 
@@ -4710,6 +5430,21 @@ class ECSApi(object):
             (data) = self.describe_spot_price_history_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def describe_spot_price_history_async(self, body, **kwargs):  # noqa: E501
+        """describe_spot_price_history  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.describe_spot_price_history_async(body)
+
+        :param DescribeSpotPriceHistoryRequest body: (required)
+        :return: DescribeSpotPriceHistoryResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`describe_spot_price_history_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.describe_spot_price_history_with_http_info(body, **kwargs)  # noqa: E501
+
     def describe_spot_price_history_with_http_info(self, body, **kwargs):  # noqa: E501
         """describe_spot_price_history  # noqa: E501
 
@@ -4807,6 +5542,21 @@ class ECSApi(object):
             (data) = self.describe_subscriptions_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def describe_subscriptions_async(self, body, **kwargs):  # noqa: E501
+        """describe_subscriptions  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.describe_subscriptions_async(body)
+
+        :param DescribeSubscriptionsRequest body: (required)
+        :return: DescribeSubscriptionsResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`describe_subscriptions_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.describe_subscriptions_with_http_info(body, **kwargs)  # noqa: E501
+
     def describe_subscriptions_with_http_info(self, body, **kwargs):  # noqa: E501
         """describe_subscriptions  # noqa: E501
 
@@ -4904,6 +5654,21 @@ class ECSApi(object):
             (data) = self.describe_system_events_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def describe_system_events_async(self, body, **kwargs):  # noqa: E501
+        """describe_system_events  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.describe_system_events_async(body)
+
+        :param DescribeSystemEventsRequest body: (required)
+        :return: DescribeSystemEventsResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`describe_system_events_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.describe_system_events_with_http_info(body, **kwargs)  # noqa: E501
+
     def describe_system_events_with_http_info(self, body, **kwargs):  # noqa: E501
         """describe_system_events  # noqa: E501
 
@@ -5001,6 +5766,21 @@ class ECSApi(object):
             (data) = self.describe_tags_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def describe_tags_async(self, body, **kwargs):  # noqa: E501
+        """describe_tags  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.describe_tags_async(body)
+
+        :param DescribeTagsRequest body: (required)
+        :return: DescribeTagsResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`describe_tags_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.describe_tags_with_http_info(body, **kwargs)  # noqa: E501
+
     def describe_tags_with_http_info(self, body, **kwargs):  # noqa: E501
         """describe_tags  # noqa: E501
 
@@ -5098,6 +5878,21 @@ class ECSApi(object):
             (data) = self.describe_tasks_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def describe_tasks_async(self, body, **kwargs):  # noqa: E501
+        """describe_tasks  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.describe_tasks_async(body)
+
+        :param DescribeTasksRequest body: (required)
+        :return: DescribeTasksResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`describe_tasks_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.describe_tasks_with_http_info(body, **kwargs)  # noqa: E501
+
     def describe_tasks_with_http_info(self, body, **kwargs):  # noqa: E501
         """describe_tasks  # noqa: E501
 
@@ -5195,6 +5990,21 @@ class ECSApi(object):
             (data) = self.describe_user_data_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def describe_user_data_async(self, body, **kwargs):  # noqa: E501
+        """describe_user_data  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.describe_user_data_async(body)
+
+        :param DescribeUserDataRequest body: (required)
+        :return: DescribeUserDataResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`describe_user_data_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.describe_user_data_with_http_info(body, **kwargs)  # noqa: E501
+
     def describe_user_data_with_http_info(self, body, **kwargs):  # noqa: E501
         """describe_user_data  # noqa: E501
 
@@ -5292,6 +6102,21 @@ class ECSApi(object):
             (data) = self.describe_zones_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def describe_zones_async(self, body, **kwargs):  # noqa: E501
+        """describe_zones  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.describe_zones_async(body)
+
+        :param DescribeZonesRequest body: (required)
+        :return: DescribeZonesResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`describe_zones_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.describe_zones_with_http_info(body, **kwargs)  # noqa: E501
+
     def describe_zones_with_http_info(self, body, **kwargs):  # noqa: E501
         """describe_zones  # noqa: E501
 
@@ -5389,6 +6214,21 @@ class ECSApi(object):
             (data) = self.detach_key_pair_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def detach_key_pair_async(self, body, **kwargs):  # noqa: E501
+        """detach_key_pair  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.detach_key_pair_async(body)
+
+        :param DetachKeyPairRequest body: (required)
+        :return: DetachKeyPairResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`detach_key_pair_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.detach_key_pair_with_http_info(body, **kwargs)  # noqa: E501
+
     def detach_key_pair_with_http_info(self, body, **kwargs):  # noqa: E501
         """detach_key_pair  # noqa: E501
 
@@ -5486,6 +6326,21 @@ class ECSApi(object):
             (data) = self.detect_image_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def detect_image_async(self, body, **kwargs):  # noqa: E501
+        """detect_image  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.detect_image_async(body)
+
+        :param DetectImageRequest body: (required)
+        :return: DetectImageResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`detect_image_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.detect_image_with_http_info(body, **kwargs)  # noqa: E501
+
     def detect_image_with_http_info(self, body, **kwargs):  # noqa: E501
         """detect_image  # noqa: E501
 
@@ -5583,6 +6438,21 @@ class ECSApi(object):
             (data) = self.disassociate_instances_iam_role_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def disassociate_instances_iam_role_async(self, body, **kwargs):  # noqa: E501
+        """disassociate_instances_iam_role  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.disassociate_instances_iam_role_async(body)
+
+        :param DisassociateInstancesIamRoleRequest body: (required)
+        :return: DisassociateInstancesIamRoleResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`disassociate_instances_iam_role_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.disassociate_instances_iam_role_with_http_info(body, **kwargs)  # noqa: E501
+
     def disassociate_instances_iam_role_with_http_info(self, body, **kwargs):  # noqa: E501
         """disassociate_instances_iam_role  # noqa: E501
 
@@ -5680,6 +6550,21 @@ class ECSApi(object):
             (data) = self.export_image_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def export_image_async(self, body, **kwargs):  # noqa: E501
+        """export_image  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.export_image_async(body)
+
+        :param ExportImageRequest body: (required)
+        :return: ExportImageResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`export_image_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.export_image_with_http_info(body, **kwargs)  # noqa: E501
+
     def export_image_with_http_info(self, body, **kwargs):  # noqa: E501
         """export_image  # noqa: E501
 
@@ -5777,6 +6662,21 @@ class ECSApi(object):
             (data) = self.get_console_output_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def get_console_output_async(self, body, **kwargs):  # noqa: E501
+        """get_console_output  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.get_console_output_async(body)
+
+        :param GetConsoleOutputRequest body: (required)
+        :return: GetConsoleOutputResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`get_console_output_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.get_console_output_with_http_info(body, **kwargs)  # noqa: E501
+
     def get_console_output_with_http_info(self, body, **kwargs):  # noqa: E501
         """get_console_output  # noqa: E501
 
@@ -5874,6 +6774,21 @@ class ECSApi(object):
             (data) = self.get_console_screenshot_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def get_console_screenshot_async(self, body, **kwargs):  # noqa: E501
+        """get_console_screenshot  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.get_console_screenshot_async(body)
+
+        :param GetConsoleScreenshotRequest body: (required)
+        :return: GetConsoleScreenshotResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`get_console_screenshot_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.get_console_screenshot_with_http_info(body, **kwargs)  # noqa: E501
+
     def get_console_screenshot_with_http_info(self, body, **kwargs):  # noqa: E501
         """get_console_screenshot  # noqa: E501
 
@@ -5971,6 +6886,21 @@ class ECSApi(object):
             (data) = self.get_scheduled_instance_latest_release_at_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def get_scheduled_instance_latest_release_at_async(self, body, **kwargs):  # noqa: E501
+        """get_scheduled_instance_latest_release_at  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.get_scheduled_instance_latest_release_at_async(body)
+
+        :param GetScheduledInstanceLatestReleaseAtRequest body: (required)
+        :return: GetScheduledInstanceLatestReleaseAtResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`get_scheduled_instance_latest_release_at_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.get_scheduled_instance_latest_release_at_with_http_info(body, **kwargs)  # noqa: E501
+
     def get_scheduled_instance_latest_release_at_with_http_info(self, body, **kwargs):  # noqa: E501
         """get_scheduled_instance_latest_release_at  # noqa: E501
 
@@ -6068,6 +6998,21 @@ class ECSApi(object):
             (data) = self.import_image_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def import_image_async(self, body, **kwargs):  # noqa: E501
+        """import_image  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.import_image_async(body)
+
+        :param ImportImageRequest body: (required)
+        :return: ImportImageResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`import_image_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.import_image_with_http_info(body, **kwargs)  # noqa: E501
+
     def import_image_with_http_info(self, body, **kwargs):  # noqa: E501
         """import_image  # noqa: E501
 
@@ -6165,6 +7110,21 @@ class ECSApi(object):
             (data) = self.import_key_pair_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def import_key_pair_async(self, body, **kwargs):  # noqa: E501
+        """import_key_pair  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.import_key_pair_async(body)
+
+        :param ImportKeyPairRequest body: (required)
+        :return: ImportKeyPairResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`import_key_pair_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.import_key_pair_with_http_info(body, **kwargs)  # noqa: E501
+
     def import_key_pair_with_http_info(self, body, **kwargs):  # noqa: E501
         """import_key_pair  # noqa: E501
 
@@ -6262,6 +7222,21 @@ class ECSApi(object):
             (data) = self.install_cloud_assistant_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def install_cloud_assistant_async(self, body, **kwargs):  # noqa: E501
+        """install_cloud_assistant  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.install_cloud_assistant_async(body)
+
+        :param InstallCloudAssistantRequest body: (required)
+        :return: InstallCloudAssistantResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`install_cloud_assistant_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.install_cloud_assistant_with_http_info(body, **kwargs)  # noqa: E501
+
     def install_cloud_assistant_with_http_info(self, body, **kwargs):  # noqa: E501
         """install_cloud_assistant  # noqa: E501
 
@@ -6359,6 +7334,21 @@ class ECSApi(object):
             (data) = self.invoke_command_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def invoke_command_async(self, body, **kwargs):  # noqa: E501
+        """invoke_command  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.invoke_command_async(body)
+
+        :param InvokeCommandRequest body: (required)
+        :return: InvokeCommandResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`invoke_command_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.invoke_command_with_http_info(body, **kwargs)  # noqa: E501
+
     def invoke_command_with_http_info(self, body, **kwargs):  # noqa: E501
         """invoke_command  # noqa: E501
 
@@ -6456,6 +7446,21 @@ class ECSApi(object):
             (data) = self.list_tags_for_resources_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def list_tags_for_resources_async(self, body, **kwargs):  # noqa: E501
+        """list_tags_for_resources  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.list_tags_for_resources_async(body)
+
+        :param ListTagsForResourcesRequest body: (required)
+        :return: ListTagsForResourcesResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`list_tags_for_resources_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.list_tags_for_resources_with_http_info(body, **kwargs)  # noqa: E501
+
     def list_tags_for_resources_with_http_info(self, body, **kwargs):  # noqa: E501
         """list_tags_for_resources  # noqa: E501
 
@@ -6553,6 +7558,21 @@ class ECSApi(object):
             (data) = self.modify_command_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def modify_command_async(self, body, **kwargs):  # noqa: E501
+        """modify_command  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.modify_command_async(body)
+
+        :param ModifyCommandRequest body: (required)
+        :return: ModifyCommandResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`modify_command_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.modify_command_with_http_info(body, **kwargs)  # noqa: E501
+
     def modify_command_with_http_info(self, body, **kwargs):  # noqa: E501
         """modify_command  # noqa: E501
 
@@ -6650,6 +7670,21 @@ class ECSApi(object):
             (data) = self.modify_dedicated_host_attribute_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def modify_dedicated_host_attribute_async(self, body, **kwargs):  # noqa: E501
+        """modify_dedicated_host_attribute  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.modify_dedicated_host_attribute_async(body)
+
+        :param ModifyDedicatedHostAttributeRequest body: (required)
+        :return: ModifyDedicatedHostAttributeResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`modify_dedicated_host_attribute_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.modify_dedicated_host_attribute_with_http_info(body, **kwargs)  # noqa: E501
+
     def modify_dedicated_host_attribute_with_http_info(self, body, **kwargs):  # noqa: E501
         """modify_dedicated_host_attribute  # noqa: E501
 
@@ -6747,6 +7782,21 @@ class ECSApi(object):
             (data) = self.modify_dedicated_host_cluster_attribute_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def modify_dedicated_host_cluster_attribute_async(self, body, **kwargs):  # noqa: E501
+        """modify_dedicated_host_cluster_attribute  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.modify_dedicated_host_cluster_attribute_async(body)
+
+        :param ModifyDedicatedHostClusterAttributeRequest body: (required)
+        :return: ModifyDedicatedHostClusterAttributeResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`modify_dedicated_host_cluster_attribute_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.modify_dedicated_host_cluster_attribute_with_http_info(body, **kwargs)  # noqa: E501
+
     def modify_dedicated_host_cluster_attribute_with_http_info(self, body, **kwargs):  # noqa: E501
         """modify_dedicated_host_cluster_attribute  # noqa: E501
 
@@ -6844,6 +7894,21 @@ class ECSApi(object):
             (data) = self.modify_deployment_set_attribute_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def modify_deployment_set_attribute_async(self, body, **kwargs):  # noqa: E501
+        """modify_deployment_set_attribute  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.modify_deployment_set_attribute_async(body)
+
+        :param ModifyDeploymentSetAttributeRequest body: (required)
+        :return: ModifyDeploymentSetAttributeResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`modify_deployment_set_attribute_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.modify_deployment_set_attribute_with_http_info(body, **kwargs)  # noqa: E501
+
     def modify_deployment_set_attribute_with_http_info(self, body, **kwargs):  # noqa: E501
         """modify_deployment_set_attribute  # noqa: E501
 
@@ -6941,6 +8006,21 @@ class ECSApi(object):
             (data) = self.modify_image_attribute_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def modify_image_attribute_async(self, body, **kwargs):  # noqa: E501
+        """modify_image_attribute  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.modify_image_attribute_async(body)
+
+        :param ModifyImageAttributeRequest body: (required)
+        :return: ModifyImageAttributeResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`modify_image_attribute_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.modify_image_attribute_with_http_info(body, **kwargs)  # noqa: E501
+
     def modify_image_attribute_with_http_info(self, body, **kwargs):  # noqa: E501
         """modify_image_attribute  # noqa: E501
 
@@ -7038,6 +8118,21 @@ class ECSApi(object):
             (data) = self.modify_image_share_permission_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def modify_image_share_permission_async(self, body, **kwargs):  # noqa: E501
+        """modify_image_share_permission  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.modify_image_share_permission_async(body)
+
+        :param ModifyImageSharePermissionRequest body: (required)
+        :return: ModifyImageSharePermissionResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`modify_image_share_permission_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.modify_image_share_permission_with_http_info(body, **kwargs)  # noqa: E501
+
     def modify_image_share_permission_with_http_info(self, body, **kwargs):  # noqa: E501
         """modify_image_share_permission  # noqa: E501
 
@@ -7135,6 +8230,21 @@ class ECSApi(object):
             (data) = self.modify_instance_attribute_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def modify_instance_attribute_async(self, body, **kwargs):  # noqa: E501
+        """modify_instance_attribute  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.modify_instance_attribute_async(body)
+
+        :param ModifyInstanceAttributeRequest body: (required)
+        :return: ModifyInstanceAttributeResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`modify_instance_attribute_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.modify_instance_attribute_with_http_info(body, **kwargs)  # noqa: E501
+
     def modify_instance_attribute_with_http_info(self, body, **kwargs):  # noqa: E501
         """modify_instance_attribute  # noqa: E501
 
@@ -7232,6 +8342,21 @@ class ECSApi(object):
             (data) = self.modify_instance_charge_type_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def modify_instance_charge_type_async(self, body, **kwargs):  # noqa: E501
+        """modify_instance_charge_type  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.modify_instance_charge_type_async(body)
+
+        :param ModifyInstanceChargeTypeRequest body: (required)
+        :return: ModifyInstanceChargeTypeResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`modify_instance_charge_type_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.modify_instance_charge_type_with_http_info(body, **kwargs)  # noqa: E501
+
     def modify_instance_charge_type_with_http_info(self, body, **kwargs):  # noqa: E501
         """modify_instance_charge_type  # noqa: E501
 
@@ -7329,6 +8454,21 @@ class ECSApi(object):
             (data) = self.modify_instance_deployment_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def modify_instance_deployment_async(self, body, **kwargs):  # noqa: E501
+        """modify_instance_deployment  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.modify_instance_deployment_async(body)
+
+        :param ModifyInstanceDeploymentRequest body: (required)
+        :return: ModifyInstanceDeploymentResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`modify_instance_deployment_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.modify_instance_deployment_with_http_info(body, **kwargs)  # noqa: E501
+
     def modify_instance_deployment_with_http_info(self, body, **kwargs):  # noqa: E501
         """modify_instance_deployment  # noqa: E501
 
@@ -7426,6 +8566,21 @@ class ECSApi(object):
             (data) = self.modify_instance_placement_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def modify_instance_placement_async(self, body, **kwargs):  # noqa: E501
+        """modify_instance_placement  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.modify_instance_placement_async(body)
+
+        :param ModifyInstancePlacementRequest body: (required)
+        :return: ModifyInstancePlacementResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`modify_instance_placement_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.modify_instance_placement_with_http_info(body, **kwargs)  # noqa: E501
+
     def modify_instance_placement_with_http_info(self, body, **kwargs):  # noqa: E501
         """modify_instance_placement  # noqa: E501
 
@@ -7523,6 +8678,21 @@ class ECSApi(object):
             (data) = self.modify_instance_spec_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def modify_instance_spec_async(self, body, **kwargs):  # noqa: E501
+        """modify_instance_spec  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.modify_instance_spec_async(body)
+
+        :param ModifyInstanceSpecRequest body: (required)
+        :return: ModifyInstanceSpecResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`modify_instance_spec_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.modify_instance_spec_with_http_info(body, **kwargs)  # noqa: E501
+
     def modify_instance_spec_with_http_info(self, body, **kwargs):  # noqa: E501
         """modify_instance_spec  # noqa: E501
 
@@ -7620,6 +8790,21 @@ class ECSApi(object):
             (data) = self.modify_instance_vpc_attribute_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def modify_instance_vpc_attribute_async(self, body, **kwargs):  # noqa: E501
+        """modify_instance_vpc_attribute  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.modify_instance_vpc_attribute_async(body)
+
+        :param ModifyInstanceVpcAttributeRequest body: (required)
+        :return: ModifyInstanceVpcAttributeResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`modify_instance_vpc_attribute_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.modify_instance_vpc_attribute_with_http_info(body, **kwargs)  # noqa: E501
+
     def modify_instance_vpc_attribute_with_http_info(self, body, **kwargs):  # noqa: E501
         """modify_instance_vpc_attribute  # noqa: E501
 
@@ -7717,6 +8902,21 @@ class ECSApi(object):
             (data) = self.modify_key_pair_attribute_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def modify_key_pair_attribute_async(self, body, **kwargs):  # noqa: E501
+        """modify_key_pair_attribute  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.modify_key_pair_attribute_async(body)
+
+        :param ModifyKeyPairAttributeRequest body: (required)
+        :return: ModifyKeyPairAttributeResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`modify_key_pair_attribute_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.modify_key_pair_attribute_with_http_info(body, **kwargs)  # noqa: E501
+
     def modify_key_pair_attribute_with_http_info(self, body, **kwargs):  # noqa: E501
         """modify_key_pair_attribute  # noqa: E501
 
@@ -7814,6 +9014,21 @@ class ECSApi(object):
             (data) = self.modify_reserved_instances_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def modify_reserved_instances_async(self, body, **kwargs):  # noqa: E501
+        """modify_reserved_instances  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.modify_reserved_instances_async(body)
+
+        :param ModifyReservedInstancesRequest body: (required)
+        :return: ModifyReservedInstancesResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`modify_reserved_instances_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.modify_reserved_instances_with_http_info(body, **kwargs)  # noqa: E501
+
     def modify_reserved_instances_with_http_info(self, body, **kwargs):  # noqa: E501
         """modify_reserved_instances  # noqa: E501
 
@@ -7911,6 +9126,21 @@ class ECSApi(object):
             (data) = self.modify_subscription_event_types_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def modify_subscription_event_types_async(self, body, **kwargs):  # noqa: E501
+        """modify_subscription_event_types  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.modify_subscription_event_types_async(body)
+
+        :param ModifySubscriptionEventTypesRequest body: (required)
+        :return: ModifySubscriptionEventTypesResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`modify_subscription_event_types_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.modify_subscription_event_types_with_http_info(body, **kwargs)  # noqa: E501
+
     def modify_subscription_event_types_with_http_info(self, body, **kwargs):  # noqa: E501
         """modify_subscription_event_types  # noqa: E501
 
@@ -8008,6 +9238,21 @@ class ECSApi(object):
             (data) = self.purchase_reserved_instances_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def purchase_reserved_instances_async(self, body, **kwargs):  # noqa: E501
+        """purchase_reserved_instances  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.purchase_reserved_instances_async(body)
+
+        :param PurchaseReservedInstancesRequest body: (required)
+        :return: PurchaseReservedInstancesResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`purchase_reserved_instances_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.purchase_reserved_instances_with_http_info(body, **kwargs)  # noqa: E501
+
     def purchase_reserved_instances_with_http_info(self, body, **kwargs):  # noqa: E501
         """purchase_reserved_instances  # noqa: E501
 
@@ -8105,6 +9350,21 @@ class ECSApi(object):
             (data) = self.reboot_instance_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def reboot_instance_async(self, body, **kwargs):  # noqa: E501
+        """reboot_instance  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.reboot_instance_async(body)
+
+        :param RebootInstanceRequest body: (required)
+        :return: RebootInstanceResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`reboot_instance_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.reboot_instance_with_http_info(body, **kwargs)  # noqa: E501
+
     def reboot_instance_with_http_info(self, body, **kwargs):  # noqa: E501
         """reboot_instance  # noqa: E501
 
@@ -8202,6 +9462,21 @@ class ECSApi(object):
             (data) = self.reboot_instances_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def reboot_instances_async(self, body, **kwargs):  # noqa: E501
+        """reboot_instances  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.reboot_instances_async(body)
+
+        :param RebootInstancesRequest body: (required)
+        :return: RebootInstancesResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`reboot_instances_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.reboot_instances_with_http_info(body, **kwargs)  # noqa: E501
+
     def reboot_instances_with_http_info(self, body, **kwargs):  # noqa: E501
         """reboot_instances  # noqa: E501
 
@@ -8299,6 +9574,21 @@ class ECSApi(object):
             (data) = self.redeploy_dedicated_host_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def redeploy_dedicated_host_async(self, body, **kwargs):  # noqa: E501
+        """redeploy_dedicated_host  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.redeploy_dedicated_host_async(body)
+
+        :param RedeployDedicatedHostRequest body: (required)
+        :return: RedeployDedicatedHostResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`redeploy_dedicated_host_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.redeploy_dedicated_host_with_http_info(body, **kwargs)  # noqa: E501
+
     def redeploy_dedicated_host_with_http_info(self, body, **kwargs):  # noqa: E501
         """redeploy_dedicated_host  # noqa: E501
 
@@ -8396,6 +9686,21 @@ class ECSApi(object):
             (data) = self.renew_dedicated_host_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def renew_dedicated_host_async(self, body, **kwargs):  # noqa: E501
+        """renew_dedicated_host  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.renew_dedicated_host_async(body)
+
+        :param RenewDedicatedHostRequest body: (required)
+        :return: RenewDedicatedHostResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`renew_dedicated_host_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.renew_dedicated_host_with_http_info(body, **kwargs)  # noqa: E501
+
     def renew_dedicated_host_with_http_info(self, body, **kwargs):  # noqa: E501
         """renew_dedicated_host  # noqa: E501
 
@@ -8493,6 +9798,21 @@ class ECSApi(object):
             (data) = self.renew_instance_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def renew_instance_async(self, body, **kwargs):  # noqa: E501
+        """renew_instance  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.renew_instance_async(body)
+
+        :param RenewInstanceRequest body: (required)
+        :return: RenewInstanceResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`renew_instance_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.renew_instance_with_http_info(body, **kwargs)  # noqa: E501
+
     def renew_instance_with_http_info(self, body, **kwargs):  # noqa: E501
         """renew_instance  # noqa: E501
 
@@ -8590,6 +9910,21 @@ class ECSApi(object):
             (data) = self.replace_system_volume_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def replace_system_volume_async(self, body, **kwargs):  # noqa: E501
+        """replace_system_volume  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.replace_system_volume_async(body)
+
+        :param ReplaceSystemVolumeRequest body: (required)
+        :return: ReplaceSystemVolumeResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`replace_system_volume_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.replace_system_volume_with_http_info(body, **kwargs)  # noqa: E501
+
     def replace_system_volume_with_http_info(self, body, **kwargs):  # noqa: E501
         """replace_system_volume  # noqa: E501
 
@@ -8687,6 +10022,21 @@ class ECSApi(object):
             (data) = self.run_command_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def run_command_async(self, body, **kwargs):  # noqa: E501
+        """run_command  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.run_command_async(body)
+
+        :param RunCommandRequest body: (required)
+        :return: RunCommandResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`run_command_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.run_command_with_http_info(body, **kwargs)  # noqa: E501
+
     def run_command_with_http_info(self, body, **kwargs):  # noqa: E501
         """run_command  # noqa: E501
 
@@ -8784,6 +10134,21 @@ class ECSApi(object):
             (data) = self.run_instances_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def run_instances_async(self, body, **kwargs):  # noqa: E501
+        """run_instances  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.run_instances_async(body)
+
+        :param RunInstancesRequest body: (required)
+        :return: RunInstancesResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`run_instances_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.run_instances_with_http_info(body, **kwargs)  # noqa: E501
+
     def run_instances_with_http_info(self, body, **kwargs):  # noqa: E501
         """run_instances  # noqa: E501
 
@@ -8881,6 +10246,21 @@ class ECSApi(object):
             (data) = self.start_instance_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def start_instance_async(self, body, **kwargs):  # noqa: E501
+        """start_instance  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.start_instance_async(body)
+
+        :param StartInstanceRequest body: (required)
+        :return: StartInstanceResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`start_instance_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.start_instance_with_http_info(body, **kwargs)  # noqa: E501
+
     def start_instance_with_http_info(self, body, **kwargs):  # noqa: E501
         """start_instance  # noqa: E501
 
@@ -8978,6 +10358,21 @@ class ECSApi(object):
             (data) = self.start_instances_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def start_instances_async(self, body, **kwargs):  # noqa: E501
+        """start_instances  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.start_instances_async(body)
+
+        :param StartInstancesRequest body: (required)
+        :return: StartInstancesResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`start_instances_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.start_instances_with_http_info(body, **kwargs)  # noqa: E501
+
     def start_instances_with_http_info(self, body, **kwargs):  # noqa: E501
         """start_instances  # noqa: E501
 
@@ -9075,6 +10470,21 @@ class ECSApi(object):
             (data) = self.stop_instance_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def stop_instance_async(self, body, **kwargs):  # noqa: E501
+        """stop_instance  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.stop_instance_async(body)
+
+        :param StopInstanceRequest body: (required)
+        :return: StopInstanceResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`stop_instance_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.stop_instance_with_http_info(body, **kwargs)  # noqa: E501
+
     def stop_instance_with_http_info(self, body, **kwargs):  # noqa: E501
         """stop_instance  # noqa: E501
 
@@ -9172,6 +10582,21 @@ class ECSApi(object):
             (data) = self.stop_instances_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def stop_instances_async(self, body, **kwargs):  # noqa: E501
+        """stop_instances  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.stop_instances_async(body)
+
+        :param StopInstancesRequest body: (required)
+        :return: StopInstancesResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`stop_instances_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.stop_instances_with_http_info(body, **kwargs)  # noqa: E501
+
     def stop_instances_with_http_info(self, body, **kwargs):  # noqa: E501
         """stop_instances  # noqa: E501
 
@@ -9269,6 +10694,21 @@ class ECSApi(object):
             (data) = self.stop_invocation_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def stop_invocation_async(self, body, **kwargs):  # noqa: E501
+        """stop_invocation  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.stop_invocation_async(body)
+
+        :param StopInvocationRequest body: (required)
+        :return: StopInvocationResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`stop_invocation_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.stop_invocation_with_http_info(body, **kwargs)  # noqa: E501
+
     def stop_invocation_with_http_info(self, body, **kwargs):  # noqa: E501
         """stop_invocation  # noqa: E501
 
@@ -9366,6 +10806,21 @@ class ECSApi(object):
             (data) = self.tag_resources_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def tag_resources_async(self, body, **kwargs):  # noqa: E501
+        """tag_resources  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.tag_resources_async(body)
+
+        :param TagResourcesRequest body: (required)
+        :return: TagResourcesResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`tag_resources_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.tag_resources_with_http_info(body, **kwargs)  # noqa: E501
+
     def tag_resources_with_http_info(self, body, **kwargs):  # noqa: E501
         """tag_resources  # noqa: E501
 
@@ -9463,6 +10918,21 @@ class ECSApi(object):
             (data) = self.uninstall_cloud_assistants_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def uninstall_cloud_assistants_async(self, body, **kwargs):  # noqa: E501
+        """uninstall_cloud_assistants  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.uninstall_cloud_assistants_async(body)
+
+        :param UninstallCloudAssistantsRequest body: (required)
+        :return: UninstallCloudAssistantsResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`uninstall_cloud_assistants_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.uninstall_cloud_assistants_with_http_info(body, **kwargs)  # noqa: E501
+
     def uninstall_cloud_assistants_with_http_info(self, body, **kwargs):  # noqa: E501
         """uninstall_cloud_assistants  # noqa: E501
 
@@ -9560,6 +11030,21 @@ class ECSApi(object):
             (data) = self.untag_resources_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def untag_resources_async(self, body, **kwargs):  # noqa: E501
+        """untag_resources  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.untag_resources_async(body)
+
+        :param UntagResourcesRequest body: (required)
+        :return: UntagResourcesResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`untag_resources_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.untag_resources_with_http_info(body, **kwargs)  # noqa: E501
+
     def untag_resources_with_http_info(self, body, **kwargs):  # noqa: E501
         """untag_resources  # noqa: E501
 
@@ -9657,6 +11142,21 @@ class ECSApi(object):
             (data) = self.update_system_events_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def update_system_events_async(self, body, **kwargs):  # noqa: E501
+        """update_system_events  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.update_system_events_async(body)
+
+        :param UpdateSystemEventsRequest body: (required)
+        :return: UpdateSystemEventsResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`update_system_events_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.update_system_events_with_http_info(body, **kwargs)  # noqa: E501
+
     def update_system_events_with_http_info(self, body, **kwargs):  # noqa: E501
         """update_system_events  # noqa: E501
 
@@ -9754,6 +11254,21 @@ class ECSApi(object):
             (data) = self.upgrade_cloud_assistants_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def upgrade_cloud_assistants_async(self, body, **kwargs):  # noqa: E501
+        """upgrade_cloud_assistants  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.upgrade_cloud_assistants_async(body)
+
+        :param UpgradeCloudAssistantsRequest body: (required)
+        :return: UpgradeCloudAssistantsResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`upgrade_cloud_assistants_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.upgrade_cloud_assistants_with_http_info(body, **kwargs)  # noqa: E501
+
     def upgrade_cloud_assistants_with_http_info(self, body, **kwargs):  # noqa: E501
         """upgrade_cloud_assistants  # noqa: E501
 
@@ -54,6 +54,21 @@ class VPCApi(object):
             (data) = self.active_flow_log_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def active_flow_log_async(self, body, **kwargs):  # noqa: E501
+        """active_flow_log  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.active_flow_log_async(body)
+
+        :param ActiveFlowLogRequest body: (required)
+        :return: ActiveFlowLogResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`active_flow_log_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.active_flow_log_with_http_info(body, **kwargs)  # noqa: E501
+
     def active_flow_log_with_http_info(self, body, **kwargs):  # noqa: E501
         """active_flow_log  # noqa: E501
 
@@ -151,6 +166,21 @@ class VPCApi(object):
             (data) = self.add_bandwidth_package_ip_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def add_bandwidth_package_ip_async(self, body, **kwargs):  # noqa: E501
+        """add_bandwidth_package_ip  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.add_bandwidth_package_ip_async(body)
+
+        :param AddBandwidthPackageIpRequest body: (required)
+        :return: AddBandwidthPackageIpResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`add_bandwidth_package_ip_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.add_bandwidth_package_ip_with_http_info(body, **kwargs)  # noqa: E501
+
     def add_bandwidth_package_ip_with_http_info(self, body, **kwargs):  # noqa: E501
         """add_bandwidth_package_ip  # noqa: E501
 
@@ -248,6 +278,21 @@ class VPCApi(object):
             (data) = self.add_ip_address_pool_cidr_block_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def add_ip_address_pool_cidr_block_async(self, body, **kwargs):  # noqa: E501
+        """add_ip_address_pool_cidr_block  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.add_ip_address_pool_cidr_block_async(body)
+
+        :param AddIpAddressPoolCidrBlockRequest body: (required)
+        :return: AddIpAddressPoolCidrBlockResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`add_ip_address_pool_cidr_block_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.add_ip_address_pool_cidr_block_with_http_info(body, **kwargs)  # noqa: E501
+
     def add_ip_address_pool_cidr_block_with_http_info(self, body, **kwargs):  # noqa: E501
         """add_ip_address_pool_cidr_block  # noqa: E501
 
@@ -345,6 +390,21 @@ class VPCApi(object):
             (data) = self.allocate_eip_address_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def allocate_eip_address_async(self, body, **kwargs):  # noqa: E501
+        """allocate_eip_address  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.allocate_eip_address_async(body)
+
+        :param AllocateEipAddressRequest body: (required)
+        :return: AllocateEipAddressResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`allocate_eip_address_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.allocate_eip_address_with_http_info(body, **kwargs)  # noqa: E501
+
     def allocate_eip_address_with_http_info(self, body, **kwargs):  # noqa: E501
         """allocate_eip_address  # noqa: E501
 
@@ -442,6 +502,21 @@ class VPCApi(object):
             (data) = self.allocate_ipv6_address_bandwidth_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def allocate_ipv6_address_bandwidth_async(self, body, **kwargs):  # noqa: E501
+        """allocate_ipv6_address_bandwidth  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.allocate_ipv6_address_bandwidth_async(body)
+
+        :param AllocateIpv6AddressBandwidthRequest body: (required)
+        :return: AllocateIpv6AddressBandwidthResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`allocate_ipv6_address_bandwidth_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.allocate_ipv6_address_bandwidth_with_http_info(body, **kwargs)  # noqa: E501
+
     def allocate_ipv6_address_bandwidth_with_http_info(self, body, **kwargs):  # noqa: E501
         """allocate_ipv6_address_bandwidth  # noqa: E501
 
@@ -539,6 +614,21 @@ class VPCApi(object):
             (data) = self.assign_ipv6_addresses_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def assign_ipv6_addresses_async(self, body, **kwargs):  # noqa: E501
+        """assign_ipv6_addresses  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.assign_ipv6_addresses_async(body)
+
+        :param AssignIpv6AddressesRequest body: (required)
+        :return: AssignIpv6AddressesResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`assign_ipv6_addresses_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.assign_ipv6_addresses_with_http_info(body, **kwargs)  # noqa: E501
+
     def assign_ipv6_addresses_with_http_info(self, body, **kwargs):  # noqa: E501
         """assign_ipv6_addresses  # noqa: E501
 
@@ -636,6 +726,21 @@ class VPCApi(object):
             (data) = self.assign_private_ip_addresses_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def assign_private_ip_addresses_async(self, body, **kwargs):  # noqa: E501
+        """assign_private_ip_addresses  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.assign_private_ip_addresses_async(body)
+
+        :param AssignPrivateIpAddressesRequest body: (required)
+        :return: AssignPrivateIpAddressesResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`assign_private_ip_addresses_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.assign_private_ip_addresses_with_http_info(body, **kwargs)  # noqa: E501
+
     def assign_private_ip_addresses_with_http_info(self, body, **kwargs):  # noqa: E501
         """assign_private_ip_addresses  # noqa: E501
 
@@ -733,6 +838,21 @@ class VPCApi(object):
             (data) = self.associate_eip_address_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def associate_eip_address_async(self, body, **kwargs):  # noqa: E501
+        """associate_eip_address  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.associate_eip_address_async(body)
+
+        :param AssociateEipAddressRequest body: (required)
+        :return: AssociateEipAddressResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`associate_eip_address_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.associate_eip_address_with_http_info(body, **kwargs)  # noqa: E501
+
     def associate_eip_address_with_http_info(self, body, **kwargs):  # noqa: E501
         """associate_eip_address  # noqa: E501
 
@@ -830,6 +950,21 @@ class VPCApi(object):
             (data) = self.associate_ha_vip_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def associate_ha_vip_async(self, body, **kwargs):  # noqa: E501
+        """associate_ha_vip  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.associate_ha_vip_async(body)
+
+        :param AssociateHaVipRequest body: (required)
+        :return: AssociateHaVipResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`associate_ha_vip_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.associate_ha_vip_with_http_info(body, **kwargs)  # noqa: E501
+
     def associate_ha_vip_with_http_info(self, body, **kwargs):  # noqa: E501
         """associate_ha_vip  # noqa: E501
 
@@ -927,6 +1062,21 @@ class VPCApi(object):
             (data) = self.associate_network_acl_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def associate_network_acl_async(self, body, **kwargs):  # noqa: E501
+        """associate_network_acl  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.associate_network_acl_async(body)
+
+        :param AssociateNetworkAclRequest body: (required)
+        :return: AssociateNetworkAclResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`associate_network_acl_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.associate_network_acl_with_http_info(body, **kwargs)  # noqa: E501
+
     def associate_network_acl_with_http_info(self, body, **kwargs):  # noqa: E501
         """associate_network_acl  # noqa: E501
 
@@ -1024,6 +1174,21 @@ class VPCApi(object):
             (data) = self.associate_route_table_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def associate_route_table_async(self, body, **kwargs):  # noqa: E501
+        """associate_route_table  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.associate_route_table_async(body)
+
+        :param AssociateRouteTableRequest body: (required)
+        :return: AssociateRouteTableResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`associate_route_table_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.associate_route_table_with_http_info(body, **kwargs)  # noqa: E501
+
     def associate_route_table_with_http_info(self, body, **kwargs):  # noqa: E501
         """associate_route_table  # noqa: E501
 
@@ -1121,6 +1286,21 @@ class VPCApi(object):
             (data) = self.associate_vpc_cidr_block_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def associate_vpc_cidr_block_async(self, body, **kwargs):  # noqa: E501
+        """associate_vpc_cidr_block  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.associate_vpc_cidr_block_async(body)
+
+        :param AssociateVpcCidrBlockRequest body: (required)
+        :return: AssociateVpcCidrBlockResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`associate_vpc_cidr_block_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.associate_vpc_cidr_block_with_http_info(body, **kwargs)  # noqa: E501
+
     def associate_vpc_cidr_block_with_http_info(self, body, **kwargs):  # noqa: E501
         """associate_vpc_cidr_block  # noqa: E501
 
@@ -1218,6 +1398,21 @@ class VPCApi(object):
             (data) = self.attach_network_interface_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def attach_network_interface_async(self, body, **kwargs):  # noqa: E501
+        """attach_network_interface  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.attach_network_interface_async(body)
+
+        :param AttachNetworkInterfaceRequest body: (required)
+        :return: AttachNetworkInterfaceResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`attach_network_interface_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.attach_network_interface_with_http_info(body, **kwargs)  # noqa: E501
+
     def attach_network_interface_with_http_info(self, body, **kwargs):  # noqa: E501
         """attach_network_interface  # noqa: E501
 
@@ -1315,6 +1510,21 @@ class VPCApi(object):
             (data) = self.authorize_security_group_egress_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def authorize_security_group_egress_async(self, body, **kwargs):  # noqa: E501
+        """authorize_security_group_egress  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.authorize_security_group_egress_async(body)
+
+        :param AuthorizeSecurityGroupEgressRequest body: (required)
+        :return: AuthorizeSecurityGroupEgressResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`authorize_security_group_egress_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.authorize_security_group_egress_with_http_info(body, **kwargs)  # noqa: E501
+
     def authorize_security_group_egress_with_http_info(self, body, **kwargs):  # noqa: E501
         """authorize_security_group_egress  # noqa: E501
 
@@ -1412,6 +1622,21 @@ class VPCApi(object):
             (data) = self.authorize_security_group_ingress_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def authorize_security_group_ingress_async(self, body, **kwargs):  # noqa: E501
+        """authorize_security_group_ingress  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.authorize_security_group_ingress_async(body)
+
+        :param AuthorizeSecurityGroupIngressRequest body: (required)
+        :return: AuthorizeSecurityGroupIngressResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`authorize_security_group_ingress_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.authorize_security_group_ingress_with_http_info(body, **kwargs)  # noqa: E501
+
     def authorize_security_group_ingress_with_http_info(self, body, **kwargs):  # noqa: E501
         """authorize_security_group_ingress  # noqa: E501
 
@@ -1509,6 +1734,21 @@ class VPCApi(object):
             (data) = self.cancel_bandwidth_package_eip_bandwidth_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def cancel_bandwidth_package_eip_bandwidth_async(self, body, **kwargs):  # noqa: E501
+        """cancel_bandwidth_package_eip_bandwidth  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.cancel_bandwidth_package_eip_bandwidth_async(body)
+
+        :param CancelBandwidthPackageEipBandwidthRequest body: (required)
+        :return: CancelBandwidthPackageEipBandwidthResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`cancel_bandwidth_package_eip_bandwidth_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.cancel_bandwidth_package_eip_bandwidth_with_http_info(body, **kwargs)  # noqa: E501
+
     def cancel_bandwidth_package_eip_bandwidth_with_http_info(self, body, **kwargs):  # noqa: E501
         """cancel_bandwidth_package_eip_bandwidth  # noqa: E501
 
@@ -1606,6 +1846,21 @@ class VPCApi(object):
             (data) = self.convert_eip_address_billing_type_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def convert_eip_address_billing_type_async(self, body, **kwargs):  # noqa: E501
+        """convert_eip_address_billing_type  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.convert_eip_address_billing_type_async(body)
+
+        :param ConvertEipAddressBillingTypeRequest body: (required)
+        :return: ConvertEipAddressBillingTypeResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`convert_eip_address_billing_type_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.convert_eip_address_billing_type_with_http_info(body, **kwargs)  # noqa: E501
+
     def convert_eip_address_billing_type_with_http_info(self, body, **kwargs):  # noqa: E501
         """convert_eip_address_billing_type  # noqa: E501
 
@@ -1703,6 +1958,21 @@ class VPCApi(object):
             (data) = self.create_bandwidth_package_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def create_bandwidth_package_async(self, body, **kwargs):  # noqa: E501
+        """create_bandwidth_package  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.create_bandwidth_package_async(body)
+
+        :param CreateBandwidthPackageRequest body: (required)
+        :return: CreateBandwidthPackageResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`create_bandwidth_package_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.create_bandwidth_package_with_http_info(body, **kwargs)  # noqa: E501
+
     def create_bandwidth_package_with_http_info(self, body, **kwargs):  # noqa: E501
         """create_bandwidth_package  # noqa: E501
 
@@ -1800,6 +2070,21 @@ class VPCApi(object):
             (data) = self.create_flow_log_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def create_flow_log_async(self, body, **kwargs):  # noqa: E501
+        """create_flow_log  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.create_flow_log_async(body)
+
+        :param CreateFlowLogRequest body: (required)
+        :return: CreateFlowLogResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`create_flow_log_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.create_flow_log_with_http_info(body, **kwargs)  # noqa: E501
+
     def create_flow_log_with_http_info(self, body, **kwargs):  # noqa: E501
         """create_flow_log  # noqa: E501
 
@@ -1897,6 +2182,21 @@ class VPCApi(object):
             (data) = self.create_ha_vip_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def create_ha_vip_async(self, body, **kwargs):  # noqa: E501
+        """create_ha_vip  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.create_ha_vip_async(body)
+
+        :param CreateHaVipRequest body: (required)
+        :return: CreateHaVipResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`create_ha_vip_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.create_ha_vip_with_http_info(body, **kwargs)  # noqa: E501
+
     def create_ha_vip_with_http_info(self, body, **kwargs):  # noqa: E501
         """create_ha_vip  # noqa: E501
 
@@ -1994,6 +2294,21 @@ class VPCApi(object):
             (data) = self.create_instance_group_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def create_instance_group_async(self, body, **kwargs):  # noqa: E501
+        """create_instance_group  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.create_instance_group_async(body)
+
+        :param CreateInstanceGroupRequest body: (required)
+        :return: CreateInstanceGroupResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`create_instance_group_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.create_instance_group_with_http_info(body, **kwargs)  # noqa: E501
+
     def create_instance_group_with_http_info(self, body, **kwargs):  # noqa: E501
         """create_instance_group  # noqa: E501
 
@@ -2091,6 +2406,21 @@ class VPCApi(object):
             (data) = self.create_ip_address_pool_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def create_ip_address_pool_async(self, body, **kwargs):  # noqa: E501
+        """create_ip_address_pool  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.create_ip_address_pool_async(body)
+
+        :param CreateIpAddressPoolRequest body: (required)
+        :return: CreateIpAddressPoolResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`create_ip_address_pool_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.create_ip_address_pool_with_http_info(body, **kwargs)  # noqa: E501
+
     def create_ip_address_pool_with_http_info(self, body, **kwargs):  # noqa: E501
         """create_ip_address_pool  # noqa: E501
 
@@ -2188,6 +2518,21 @@ class VPCApi(object):
             (data) = self.create_ipv6_egress_only_rule_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def create_ipv6_egress_only_rule_async(self, body, **kwargs):  # noqa: E501
+        """create_ipv6_egress_only_rule  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.create_ipv6_egress_only_rule_async(body)
+
+        :param CreateIpv6EgressOnlyRuleRequest body: (required)
+        :return: CreateIpv6EgressOnlyRuleResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`create_ipv6_egress_only_rule_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.create_ipv6_egress_only_rule_with_http_info(body, **kwargs)  # noqa: E501
+
     def create_ipv6_egress_only_rule_with_http_info(self, body, **kwargs):  # noqa: E501
         """create_ipv6_egress_only_rule  # noqa: E501
 
@@ -2285,6 +2630,21 @@ class VPCApi(object):
             (data) = self.create_ipv6_gateway_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def create_ipv6_gateway_async(self, body, **kwargs):  # noqa: E501
+        """create_ipv6_gateway  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.create_ipv6_gateway_async(body)
+
+        :param CreateIpv6GatewayRequest body: (required)
+        :return: CreateIpv6GatewayResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`create_ipv6_gateway_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.create_ipv6_gateway_with_http_info(body, **kwargs)  # noqa: E501
+
     def create_ipv6_gateway_with_http_info(self, body, **kwargs):  # noqa: E501
         """create_ipv6_gateway  # noqa: E501
 
@@ -2382,6 +2742,21 @@ class VPCApi(object):
             (data) = self.create_network_acl_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def create_network_acl_async(self, body, **kwargs):  # noqa: E501
+        """create_network_acl  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.create_network_acl_async(body)
+
+        :param CreateNetworkAclRequest body: (required)
+        :return: CreateNetworkAclResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`create_network_acl_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.create_network_acl_with_http_info(body, **kwargs)  # noqa: E501
+
     def create_network_acl_with_http_info(self, body, **kwargs):  # noqa: E501
         """create_network_acl  # noqa: E501
 
@@ -2479,6 +2854,21 @@ class VPCApi(object):
             (data) = self.create_network_interface_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def create_network_interface_async(self, body, **kwargs):  # noqa: E501
+        """create_network_interface  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.create_network_interface_async(body)
+
+        :param CreateNetworkInterfaceRequest body: (required)
+        :return: CreateNetworkInterfaceResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`create_network_interface_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.create_network_interface_with_http_info(body, **kwargs)  # noqa: E501
+
     def create_network_interface_with_http_info(self, body, **kwargs):  # noqa: E501
         """create_network_interface  # noqa: E501
 
@@ -2576,6 +2966,21 @@ class VPCApi(object):
             (data) = self.create_prefix_list_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def create_prefix_list_async(self, body, **kwargs):  # noqa: E501
+        """create_prefix_list  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.create_prefix_list_async(body)
+
+        :param CreatePrefixListRequest body: (required)
+        :return: CreatePrefixListResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`create_prefix_list_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.create_prefix_list_with_http_info(body, **kwargs)  # noqa: E501
+
     def create_prefix_list_with_http_info(self, body, **kwargs):  # noqa: E501
         """create_prefix_list  # noqa: E501
 
@@ -2673,6 +3078,21 @@ class VPCApi(object):
             (data) = self.create_route_entry_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def create_route_entry_async(self, body, **kwargs):  # noqa: E501
+        """create_route_entry  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.create_route_entry_async(body)
+
+        :param CreateRouteEntryRequest body: (required)
+        :return: CreateRouteEntryResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`create_route_entry_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.create_route_entry_with_http_info(body, **kwargs)  # noqa: E501
+
     def create_route_entry_with_http_info(self, body, **kwargs):  # noqa: E501
         """create_route_entry  # noqa: E501
 
@@ -2770,6 +3190,21 @@ class VPCApi(object):
             (data) = self.create_route_table_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def create_route_table_async(self, body, **kwargs):  # noqa: E501
+        """create_route_table  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.create_route_table_async(body)
+
+        :param CreateRouteTableRequest body: (required)
+        :return: CreateRouteTableResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`create_route_table_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.create_route_table_with_http_info(body, **kwargs)  # noqa: E501
+
     def create_route_table_with_http_info(self, body, **kwargs):  # noqa: E501
         """create_route_table  # noqa: E501
 
@@ -2867,6 +3302,21 @@ class VPCApi(object):
             (data) = self.create_security_group_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def create_security_group_async(self, body, **kwargs):  # noqa: E501
+        """create_security_group  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.create_security_group_async(body)
+
+        :param CreateSecurityGroupRequest body: (required)
+        :return: CreateSecurityGroupResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`create_security_group_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.create_security_group_with_http_info(body, **kwargs)  # noqa: E501
+
     def create_security_group_with_http_info(self, body, **kwargs):  # noqa: E501
         """create_security_group  # noqa: E501
 
@@ -2964,6 +3414,21 @@ class VPCApi(object):
             (data) = self.create_subnet_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def create_subnet_async(self, body, **kwargs):  # noqa: E501
+        """create_subnet  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.create_subnet_async(body)
+
+        :param CreateSubnetRequest body: (required)
+        :return: CreateSubnetResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`create_subnet_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.create_subnet_with_http_info(body, **kwargs)  # noqa: E501
+
     def create_subnet_with_http_info(self, body, **kwargs):  # noqa: E501
         """create_subnet  # noqa: E501
 
@@ -3061,6 +3526,21 @@ class VPCApi(object):
             (data) = self.create_traffic_mirror_filter_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def create_traffic_mirror_filter_async(self, body, **kwargs):  # noqa: E501
+        """create_traffic_mirror_filter  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.create_traffic_mirror_filter_async(body)
+
+        :param CreateTrafficMirrorFilterRequest body: (required)
+        :return: CreateTrafficMirrorFilterResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`create_traffic_mirror_filter_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.create_traffic_mirror_filter_with_http_info(body, **kwargs)  # noqa: E501
+
     def create_traffic_mirror_filter_with_http_info(self, body, **kwargs):  # noqa: E501
         """create_traffic_mirror_filter  # noqa: E501
 
@@ -3158,6 +3638,21 @@ class VPCApi(object):
             (data) = self.create_traffic_mirror_filter_rule_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def create_traffic_mirror_filter_rule_async(self, body, **kwargs):  # noqa: E501
+        """create_traffic_mirror_filter_rule  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.create_traffic_mirror_filter_rule_async(body)
+
+        :param CreateTrafficMirrorFilterRuleRequest body: (required)
+        :return: CreateTrafficMirrorFilterRuleResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`create_traffic_mirror_filter_rule_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.create_traffic_mirror_filter_rule_with_http_info(body, **kwargs)  # noqa: E501
+
     def create_traffic_mirror_filter_rule_with_http_info(self, body, **kwargs):  # noqa: E501
         """create_traffic_mirror_filter_rule  # noqa: E501
 
@@ -3255,6 +3750,21 @@ class VPCApi(object):
             (data) = self.create_traffic_mirror_session_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def create_traffic_mirror_session_async(self, body, **kwargs):  # noqa: E501
+        """create_traffic_mirror_session  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.create_traffic_mirror_session_async(body)
+
+        :param CreateTrafficMirrorSessionRequest body: (required)
+        :return: CreateTrafficMirrorSessionResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`create_traffic_mirror_session_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.create_traffic_mirror_session_with_http_info(body, **kwargs)  # noqa: E501
+
     def create_traffic_mirror_session_with_http_info(self, body, **kwargs):  # noqa: E501
         """create_traffic_mirror_session  # noqa: E501
 
@@ -3352,6 +3862,21 @@ class VPCApi(object):
             (data) = self.create_traffic_mirror_target_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def create_traffic_mirror_target_async(self, body, **kwargs):  # noqa: E501
+        """create_traffic_mirror_target  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.create_traffic_mirror_target_async(body)
+
+        :param CreateTrafficMirrorTargetRequest body: (required)
+        :return: CreateTrafficMirrorTargetResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`create_traffic_mirror_target_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.create_traffic_mirror_target_with_http_info(body, **kwargs)  # noqa: E501
+
     def create_traffic_mirror_target_with_http_info(self, body, **kwargs):  # noqa: E501
         """create_traffic_mirror_target  # noqa: E501
 
@@ -3449,6 +3974,21 @@ class VPCApi(object):
             (data) = self.create_vpc_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def create_vpc_async(self, body, **kwargs):  # noqa: E501
+        """create_vpc  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.create_vpc_async(body)
+
+        :param CreateVpcRequest body: (required)
+        :return: CreateVpcResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`create_vpc_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.create_vpc_with_http_info(body, **kwargs)  # noqa: E501
+
     def create_vpc_with_http_info(self, body, **kwargs):  # noqa: E501
         """create_vpc  # noqa: E501
 
@@ -3546,6 +4086,21 @@ class VPCApi(object):
             (data) = self.deactive_flow_log_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def deactive_flow_log_async(self, body, **kwargs):  # noqa: E501
+        """deactive_flow_log  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.deactive_flow_log_async(body)
+
+        :param DeactiveFlowLogRequest body: (required)
+        :return: DeactiveFlowLogResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`deactive_flow_log_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.deactive_flow_log_with_http_info(body, **kwargs)  # noqa: E501
+
     def deactive_flow_log_with_http_info(self, body, **kwargs):  # noqa: E501
         """deactive_flow_log  # noqa: E501
 
@@ -3643,6 +4198,21 @@ class VPCApi(object):
             (data) = self.delete_bandwidth_package_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def delete_bandwidth_package_async(self, body, **kwargs):  # noqa: E501
+        """delete_bandwidth_package  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.delete_bandwidth_package_async(body)
+
+        :param DeleteBandwidthPackageRequest body: (required)
+        :return: DeleteBandwidthPackageResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`delete_bandwidth_package_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.delete_bandwidth_package_with_http_info(body, **kwargs)  # noqa: E501
+
     def delete_bandwidth_package_with_http_info(self, body, **kwargs):  # noqa: E501
         """delete_bandwidth_package  # noqa: E501
 
@@ -3740,6 +4310,21 @@ class VPCApi(object):
             (data) = self.delete_flow_log_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def delete_flow_log_async(self, body, **kwargs):  # noqa: E501
+        """delete_flow_log  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.delete_flow_log_async(body)
+
+        :param DeleteFlowLogRequest body: (required)
+        :return: DeleteFlowLogResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`delete_flow_log_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.delete_flow_log_with_http_info(body, **kwargs)  # noqa: E501
+
     def delete_flow_log_with_http_info(self, body, **kwargs):  # noqa: E501
         """delete_flow_log  # noqa: E501
 
@@ -3837,6 +4422,21 @@ class VPCApi(object):
             (data) = self.delete_ha_vip_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def delete_ha_vip_async(self, body, **kwargs):  # noqa: E501
+        """delete_ha_vip  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.delete_ha_vip_async(body)
+
+        :param DeleteHaVipRequest body: (required)
+        :return: DeleteHaVipResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`delete_ha_vip_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.delete_ha_vip_with_http_info(body, **kwargs)  # noqa: E501
+
     def delete_ha_vip_with_http_info(self, body, **kwargs):  # noqa: E501
         """delete_ha_vip  # noqa: E501
 
@@ -3934,6 +4534,21 @@ class VPCApi(object):
             (data) = self.delete_instance_group_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def delete_instance_group_async(self, body, **kwargs):  # noqa: E501
+        """delete_instance_group  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.delete_instance_group_async(body)
+
+        :param DeleteInstanceGroupRequest body: (required)
+        :return: DeleteInstanceGroupResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`delete_instance_group_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.delete_instance_group_with_http_info(body, **kwargs)  # noqa: E501
+
     def delete_instance_group_with_http_info(self, body, **kwargs):  # noqa: E501
         """delete_instance_group  # noqa: E501
 
@@ -4031,6 +4646,21 @@ class VPCApi(object):
             (data) = self.delete_ip_address_pool_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def delete_ip_address_pool_async(self, body, **kwargs):  # noqa: E501
+        """delete_ip_address_pool  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.delete_ip_address_pool_async(body)
+
+        :param DeleteIpAddressPoolRequest body: (required)
+        :return: DeleteIpAddressPoolResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`delete_ip_address_pool_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.delete_ip_address_pool_with_http_info(body, **kwargs)  # noqa: E501
+
     def delete_ip_address_pool_with_http_info(self, body, **kwargs):  # noqa: E501
         """delete_ip_address_pool  # noqa: E501
 
@@ -4128,6 +4758,21 @@ class VPCApi(object):
             (data) = self.delete_ip_address_pool_cidr_block_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def delete_ip_address_pool_cidr_block_async(self, body, **kwargs):  # noqa: E501
+        """delete_ip_address_pool_cidr_block  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.delete_ip_address_pool_cidr_block_async(body)
+
+        :param DeleteIpAddressPoolCidrBlockRequest body: (required)
+        :return: DeleteIpAddressPoolCidrBlockResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`delete_ip_address_pool_cidr_block_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.delete_ip_address_pool_cidr_block_with_http_info(body, **kwargs)  # noqa: E501
+
     def delete_ip_address_pool_cidr_block_with_http_info(self, body, **kwargs):  # noqa: E501
         """delete_ip_address_pool_cidr_block  # noqa: E501
 
@@ -4225,6 +4870,21 @@ class VPCApi(object):
             (data) = self.delete_ipv6_egress_only_rule_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def delete_ipv6_egress_only_rule_async(self, body, **kwargs):  # noqa: E501
+        """delete_ipv6_egress_only_rule  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.delete_ipv6_egress_only_rule_async(body)
+
+        :param DeleteIpv6EgressOnlyRuleRequest body: (required)
+        :return: DeleteIpv6EgressOnlyRuleResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`delete_ipv6_egress_only_rule_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.delete_ipv6_egress_only_rule_with_http_info(body, **kwargs)  # noqa: E501
+
     def delete_ipv6_egress_only_rule_with_http_info(self, body, **kwargs):  # noqa: E501
         """delete_ipv6_egress_only_rule  # noqa: E501
 
@@ -4322,6 +4982,21 @@ class VPCApi(object):
             (data) = self.delete_ipv6_gateway_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def delete_ipv6_gateway_async(self, body, **kwargs):  # noqa: E501
+        """delete_ipv6_gateway  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.delete_ipv6_gateway_async(body)
+
+        :param DeleteIpv6GatewayRequest body: (required)
+        :return: DeleteIpv6GatewayResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`delete_ipv6_gateway_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.delete_ipv6_gateway_with_http_info(body, **kwargs)  # noqa: E501
+
     def delete_ipv6_gateway_with_http_info(self, body, **kwargs):  # noqa: E501
         """delete_ipv6_gateway  # noqa: E501
 
@@ -4419,6 +5094,21 @@ class VPCApi(object):
             (data) = self.delete_network_acl_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def delete_network_acl_async(self, body, **kwargs):  # noqa: E501
+        """delete_network_acl  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.delete_network_acl_async(body)
+
+        :param DeleteNetworkAclRequest body: (required)
+        :return: DeleteNetworkAclResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`delete_network_acl_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.delete_network_acl_with_http_info(body, **kwargs)  # noqa: E501
+
     def delete_network_acl_with_http_info(self, body, **kwargs):  # noqa: E501
         """delete_network_acl  # noqa: E501
 
@@ -4516,6 +5206,21 @@ class VPCApi(object):
             (data) = self.delete_network_interface_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def delete_network_interface_async(self, body, **kwargs):  # noqa: E501
+        """delete_network_interface  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.delete_network_interface_async(body)
+
+        :param DeleteNetworkInterfaceRequest body: (required)
+        :return: DeleteNetworkInterfaceResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`delete_network_interface_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.delete_network_interface_with_http_info(body, **kwargs)  # noqa: E501
+
     def delete_network_interface_with_http_info(self, body, **kwargs):  # noqa: E501
         """delete_network_interface  # noqa: E501
 
@@ -4613,6 +5318,21 @@ class VPCApi(object):
             (data) = self.delete_prefix_list_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def delete_prefix_list_async(self, body, **kwargs):  # noqa: E501
+        """delete_prefix_list  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.delete_prefix_list_async(body)
+
+        :param DeletePrefixListRequest body: (required)
+        :return: DeletePrefixListResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`delete_prefix_list_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.delete_prefix_list_with_http_info(body, **kwargs)  # noqa: E501
+
     def delete_prefix_list_with_http_info(self, body, **kwargs):  # noqa: E501
         """delete_prefix_list  # noqa: E501
 
@@ -4710,6 +5430,21 @@ class VPCApi(object):
             (data) = self.delete_route_entry_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def delete_route_entry_async(self, body, **kwargs):  # noqa: E501
+        """delete_route_entry  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.delete_route_entry_async(body)
+
+        :param DeleteRouteEntryRequest body: (required)
+        :return: DeleteRouteEntryResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`delete_route_entry_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.delete_route_entry_with_http_info(body, **kwargs)  # noqa: E501
+
     def delete_route_entry_with_http_info(self, body, **kwargs):  # noqa: E501
         """delete_route_entry  # noqa: E501
 
@@ -4807,6 +5542,21 @@ class VPCApi(object):
             (data) = self.delete_route_table_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def delete_route_table_async(self, body, **kwargs):  # noqa: E501
+        """delete_route_table  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.delete_route_table_async(body)
+
+        :param DeleteRouteTableRequest body: (required)
+        :return: DeleteRouteTableResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`delete_route_table_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.delete_route_table_with_http_info(body, **kwargs)  # noqa: E501
+
     def delete_route_table_with_http_info(self, body, **kwargs):  # noqa: E501
         """delete_route_table  # noqa: E501
 
@@ -4904,6 +5654,21 @@ class VPCApi(object):
             (data) = self.delete_security_group_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def delete_security_group_async(self, body, **kwargs):  # noqa: E501
+        """delete_security_group  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.delete_security_group_async(body)
+
+        :param DeleteSecurityGroupRequest body: (required)
+        :return: DeleteSecurityGroupResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`delete_security_group_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.delete_security_group_with_http_info(body, **kwargs)  # noqa: E501
+
     def delete_security_group_with_http_info(self, body, **kwargs):  # noqa: E501
         """delete_security_group  # noqa: E501
 
@@ -5001,6 +5766,21 @@ class VPCApi(object):
             (data) = self.delete_subnet_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def delete_subnet_async(self, body, **kwargs):  # noqa: E501
+        """delete_subnet  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.delete_subnet_async(body)
+
+        :param DeleteSubnetRequest body: (required)
+        :return: DeleteSubnetResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`delete_subnet_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.delete_subnet_with_http_info(body, **kwargs)  # noqa: E501
+
     def delete_subnet_with_http_info(self, body, **kwargs):  # noqa: E501
         """delete_subnet  # noqa: E501
 
@@ -5098,6 +5878,21 @@ class VPCApi(object):
             (data) = self.delete_traffic_mirror_filter_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def delete_traffic_mirror_filter_async(self, body, **kwargs):  # noqa: E501
+        """delete_traffic_mirror_filter  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.delete_traffic_mirror_filter_async(body)
+
+        :param DeleteTrafficMirrorFilterRequest body: (required)
+        :return: DeleteTrafficMirrorFilterResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`delete_traffic_mirror_filter_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.delete_traffic_mirror_filter_with_http_info(body, **kwargs)  # noqa: E501
+
     def delete_traffic_mirror_filter_with_http_info(self, body, **kwargs):  # noqa: E501
         """delete_traffic_mirror_filter  # noqa: E501
 
@@ -5195,6 +5990,21 @@ class VPCApi(object):
             (data) = self.delete_traffic_mirror_filter_rule_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def delete_traffic_mirror_filter_rule_async(self, body, **kwargs):  # noqa: E501
+        """delete_traffic_mirror_filter_rule  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.delete_traffic_mirror_filter_rule_async(body)
+
+        :param DeleteTrafficMirrorFilterRuleRequest body: (required)
+        :return: DeleteTrafficMirrorFilterRuleResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`delete_traffic_mirror_filter_rule_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.delete_traffic_mirror_filter_rule_with_http_info(body, **kwargs)  # noqa: E501
+
     def delete_traffic_mirror_filter_rule_with_http_info(self, body, **kwargs):  # noqa: E501
         """delete_traffic_mirror_filter_rule  # noqa: E501
 
@@ -5292,6 +6102,21 @@ class VPCApi(object):
             (data) = self.delete_traffic_mirror_session_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def delete_traffic_mirror_session_async(self, body, **kwargs):  # noqa: E501
+        """delete_traffic_mirror_session  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.delete_traffic_mirror_session_async(body)
+
+        :param DeleteTrafficMirrorSessionRequest body: (required)
+        :return: DeleteTrafficMirrorSessionResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`delete_traffic_mirror_session_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.delete_traffic_mirror_session_with_http_info(body, **kwargs)  # noqa: E501
+
     def delete_traffic_mirror_session_with_http_info(self, body, **kwargs):  # noqa: E501
         """delete_traffic_mirror_session  # noqa: E501
 
@@ -5389,6 +6214,21 @@ class VPCApi(object):
             (data) = self.delete_traffic_mirror_target_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def delete_traffic_mirror_target_async(self, body, **kwargs):  # noqa: E501
+        """delete_traffic_mirror_target  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.delete_traffic_mirror_target_async(body)
+
+        :param DeleteTrafficMirrorTargetRequest body: (required)
+        :return: DeleteTrafficMirrorTargetResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`delete_traffic_mirror_target_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.delete_traffic_mirror_target_with_http_info(body, **kwargs)  # noqa: E501
+
     def delete_traffic_mirror_target_with_http_info(self, body, **kwargs):  # noqa: E501
         """delete_traffic_mirror_target  # noqa: E501
 
@@ -5486,6 +6326,21 @@ class VPCApi(object):
             (data) = self.delete_vpc_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def delete_vpc_async(self, body, **kwargs):  # noqa: E501
+        """delete_vpc  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.delete_vpc_async(body)
+
+        :param DeleteVpcRequest body: (required)
+        :return: DeleteVpcResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`delete_vpc_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.delete_vpc_with_http_info(body, **kwargs)  # noqa: E501
+
     def delete_vpc_with_http_info(self, body, **kwargs):  # noqa: E501
         """delete_vpc  # noqa: E501
 
@@ -5583,6 +6438,21 @@ class VPCApi(object):
             (data) = self.describe_bandwidth_packages_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def describe_bandwidth_packages_async(self, body, **kwargs):  # noqa: E501
+        """describe_bandwidth_packages  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.describe_bandwidth_packages_async(body)
+
+        :param DescribeBandwidthPackagesRequest body: (required)
+        :return: DescribeBandwidthPackagesResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`describe_bandwidth_packages_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.describe_bandwidth_packages_with_http_info(body, **kwargs)  # noqa: E501
+
     def describe_bandwidth_packages_with_http_info(self, body, **kwargs):  # noqa: E501
         """describe_bandwidth_packages  # noqa: E501
 
@@ -5680,6 +6550,21 @@ class VPCApi(object):
             (data) = self.describe_eip_address_attributes_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def describe_eip_address_attributes_async(self, body, **kwargs):  # noqa: E501
+        """describe_eip_address_attributes  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.describe_eip_address_attributes_async(body)
+
+        :param DescribeEipAddressAttributesRequest body: (required)
+        :return: DescribeEipAddressAttributesResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`describe_eip_address_attributes_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.describe_eip_address_attributes_with_http_info(body, **kwargs)  # noqa: E501
+
     def describe_eip_address_attributes_with_http_info(self, body, **kwargs):  # noqa: E501
         """describe_eip_address_attributes  # noqa: E501
 
@@ -5777,6 +6662,21 @@ class VPCApi(object):
             (data) = self.describe_eip_addresses_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def describe_eip_addresses_async(self, body, **kwargs):  # noqa: E501
+        """describe_eip_addresses  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.describe_eip_addresses_async(body)
+
+        :param DescribeEipAddressesRequest body: (required)
+        :return: DescribeEipAddressesResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`describe_eip_addresses_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.describe_eip_addresses_with_http_info(body, **kwargs)  # noqa: E501
+
     def describe_eip_addresses_with_http_info(self, body, **kwargs):  # noqa: E501
         """describe_eip_addresses  # noqa: E501
 
@@ -5874,6 +6774,21 @@ class VPCApi(object):
             (data) = self.describe_flow_logs_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def describe_flow_logs_async(self, body, **kwargs):  # noqa: E501
+        """describe_flow_logs  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.describe_flow_logs_async(body)
+
+        :param DescribeFlowLogsRequest body: (required)
+        :return: DescribeFlowLogsResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`describe_flow_logs_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.describe_flow_logs_with_http_info(body, **kwargs)  # noqa: E501
+
     def describe_flow_logs_with_http_info(self, body, **kwargs):  # noqa: E501
         """describe_flow_logs  # noqa: E501
 
@@ -5971,6 +6886,21 @@ class VPCApi(object):
             (data) = self.describe_ha_vips_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def describe_ha_vips_async(self, body, **kwargs):  # noqa: E501
+        """describe_ha_vips  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.describe_ha_vips_async(body)
+
+        :param DescribeHaVipsRequest body: (required)
+        :return: DescribeHaVipsResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`describe_ha_vips_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.describe_ha_vips_with_http_info(body, **kwargs)  # noqa: E501
+
     def describe_ha_vips_with_http_info(self, body, **kwargs):  # noqa: E501
         """describe_ha_vips  # noqa: E501
 
@@ -6068,6 +6998,21 @@ class VPCApi(object):
             (data) = self.describe_instance_groups_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def describe_instance_groups_async(self, body, **kwargs):  # noqa: E501
+        """describe_instance_groups  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.describe_instance_groups_async(body)
+
+        :param DescribeInstanceGroupsRequest body: (required)
+        :return: DescribeInstanceGroupsResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`describe_instance_groups_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.describe_instance_groups_with_http_info(body, **kwargs)  # noqa: E501
+
     def describe_instance_groups_with_http_info(self, body, **kwargs):  # noqa: E501
         """describe_instance_groups  # noqa: E501
 
@@ -6165,6 +7110,21 @@ class VPCApi(object):
             (data) = self.describe_ip_address_pool_attributes_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def describe_ip_address_pool_attributes_async(self, body, **kwargs):  # noqa: E501
+        """describe_ip_address_pool_attributes  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.describe_ip_address_pool_attributes_async(body)
+
+        :param DescribeIpAddressPoolAttributesRequest body: (required)
+        :return: DescribeIpAddressPoolAttributesResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`describe_ip_address_pool_attributes_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.describe_ip_address_pool_attributes_with_http_info(body, **kwargs)  # noqa: E501
+
     def describe_ip_address_pool_attributes_with_http_info(self, body, **kwargs):  # noqa: E501
         """describe_ip_address_pool_attributes  # noqa: E501
 
@@ -6262,6 +7222,21 @@ class VPCApi(object):
             (data) = self.describe_ip_address_pool_cidr_blocks_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def describe_ip_address_pool_cidr_blocks_async(self, body, **kwargs):  # noqa: E501
+        """describe_ip_address_pool_cidr_blocks  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.describe_ip_address_pool_cidr_blocks_async(body)
+
+        :param DescribeIpAddressPoolCidrBlocksRequest body: (required)
+        :return: DescribeIpAddressPoolCidrBlocksResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`describe_ip_address_pool_cidr_blocks_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.describe_ip_address_pool_cidr_blocks_with_http_info(body, **kwargs)  # noqa: E501
+
     def describe_ip_address_pool_cidr_blocks_with_http_info(self, body, **kwargs):  # noqa: E501
         """describe_ip_address_pool_cidr_blocks  # noqa: E501
 
@@ -6359,6 +7334,21 @@ class VPCApi(object):
             (data) = self.describe_ip_address_pools_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def describe_ip_address_pools_async(self, body, **kwargs):  # noqa: E501
+        """describe_ip_address_pools  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.describe_ip_address_pools_async(body)
+
+        :param DescribeIpAddressPoolsRequest body: (required)
+        :return: DescribeIpAddressPoolsResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`describe_ip_address_pools_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.describe_ip_address_pools_with_http_info(body, **kwargs)  # noqa: E501
+
     def describe_ip_address_pools_with_http_info(self, body, **kwargs):  # noqa: E501
         """describe_ip_address_pools  # noqa: E501
 
@@ -6456,6 +7446,21 @@ class VPCApi(object):
             (data) = self.describe_ipv6_address_bandwidth_attributes_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def describe_ipv6_address_bandwidth_attributes_async(self, body, **kwargs):  # noqa: E501
+        """describe_ipv6_address_bandwidth_attributes  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.describe_ipv6_address_bandwidth_attributes_async(body)
+
+        :param DescribeIpv6AddressBandwidthAttributesRequest body: (required)
+        :return: DescribeIpv6AddressBandwidthAttributesResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`describe_ipv6_address_bandwidth_attributes_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.describe_ipv6_address_bandwidth_attributes_with_http_info(body, **kwargs)  # noqa: E501
+
     def describe_ipv6_address_bandwidth_attributes_with_http_info(self, body, **kwargs):  # noqa: E501
         """describe_ipv6_address_bandwidth_attributes  # noqa: E501
 
@@ -6553,6 +7558,21 @@ class VPCApi(object):
             (data) = self.describe_ipv6_address_bandwidths_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def describe_ipv6_address_bandwidths_async(self, body, **kwargs):  # noqa: E501
+        """describe_ipv6_address_bandwidths  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.describe_ipv6_address_bandwidths_async(body)
+
+        :param DescribeIpv6AddressBandwidthsRequest body: (required)
+        :return: DescribeIpv6AddressBandwidthsResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`describe_ipv6_address_bandwidths_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.describe_ipv6_address_bandwidths_with_http_info(body, **kwargs)  # noqa: E501
+
     def describe_ipv6_address_bandwidths_with_http_info(self, body, **kwargs):  # noqa: E501
         """describe_ipv6_address_bandwidths  # noqa: E501
 
@@ -6650,6 +7670,21 @@ class VPCApi(object):
             (data) = self.describe_ipv6_egress_only_rules_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def describe_ipv6_egress_only_rules_async(self, body, **kwargs):  # noqa: E501
+        """describe_ipv6_egress_only_rules  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.describe_ipv6_egress_only_rules_async(body)
+
+        :param DescribeIpv6EgressOnlyRulesRequest body: (required)
+        :return: DescribeIpv6EgressOnlyRulesResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`describe_ipv6_egress_only_rules_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.describe_ipv6_egress_only_rules_with_http_info(body, **kwargs)  # noqa: E501
+
     def describe_ipv6_egress_only_rules_with_http_info(self, body, **kwargs):  # noqa: E501
         """describe_ipv6_egress_only_rules  # noqa: E501
 
@@ -6747,6 +7782,21 @@ class VPCApi(object):
             (data) = self.describe_ipv6_gateway_attribute_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def describe_ipv6_gateway_attribute_async(self, body, **kwargs):  # noqa: E501
+        """describe_ipv6_gateway_attribute  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.describe_ipv6_gateway_attribute_async(body)
+
+        :param DescribeIpv6GatewayAttributeRequest body: (required)
+        :return: DescribeIpv6GatewayAttributeResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`describe_ipv6_gateway_attribute_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.describe_ipv6_gateway_attribute_with_http_info(body, **kwargs)  # noqa: E501
+
     def describe_ipv6_gateway_attribute_with_http_info(self, body, **kwargs):  # noqa: E501
         """describe_ipv6_gateway_attribute  # noqa: E501
 
@@ -6844,6 +7894,21 @@ class VPCApi(object):
             (data) = self.describe_ipv6_gateways_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def describe_ipv6_gateways_async(self, body, **kwargs):  # noqa: E501
+        """describe_ipv6_gateways  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.describe_ipv6_gateways_async(body)
+
+        :param DescribeIpv6GatewaysRequest body: (required)
+        :return: DescribeIpv6GatewaysResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`describe_ipv6_gateways_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.describe_ipv6_gateways_with_http_info(body, **kwargs)  # noqa: E501
+
     def describe_ipv6_gateways_with_http_info(self, body, **kwargs):  # noqa: E501
         """describe_ipv6_gateways  # noqa: E501
 
@@ -6941,6 +8006,21 @@ class VPCApi(object):
             (data) = self.describe_network_acl_attributes_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def describe_network_acl_attributes_async(self, body, **kwargs):  # noqa: E501
+        """describe_network_acl_attributes  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.describe_network_acl_attributes_async(body)
+
+        :param DescribeNetworkAclAttributesRequest body: (required)
+        :return: DescribeNetworkAclAttributesResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`describe_network_acl_attributes_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.describe_network_acl_attributes_with_http_info(body, **kwargs)  # noqa: E501
+
     def describe_network_acl_attributes_with_http_info(self, body, **kwargs):  # noqa: E501
         """describe_network_acl_attributes  # noqa: E501
 
@@ -7038,6 +8118,21 @@ class VPCApi(object):
             (data) = self.describe_network_acls_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def describe_network_acls_async(self, body, **kwargs):  # noqa: E501
+        """describe_network_acls  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.describe_network_acls_async(body)
+
+        :param DescribeNetworkAclsRequest body: (required)
+        :return: DescribeNetworkAclsResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`describe_network_acls_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.describe_network_acls_with_http_info(body, **kwargs)  # noqa: E501
+
     def describe_network_acls_with_http_info(self, body, **kwargs):  # noqa: E501
         """describe_network_acls  # noqa: E501
 
@@ -7135,6 +8230,21 @@ class VPCApi(object):
             (data) = self.describe_network_interface_attributes_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def describe_network_interface_attributes_async(self, body, **kwargs):  # noqa: E501
+        """describe_network_interface_attributes  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.describe_network_interface_attributes_async(body)
+
+        :param DescribeNetworkInterfaceAttributesRequest body: (required)
+        :return: DescribeNetworkInterfaceAttributesResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`describe_network_interface_attributes_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.describe_network_interface_attributes_with_http_info(body, **kwargs)  # noqa: E501
+
     def describe_network_interface_attributes_with_http_info(self, body, **kwargs):  # noqa: E501
         """describe_network_interface_attributes  # noqa: E501
 
@@ -7232,6 +8342,21 @@ class VPCApi(object):
             (data) = self.describe_network_interfaces_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def describe_network_interfaces_async(self, body, **kwargs):  # noqa: E501
+        """describe_network_interfaces  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.describe_network_interfaces_async(body)
+
+        :param DescribeNetworkInterfacesRequest body: (required)
+        :return: DescribeNetworkInterfacesResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`describe_network_interfaces_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.describe_network_interfaces_with_http_info(body, **kwargs)  # noqa: E501
+
     def describe_network_interfaces_with_http_info(self, body, **kwargs):  # noqa: E501
         """describe_network_interfaces  # noqa: E501
 
@@ -7329,6 +8454,21 @@ class VPCApi(object):
             (data) = self.describe_prefix_list_associations_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def describe_prefix_list_associations_async(self, body, **kwargs):  # noqa: E501
+        """describe_prefix_list_associations  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.describe_prefix_list_associations_async(body)
+
+        :param DescribePrefixListAssociationsRequest body: (required)
+        :return: DescribePrefixListAssociationsResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`describe_prefix_list_associations_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.describe_prefix_list_associations_with_http_info(body, **kwargs)  # noqa: E501
+
     def describe_prefix_list_associations_with_http_info(self, body, **kwargs):  # noqa: E501
         """describe_prefix_list_associations  # noqa: E501
 
@@ -7426,6 +8566,21 @@ class VPCApi(object):
             (data) = self.describe_prefix_list_entries_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def describe_prefix_list_entries_async(self, body, **kwargs):  # noqa: E501
+        """describe_prefix_list_entries  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.describe_prefix_list_entries_async(body)
+
+        :param DescribePrefixListEntriesRequest body: (required)
+        :return: DescribePrefixListEntriesResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`describe_prefix_list_entries_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.describe_prefix_list_entries_with_http_info(body, **kwargs)  # noqa: E501
+
     def describe_prefix_list_entries_with_http_info(self, body, **kwargs):  # noqa: E501
         """describe_prefix_list_entries  # noqa: E501
 
@@ -7523,6 +8678,21 @@ class VPCApi(object):
             (data) = self.describe_prefix_lists_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def describe_prefix_lists_async(self, body, **kwargs):  # noqa: E501
+        """describe_prefix_lists  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.describe_prefix_lists_async(body)
+
+        :param DescribePrefixListsRequest body: (required)
+        :return: DescribePrefixListsResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`describe_prefix_lists_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.describe_prefix_lists_with_http_info(body, **kwargs)  # noqa: E501
+
     def describe_prefix_lists_with_http_info(self, body, **kwargs):  # noqa: E501
         """describe_prefix_lists  # noqa: E501
 
@@ -7620,6 +8790,21 @@ class VPCApi(object):
             (data) = self.describe_route_entry_list_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def describe_route_entry_list_async(self, body, **kwargs):  # noqa: E501
+        """describe_route_entry_list  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.describe_route_entry_list_async(body)
+
+        :param DescribeRouteEntryListRequest body: (required)
+        :return: DescribeRouteEntryListResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`describe_route_entry_list_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.describe_route_entry_list_with_http_info(body, **kwargs)  # noqa: E501
+
     def describe_route_entry_list_with_http_info(self, body, **kwargs):  # noqa: E501
         """describe_route_entry_list  # noqa: E501
 
@@ -7717,6 +8902,21 @@ class VPCApi(object):
             (data) = self.describe_route_table_list_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def describe_route_table_list_async(self, body, **kwargs):  # noqa: E501
+        """describe_route_table_list  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.describe_route_table_list_async(body)
+
+        :param DescribeRouteTableListRequest body: (required)
+        :return: DescribeRouteTableListResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`describe_route_table_list_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.describe_route_table_list_with_http_info(body, **kwargs)  # noqa: E501
+
     def describe_route_table_list_with_http_info(self, body, **kwargs):  # noqa: E501
         """describe_route_table_list  # noqa: E501
 
@@ -7814,6 +9014,21 @@ class VPCApi(object):
             (data) = self.describe_security_group_attributes_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def describe_security_group_attributes_async(self, body, **kwargs):  # noqa: E501
+        """describe_security_group_attributes  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.describe_security_group_attributes_async(body)
+
+        :param DescribeSecurityGroupAttributesRequest body: (required)
+        :return: DescribeSecurityGroupAttributesResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`describe_security_group_attributes_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.describe_security_group_attributes_with_http_info(body, **kwargs)  # noqa: E501
+
     def describe_security_group_attributes_with_http_info(self, body, **kwargs):  # noqa: E501
         """describe_security_group_attributes  # noqa: E501
 
@@ -7911,6 +9126,21 @@ class VPCApi(object):
             (data) = self.describe_security_groups_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def describe_security_groups_async(self, body, **kwargs):  # noqa: E501
+        """describe_security_groups  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.describe_security_groups_async(body)
+
+        :param DescribeSecurityGroupsRequest body: (required)
+        :return: DescribeSecurityGroupsResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`describe_security_groups_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.describe_security_groups_with_http_info(body, **kwargs)  # noqa: E501
+
     def describe_security_groups_with_http_info(self, body, **kwargs):  # noqa: E501
         """describe_security_groups  # noqa: E501
 
@@ -8008,6 +9238,21 @@ class VPCApi(object):
             (data) = self.describe_subnet_attributes_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def describe_subnet_attributes_async(self, body, **kwargs):  # noqa: E501
+        """describe_subnet_attributes  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.describe_subnet_attributes_async(body)
+
+        :param DescribeSubnetAttributesRequest body: (required)
+        :return: DescribeSubnetAttributesResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`describe_subnet_attributes_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.describe_subnet_attributes_with_http_info(body, **kwargs)  # noqa: E501
+
     def describe_subnet_attributes_with_http_info(self, body, **kwargs):  # noqa: E501
         """describe_subnet_attributes  # noqa: E501
 
@@ -8105,6 +9350,21 @@ class VPCApi(object):
             (data) = self.describe_subnets_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def describe_subnets_async(self, body, **kwargs):  # noqa: E501
+        """describe_subnets  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.describe_subnets_async(body)
+
+        :param DescribeSubnetsRequest body: (required)
+        :return: DescribeSubnetsResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`describe_subnets_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.describe_subnets_with_http_info(body, **kwargs)  # noqa: E501
+
     def describe_subnets_with_http_info(self, body, **kwargs):  # noqa: E501
         """describe_subnets  # noqa: E501
 
@@ -8202,6 +9462,21 @@ class VPCApi(object):
             (data) = self.describe_traffic_mirror_filters_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def describe_traffic_mirror_filters_async(self, body, **kwargs):  # noqa: E501
+        """describe_traffic_mirror_filters  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.describe_traffic_mirror_filters_async(body)
+
+        :param DescribeTrafficMirrorFiltersRequest body: (required)
+        :return: DescribeTrafficMirrorFiltersResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`describe_traffic_mirror_filters_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.describe_traffic_mirror_filters_with_http_info(body, **kwargs)  # noqa: E501
+
     def describe_traffic_mirror_filters_with_http_info(self, body, **kwargs):  # noqa: E501
         """describe_traffic_mirror_filters  # noqa: E501
 
@@ -8299,6 +9574,21 @@ class VPCApi(object):
             (data) = self.describe_traffic_mirror_sessions_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def describe_traffic_mirror_sessions_async(self, body, **kwargs):  # noqa: E501
+        """describe_traffic_mirror_sessions  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.describe_traffic_mirror_sessions_async(body)
+
+        :param DescribeTrafficMirrorSessionsRequest body: (required)
+        :return: DescribeTrafficMirrorSessionsResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`describe_traffic_mirror_sessions_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.describe_traffic_mirror_sessions_with_http_info(body, **kwargs)  # noqa: E501
+
     def describe_traffic_mirror_sessions_with_http_info(self, body, **kwargs):  # noqa: E501
         """describe_traffic_mirror_sessions  # noqa: E501
 
@@ -8396,6 +9686,21 @@ class VPCApi(object):
             (data) = self.describe_traffic_mirror_targets_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def describe_traffic_mirror_targets_async(self, body, **kwargs):  # noqa: E501
+        """describe_traffic_mirror_targets  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.describe_traffic_mirror_targets_async(body)
+
+        :param DescribeTrafficMirrorTargetsRequest body: (required)
+        :return: DescribeTrafficMirrorTargetsResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`describe_traffic_mirror_targets_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.describe_traffic_mirror_targets_with_http_info(body, **kwargs)  # noqa: E501
+
     def describe_traffic_mirror_targets_with_http_info(self, body, **kwargs):  # noqa: E501
         """describe_traffic_mirror_targets  # noqa: E501
 
@@ -8493,6 +9798,21 @@ class VPCApi(object):
             (data) = self.describe_vpc_attributes_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def describe_vpc_attributes_async(self, body, **kwargs):  # noqa: E501
+        """describe_vpc_attributes  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.describe_vpc_attributes_async(body)
+
+        :param DescribeVpcAttributesRequest body: (required)
+        :return: DescribeVpcAttributesResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`describe_vpc_attributes_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.describe_vpc_attributes_with_http_info(body, **kwargs)  # noqa: E501
+
     def describe_vpc_attributes_with_http_info(self, body, **kwargs):  # noqa: E501
         """describe_vpc_attributes  # noqa: E501
 
@@ -8590,6 +9910,21 @@ class VPCApi(object):
             (data) = self.describe_vpcs_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def describe_vpcs_async(self, body, **kwargs):  # noqa: E501
+        """describe_vpcs  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.describe_vpcs_async(body)
+
+        :param DescribeVpcsRequest body: (required)
+        :return: DescribeVpcsResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`describe_vpcs_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.describe_vpcs_with_http_info(body, **kwargs)  # noqa: E501
+
     def describe_vpcs_with_http_info(self, body, **kwargs):  # noqa: E501
         """describe_vpcs  # noqa: E501
 
@@ -8687,6 +10022,21 @@ class VPCApi(object):
             (data) = self.detach_network_interface_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def detach_network_interface_async(self, body, **kwargs):  # noqa: E501
+        """detach_network_interface  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.detach_network_interface_async(body)
+
+        :param DetachNetworkInterfaceRequest body: (required)
+        :return: DetachNetworkInterfaceResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`detach_network_interface_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.detach_network_interface_with_http_info(body, **kwargs)  # noqa: E501
+
     def detach_network_interface_with_http_info(self, body, **kwargs):  # noqa: E501
         """detach_network_interface  # noqa: E501
 
@@ -8784,6 +10134,21 @@ class VPCApi(object):
             (data) = self.disassociate_eip_address_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def disassociate_eip_address_async(self, body, **kwargs):  # noqa: E501
+        """disassociate_eip_address  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.disassociate_eip_address_async(body)
+
+        :param DisassociateEipAddressRequest body: (required)
+        :return: DisassociateEipAddressResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`disassociate_eip_address_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.disassociate_eip_address_with_http_info(body, **kwargs)  # noqa: E501
+
     def disassociate_eip_address_with_http_info(self, body, **kwargs):  # noqa: E501
         """disassociate_eip_address  # noqa: E501
 
@@ -8881,6 +10246,21 @@ class VPCApi(object):
             (data) = self.disassociate_ha_vip_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def disassociate_ha_vip_async(self, body, **kwargs):  # noqa: E501
+        """disassociate_ha_vip  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.disassociate_ha_vip_async(body)
+
+        :param DisassociateHaVipRequest body: (required)
+        :return: DisassociateHaVipResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`disassociate_ha_vip_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.disassociate_ha_vip_with_http_info(body, **kwargs)  # noqa: E501
+
     def disassociate_ha_vip_with_http_info(self, body, **kwargs):  # noqa: E501
         """disassociate_ha_vip  # noqa: E501
 
@@ -8978,6 +10358,21 @@ class VPCApi(object):
             (data) = self.disassociate_network_acl_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def disassociate_network_acl_async(self, body, **kwargs):  # noqa: E501
+        """disassociate_network_acl  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.disassociate_network_acl_async(body)
+
+        :param DisassociateNetworkAclRequest body: (required)
+        :return: DisassociateNetworkAclResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`disassociate_network_acl_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.disassociate_network_acl_with_http_info(body, **kwargs)  # noqa: E501
+
     def disassociate_network_acl_with_http_info(self, body, **kwargs):  # noqa: E501
         """disassociate_network_acl  # noqa: E501
 
@@ -9075,6 +10470,21 @@ class VPCApi(object):
             (data) = self.disassociate_route_table_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def disassociate_route_table_async(self, body, **kwargs):  # noqa: E501
+        """disassociate_route_table  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.disassociate_route_table_async(body)
+
+        :param DisassociateRouteTableRequest body: (required)
+        :return: DisassociateRouteTableResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`disassociate_route_table_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.disassociate_route_table_with_http_info(body, **kwargs)  # noqa: E501
+
     def disassociate_route_table_with_http_info(self, body, **kwargs):  # noqa: E501
         """disassociate_route_table  # noqa: E501
 
@@ -9172,6 +10582,21 @@ class VPCApi(object):
             (data) = self.disassociate_vpc_cidr_block_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def disassociate_vpc_cidr_block_async(self, body, **kwargs):  # noqa: E501
+        """disassociate_vpc_cidr_block  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.disassociate_vpc_cidr_block_async(body)
+
+        :param DisassociateVpcCidrBlockRequest body: (required)
+        :return: DisassociateVpcCidrBlockResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`disassociate_vpc_cidr_block_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.disassociate_vpc_cidr_block_with_http_info(body, **kwargs)  # noqa: E501
+
     def disassociate_vpc_cidr_block_with_http_info(self, body, **kwargs):  # noqa: E501
         """disassociate_vpc_cidr_block  # noqa: E501
 
@@ -9269,6 +10694,21 @@ class VPCApi(object):
             (data) = self.list_tags_for_resources_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def list_tags_for_resources_async(self, body, **kwargs):  # noqa: E501
+        """list_tags_for_resources  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.list_tags_for_resources_async(body)
+
+        :param ListTagsForResourcesRequest body: (required)
+        :return: ListTagsForResourcesResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`list_tags_for_resources_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.list_tags_for_resources_with_http_info(body, **kwargs)  # noqa: E501
+
     def list_tags_for_resources_with_http_info(self, body, **kwargs):  # noqa: E501
         """list_tags_for_resources  # noqa: E501
 
@@ -9366,6 +10806,21 @@ class VPCApi(object):
             (data) = self.modify_bandwidth_package_attributes_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def modify_bandwidth_package_attributes_async(self, body, **kwargs):  # noqa: E501
+        """modify_bandwidth_package_attributes  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.modify_bandwidth_package_attributes_async(body)
+
+        :param ModifyBandwidthPackageAttributesRequest body: (required)
+        :return: ModifyBandwidthPackageAttributesResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`modify_bandwidth_package_attributes_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.modify_bandwidth_package_attributes_with_http_info(body, **kwargs)  # noqa: E501
+
     def modify_bandwidth_package_attributes_with_http_info(self, body, **kwargs):  # noqa: E501
         """modify_bandwidth_package_attributes  # noqa: E501
 
@@ -9463,6 +10918,21 @@ class VPCApi(object):
             (data) = self.modify_bandwidth_package_eip_bandwidth_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def modify_bandwidth_package_eip_bandwidth_async(self, body, **kwargs):  # noqa: E501
+        """modify_bandwidth_package_eip_bandwidth  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.modify_bandwidth_package_eip_bandwidth_async(body)
+
+        :param ModifyBandwidthPackageEipBandwidthRequest body: (required)
+        :return: ModifyBandwidthPackageEipBandwidthResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`modify_bandwidth_package_eip_bandwidth_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.modify_bandwidth_package_eip_bandwidth_with_http_info(body, **kwargs)  # noqa: E501
+
     def modify_bandwidth_package_eip_bandwidth_with_http_info(self, body, **kwargs):  # noqa: E501
         """modify_bandwidth_package_eip_bandwidth  # noqa: E501
 
@@ -9560,6 +11030,21 @@ class VPCApi(object):
             (data) = self.modify_bandwidth_package_spec_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def modify_bandwidth_package_spec_async(self, body, **kwargs):  # noqa: E501
+        """modify_bandwidth_package_spec  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.modify_bandwidth_package_spec_async(body)
+
+        :param ModifyBandwidthPackageSpecRequest body: (required)
+        :return: ModifyBandwidthPackageSpecResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`modify_bandwidth_package_spec_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.modify_bandwidth_package_spec_with_http_info(body, **kwargs)  # noqa: E501
+
     def modify_bandwidth_package_spec_with_http_info(self, body, **kwargs):  # noqa: E501
         """modify_bandwidth_package_spec  # noqa: E501
 
@@ -9657,6 +11142,21 @@ class VPCApi(object):
             (data) = self.modify_eip_address_attributes_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def modify_eip_address_attributes_async(self, body, **kwargs):  # noqa: E501
+        """modify_eip_address_attributes  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.modify_eip_address_attributes_async(body)
+
+        :param ModifyEipAddressAttributesRequest body: (required)
+        :return: ModifyEipAddressAttributesResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`modify_eip_address_attributes_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.modify_eip_address_attributes_with_http_info(body, **kwargs)  # noqa: E501
+
     def modify_eip_address_attributes_with_http_info(self, body, **kwargs):  # noqa: E501
         """modify_eip_address_attributes  # noqa: E501
 
@@ -9754,6 +11254,21 @@ class VPCApi(object):
             (data) = self.modify_flow_log_attribute_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def modify_flow_log_attribute_async(self, body, **kwargs):  # noqa: E501
+        """modify_flow_log_attribute  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.modify_flow_log_attribute_async(body)
+
+        :param ModifyFlowLogAttributeRequest body: (required)
+        :return: ModifyFlowLogAttributeResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`modify_flow_log_attribute_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.modify_flow_log_attribute_with_http_info(body, **kwargs)  # noqa: E501
+
     def modify_flow_log_attribute_with_http_info(self, body, **kwargs):  # noqa: E501
         """modify_flow_log_attribute  # noqa: E501
 
@@ -9851,6 +11366,21 @@ class VPCApi(object):
             (data) = self.modify_ha_vip_attributes_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def modify_ha_vip_attributes_async(self, body, **kwargs):  # noqa: E501
+        """modify_ha_vip_attributes  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.modify_ha_vip_attributes_async(body)
+
+        :param ModifyHaVipAttributesRequest body: (required)
+        :return: ModifyHaVipAttributesResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`modify_ha_vip_attributes_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.modify_ha_vip_attributes_with_http_info(body, **kwargs)  # noqa: E501
+
     def modify_ha_vip_attributes_with_http_info(self, body, **kwargs):  # noqa: E501
         """modify_ha_vip_attributes  # noqa: E501
 
@@ -9948,6 +11478,21 @@ class VPCApi(object):
             (data) = self.modify_instance_group_attributes_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def modify_instance_group_attributes_async(self, body, **kwargs):  # noqa: E501
+        """modify_instance_group_attributes  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.modify_instance_group_attributes_async(body)
+
+        :param ModifyInstanceGroupAttributesRequest body: (required)
+        :return: ModifyInstanceGroupAttributesResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`modify_instance_group_attributes_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.modify_instance_group_attributes_with_http_info(body, **kwargs)  # noqa: E501
+
     def modify_instance_group_attributes_with_http_info(self, body, **kwargs):  # noqa: E501
         """modify_instance_group_attributes  # noqa: E501
 
@@ -10045,6 +11590,21 @@ class VPCApi(object):
             (data) = self.modify_instance_group_members_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def modify_instance_group_members_async(self, body, **kwargs):  # noqa: E501
+        """modify_instance_group_members  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.modify_instance_group_members_async(body)
+
+        :param ModifyInstanceGroupMembersRequest body: (required)
+        :return: ModifyInstanceGroupMembersResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`modify_instance_group_members_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.modify_instance_group_members_with_http_info(body, **kwargs)  # noqa: E501
+
     def modify_instance_group_members_with_http_info(self, body, **kwargs):  # noqa: E501
         """modify_instance_group_members  # noqa: E501
 
@@ -10142,6 +11702,21 @@ class VPCApi(object):
             (data) = self.modify_ip_address_pool_attributes_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def modify_ip_address_pool_attributes_async(self, body, **kwargs):  # noqa: E501
+        """modify_ip_address_pool_attributes  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.modify_ip_address_pool_attributes_async(body)
+
+        :param ModifyIpAddressPoolAttributesRequest body: (required)
+        :return: ModifyIpAddressPoolAttributesResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`modify_ip_address_pool_attributes_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.modify_ip_address_pool_attributes_with_http_info(body, **kwargs)  # noqa: E501
+
     def modify_ip_address_pool_attributes_with_http_info(self, body, **kwargs):  # noqa: E501
         """modify_ip_address_pool_attributes  # noqa: E501
 
@@ -10239,6 +11814,21 @@ class VPCApi(object):
             (data) = self.modify_ipv6_address_bandwidth_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def modify_ipv6_address_bandwidth_async(self, body, **kwargs):  # noqa: E501
+        """modify_ipv6_address_bandwidth  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.modify_ipv6_address_bandwidth_async(body)
+
+        :param ModifyIpv6AddressBandwidthRequest body: (required)
+        :return: ModifyIpv6AddressBandwidthResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`modify_ipv6_address_bandwidth_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.modify_ipv6_address_bandwidth_with_http_info(body, **kwargs)  # noqa: E501
+
     def modify_ipv6_address_bandwidth_with_http_info(self, body, **kwargs):  # noqa: E501
         """modify_ipv6_address_bandwidth  # noqa: E501
 
@@ -10336,6 +11926,21 @@ class VPCApi(object):
             (data) = self.modify_ipv6_egress_only_rule_attribute_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def modify_ipv6_egress_only_rule_attribute_async(self, body, **kwargs):  # noqa: E501
+        """modify_ipv6_egress_only_rule_attribute  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.modify_ipv6_egress_only_rule_attribute_async(body)
+
+        :param ModifyIpv6EgressOnlyRuleAttributeRequest body: (required)
+        :return: ModifyIpv6EgressOnlyRuleAttributeResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`modify_ipv6_egress_only_rule_attribute_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.modify_ipv6_egress_only_rule_attribute_with_http_info(body, **kwargs)  # noqa: E501
+
     def modify_ipv6_egress_only_rule_attribute_with_http_info(self, body, **kwargs):  # noqa: E501
         """modify_ipv6_egress_only_rule_attribute  # noqa: E501
 
@@ -10433,6 +12038,21 @@ class VPCApi(object):
             (data) = self.modify_ipv6_gateway_attribute_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def modify_ipv6_gateway_attribute_async(self, body, **kwargs):  # noqa: E501
+        """modify_ipv6_gateway_attribute  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.modify_ipv6_gateway_attribute_async(body)
+
+        :param ModifyIpv6GatewayAttributeRequest body: (required)
+        :return: ModifyIpv6GatewayAttributeResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`modify_ipv6_gateway_attribute_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.modify_ipv6_gateway_attribute_with_http_info(body, **kwargs)  # noqa: E501
+
     def modify_ipv6_gateway_attribute_with_http_info(self, body, **kwargs):  # noqa: E501
         """modify_ipv6_gateway_attribute  # noqa: E501
 
@@ -10530,6 +12150,21 @@ class VPCApi(object):
             (data) = self.modify_network_acl_attributes_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def modify_network_acl_attributes_async(self, body, **kwargs):  # noqa: E501
+        """modify_network_acl_attributes  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.modify_network_acl_attributes_async(body)
+
+        :param ModifyNetworkAclAttributesRequest body: (required)
+        :return: ModifyNetworkAclAttributesResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`modify_network_acl_attributes_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.modify_network_acl_attributes_with_http_info(body, **kwargs)  # noqa: E501
+
     def modify_network_acl_attributes_with_http_info(self, body, **kwargs):  # noqa: E501
         """modify_network_acl_attributes  # noqa: E501
 
@@ -10627,6 +12262,21 @@ class VPCApi(object):
             (data) = self.modify_network_interface_attributes_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def modify_network_interface_attributes_async(self, body, **kwargs):  # noqa: E501
+        """modify_network_interface_attributes  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.modify_network_interface_attributes_async(body)
+
+        :param ModifyNetworkInterfaceAttributesRequest body: (required)
+        :return: ModifyNetworkInterfaceAttributesResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`modify_network_interface_attributes_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.modify_network_interface_attributes_with_http_info(body, **kwargs)  # noqa: E501
+
     def modify_network_interface_attributes_with_http_info(self, body, **kwargs):  # noqa: E501
         """modify_network_interface_attributes  # noqa: E501
 
@@ -10724,6 +12374,21 @@ class VPCApi(object):
             (data) = self.modify_prefix_list_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def modify_prefix_list_async(self, body, **kwargs):  # noqa: E501
+        """modify_prefix_list  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.modify_prefix_list_async(body)
+
+        :param ModifyPrefixListRequest body: (required)
+        :return: ModifyPrefixListResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`modify_prefix_list_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.modify_prefix_list_with_http_info(body, **kwargs)  # noqa: E501
+
     def modify_prefix_list_with_http_info(self, body, **kwargs):  # noqa: E501
         """modify_prefix_list  # noqa: E501
 
@@ -10821,6 +12486,21 @@ class VPCApi(object):
             (data) = self.modify_route_entry_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def modify_route_entry_async(self, body, **kwargs):  # noqa: E501
+        """modify_route_entry  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.modify_route_entry_async(body)
+
+        :param ModifyRouteEntryRequest body: (required)
+        :return: ModifyRouteEntryResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`modify_route_entry_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.modify_route_entry_with_http_info(body, **kwargs)  # noqa: E501
+
     def modify_route_entry_with_http_info(self, body, **kwargs):  # noqa: E501
         """modify_route_entry  # noqa: E501
 
@@ -10918,6 +12598,21 @@ class VPCApi(object):
             (data) = self.modify_route_table_attributes_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def modify_route_table_attributes_async(self, body, **kwargs):  # noqa: E501
+        """modify_route_table_attributes  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.modify_route_table_attributes_async(body)
+
+        :param ModifyRouteTableAttributesRequest body: (required)
+        :return: ModifyRouteTableAttributesResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`modify_route_table_attributes_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.modify_route_table_attributes_with_http_info(body, **kwargs)  # noqa: E501
+
     def modify_route_table_attributes_with_http_info(self, body, **kwargs):  # noqa: E501
         """modify_route_table_attributes  # noqa: E501
 
@@ -11015,6 +12710,21 @@ class VPCApi(object):
             (data) = self.modify_security_group_attributes_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def modify_security_group_attributes_async(self, body, **kwargs):  # noqa: E501
+        """modify_security_group_attributes  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.modify_security_group_attributes_async(body)
+
+        :param ModifySecurityGroupAttributesRequest body: (required)
+        :return: ModifySecurityGroupAttributesResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`modify_security_group_attributes_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.modify_security_group_attributes_with_http_info(body, **kwargs)  # noqa: E501
+
     def modify_security_group_attributes_with_http_info(self, body, **kwargs):  # noqa: E501
         """modify_security_group_attributes  # noqa: E501
 
@@ -11112,6 +12822,21 @@ class VPCApi(object):
             (data) = self.modify_security_group_rule_descriptions_egress_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def modify_security_group_rule_descriptions_egress_async(self, body, **kwargs):  # noqa: E501
+        """modify_security_group_rule_descriptions_egress  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.modify_security_group_rule_descriptions_egress_async(body)
+
+        :param ModifySecurityGroupRuleDescriptionsEgressRequest body: (required)
+        :return: ModifySecurityGroupRuleDescriptionsEgressResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`modify_security_group_rule_descriptions_egress_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.modify_security_group_rule_descriptions_egress_with_http_info(body, **kwargs)  # noqa: E501
+
     def modify_security_group_rule_descriptions_egress_with_http_info(self, body, **kwargs):  # noqa: E501
         """modify_security_group_rule_descriptions_egress  # noqa: E501
 
@@ -11209,6 +12934,21 @@ class VPCApi(object):
             (data) = self.modify_security_group_rule_descriptions_ingress_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def modify_security_group_rule_descriptions_ingress_async(self, body, **kwargs):  # noqa: E501
+        """modify_security_group_rule_descriptions_ingress  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.modify_security_group_rule_descriptions_ingress_async(body)
+
+        :param ModifySecurityGroupRuleDescriptionsIngressRequest body: (required)
+        :return: ModifySecurityGroupRuleDescriptionsIngressResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`modify_security_group_rule_descriptions_ingress_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.modify_security_group_rule_descriptions_ingress_with_http_info(body, **kwargs)  # noqa: E501
+
     def modify_security_group_rule_descriptions_ingress_with_http_info(self, body, **kwargs):  # noqa: E501
         """modify_security_group_rule_descriptions_ingress  # noqa: E501
 
@@ -11306,6 +13046,21 @@ class VPCApi(object):
             (data) = self.modify_subnet_attributes_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def modify_subnet_attributes_async(self, body, **kwargs):  # noqa: E501
+        """modify_subnet_attributes  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.modify_subnet_attributes_async(body)
+
+        :param ModifySubnetAttributesRequest body: (required)
+        :return: ModifySubnetAttributesResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`modify_subnet_attributes_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.modify_subnet_attributes_with_http_info(body, **kwargs)  # noqa: E501
+
     def modify_subnet_attributes_with_http_info(self, body, **kwargs):  # noqa: E501
         """modify_subnet_attributes  # noqa: E501
 
@@ -11403,6 +13158,21 @@ class VPCApi(object):
             (data) = self.modify_traffic_mirror_filter_attributes_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def modify_traffic_mirror_filter_attributes_async(self, body, **kwargs):  # noqa: E501
+        """modify_traffic_mirror_filter_attributes  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.modify_traffic_mirror_filter_attributes_async(body)
+
+        :param ModifyTrafficMirrorFilterAttributesRequest body: (required)
+        :return: ModifyTrafficMirrorFilterAttributesResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`modify_traffic_mirror_filter_attributes_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.modify_traffic_mirror_filter_attributes_with_http_info(body, **kwargs)  # noqa: E501
+
     def modify_traffic_mirror_filter_attributes_with_http_info(self, body, **kwargs):  # noqa: E501
         """modify_traffic_mirror_filter_attributes  # noqa: E501
 
@@ -11500,6 +13270,21 @@ class VPCApi(object):
             (data) = self.modify_traffic_mirror_filter_rule_attributes_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def modify_traffic_mirror_filter_rule_attributes_async(self, body, **kwargs):  # noqa: E501
+        """modify_traffic_mirror_filter_rule_attributes  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.modify_traffic_mirror_filter_rule_attributes_async(body)
+
+        :param ModifyTrafficMirrorFilterRuleAttributesRequest body: (required)
+        :return: ModifyTrafficMirrorFilterRuleAttributesResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`modify_traffic_mirror_filter_rule_attributes_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.modify_traffic_mirror_filter_rule_attributes_with_http_info(body, **kwargs)  # noqa: E501
+
     def modify_traffic_mirror_filter_rule_attributes_with_http_info(self, body, **kwargs):  # noqa: E501
         """modify_traffic_mirror_filter_rule_attributes  # noqa: E501
 
@@ -11597,6 +13382,21 @@ class VPCApi(object):
             (data) = self.modify_traffic_mirror_session_attributes_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def modify_traffic_mirror_session_attributes_async(self, body, **kwargs):  # noqa: E501
+        """modify_traffic_mirror_session_attributes  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.modify_traffic_mirror_session_attributes_async(body)
+
+        :param ModifyTrafficMirrorSessionAttributesRequest body: (required)
+        :return: ModifyTrafficMirrorSessionAttributesResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`modify_traffic_mirror_session_attributes_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.modify_traffic_mirror_session_attributes_with_http_info(body, **kwargs)  # noqa: E501
+
     def modify_traffic_mirror_session_attributes_with_http_info(self, body, **kwargs):  # noqa: E501
         """modify_traffic_mirror_session_attributes  # noqa: E501
 
@@ -11694,6 +13494,21 @@ class VPCApi(object):
             (data) = self.modify_traffic_mirror_target_attributes_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def modify_traffic_mirror_target_attributes_async(self, body, **kwargs):  # noqa: E501
+        """modify_traffic_mirror_target_attributes  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.modify_traffic_mirror_target_attributes_async(body)
+
+        :param ModifyTrafficMirrorTargetAttributesRequest body: (required)
+        :return: ModifyTrafficMirrorTargetAttributesResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`modify_traffic_mirror_target_attributes_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.modify_traffic_mirror_target_attributes_with_http_info(body, **kwargs)  # noqa: E501
+
     def modify_traffic_mirror_target_attributes_with_http_info(self, body, **kwargs):  # noqa: E501
         """modify_traffic_mirror_target_attributes  # noqa: E501
 
@@ -11791,6 +13606,21 @@ class VPCApi(object):
             (data) = self.modify_vpc_attributes_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def modify_vpc_attributes_async(self, body, **kwargs):  # noqa: E501
+        """modify_vpc_attributes  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.modify_vpc_attributes_async(body)
+
+        :param ModifyVpcAttributesRequest body: (required)
+        :return: ModifyVpcAttributesResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`modify_vpc_attributes_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.modify_vpc_attributes_with_http_info(body, **kwargs)  # noqa: E501
+
     def modify_vpc_attributes_with_http_info(self, body, **kwargs):  # noqa: E501
         """modify_vpc_attributes  # noqa: E501
 
@@ -11888,6 +13718,21 @@ class VPCApi(object):
             (data) = self.release_eip_address_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def release_eip_address_async(self, body, **kwargs):  # noqa: E501
+        """release_eip_address  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.release_eip_address_async(body)
+
+        :param ReleaseEipAddressRequest body: (required)
+        :return: ReleaseEipAddressResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`release_eip_address_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.release_eip_address_with_http_info(body, **kwargs)  # noqa: E501
+
     def release_eip_address_with_http_info(self, body, **kwargs):  # noqa: E501
         """release_eip_address  # noqa: E501
 
@@ -11985,6 +13830,21 @@ class VPCApi(object):
             (data) = self.release_ipv6_address_bandwidth_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def release_ipv6_address_bandwidth_async(self, body, **kwargs):  # noqa: E501
+        """release_ipv6_address_bandwidth  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.release_ipv6_address_bandwidth_async(body)
+
+        :param ReleaseIpv6AddressBandwidthRequest body: (required)
+        :return: ReleaseIpv6AddressBandwidthResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`release_ipv6_address_bandwidth_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.release_ipv6_address_bandwidth_with_http_info(body, **kwargs)  # noqa: E501
+
     def release_ipv6_address_bandwidth_with_http_info(self, body, **kwargs):  # noqa: E501
         """release_ipv6_address_bandwidth  # noqa: E501
 
@@ -12082,6 +13942,21 @@ class VPCApi(object):
             (data) = self.remove_bandwidth_package_ip_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def remove_bandwidth_package_ip_async(self, body, **kwargs):  # noqa: E501
+        """remove_bandwidth_package_ip  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.remove_bandwidth_package_ip_async(body)
+
+        :param RemoveBandwidthPackageIpRequest body: (required)
+        :return: RemoveBandwidthPackageIpResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`remove_bandwidth_package_ip_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.remove_bandwidth_package_ip_with_http_info(body, **kwargs)  # noqa: E501
+
     def remove_bandwidth_package_ip_with_http_info(self, body, **kwargs):  # noqa: E501
         """remove_bandwidth_package_ip  # noqa: E501
 
@@ -12179,6 +14054,21 @@ class VPCApi(object):
             (data) = self.revoke_security_group_egress_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def revoke_security_group_egress_async(self, body, **kwargs):  # noqa: E501
+        """revoke_security_group_egress  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.revoke_security_group_egress_async(body)
+
+        :param RevokeSecurityGroupEgressRequest body: (required)
+        :return: RevokeSecurityGroupEgressResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`revoke_security_group_egress_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.revoke_security_group_egress_with_http_info(body, **kwargs)  # noqa: E501
+
     def revoke_security_group_egress_with_http_info(self, body, **kwargs):  # noqa: E501
         """revoke_security_group_egress  # noqa: E501
 
@@ -12276,6 +14166,21 @@ class VPCApi(object):
             (data) = self.revoke_security_group_ingress_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def revoke_security_group_ingress_async(self, body, **kwargs):  # noqa: E501
+        """revoke_security_group_ingress  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.revoke_security_group_ingress_async(body)
+
+        :param RevokeSecurityGroupIngressRequest body: (required)
+        :return: RevokeSecurityGroupIngressResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`revoke_security_group_ingress_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.revoke_security_group_ingress_with_http_info(body, **kwargs)  # noqa: E501
+
     def revoke_security_group_ingress_with_http_info(self, body, **kwargs):  # noqa: E501
         """revoke_security_group_ingress  # noqa: E501
 
@@ -12373,6 +14278,21 @@ class VPCApi(object):
             (data) = self.tag_resources_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def tag_resources_async(self, body, **kwargs):  # noqa: E501
+        """tag_resources  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.tag_resources_async(body)
+
+        :param TagResourcesRequest body: (required)
+        :return: TagResourcesResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`tag_resources_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.tag_resources_with_http_info(body, **kwargs)  # noqa: E501
+
     def tag_resources_with_http_info(self, body, **kwargs):  # noqa: E501
         """tag_resources  # noqa: E501
 
@@ -12470,6 +14390,21 @@ class VPCApi(object):
             (data) = self.temporary_upgrade_eip_address_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def temporary_upgrade_eip_address_async(self, body, **kwargs):  # noqa: E501
+        """temporary_upgrade_eip_address  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.temporary_upgrade_eip_address_async(body)
+
+        :param TemporaryUpgradeEipAddressRequest body: (required)
+        :return: TemporaryUpgradeEipAddressResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`temporary_upgrade_eip_address_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.temporary_upgrade_eip_address_with_http_info(body, **kwargs)  # noqa: E501
+
     def temporary_upgrade_eip_address_with_http_info(self, body, **kwargs):  # noqa: E501
         """temporary_upgrade_eip_address  # noqa: E501
 
@@ -12567,6 +14502,21 @@ class VPCApi(object):
             (data) = self.unassign_ipv6_addresses_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def unassign_ipv6_addresses_async(self, body, **kwargs):  # noqa: E501
+        """unassign_ipv6_addresses  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.unassign_ipv6_addresses_async(body)
+
+        :param UnassignIpv6AddressesRequest body: (required)
+        :return: UnassignIpv6AddressesResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`unassign_ipv6_addresses_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.unassign_ipv6_addresses_with_http_info(body, **kwargs)  # noqa: E501
+
     def unassign_ipv6_addresses_with_http_info(self, body, **kwargs):  # noqa: E501
         """unassign_ipv6_addresses  # noqa: E501
 
@@ -12664,6 +14614,21 @@ class VPCApi(object):
             (data) = self.unassign_private_ip_addresses_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def unassign_private_ip_addresses_async(self, body, **kwargs):  # noqa: E501
+        """unassign_private_ip_addresses  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.unassign_private_ip_addresses_async(body)
+
+        :param UnassignPrivateIpAddressesRequest body: (required)
+        :return: UnassignPrivateIpAddressesResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`unassign_private_ip_addresses_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.unassign_private_ip_addresses_with_http_info(body, **kwargs)  # noqa: E501
+
     def unassign_private_ip_addresses_with_http_info(self, body, **kwargs):  # noqa: E501
         """unassign_private_ip_addresses  # noqa: E501
 
@@ -12761,6 +14726,21 @@ class VPCApi(object):
             (data) = self.untag_resources_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def untag_resources_async(self, body, **kwargs):  # noqa: E501
+        """untag_resources  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.untag_resources_async(body)
+
+        :param UntagResourcesRequest body: (required)
+        :return: UntagResourcesResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`untag_resources_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.untag_resources_with_http_info(body, **kwargs)  # noqa: E501
+
     def untag_resources_with_http_info(self, body, **kwargs):  # noqa: E501
         """untag_resources  # noqa: E501
 
@@ -12858,6 +14838,21 @@ class VPCApi(object):
             (data) = self.update_network_acl_entries_with_http_info(body, **kwargs)  # noqa: E501
             return data
 
+    def update_network_acl_entries_async(self, body, **kwargs):  # noqa: E501
+        """update_network_acl_entries  # noqa: E501
+
+        This method returns an awaitable and requires the api client to be a
+        byteplussdkcore.AsyncApiClient
+        >>> result = await api.update_network_acl_entries_async(body)
+
+        :param UpdateNetworkAclEntriesRequest body: (required)
+        :return: UpdateNetworkAclEntriesResponse
+        """
+        if not getattr(self.api_client, 'is_async', False):
+            raise TypeError("`update_network_acl_entries_async` requires a byteplussdkcore.AsyncApiClient")  # noqa: E501
+        kwargs['_return_http_data_only'] = True
+        return self.update_network_acl_entries_with_http_info(body, **kwargs)  # noqa: E501
+
     def update_network_acl_entries_with_http_info(self, body, **kwargs):  # noqa: E501
         """update_network_acl_entries  # noqa: E501
 
@@ -14,380 +14,390 @@
 
 from __future__ import absolute_import
 
-# import models into model package
-from byteplussdkvpc.models.active_flow_log_request import ActiveFlowLogRequest
-from byteplussdkvpc.models.active_flow_log_response import ActiveFlowLogResponse
-from byteplussdkvpc.models.add_bandwidth_package_ip_request import AddBandwidthPackageIpRequest
-from byteplussdkvpc.models.add_bandwidth_package_ip_response import AddBandwidthPackageIpResponse
-from byteplussdkvpc.models.add_ip_address_pool_cidr_block_request import AddIpAddressPoolCidrBlockRequest
-from byteplussdkvpc.models.add_ip_address_pool_cidr_block_response import AddIpAddressPoolCidrBlockResponse
-from byteplussdkvpc.models.add_prefix_list_entry_for_modify_prefix_list_input import AddPrefixListEntryForModifyPrefixListInput
-from byteplussdkvpc.models.allocate_eip_address_request import AllocateEipAddressRequest
-from byteplussdkvpc.models.allocate_eip_address_response import AllocateEipAddressResponse
-from byteplussdkvpc.models.allocate_ipv6_address_bandwidth_request import AllocateIpv6AddressBandwidthRequest
-from byteplussdkvpc.models.allocate_ipv6_address_bandwidth_response import AllocateIpv6AddressBandwidthResponse
-from byteplussdkvpc.models.append_member_for_modify_instance_group_members_input import AppendMemberForModifyInstanceGroupMembersInput
-from byteplussdkvpc.models.assign_ipv6_addresses_request import AssignIpv6AddressesRequest
-from byteplussdkvpc.models.assign_ipv6_addresses_response import AssignIpv6AddressesResponse
-from byteplussdkvpc.models.assign_private_ip_addresses_request import AssignPrivateIpAddressesRequest
-from byteplussdkvpc.models.assign_private_ip_addresses_response import AssignPrivateIpAddressesResponse
-from byteplussdkvpc.models.associate_cen_for_describe_vpc_attributes_output import AssociateCenForDescribeVpcAttributesOutput
-from byteplussdkvpc.models.associate_cen_for_describe_vpcs_output import AssociateCenForDescribeVpcsOutput
-from byteplussdkvpc.models.associate_eip_address_request import AssociateEipAddressRequest
-from byteplussdkvpc.models.associate_eip_address_response import AssociateEipAddressResponse
-from byteplussdkvpc.models.associate_ha_vip_request import AssociateHaVipRequest
-from byteplussdkvpc.models.associate_ha_vip_response import AssociateHaVipResponse
-from byteplussdkvpc.models.associate_network_acl_request import AssociateNetworkAclRequest
-from byteplussdkvpc.models.associate_network_acl_response import AssociateNetworkAclResponse
-from byteplussdkvpc.models.associate_route_table_request import AssociateRouteTableRequest
-from byteplussdkvpc.models.associate_route_table_response import AssociateRouteTableResponse
-from byteplussdkvpc.models.associate_vpc_cidr_block_request import AssociateVpcCidrBlockRequest
-from byteplussdkvpc.models.associate_vpc_cidr_block_response import AssociateVpcCidrBlockResponse
-from byteplussdkvpc.models.associated_elastic_ip_for_describe_network_interface_attributes_output import AssociatedElasticIpForDescribeNetworkInterfaceAttributesOutput
-from byteplussdkvpc.models.associated_elastic_ip_for_describe_network_interfaces_output import AssociatedElasticIpForDescribeNetworkInterfacesOutput
-from byteplussdkvpc.models.attach_network_interface_request import AttachNetworkInterfaceRequest
-from byteplussdkvpc.models.attach_network_interface_response import AttachNetworkInterfaceResponse
-from byteplussdkvpc.models.authorize_security_group_egress_request import AuthorizeSecurityGroupEgressRequest
-from byteplussdkvpc.models.authorize_security_group_egress_response import AuthorizeSecurityGroupEgressResponse
-from byteplussdkvpc.models.authorize_security_group_ingress_request import AuthorizeSecurityGroupIngressRequest
-from byteplussdkvpc.models.authorize_security_group_ingress_response import AuthorizeSecurityGroupIngressResponse
-from byteplussdkvpc.models.bandwidth_package_for_describe_bandwidth_packages_output import BandwidthPackageForDescribeBandwidthPackagesOutput
-from byteplussdkvpc.models.cancel_bandwidth_package_eip_bandwidth_request import CancelBandwidthPackageEipBandwidthRequest
-from byteplussdkvpc.models.cancel_bandwidth_package_eip_bandwidth_response import CancelBandwidthPackageEipBandwidthResponse
-from byteplussdkvpc.models.convert_eip_address_billing_type_request import ConvertEipAddressBillingTypeRequest
-from byteplussdkvpc.models.convert_eip_address_billing_type_response import ConvertEipAddressBillingTypeResponse
-from byteplussdkvpc.models.create_bandwidth_package_request import CreateBandwidthPackageRequest
-from byteplussdkvpc.models.create_bandwidth_package_response import CreateBandwidthPackageResponse
-from byteplussdkvpc.models.create_flow_log_request import CreateFlowLogRequest
-from byteplussdkvpc.models.create_flow_log_response import CreateFlowLogResponse
-from byteplussdkvpc.models.create_ha_vip_request import CreateHaVipRequest
-from byteplussdkvpc.models.create_ha_vip_response import CreateHaVipResponse
-from byteplussdkvpc.models.create_instance_group_request import CreateInstanceGroupRequest
-from byteplussdkvpc.models.create_instance_group_response import CreateInstanceGroupResponse
-from byteplussdkvpc.models.create_ip_address_pool_request import CreateIpAddressPoolRequest
-from byteplussdkvpc.models.create_ip_address_pool_response import CreateIpAddressPoolResponse
-from byteplussdkvpc.models.create_ipv6_egress_only_rule_request import CreateIpv6EgressOnlyRuleRequest
-from byteplussdkvpc.models.create_ipv6_egress_only_rule_response import CreateIpv6EgressOnlyRuleResponse
-from byteplussdkvpc.models.create_ipv6_gateway_request import CreateIpv6GatewayRequest
-from byteplussdkvpc.models.create_ipv6_gateway_response import CreateIpv6GatewayResponse
-from byteplussdkvpc.models.create_network_acl_request import CreateNetworkAclRequest
-from byteplussdkvpc.models.create_network_acl_response import CreateNetworkAclResponse
-from byteplussdkvpc.models.create_network_interface_request import CreateNetworkInterfaceRequest
-from byteplussdkvpc.models.create_network_interface_response import CreateNetworkInterfaceResponse
-from byteplussdkvpc.models.create_prefix_list_request import CreatePrefixListRequest
-from byteplussdkvpc.models.create_prefix_list_response import CreatePrefixListResponse
-from byteplussdkvpc.models.create_route_entry_request import CreateRouteEntryRequest
-from byteplussdkvpc.models.create_route_entry_response import CreateRouteEntryResponse
-from byteplussdkvpc.models.create_route_table_request import CreateRouteTableRequest
-from byteplussdkvpc.models.create_route_table_response import CreateRouteTableResponse
-from byteplussdkvpc.models.create_security_group_request import CreateSecurityGroupRequest
-from byteplussdkvpc.models.create_security_group_response import CreateSecurityGroupResponse
-from byteplussdkvpc.models.create_subnet_request import CreateSubnetRequest
-from byteplussdkvpc.models.create_subnet_response import CreateSubnetResponse
-from byteplussdkvpc.models.create_traffic_mirror_filter_request import CreateTrafficMirrorFilterRequest
-from byteplussdkvpc.models.create_traffic_mirror_filter_response import CreateTrafficMirrorFilterResponse
-from byteplussdkvpc.models.create_traffic_mirror_filter_rule_request import CreateTrafficMirrorFilterRuleRequest
-from byteplussdkvpc.models.create_traffic_mirror_filter_rule_response import CreateTrafficMirrorFilterRuleResponse
-from byteplussdkvpc.models.create_traffic_mirror_session_request import CreateTrafficMirrorSessionRequest
-from byteplussdkvpc.models.create_traffic_mirror_session_response import CreateTrafficMirrorSessionResponse
-from byteplussdkvpc.models.create_traffic_mirror_target_request import CreateTrafficMirrorTargetRequest
-from byteplussdkvpc.models.create_traffic_mirror_target_response import CreateTrafficMirrorTargetResponse
-from byteplussdkvpc.models.create_vpc_request import CreateVpcRequest
-from byteplussdkvpc.models.create_vpc_response import CreateVpcResponse
-from byteplussdkvpc.models.deactive_flow_log_request import DeactiveFlowLogRequest
-from byteplussdkvpc.models.deactive_flow_log_response import DeactiveFlowLogResponse
-from byteplussdkvpc.models.delete_bandwidth_package_request import DeleteBandwidthPackageRequest
-from byteplussdkvpc.models.delete_bandwidth_package_response import DeleteBandwidthPackageResponse
-from byteplussdkvpc.models.delete_flow_log_request import DeleteFlowLogRequest
-from byteplussdkvpc.models.delete_flow_log_response import DeleteFlowLogResponse
-from byteplussdkvpc.models.delete_ha_vip_request import DeleteHaVipRequest
-from byteplussdkvpc.models.delete_ha_vip_response import DeleteHaVipResponse
-from byteplussdkvpc.models.delete_instance_group_request import DeleteInstanceGroupRequest
-from byteplussdkvpc.models.delete_instance_group_response import DeleteInstanceGroupResponse
-from byteplussdkvpc.models.delete_ip_address_pool_cidr_block_request import DeleteIpAddressPoolCidrBlockRequest
-from byteplussdkvpc.models.delete_ip_address_pool_cidr_block_response import DeleteIpAddressPoolCidrBlockResponse
-from byteplussdkvpc.models.delete_ip_address_pool_request import DeleteIpAddressPoolRequest
-from byteplussdkvpc.models.delete_ip_address_pool_response import DeleteIpAddressPoolResponse
-from byteplussdkvpc.models.delete_ipv6_egress_only_rule_request import DeleteIpv6EgressOnlyRuleRequest
-from byteplussdkvpc.models.delete_ipv6_egress_only_rule_response import DeleteIpv6EgressOnlyRuleResponse
-from byteplussdkvpc.models.delete_ipv6_gateway_request import DeleteIpv6GatewayRequest
-from byteplussdkvpc.models.delete_ipv6_gateway_response import DeleteIpv6GatewayResponse
-from byteplussdkvpc.models.delete_network_acl_request import DeleteNetworkAclRequest
-from byteplussdkvpc.models.delete_network_acl_response import DeleteNetworkAclResponse
-from byteplussdkvpc.models.delete_network_interface_request import DeleteNetworkInterfaceRequest
-from byteplussdkvpc.models.delete_network_interface_response import DeleteNetworkInterfaceResponse
-from byteplussdkvpc.models.delete_prefix_list_request import DeletePrefixListRequest
-from byteplussdkvpc.models.delete_prefix_list_response import DeletePrefixListResponse
-from byteplussdkvpc.models.delete_route_entry_request import DeleteRouteEntryRequest
-from byteplussdkvpc.models.delete_route_entry_response import DeleteRouteEntryResponse
-from byteplussdkvpc.models.delete_route_table_request import DeleteRouteTableRequest
-from byteplussdkvpc.models.delete_route_table_response import DeleteRouteTableResponse
-from byteplussdkvpc.models.delete_security_group_request import DeleteSecurityGroupRequest
-from byteplussdkvpc.models.delete_security_group_response import DeleteSecurityGroupResponse
-from byteplussdkvpc.models.delete_subnet_request import DeleteSubnetRequest
-from byteplussdkvpc.models.delete_subnet_response import DeleteSubnetResponse
-from byteplussdkvpc.models.delete_traffic_mirror_filter_request import DeleteTrafficMirrorFilterRequest
-from byteplussdkvpc.models.delete_traffic_mirror_filter_response import DeleteTrafficMirrorFilterResponse
-from byteplussdkvpc.models.delete_traffic_mirror_filter_rule_request import DeleteTrafficMirrorFilterRuleRequest
-from byteplussdkvpc.models.delete_traffic_mirror_filter_rule_response import DeleteTrafficMirrorFilterRuleResponse
-from byteplussdkvpc.models.delete_traffic_mirror_session_request import DeleteTrafficMirrorSessionRequest
-from byteplussdkvpc.models.delete_traffic_mirror_session_response import DeleteTrafficMirrorSessionResponse
-from byteplussdkvpc.models.delete_traffic_mirror_target_request import DeleteTrafficMirrorTargetRequest
-from byteplussdkvpc.models.delete_traffic_mirror_target_response import DeleteTrafficMirrorTargetResponse
-from byteplussdkvpc.models.delete_vpc_request import DeleteVpcRequest
-from byteplussdkvpc.models.delete_vpc_response import DeleteVpcResponse
-from byteplussdkvpc.models.describe_bandwidth_packages_request import DescribeBandwidthPackagesRequest
-from byteplussdkvpc.models.describe_bandwidth_packages_response import DescribeBandwidthPackagesResponse
-from byteplussdkvpc.models.describe_eip_address_attributes_request import DescribeEipAddressAttributesRequest
-from byteplussdkvpc.models.describe_eip_address_attributes_response import DescribeEipAddressAttributesResponse
-from byteplussdkvpc.models.describe_eip_addresses_request import DescribeEipAddressesRequest
-from byteplussdkvpc.models.describe_eip_addresses_response import DescribeEipAddressesResponse
-from byteplussdkvpc.models.describe_flow_logs_request import DescribeFlowLogsRequest
-from byteplussdkvpc.models.describe_flow_logs_response import DescribeFlowLogsResponse
-from byteplussdkvpc.models.describe_ha_vips_request import DescribeHaVipsRequest
-from byteplussdkvpc.models.describe_ha_vips_response import DescribeHaVipsResponse
-from byteplussdkvpc.models.describe_instance_groups_request import DescribeInstanceGroupsRequest
-from byteplussdkvpc.models.describe_instance_groups_response import DescribeInstanceGroupsResponse
-from byteplussdkvpc.models.describe_ip_address_pool_attributes_request import DescribeIpAddressPoolAttributesRequest
-from byteplussdkvpc.models.describe_ip_address_pool_attributes_response import DescribeIpAddressPoolAttributesResponse
-from byteplussdkvpc.models.describe_ip_address_pool_cidr_blocks_request import DescribeIpAddressPoolCidrBlocksRequest
-from byteplussdkvpc.models.describe_ip_address_pool_cidr_blocks_response import DescribeIpAddressPoolCidrBlocksResponse
-from byteplussdkvpc.models.describe_ip_address_pools_request import DescribeIpAddressPoolsRequest
-from byteplussdkvpc.models.describe_ip_address_pools_response import DescribeIpAddressPoolsResponse
-from byteplussdkvpc.models.describe_ipv6_address_bandwidth_attributes_request import DescribeIpv6AddressBandwidthAttributesRequest
-from byteplussdkvpc.models.describe_ipv6_address_bandwidth_attributes_response import DescribeIpv6AddressBandwidthAttributesResponse
-from byteplussdkvpc.models.describe_ipv6_address_bandwidths_request import DescribeIpv6AddressBandwidthsRequest
-from byteplussdkvpc.models.describe_ipv6_address_bandwidths_response import DescribeIpv6AddressBandwidthsResponse
-from byteplussdkvpc.models.describe_ipv6_egress_only_rules_request import DescribeIpv6EgressOnlyRulesRequest
-from byteplussdkvpc.models.describe_ipv6_egress_only_rules_response import DescribeIpv6EgressOnlyRulesResponse
-from byteplussdkvpc.models.describe_ipv6_gateway_attribute_request import DescribeIpv6GatewayAttributeRequest
-from byteplussdkvpc.models.describe_ipv6_gateway_attribute_response import DescribeIpv6GatewayAttributeResponse
-from byteplussdkvpc.models.describe_ipv6_gateways_request import DescribeIpv6GatewaysRequest
-from byteplussdkvpc.models.describe_ipv6_gateways_response import DescribeIpv6GatewaysResponse
-from byteplussdkvpc.models.describe_network_acl_attributes_request import DescribeNetworkAclAttributesRequest
-from byteplussdkvpc.models.describe_network_acl_attributes_response import DescribeNetworkAclAttributesResponse
-from byteplussdkvpc.models.describe_network_acls_request import DescribeNetworkAclsRequest
-from byteplussdkvpc.models.describe_network_acls_response import DescribeNetworkAclsResponse
-from byteplussdkvpc.models.describe_network_interface_attributes_request import DescribeNetworkInterfaceAttributesRequest
-from byteplussdkvpc.models.describe_network_interface_attributes_response import DescribeNetworkInterfaceAttributesResponse
-from byteplussdkvpc.models.describe_network_interfaces_request import DescribeNetworkInterfacesRequest
-from byteplussdkvpc.models.describe_network_interfaces_response import DescribeNetworkInterfacesResponse
-from byteplussdkvpc.models.describe_prefix_list_associations_request import DescribePrefixListAssociationsRequest
-from byteplussdkvpc.models.describe_prefix_list_associations_response import DescribePrefixListAssociationsResponse
-from byteplussdkvpc.models.describe_prefix_list_entries_request import DescribePrefixListEntriesRequest
-from byteplussdkvpc.models.describe_prefix_list_entries_response import DescribePrefixListEntriesResponse
-from byteplussdkvpc.models.describe_prefix_lists_request import DescribePrefixListsRequest
-from byteplussdkvpc.models.describe_prefix_lists_response import DescribePrefixListsResponse
-from byteplussdkvpc.models.describe_route_entry_list_request import DescribeRouteEntryListRequest
-from byteplussdkvpc.models.describe_route_entry_list_response import DescribeRouteEntryListResponse
-from byteplussdkvpc.models.describe_route_table_list_request import DescribeRouteTableListRequest
-from byteplussdkvpc.models.describe_route_table_list_response import DescribeRouteTableListResponse
-from byteplussdkvpc.models.describe_security_group_attributes_request import DescribeSecurityGroupAttributesRequest
-from byteplussdkvpc.models.describe_security_group_attributes_response import DescribeSecurityGroupAttributesResponse
-from byteplussdkvpc.models.describe_security_groups_request import DescribeSecurityGroupsRequest
-from byteplussdkvpc.models.describe_security_groups_response import DescribeSecurityGroupsResponse
-from byteplussdkvpc.models.describe_subnet_attributes_request import DescribeSubnetAttributesRequest
-from byteplussdkvpc.models.describe_subnet_attributes_response import DescribeSubnetAttributesResponse
-from byteplussdkvpc.models.describe_subnets_request import DescribeSubnetsRequest
-from byteplussdkvpc.models.describe_subnets_response import DescribeSubnetsResponse
-from byteplussdkvpc.models.describe_traffic_mirror_filters_request import DescribeTrafficMirrorFiltersRequest
-from byteplussdkvpc.models.describe_traffic_mirror_filters_response import DescribeTrafficMirrorFiltersResponse
-from byteplussdkvpc.models.describe_traffic_mirror_sessions_request import DescribeTrafficMirrorSessionsRequest
-from byteplussdkvpc.models.describe_traffic_mirror_sessions_response import DescribeTrafficMirrorSessionsResponse
-from byteplussdkvpc.models.describe_traffic_mirror_targets_request import DescribeTrafficMirrorTargetsRequest
-from byteplussdkvpc.models.describe_traffic_mirror_targets_response import DescribeTrafficMirrorTargetsResponse
-from byteplussdkvpc.models.describe_vpc_attributes_request import DescribeVpcAttributesRequest
-from byteplussdkvpc.models.describe_vpc_attributes_response import DescribeVpcAttributesResponse
-from byteplussdkvpc.models.describe_vpcs_request import DescribeVpcsRequest
-from byteplussdkvpc.models.describe_vpcs_response import DescribeVpcsResponse
-from byteplussdkvpc.models.detach_network_interface_request import DetachNetworkInterfaceRequest
-from byteplussdkvpc.models.detach_network_interface_response import DetachNetworkInterfaceResponse
-from byteplussdkvpc.models.disassociate_eip_address_request import DisassociateEipAddressRequest
-from byteplussdkvpc.models.disassociate_eip_address_response import DisassociateEipAddressResponse
-from byteplussdkvpc.models.disassociate_ha_vip_request import DisassociateHaVipRequest
-from byteplussdkvpc.models.disassociate_ha_vip_response import DisassociateHaVipResponse
-from byteplussdkvpc.models.disassociate_network_acl_request import DisassociateNetworkAclRequest
-from byteplussdkvpc.models.disassociate_network_acl_response import DisassociateNetworkAclResponse
-from byteplussdkvpc.models.disassociate_route_table_request import DisassociateRouteTableRequest
-from byteplussdkvpc.models.disassociate_route_table_response import DisassociateRouteTableResponse
-from byteplussdkvpc.models.disassociate_vpc_cidr_block_request import DisassociateVpcCidrBlockRequest
-from byteplussdkvpc.models.disassociate_vpc_cidr_block_response import DisassociateVpcCidrBlockResponse
-from byteplussdkvpc.models.egress_acl_entry_for_describe_network_acl_attributes_output import EgressAclEntryForDescribeNetworkAclAttributesOutput
-from byteplussdkvpc.models.egress_acl_entry_for_describe_network_acls_output import EgressAclEntryForDescribeNetworkAclsOutput
-from byteplussdkvpc.models.egress_acl_entry_for_update_network_acl_entries_input import EgressAclEntryForUpdateNetworkAclEntriesInput
-from byteplussdkvpc.models.egress_filter_rule_for_describe_traffic_mirror_filters_output import EgressFilterRuleForDescribeTrafficMirrorFiltersOutput
-from byteplussdkvpc.models.eip_address_for_describe_bandwidth_packages_output import EipAddressForDescribeBandwidthPackagesOutput
-from byteplussdkvpc.models.eip_address_for_describe_eip_addresses_output import EipAddressForDescribeEipAddressesOutput
-from byteplussdkvpc.models.flow_log_for_describe_flow_logs_output import FlowLogForDescribeFlowLogsOutput
-from byteplussdkvpc.models.ha_vip_for_describe_ha_vips_output import HaVipForDescribeHaVipsOutput
-from byteplussdkvpc.models.ingress_acl_entry_for_describe_network_acl_attributes_output import IngressAclEntryForDescribeNetworkAclAttributesOutput
-from byteplussdkvpc.models.ingress_acl_entry_for_describe_network_acls_output import IngressAclEntryForDescribeNetworkAclsOutput
-from byteplussdkvpc.models.ingress_acl_entry_for_update_network_acl_entries_input import IngressAclEntryForUpdateNetworkAclEntriesInput
-from byteplussdkvpc.models.ingress_filter_rule_for_describe_traffic_mirror_filters_output import IngressFilterRuleForDescribeTrafficMirrorFiltersOutput
-from byteplussdkvpc.models.instance_group_for_describe_instance_groups_output import InstanceGroupForDescribeInstanceGroupsOutput
-from byteplussdkvpc.models.ip_address_pool_cidr_block_for_describe_ip_address_pool_cidr_blocks_output import IpAddressPoolCidrBlockForDescribeIpAddressPoolCidrBlocksOutput
-from byteplussdkvpc.models.ip_address_pool_for_describe_ip_address_pools_output import IpAddressPoolForDescribeIpAddressPoolsOutput
-from byteplussdkvpc.models.ipv6_address_bandwidth_for_describe_ipv6_address_bandwidths_output import Ipv6AddressBandwidthForDescribeIpv6AddressBandwidthsOutput
-from byteplussdkvpc.models.ipv6_egress_rule_for_describe_ipv6_egress_only_rules_output import Ipv6EgressRuleForDescribeIpv6EgressOnlyRulesOutput
-from byteplussdkvpc.models.ipv6_gateway_for_describe_ipv6_gateways_output import Ipv6GatewayForDescribeIpv6GatewaysOutput
-from byteplussdkvpc.models.list_tags_for_resources_request import ListTagsForResourcesRequest
-from byteplussdkvpc.models.list_tags_for_resources_response import ListTagsForResourcesResponse
-from byteplussdkvpc.models.member_for_describe_instance_groups_output import MemberForDescribeInstanceGroupsOutput
-from byteplussdkvpc.models.modify_bandwidth_package_attributes_request import ModifyBandwidthPackageAttributesRequest
-from byteplussdkvpc.models.modify_bandwidth_package_attributes_response import ModifyBandwidthPackageAttributesResponse
-from byteplussdkvpc.models.modify_bandwidth_package_eip_bandwidth_request import ModifyBandwidthPackageEipBandwidthRequest
-from byteplussdkvpc.models.modify_bandwidth_package_eip_bandwidth_response import ModifyBandwidthPackageEipBandwidthResponse
-from byteplussdkvpc.models.modify_bandwidth_package_spec_request import ModifyBandwidthPackageSpecRequest
-from byteplussdkvpc.models.modify_bandwidth_package_spec_response import ModifyBandwidthPackageSpecResponse
-from byteplussdkvpc.models.modify_eip_address_attributes_request import ModifyEipAddressAttributesRequest
-from byteplussdkvpc.models.modify_eip_address_attributes_response import ModifyEipAddressAttributesResponse
-from byteplussdkvpc.models.modify_flow_log_attribute_request import ModifyFlowLogAttributeRequest
-from byteplussdkvpc.models.modify_flow_log_attribute_response import ModifyFlowLogAttributeResponse
-from byteplussdkvpc.models.modify_ha_vip_attributes_request import ModifyHaVipAttributesRequest
-from byteplussdkvpc.models.modify_ha_vip_attributes_response import ModifyHaVipAttributesResponse
-from byteplussdkvpc.models.modify_instance_group_attributes_request import ModifyInstanceGroupAttributesRequest
-from byteplussdkvpc.models.modify_instance_group_attributes_response import ModifyInstanceGroupAttributesResponse
-from byteplussdkvpc.models.modify_instance_group_members_request import ModifyInstanceGroupMembersRequest
-from byteplussdkvpc.models.modify_instance_group_members_response import ModifyInstanceGroupMembersResponse
-from byteplussdkvpc.models.modify_ip_address_pool_attributes_request import ModifyIpAddressPoolAttributesRequest
-from byteplussdkvpc.models.modify_ip_address_pool_attributes_response import ModifyIpAddressPoolAttributesResponse
-from byteplussdkvpc.models.modify_ipv6_address_bandwidth_request import ModifyIpv6AddressBandwidthRequest
-from byteplussdkvpc.models.modify_ipv6_address_bandwidth_response import ModifyIpv6AddressBandwidthResponse
-from byteplussdkvpc.models.modify_ipv6_egress_only_rule_attribute_request import ModifyIpv6EgressOnlyRuleAttributeRequest
-from byteplussdkvpc.models.modify_ipv6_egress_only_rule_attribute_response import ModifyIpv6EgressOnlyRuleAttributeResponse
-from byteplussdkvpc.models.modify_ipv6_gateway_attribute_request import ModifyIpv6GatewayAttributeRequest
-from byteplussdkvpc.models.modify_ipv6_gateway_attribute_response import ModifyIpv6GatewayAttributeResponse
-from byteplussdkvpc.models.modify_network_acl_attributes_request import ModifyNetworkAclAttributesRequest
-from byteplussdkvpc.models.modify_network_acl_attributes_response import ModifyNetworkAclAttributesResponse
-from byteplussdkvpc.models.modify_network_interface_attributes_request import ModifyNetworkInterfaceAttributesRequest
-from byteplussdkvpc.models.modify_network_interface_attributes_response import ModifyNetworkInterfaceAttributesResponse
-from byteplussdkvpc.models.modify_prefix_list_request import ModifyPrefixListRequest
-from byteplussdkvpc.models.modify_prefix_list_response import ModifyPrefixListResponse
-from byteplussdkvpc.models.modify_route_entry_request import ModifyRouteEntryRequest
-from byteplussdkvpc.models.modify_route_entry_response import ModifyRouteEntryResponse
-from byteplussdkvpc.models.modify_route_table_attributes_request import ModifyRouteTableAttributesRequest
-from byteplussdkvpc.models.modify_route_table_attributes_response import ModifyRouteTableAttributesResponse
-from byteplussdkvpc.models.modify_security_group_attributes_request import ModifySecurityGroupAttributesRequest
-from byteplussdkvpc.models.modify_security_group_attributes_response import ModifySecurityGroupAttributesResponse
-from byteplussdkvpc.models.modify_security_group_rule_descriptions_egress_request import ModifySecurityGroupRuleDescriptionsEgressRequest
-from byteplussdkvpc.models.modify_security_group_rule_descriptions_egress_response import ModifySecurityGroupRuleDescriptionsEgressResponse
-from byteplussdkvpc.models.modify_security_group_rule_descriptions_ingress_request import ModifySecurityGroupRuleDescriptionsIngressRequest
-from byteplussdkvpc.models.modify_security_group_rule_descriptions_ingress_response import ModifySecurityGroupRuleDescriptionsIngressResponse
-from byteplussdkvpc.models.modify_subnet_attributes_request import ModifySubnetAttributesRequest
-from byteplussdkvpc.models.modify_subnet_attributes_response import ModifySubnetAttributesResponse
-from byteplussdkvpc.models.modify_traffic_mirror_filter_attributes_request import ModifyTrafficMirrorFilterAttributesRequest
-from byteplussdkvpc.models.modify_traffic_mirror_filter_attributes_response import ModifyTrafficMirrorFilterAttributesResponse
-from byteplussdkvpc.models.modify_traffic_mirror_filter_rule_attributes_request import ModifyTrafficMirrorFilterRuleAttributesRequest
-from byteplussdkvpc.models.modify_traffic_mirror_filter_rule_attributes_response import ModifyTrafficMirrorFilterRuleAttributesResponse
-from byteplussdkvpc.models.modify_traffic_mirror_session_attributes_request import ModifyTrafficMirrorSessionAttributesRequest
-from byteplussdkvpc.models.modify_traffic_mirror_session_attributes_response import ModifyTrafficMirrorSessionAttributesResponse
-from byteplussdkvpc.models.modify_traffic_mirror_target_attributes_request import ModifyTrafficMirrorTargetAttributesRequest
-from byteplussdkvpc.models.modify_traffic_mirror_target_attributes_response import ModifyTrafficMirrorTargetAttributesResponse
-from byteplussdkvpc.models.modify_vpc_attributes_request import ModifyVpcAttributesRequest
-from byteplussdkvpc.models.modify_vpc_attributes_response import ModifyVpcAttributesResponse
-from byteplussdkvpc.models.network_acl_attribute_for_describe_network_acl_attributes_output import NetworkAclAttributeForDescribeNetworkAclAttributesOutput
-from byteplussdkvpc.models.network_acl_for_describe_network_acls_output import NetworkAclForDescribeNetworkAclsOutput
-from byteplussdkvpc.models.network_interface_set_for_describe_network_interfaces_output import NetworkInterfaceSetForDescribeNetworkInterfacesOutput
-from byteplussdkvpc.models.permission_for_describe_security_group_attributes_output import PermissionForDescribeSecurityGroupAttributesOutput
-from byteplussdkvpc.models.prefix_list_association_for_describe_prefix_list_associations_output import PrefixListAssociationForDescribePrefixListAssociationsOutput
-from byteplussdkvpc.models.prefix_list_entry_for_create_prefix_list_input import PrefixListEntryForCreatePrefixListInput
-from byteplussdkvpc.models.prefix_list_entry_for_describe_prefix_list_entries_output import PrefixListEntryForDescribePrefixListEntriesOutput
-from byteplussdkvpc.models.prefix_list_for_describe_prefix_lists_output import PrefixListForDescribePrefixListsOutput
-from byteplussdkvpc.models.private_ip_set_for_describe_network_interface_attributes_output import PrivateIpSetForDescribeNetworkInterfaceAttributesOutput
-from byteplussdkvpc.models.private_ip_set_for_describe_network_interfaces_output import PrivateIpSetForDescribeNetworkInterfacesOutput
-from byteplussdkvpc.models.private_ip_sets_for_describe_network_interface_attributes_output import PrivateIpSetsForDescribeNetworkInterfaceAttributesOutput
-from byteplussdkvpc.models.private_ip_sets_for_describe_network_interfaces_output import PrivateIpSetsForDescribeNetworkInterfacesOutput
-from byteplussdkvpc.models.release_eip_address_request import ReleaseEipAddressRequest
-from byteplussdkvpc.models.release_eip_address_response import ReleaseEipAddressResponse
-from byteplussdkvpc.models.release_ipv6_address_bandwidth_request import ReleaseIpv6AddressBandwidthRequest
-from byteplussdkvpc.models.release_ipv6_address_bandwidth_response import ReleaseIpv6AddressBandwidthResponse
-from byteplussdkvpc.models.remove_bandwidth_package_ip_request import RemoveBandwidthPackageIpRequest
-from byteplussdkvpc.models.remove_bandwidth_package_ip_response import RemoveBandwidthPackageIpResponse
-from byteplussdkvpc.models.remove_member_for_modify_instance_group_members_input import RemoveMemberForModifyInstanceGroupMembersInput
-from byteplussdkvpc.models.remove_prefix_list_entry_for_modify_prefix_list_input import RemovePrefixListEntryForModifyPrefixListInput
-from byteplussdkvpc.models.resource_for_associate_network_acl_input import ResourceForAssociateNetworkAclInput
-from byteplussdkvpc.models.resource_for_describe_network_acl_attributes_output import ResourceForDescribeNetworkAclAttributesOutput
-from byteplussdkvpc.models.resource_for_describe_network_acls_output import ResourceForDescribeNetworkAclsOutput
-from byteplussdkvpc.models.resource_for_disassociate_network_acl_input import ResourceForDisassociateNetworkAclInput
-from byteplussdkvpc.models.resource_tag_for_list_tags_for_resources_output import ResourceTagForListTagsForResourcesOutput
-from byteplussdkvpc.models.revoke_security_group_egress_request import RevokeSecurityGroupEgressRequest
-from byteplussdkvpc.models.revoke_security_group_egress_response import RevokeSecurityGroupEgressResponse
-from byteplussdkvpc.models.revoke_security_group_ingress_request import RevokeSecurityGroupIngressRequest
-from byteplussdkvpc.models.revoke_security_group_ingress_response import RevokeSecurityGroupIngressResponse
-from byteplussdkvpc.models.route_entry_for_describe_route_entry_list_output import RouteEntryForDescribeRouteEntryListOutput
-from byteplussdkvpc.models.route_table_for_describe_subnet_attributes_output import RouteTableForDescribeSubnetAttributesOutput
-from byteplussdkvpc.models.route_table_for_describe_subnets_output import RouteTableForDescribeSubnetsOutput
-from byteplussdkvpc.models.router_table_list_for_describe_route_table_list_output import RouterTableListForDescribeRouteTableListOutput
-from byteplussdkvpc.models.security_group_for_describe_security_groups_output import SecurityGroupForDescribeSecurityGroupsOutput
-from byteplussdkvpc.models.subnet_for_describe_subnets_output import SubnetForDescribeSubnetsOutput
-from byteplussdkvpc.models.tag_filter_for_describe_bandwidth_packages_input import TagFilterForDescribeBandwidthPackagesInput
-from byteplussdkvpc.models.tag_filter_for_describe_eip_addresses_input import TagFilterForDescribeEipAddressesInput
-from byteplussdkvpc.models.tag_filter_for_describe_flow_logs_input import TagFilterForDescribeFlowLogsInput
-from byteplussdkvpc.models.tag_filter_for_describe_ha_vips_input import TagFilterForDescribeHaVipsInput
-from byteplussdkvpc.models.tag_filter_for_describe_ip_address_pools_input import TagFilterForDescribeIpAddressPoolsInput
-from byteplussdkvpc.models.tag_filter_for_describe_ipv6_gateways_input import TagFilterForDescribeIpv6GatewaysInput
-from byteplussdkvpc.models.tag_filter_for_describe_network_acls_input import TagFilterForDescribeNetworkAclsInput
-from byteplussdkvpc.models.tag_filter_for_describe_network_interfaces_input import TagFilterForDescribeNetworkInterfacesInput
-from byteplussdkvpc.models.tag_filter_for_describe_prefix_lists_input import TagFilterForDescribePrefixListsInput
-from byteplussdkvpc.models.tag_filter_for_describe_route_table_list_input import TagFilterForDescribeRouteTableListInput
-from byteplussdkvpc.models.tag_filter_for_describe_security_groups_input import TagFilterForDescribeSecurityGroupsInput
-from byteplussdkvpc.models.tag_filter_for_describe_subnets_input import TagFilterForDescribeSubnetsInput
-from byteplussdkvpc.models.tag_filter_for_describe_traffic_mirror_filters_input import TagFilterForDescribeTrafficMirrorFiltersInput
-from byteplussdkvpc.models.tag_filter_for_describe_traffic_mirror_sessions_input import TagFilterForDescribeTrafficMirrorSessionsInput
-from byteplussdkvpc.models.tag_filter_for_describe_traffic_mirror_targets_input import TagFilterForDescribeTrafficMirrorTargetsInput
-from byteplussdkvpc.models.tag_filter_for_describe_vpcs_input import TagFilterForDescribeVpcsInput
-from byteplussdkvpc.models.tag_filter_for_list_tags_for_resources_input import TagFilterForListTagsForResourcesInput
-from byteplussdkvpc.models.tag_for_allocate_eip_address_input import TagForAllocateEipAddressInput
-from byteplussdkvpc.models.tag_for_create_bandwidth_package_input import TagForCreateBandwidthPackageInput
-from byteplussdkvpc.models.tag_for_create_flow_log_input import TagForCreateFlowLogInput
-from byteplussdkvpc.models.tag_for_create_ha_vip_input import TagForCreateHaVipInput
-from byteplussdkvpc.models.tag_for_create_ip_address_pool_input import TagForCreateIpAddressPoolInput
-from byteplussdkvpc.models.tag_for_create_network_acl_input import TagForCreateNetworkAclInput
-from byteplussdkvpc.models.tag_for_create_network_interface_input import TagForCreateNetworkInterfaceInput
-from byteplussdkvpc.models.tag_for_create_prefix_list_input import TagForCreatePrefixListInput
-from byteplussdkvpc.models.tag_for_create_route_table_input import TagForCreateRouteTableInput
-from byteplussdkvpc.models.tag_for_create_security_group_input import TagForCreateSecurityGroupInput
-from byteplussdkvpc.models.tag_for_create_subnet_input import TagForCreateSubnetInput
-from byteplussdkvpc.models.tag_for_create_traffic_mirror_filter_input import TagForCreateTrafficMirrorFilterInput
-from byteplussdkvpc.models.tag_for_create_traffic_mirror_session_input import TagForCreateTrafficMirrorSessionInput
-from byteplussdkvpc.models.tag_for_create_traffic_mirror_target_input import TagForCreateTrafficMirrorTargetInput
-from byteplussdkvpc.models.tag_for_create_vpc_input import TagForCreateVpcInput
-from byteplussdkvpc.models.tag_for_describe_bandwidth_packages_output import TagForDescribeBandwidthPackagesOutput
-from byteplussdkvpc.models.tag_for_describe_eip_address_attributes_output import TagForDescribeEipAddressAttributesOutput
-from byteplussdkvpc.models.tag_for_describe_eip_addresses_output import TagForDescribeEipAddressesOutput
-from byteplussdkvpc.models.tag_for_describe_flow_logs_output import TagForDescribeFlowLogsOutput
-from byteplussdkvpc.models.tag_for_describe_ha_vips_output import TagForDescribeHaVipsOutput
-from byteplussdkvpc.models.tag_for_describe_ip_address_pool_attributes_output import TagForDescribeIpAddressPoolAttributesOutput
-from byteplussdkvpc.models.tag_for_describe_ip_address_pools_output import TagForDescribeIpAddressPoolsOutput
-from byteplussdkvpc.models.tag_for_describe_network_acl_attributes_output import TagForDescribeNetworkAclAttributesOutput
-from byteplussdkvpc.models.tag_for_describe_network_acls_output import TagForDescribeNetworkAclsOutput
-from byteplussdkvpc.models.tag_for_describe_network_interface_attributes_output import TagForDescribeNetworkInterfaceAttributesOutput
-from byteplussdkvpc.models.tag_for_describe_network_interfaces_output import TagForDescribeNetworkInterfacesOutput
-from byteplussdkvpc.models.tag_for_describe_prefix_lists_output import TagForDescribePrefixListsOutput
-from byteplussdkvpc.models.tag_for_describe_route_table_list_output import TagForDescribeRouteTableListOutput
-from byteplussdkvpc.models.tag_for_describe_security_group_attributes_output import TagForDescribeSecurityGroupAttributesOutput
-from byteplussdkvpc.models.tag_for_describe_security_groups_output import TagForDescribeSecurityGroupsOutput
-from byteplussdkvpc.models.tag_for_describe_subnet_attributes_output import TagForDescribeSubnetAttributesOutput
-from byteplussdkvpc.models.tag_for_describe_subnets_output import TagForDescribeSubnetsOutput
-from byteplussdkvpc.models.tag_for_describe_traffic_mirror_filters_output import TagForDescribeTrafficMirrorFiltersOutput
-from byteplussdkvpc.models.tag_for_describe_traffic_mirror_sessions_output import TagForDescribeTrafficMirrorSessionsOutput
-from byteplussdkvpc.models.tag_for_describe_traffic_mirror_targets_output import TagForDescribeTrafficMirrorTargetsOutput
-from byteplussdkvpc.models.tag_for_describe_vpc_attributes_output import TagForDescribeVpcAttributesOutput
-from byteplussdkvpc.models.tag_for_describe_vpcs_output import TagForDescribeVpcsOutput
-from byteplussdkvpc.models.tag_for_tag_resources_input import TagForTagResourcesInput
-from byteplussdkvpc.models.tag_resources_request import TagResourcesRequest
-from byteplussdkvpc.models.tag_resources_response import TagResourcesResponse
-from byteplussdkvpc.models.temporary_upgrade_eip_address_request import TemporaryUpgradeEipAddressRequest
-from byteplussdkvpc.models.temporary_upgrade_eip_address_response import TemporaryUpgradeEipAddressResponse
-from byteplussdkvpc.models.traffic_mirror_filter_for_describe_traffic_mirror_filters_output import TrafficMirrorFilterForDescribeTrafficMirrorFiltersOutput
-from byteplussdkvpc.models.traffic_mirror_session_for_describe_traffic_mirror_sessions_output import TrafficMirrorSessionForDescribeTrafficMirrorSessionsOutput
-from byteplussdkvpc.models.traffic_mirror_target_for_describe_traffic_mirror_targets_output import TrafficMirrorTargetForDescribeTrafficMirrorTargetsOutput
-from byteplussdkvpc.models.unassign_ipv6_addresses_request import UnassignIpv6AddressesRequest
-from byteplussdkvpc.models.unassign_ipv6_addresses_response import UnassignIpv6AddressesResponse
-from byteplussdkvpc.models.unassign_private_ip_addresses_request import UnassignPrivateIpAddressesRequest
-from byteplussdkvpc.models.unassign_private_ip_addresses_response import UnassignPrivateIpAddressesResponse
-from byteplussdkvpc.models.untag_resources_request import UntagResourcesRequest
-from byteplussdkvpc.models.untag_resources_response import UntagResourcesResponse
-from byteplussdkvpc.models.update_network_acl_entries_request import UpdateNetworkAclEntriesRequest
-from byteplussdkvpc.models.update_network_acl_entries_response import UpdateNetworkAclEntriesResponse
-from byteplussdkvpc.models.vpc_for_describe_vpcs_output import VpcForDescribeVpcsOutput
+from byteplussdkcore.lazy import LazyImporter
+
+# generated modules are imported on first attribute access, see LazyImporter
+_importer = LazyImporter(__name__, {
+    # import models into model package
+    'ActiveFlowLogRequest': 'byteplussdkvpc.models.active_flow_log_request',
+    'ActiveFlowLogResponse': 'byteplussdkvpc.models.active_flow_log_response',
+    'AddBandwidthPackageIpRequest': 'byteplussdkvpc.models.add_bandwidth_package_ip_request',
+    'AddBandwidthPackageIpResponse': 'byteplussdkvpc.models.add_bandwidth_package_ip_response',
+    'AddIpAddressPoolCidrBlockRequest': 'byteplussdkvpc.models.add_ip_address_pool_cidr_block_request',
+    'AddIpAddressPoolCidrBlockResponse': 'byteplussdkvpc.models.add_ip_address_pool_cidr_block_response',
+    'AddPrefixListEntryForModifyPrefixListInput': 'byteplussdkvpc.models.add_prefix_list_entry_for_modify_prefix_list_input',
+    'AllocateEipAddressRequest': 'byteplussdkvpc.models.allocate_eip_address_request',
+    'AllocateEipAddressResponse': 'byteplussdkvpc.models.allocate_eip_address_response',
+    'AllocateIpv6AddressBandwidthRequest': 'byteplussdkvpc.models.allocate_ipv6_address_bandwidth_request',
+    'AllocateIpv6AddressBandwidthResponse': 'byteplussdkvpc.models.allocate_ipv6_address_bandwidth_response',
+    'AppendMemberForModifyInstanceGroupMembersInput': 'byteplussdkvpc.models.append_member_for_modify_instance_group_members_input',
+    'AssignIpv6AddressesRequest': 'byteplussdkvpc.models.assign_ipv6_addresses_request',
+    'AssignIpv6AddressesResponse': 'byteplussdkvpc.models.assign_ipv6_addresses_response',
+    'AssignPrivateIpAddressesRequest': 'byteplussdkvpc.models.assign_private_ip_addresses_request',
+    'AssignPrivateIpAddressesResponse': 'byteplussdkvpc.models.assign_private_ip_addresses_response',
+    'AssociateCenForDescribeVpcAttributesOutput': 'byteplussdkvpc.models.associate_cen_for_describe_vpc_attributes_output',
+    'AssociateCenForDescribeVpcsOutput': 'byteplussdkvpc.models.associate_cen_for_describe_vpcs_output',
+    'AssociateEipAddressRequest': 'byteplussdkvpc.models.associate_eip_address_request',
+    'AssociateEipAddressResponse': 'byteplussdkvpc.models.associate_eip_address_response',
+    'AssociateHaVipRequest': 'byteplussdkvpc.models.associate_ha_vip_request',
+    'AssociateHaVipResponse': 'byteplussdkvpc.models.associate_ha_vip_response',
+    'AssociateNetworkAclRequest': 'byteplussdkvpc.models.associate_network_acl_request',
+    'AssociateNetworkAclResponse': 'byteplussdkvpc.models.associate_network_acl_response',
+    'AssociateRouteTableRequest': 'byteplussdkvpc.models.associate_route_table_request',
+    'AssociateRouteTableResponse': 'byteplussdkvpc.models.associate_route_table_response',
+    'AssociateVpcCidrBlockRequest': 'byteplussdkvpc.models.associate_vpc_cidr_block_request',
+    'AssociateVpcCidrBlockResponse': 'byteplussdkvpc.models.associate_vpc_cidr_block_response',
+    'AssociatedElasticIpForDescribeNetworkInterfaceAttributesOutput': 'byteplussdkvpc.models.associated_elastic_ip_for_describe_network_interface_attributes_output',
+    'AssociatedElasticIpForDescribeNetworkInterfacesOutput': 'byteplussdkvpc.models.associated_elastic_ip_for_describe_network_interfaces_output',
+    'AttachNetworkInterfaceRequest': 'byteplussdkvpc.models.attach_network_interface_request',
+    'AttachNetworkInterfaceResponse': 'byteplussdkvpc.models.attach_network_interface_response',
+    'AuthorizeSecurityGroupEgressRequest': 'byteplussdkvpc.models.authorize_security_group_egress_request',
+    'AuthorizeSecurityGroupEgressResponse': 'byteplussdkvpc.models.authorize_security_group_egress_response',
+    'AuthorizeSecurityGroupIngressRequest': 'byteplussdkvpc.models.authorize_security_group_ingress_request',
+    'AuthorizeSecurityGroupIngressResponse': 'byteplussdkvpc.models.authorize_security_group_ingress_response',
+    'BandwidthPackageForDescribeBandwidthPackagesOutput': 'byteplussdkvpc.models.bandwidth_package_for_describe_bandwidth_packages_output',
+    'CancelBandwidthPackageEipBandwidthRequest': 'byteplussdkvpc.models.cancel_bandwidth_package_eip_bandwidth_request',
+    'CancelBandwidthPackageEipBandwidthResponse': 'byteplussdkvpc.models.cancel_bandwidth_package_eip_bandwidth_response',
+    'ConvertEipAddressBillingTypeRequest': 'byteplussdkvpc.models.convert_eip_address_billing_type_request',
+    'ConvertEipAddressBillingTypeResponse': 'byteplussdkvpc.models.convert_eip_address_billing_type_response',
+    'CreateBandwidthPackageRequest': 'byteplussdkvpc.models.create_bandwidth_package_request',
+    'CreateBandwidthPackageResponse': 'byteplussdkvpc.models.create_bandwidth_package_response',
+    'CreateFlowLogRequest': 'byteplussdkvpc.models.create_flow_log_request',
+    'CreateFlowLogResponse': 'byteplussdkvpc.models.create_flow_log_response',
+    'CreateHaVipRequest': 'byteplussdkvpc.models.create_ha_vip_request',
+    'CreateHaVipResponse': 'byteplussdkvpc.models.create_ha_vip_response',
+    'CreateInstanceGroupRequest': 'byteplussdkvpc.models.create_instance_group_request',
+    'CreateInstanceGroupResponse': 'byteplussdkvpc.models.create_instance_group_response',
+    'CreateIpAddressPoolRequest': 'byteplussdkvpc.models.create_ip_address_pool_request',
+    'CreateIpAddressPoolResponse': 'byteplussdkvpc.models.create_ip_address_pool_response',
+    'CreateIpv6EgressOnlyRuleRequest': 'byteplussdkvpc.models.create_ipv6_egress_only_rule_request',
+    'CreateIpv6EgressOnlyRuleResponse': 'byteplussdkvpc.models.create_ipv6_egress_only_rule_response',
+    'CreateIpv6GatewayRequest': 'byteplussdkvpc.models.create_ipv6_gateway_request',
+    'CreateIpv6GatewayResponse': 'byteplussdkvpc.models.create_ipv6_gateway_response',
+    'CreateNetworkAclRequest': 'byteplussdkvpc.models.create_network_acl_request',
+    'CreateNetworkAclResponse': 'byteplussdkvpc.models.create_network_acl_response',
+    'CreateNetworkInterfaceRequest': 'byteplussdkvpc.models.create_network_interface_request',
+    'CreateNetworkInterfaceResponse': 'byteplussdkvpc.models.create_network_interface_response',
+    'CreatePrefixListRequest': 'byteplussdkvpc.models.create_prefix_list_request',
+    'CreatePrefixListResponse': 'byteplussdkvpc.models.create_prefix_list_response',
+    'CreateRouteEntryRequest': 'byteplussdkvpc.models.create_route_entry_request',
+    'CreateRouteEntryResponse': 'byteplussdkvpc.models.create_route_entry_response',
+    'CreateRouteTableRequest': 'byteplussdkvpc.models.create_route_table_request',
+    'CreateRouteTableResponse': 'byteplussdkvpc.models.create_route_table_response',
+    'CreateSecurityGroupRequest': 'byteplussdkvpc.models.create_security_group_request',
+    'CreateSecurityGroupResponse': 'byteplussdkvpc.models.create_security_group_response',
+    'CreateSubnetRequest': 'byteplussdkvpc.models.create_subnet_request',
+    'CreateSubnetResponse': 'byteplussdkvpc.models.create_subnet_response',
+    'CreateTrafficMirrorFilterRequest': 'byteplussdkvpc.models.create_traffic_mirror_filter_request',
+    'CreateTrafficMirrorFilterResponse': 'byteplussdkvpc.models.create_traffic_mirror_filter_response',
+    'CreateTrafficMirrorFilterRuleRequest': 'byteplussdkvpc.models.create_traffic_mirror_filter_rule_request',
+    'CreateTrafficMirrorFilterRuleResponse': 'byteplussdkvpc.models.create_traffic_mirror_filter_rule_response',
+    'CreateTrafficMirrorSessionRequest': 'byteplussdkvpc.models.create_traffic_mirror_session_request',
+    'CreateTrafficMirrorSessionResponse': 'byteplussdkvpc.models.create_traffic_mirror_session_response',
+    'CreateTrafficMirrorTargetRequest': 'byteplussdkvpc.models.create_traffic_mirror_target_request',
+    'CreateTrafficMirrorTargetResponse': 'byteplussdkvpc.models.create_traffic_mirror_target_response',
+    'CreateVpcRequest': 'byteplussdkvpc.models.create_vpc_request',
+    'CreateVpcResponse': 'byteplussdkvpc.models.create_vpc_response',
+    'DeactiveFlowLogRequest': 'byteplussdkvpc.models.deactive_flow_log_request',
+    'DeactiveFlowLogResponse': 'byteplussdkvpc.models.deactive_flow_log_response',
+    'DeleteBandwidthPackageRequest': 'byteplussdkvpc.models.delete_bandwidth_package_request',
+    'DeleteBandwidthPackageResponse': 'byteplussdkvpc.models.delete_bandwidth_package_response',
+    'DeleteFlowLogRequest': 'byteplussdkvpc.models.delete_flow_log_request',
+    'DeleteFlowLogResponse': 'byteplussdkvpc.models.delete_flow_log_response',
+    'DeleteHaVipRequest': 'byteplussdkvpc.models.delete_ha_vip_request',
+    'DeleteHaVipResponse': 'byteplussdkvpc.models.delete_ha_vip_response',
+    'DeleteInstanceGroupRequest': 'byteplussdkvpc.models.delete_instance_group_request',
+    'DeleteInstanceGroupResponse': 'byteplussdkvpc.models.delete_instance_group_response',
+    'DeleteIpAddressPoolCidrBlockRequest': 'byteplussdkvpc.models.delete_ip_address_pool_cidr_block_request',
+    'DeleteIpAddressPoolCidrBlockResponse': 'byteplussdkvpc.models.delete_ip_address_pool_cidr_block_response',
+    'DeleteIpAddressPoolRequest': 'byteplussdkvpc.models.delete_ip_address_pool_request',
+    'DeleteIpAddressPoolResponse': 'byteplussdkvpc.models.delete_ip_address_pool_response',
+    'DeleteIpv6EgressOnlyRuleRequest': 'byteplussdkvpc.models.delete_ipv6_egress_only_rule_request',
+    'DeleteIpv6EgressOnlyRuleResponse': 'byteplussdkvpc.models.delete_ipv6_egress_only_rule_response',
+    'DeleteIpv6GatewayRequest': 'byteplussdkvpc.models.delete_ipv6_gateway_request',
+    'DeleteIpv6GatewayResponse': 'byteplussdkvpc.models.delete_ipv6_gateway_response',
+    'DeleteNetworkAclRequest': 'byteplussdkvpc.models.delete_network_acl_request',
+    'DeleteNetworkAclResponse': 'byteplussdkvpc.models.delete_network_acl_response',
+    'DeleteNetworkInterfaceRequest': 'byteplussdkvpc.models.delete_network_interface_request',
+    'DeleteNetworkInterfaceResponse': 'byteplussdkvpc.models.delete_network_interface_response',
+    'DeletePrefixListRequest': 'byteplussdkvpc.models.delete_prefix_list_request',
+    'DeletePrefixListResponse': 'byteplussdkvpc.models.delete_prefix_list_response',
+    'DeleteRouteEntryRequest': 'byteplussdkvpc.models.delete_route_entry_request',
+    'DeleteRouteEntryResponse': 'byteplussdkvpc.models.delete_route_entry_response',
+    'DeleteRouteTableRequest': 'byteplussdkvpc.models.delete_route_table_request',
+    'DeleteRouteTableResponse': 'byteplussdkvpc.models.delete_route_table_response',
+    'DeleteSecurityGroupRequest': 'byteplussdkvpc.models.delete_security_group_request',
+    'DeleteSecurityGroupResponse': 'byteplussdkvpc.models.delete_security_group_response',
+    'DeleteSubnetRequest': 'byteplussdkvpc.models.delete_subnet_request',
+    'DeleteSubnetResponse': 'byteplussdkvpc.models.delete_subnet_response',
+    'DeleteTrafficMirrorFilterRequest': 'byteplussdkvpc.models.delete_traffic_mirror_filter_request',
+    'DeleteTrafficMirrorFilterResponse': 'byteplussdkvpc.models.delete_traffic_mirror_filter_response',
+    'DeleteTrafficMirrorFilterRuleRequest': 'byteplussdkvpc.models.delete_traffic_mirror_filter_rule_request',
+    'DeleteTrafficMirrorFilterRuleResponse': 'byteplussdkvpc.models.delete_traffic_mirror_filter_rule_response',
+    'DeleteTrafficMirrorSessionRequest': 'byteplussdkvpc.models.delete_traffic_mirror_session_request',
+    'DeleteTrafficMirrorSessionResponse': 'byteplussdkvpc.models.delete_traffic_mirror_session_response',
+    'DeleteTrafficMirrorTargetRequest': 'byteplussdkvpc.models.delete_traffic_mirror_target_request',
+    'DeleteTrafficMirrorTargetResponse': 'byteplussdkvpc.models.delete_traffic_mirror_target_response',
+    'DeleteVpcRequest': 'byteplussdkvpc.models.delete_vpc_request',
+    'DeleteVpcResponse': 'byteplussdkvpc.models.delete_vpc_response',
+    'DescribeBandwidthPackagesRequest': 'byteplussdkvpc.models.describe_bandwidth_packages_request',
+    'DescribeBandwidthPackagesResponse': 'byteplussdkvpc.models.describe_bandwidth_packages_response',
+    'DescribeEipAddressAttributesRequest': 'byteplussdkvpc.models.describe_eip_address_attributes_request',
+    'DescribeEipAddressAttributesResponse': 'byteplussdkvpc.models.describe_eip_address_attributes_response',
+    'DescribeEipAddressesRequest': 'byteplussdkvpc.models.describe_eip_addresses_request',
+    'DescribeEipAddressesResponse': 'byteplussdkvpc.models.describe_eip_addresses_response',
+    'DescribeFlowLogsRequest': 'byteplussdkvpc.models.describe_flow_logs_request',
+    'DescribeFlowLogsResponse': 'byteplussdkvpc.models.describe_flow_logs_response',
+    'DescribeHaVipsRequest': 'byteplussdkvpc.models.describe_ha_vips_request',
+    'DescribeHaVipsResponse': 'byteplussdkvpc.models.describe_ha_vips_response',
+    'DescribeInstanceGroupsRequest': 'byteplussdkvpc.models.describe_instance_groups_request',
+    'DescribeInstanceGroupsResponse': 'byteplussdkvpc.models.describe_instance_groups_response',
+    'DescribeIpAddressPoolAttributesRequest': 'byteplussdkvpc.models.describe_ip_address_pool_attributes_request',
+    'DescribeIpAddressPoolAttributesResponse': 'byteplussdkvpc.models.describe_ip_address_pool_attributes_response',
+    'DescribeIpAddressPoolCidrBlocksRequest': 'byteplussdkvpc.models.describe_ip_address_pool_cidr_blocks_request',
+    'DescribeIpAddressPoolCidrBlocksResponse': 'byteplussdkvpc.models.describe_ip_address_pool_cidr_blocks_response',
+    'DescribeIpAddressPoolsRequest': 'byteplussdkvpc.models.describe_ip_address_pools_request',
+    'DescribeIpAddressPoolsResponse': 'byteplussdkvpc.models.describe_ip_address_pools_response',
+    'DescribeIpv6AddressBandwidthAttributesRequest': 'byteplussdkvpc.models.describe_ipv6_address_bandwidth_attributes_request',
+    'DescribeIpv6AddressBandwidthAttributesResponse': 'byteplussdkvpc.models.describe_ipv6_address_bandwidth_attributes_response',
+    'DescribeIpv6AddressBandwidthsRequest': 'byteplussdkvpc.models.describe_ipv6_address_bandwidths_request',
+    'DescribeIpv6AddressBandwidthsResponse': 'byteplussdkvpc.models.describe_ipv6_address_bandwidths_response',
+    'DescribeIpv6EgressOnlyRulesRequest': 'byteplussdkvpc.models.describe_ipv6_egress_only_rules_request',
+    'DescribeIpv6EgressOnlyRulesResponse': 'byteplussdkvpc.models.describe_ipv6_egress_only_rules_response',
+    'DescribeIpv6GatewayAttributeRequest': 'byteplussdkvpc.models.describe_ipv6_gateway_attribute_request',
+    'DescribeIpv6GatewayAttributeResponse': 'byteplussdkvpc.models.describe_ipv6_gateway_attribute_response',
+    'DescribeIpv6GatewaysRequest': 'byteplussdkvpc.models.describe_ipv6_gateways_request',
+    'DescribeIpv6GatewaysResponse': 'byteplussdkvpc.models.describe_ipv6_gateways_response',
+    'DescribeNetworkAclAttributesRequest': 'byteplussdkvpc.models.describe_network_acl_attributes_request',
+    'DescribeNetworkAclAttributesResponse': 'byteplussdkvpc.models.describe_network_acl_attributes_response',
+    'DescribeNetworkAclsRequest': 'byteplussdkvpc.models.describe_network_acls_request',
+    'DescribeNetworkAclsResponse': 'byteplussdkvpc.models.describe_network_acls_response',
+    'DescribeNetworkInterfaceAttributesRequest': 'byteplussdkvpc.models.describe_network_interface_attributes_request',
+    'DescribeNetworkInterfaceAttributesResponse': 'byteplussdkvpc.models.describe_network_interface_attributes_response',
+    'DescribeNetworkInterfacesRequest': 'byteplussdkvpc.models.describe_network_interfaces_request',
+    'DescribeNetworkInterfacesResponse': 'byteplussdkvpc.models.describe_network_interfaces_response',
+    'DescribePrefixListAssociationsRequest': 'byteplussdkvpc.models.describe_prefix_list_associations_request',
+    'DescribePrefixListAssociationsResponse': 'byteplussdkvpc.models.describe_prefix_list_associations_response',
+    'DescribePrefixListEntriesRequest': 'byteplussdkvpc.models.describe_prefix_list_entries_request',
+    'DescribePrefixListEntriesResponse': 'byteplussdkvpc.models.describe_prefix_list_entries_response',
+    'DescribePrefixListsRequest': 'byteplussdkvpc.models.describe_prefix_lists_request',
+    'DescribePrefixListsResponse': 'byteplussdkvpc.models.describe_prefix_lists_response',
+    'DescribeRouteEntryListRequest': 'byteplussdkvpc.models.describe_route_entry_list_request',
+    'DescribeRouteEntryListResponse': 'byteplussdkvpc.models.describe_route_entry_list_response',
+    'DescribeRouteTableListRequest': 'byteplussdkvpc.models.describe_route_table_list_request',
+    'DescribeRouteTableListResponse': 'byteplussdkvpc.models.describe_route_table_list_response',
+    'DescribeSecurityGroupAttributesRequest': 'byteplussdkvpc.models.describe_security_group_attributes_request',
+    'DescribeSecurityGroupAttributesResponse': 'byteplussdkvpc.models.describe_security_group_attributes_response',
+    'DescribeSecurityGroupsRequest': 'byteplussdkvpc.models.describe_security_groups_request',
+    'DescribeSecurityGroupsResponse': 'byteplussdkvpc.models.describe_security_groups_response',
+    'DescribeSubnetAttributesRequest': 'byteplussdkvpc.models.describe_subnet_attributes_request',
+    'DescribeSubnetAttributesResponse': 'byteplussdkvpc.models.describe_subnet_attributes_response',
+    'DescribeSubnetsRequest': 'byteplussdkvpc.models.describe_subnets_request',
+    'DescribeSubnetsResponse': 'byteplussdkvpc.models.describe_subnets_response',
+    'DescribeTrafficMirrorFiltersRequest': 'byteplussdkvpc.models.describe_traffic_mirror_filters_request',
+    'DescribeTrafficMirrorFiltersResponse': 'byteplussdkvpc.models.describe_traffic_mirror_filters_response',
+    'DescribeTrafficMirrorSessionsRequest': 'byteplussdkvpc.models.describe_traffic_mirror_sessions_request',
+    'DescribeTrafficMirrorSessionsResponse': 'byteplussdkvpc.models.describe_traffic_mirror_sessions_response',
+    'DescribeTrafficMirrorTargetsRequest': 'byteplussdkvpc.models.describe_traffic_mirror_targets_request',
+    'DescribeTrafficMirrorTargetsResponse': 'byteplussdkvpc.models.describe_traffic_mirror_targets_response',
+    'DescribeVpcAttributesRequest': 'byteplussdkvpc.models.describe_vpc_attributes_request',
+    'DescribeVpcAttributesResponse': 'byteplussdkvpc.models.describe_vpc_attributes_response',
+    'DescribeVpcsRequest': 'byteplussdkvpc.models.describe_vpcs_request',
+    'DescribeVpcsResponse': 'byteplussdkvpc.models.describe_vpcs_response',
+    'DetachNetworkInterfaceRequest': 'byteplussdkvpc.models.detach_network_interface_request',
+    'DetachNetworkInterfaceResponse': 'byteplussdkvpc.models.detach_network_interface_response',
+    'DisassociateEipAddressRequest': 'byteplussdkvpc.models.disassociate_eip_address_request',
+    'DisassociateEipAddressResponse': 'byteplussdkvpc.models.disassociate_eip_address_response',
+    'DisassociateHaVipRequest': 'byteplussdkvpc.models.disassociate_ha_vip_request',
+    'DisassociateHaVipResponse': 'byteplussdkvpc.models.disassociate_ha_vip_response',
+    'DisassociateNetworkAclRequest': 'byteplussdkvpc.models.disassociate_network_acl_request',
+    'DisassociateNetworkAclResponse': 'byteplussdkvpc.models.disassociate_network_acl_response',
+    'DisassociateRouteTableRequest': 'byteplussdkvpc.models.disassociate_route_table_request',
+    'DisassociateRouteTableResponse': 'byteplussdkvpc.models.disassociate_route_table_response',
+    'DisassociateVpcCidrBlockRequest': 'byteplussdkvpc.models.disassociate_vpc_cidr_block_request',
+    'DisassociateVpcCidrBlockResponse': 'byteplussdkvpc.models.disassociate_vpc_cidr_block_response',
+    'EgressAclEntryForDescribeNetworkAclAttributesOutput': 'byteplussdkvpc.models.egress_acl_entry_for_describe_network_acl_attributes_output',
+    'EgressAclEntryForDescribeNetworkAclsOutput': 'byteplussdkvpc.models.egress_acl_entry_for_describe_network_acls_output',
+    'EgressAclEntryForUpdateNetworkAclEntriesInput': 'byteplussdkvpc.models.egress_acl_entry_for_update_network_acl_entries_input',
+    'EgressFilterRuleForDescribeTrafficMirrorFiltersOutput': 'byteplussdkvpc.models.egress_filter_rule_for_describe_traffic_mirror_filters_output',
+    'EipAddressForDescribeBandwidthPackagesOutput': 'byteplussdkvpc.models.eip_address_for_describe_bandwidth_packages_output',
+    'EipAddressForDescribeEipAddressesOutput': 'byteplussdkvpc.models.eip_address_for_describe_eip_addresses_output',
+    'FlowLogForDescribeFlowLogsOutput': 'byteplussdkvpc.models.flow_log_for_describe_flow_logs_output',
+    'HaVipForDescribeHaVipsOutput': 'byteplussdkvpc.models.ha_vip_for_describe_ha_vips_output',
+    'IngressAclEntryForDescribeNetworkAclAttributesOutput': 'byteplussdkvpc.models.ingress_acl_entry_for_describe_network_acl_attributes_output',
+    'IngressAclEntryForDescribeNetworkAclsOutput': 'byteplussdkvpc.models.ingress_acl_entry_for_describe_network_acls_output',
+    'IngressAclEntryForUpdateNetworkAclEntriesInput': 'byteplussdkvpc.models.ingress_acl_entry_for_update_network_acl_entries_input',
+    'IngressFilterRuleForDescribeTrafficMirrorFiltersOutput': 'byteplussdkvpc.models.ingress_filter_rule_for_describe_traffic_mirror_filters_output',
+    'InstanceGroupForDescribeInstanceGroupsOutput': 'byteplussdkvpc.models.instance_group_for_describe_instance_groups_output',
+    'IpAddressPoolCidrBlockForDescribeIpAddressPoolCidrBlocksOutput': 'byteplussdkvpc.models.ip_address_pool_cidr_block_for_describe_ip_address_pool_cidr_blocks_output',
+    'IpAddressPoolForDescribeIpAddressPoolsOutput': 'byteplussdkvpc.models.ip_address_pool_for_describe_ip_address_pools_output',
+    'Ipv6AddressBandwidthForDescribeIpv6AddressBandwidthsOutput': 'byteplussdkvpc.models.ipv6_address_bandwidth_for_describe_ipv6_address_bandwidths_output',
+    'Ipv6EgressRuleForDescribeIpv6EgressOnlyRulesOutput': 'byteplussdkvpc.models.ipv6_egress_rule_for_describe_ipv6_egress_only_rules_output',
+    'Ipv6GatewayForDescribeIpv6GatewaysOutput': 'byteplussdkvpc.models.ipv6_gateway_for_describe_ipv6_gateways_output',
+    'ListTagsForResourcesRequest': 'byteplussdkvpc.models.list_tags_for_resources_request',
+    'ListTagsForResourcesResponse': 'byteplussdkvpc.models.list_tags_for_resources_response',
+    'MemberForDescribeInstanceGroupsOutput': 'byteplussdkvpc.models.member_for_describe_instance_groups_output',
+    'ModifyBandwidthPackageAttributesRequest': 'byteplussdkvpc.models.modify_bandwidth_package_attributes_request',
+    'ModifyBandwidthPackageAttributesResponse': 'byteplussdkvpc.models.modify_bandwidth_package_attributes_response',
+    'ModifyBandwidthPackageEipBandwidthRequest': 'byteplussdkvpc.models.modify_bandwidth_package_eip_bandwidth_request',
+    'ModifyBandwidthPackageEipBandwidthResponse': 'byteplussdkvpc.models.modify_bandwidth_package_eip_bandwidth_response',
+    'ModifyBandwidthPackageSpecRequest': 'byteplussdkvpc.models.modify_bandwidth_package_spec_request',
+    'ModifyBandwidthPackageSpecResponse': 'byteplussdkvpc.models.modify_bandwidth_package_spec_response',
+    'ModifyEipAddressAttributesRequest': 'byteplussdkvpc.models.modify_eip_address_attributes_request',
+    'ModifyEipAddressAttributesResponse': 'byteplussdkvpc.models.modify_eip_address_attributes_response',
+    'ModifyFlowLogAttributeRequest': 'byteplussdkvpc.models.modify_flow_log_attribute_request',
+    'ModifyFlowLogAttributeResponse': 'byteplussdkvpc.models.modify_flow_log_attribute_response',
+    'ModifyHaVipAttributesRequest': 'byteplussdkvpc.models.modify_ha_vip_attributes_request',
+    'ModifyHaVipAttributesResponse': 'byteplussdkvpc.models.modify_ha_vip_attributes_response',
+    'ModifyInstanceGroupAttributesRequest': 'byteplussdkvpc.models.modify_instance_group_attributes_request',
+    'ModifyInstanceGroupAttributesResponse': 'byteplussdkvpc.models.modify_instance_group_attributes_response',
+    'ModifyInstanceGroupMembersRequest': 'byteplussdkvpc.models.modify_instance_group_members_request',
+    'ModifyInstanceGroupMembersResponse': 'byteplussdkvpc.models.modify_instance_group_members_response',
+    'ModifyIpAddressPoolAttributesRequest': 'byteplussdkvpc.models.modify_ip_address_pool_attributes_request',
+    'ModifyIpAddressPoolAttributesResponse': 'byteplussdkvpc.models.modify_ip_address_pool_attributes_response',
+    'ModifyIpv6AddressBandwidthRequest': 'byteplussdkvpc.models.modify_ipv6_address_bandwidth_request',
+    'ModifyIpv6AddressBandwidthResponse': 'byteplussdkvpc.models.modify_ipv6_address_bandwidth_response',
+    'ModifyIpv6EgressOnlyRuleAttributeRequest': 'byteplussdkvpc.models.modify_ipv6_egress_only_rule_attribute_request',
+    'ModifyIpv6EgressOnlyRuleAttributeResponse': 'byteplussdkvpc.models.modify_ipv6_egress_only_rule_attribute_response',
+    'ModifyIpv6GatewayAttributeRequest': 'byteplussdkvpc.models.modify_ipv6_gateway_attribute_request',
+    'ModifyIpv6GatewayAttributeResponse': 'byteplussdkvpc.models.modify_ipv6_gateway_attribute_response',
+    'ModifyNetworkAclAttributesRequest': 'byteplussdkvpc.models.modify_network_acl_attributes_request',
+    'ModifyNetworkAclAttributesResponse': 'byteplussdkvpc.models.modify_network_acl_attributes_response',
+    'ModifyNetworkInterfaceAttributesRequest': 'byteplussdkvpc.models.modify_network_interface_attributes_request',
+    'ModifyNetworkInterfaceAttributesResponse': 'byteplussdkvpc.models.modify_network_interface_attributes_response',
+    'ModifyPrefixListRequest': 'byteplussdkvpc.models.modify_prefix_list_request',
+    'ModifyPrefixListResponse': 'byteplussdkvpc.models.modify_prefix_list_response',
+    'ModifyRouteEntryRequest': 'byteplussdkvpc.models.modify_route_entry_request',
+    'ModifyRouteEntryResponse': 'byteplussdkvpc.models.modify_route_entry_response',
+    'ModifyRouteTableAttributesRequest': 'byteplussdkvpc.models.modify_route_table_attributes_request',
+    'ModifyRouteTableAttributesResponse': 'byteplussdkvpc.models.modify_route_table_attributes_response',
+    'ModifySecurityGroupAttributesRequest': 'byteplussdkvpc.models.modify_security_group_attributes_request',
+    'ModifySecurityGroupAttributesResponse': 'byteplussdkvpc.models.modify_security_group_attributes_response',
+    'ModifySecurityGroupRuleDescriptionsEgressRequest': 'byteplussdkvpc.models.modify_security_group_rule_descriptions_egress_request',
+    'ModifySecurityGroupRuleDescriptionsEgressResponse': 'byteplussdkvpc.models.modify_security_group_rule_descriptions_egress_response',
+    'ModifySecurityGroupRuleDescriptionsIngressRequest': 'byteplussdkvpc.models.modify_security_group_rule_descriptions_ingress_request',
+    'ModifySecurityGroupRuleDescriptionsIngressResponse': 'byteplussdkvpc.models.modify_security_group_rule_descriptions_ingress_response',
+    'ModifySubnetAttributesRequest': 'byteplussdkvpc.models.modify_subnet_attributes_request',
+    'ModifySubnetAttributesResponse': 'byteplussdkvpc.models.modify_subnet_attributes_response',
+    'ModifyTrafficMirrorFilterAttributesRequest': 'byteplussdkvpc.models.modify_traffic_mirror_filter_attributes_request',
+    'ModifyTrafficMirrorFilterAttributesResponse': 'byteplussdkvpc.models.modify_traffic_mirror_filter_attributes_response',
+    'ModifyTrafficMirrorFilterRuleAttributesRequest': 'byteplussdkvpc.models.modify_traffic_mirror_filter_rule_attributes_request',
+    'ModifyTrafficMirrorFilterRuleAttributesResponse': 'byteplussdkvpc.models.modify_traffic_mirror_filter_rule_attributes_response',
+    'ModifyTrafficMirrorSessionAttributesRequest': 'byteplussdkvpc.models.modify_traffic_mirror_session_attributes_request',
+    'ModifyTrafficMirrorSessionAttributesResponse': 'byteplussdkvpc.models.modify_traffic_mirror_session_attributes_response',
+    'ModifyTrafficMirrorTargetAttributesRequest': 'byteplussdkvpc.models.modify_traffic_mirror_target_attributes_request',
+    'ModifyTrafficMirrorTargetAttributesResponse': 'byteplussdkvpc.models.modify_traffic_mirror_target_attributes_response',
+    'ModifyVpcAttributesRequest': 'byteplussdkvpc.models.modify_vpc_attributes_request',
+    'ModifyVpcAttributesResponse': 'byteplussdkvpc.models.modify_vpc_attributes_response',
+    'NetworkAclAttributeForDescribeNetworkAclAttributesOutput': 'byteplussdkvpc.models.network_acl_attribute_for_describe_network_acl_attributes_output',
+    'NetworkAclForDescribeNetworkAclsOutput': 'byteplussdkvpc.models.network_acl_for_describe_network_acls_output',
+    'NetworkInterfaceSetForDescribeNetworkInterfacesOutput': 'byteplussdkvpc.models.network_interface_set_for_describe_network_interfaces_output',
+    'PermissionForDescribeSecurityGroupAttributesOutput': 'byteplussdkvpc.models.permission_for_describe_security_group_attributes_output',
+    'PrefixListAssociationForDescribePrefixListAssociationsOutput': 'byteplussdkvpc.models.prefix_list_association_for_describe_prefix_list_associations_output',
+    'PrefixListEntryForCreatePrefixListInput': 'byteplussdkvpc.models.prefix_list_entry_for_create_prefix_list_input',
+    'PrefixListEntryForDescribePrefixListEntriesOutput': 'byteplussdkvpc.models.prefix_list_entry_for_describe_prefix_list_entries_output',
+    'PrefixListForDescribePrefixListsOutput': 'byteplussdkvpc.models.prefix_list_for_describe_prefix_lists_output',
+    'PrivateIpSetForDescribeNetworkInterfaceAttributesOutput': 'byteplussdkvpc.models.private_ip_set_for_describe_network_interface_attributes_output',
+    'PrivateIpSetForDescribeNetworkInterfacesOutput': 'byteplussdkvpc.models.private_ip_set_for_describe_network_interfaces_output',
+    'PrivateIpSetsForDescribeNetworkInterfaceAttributesOutput': 'byteplussdkvpc.models.private_ip_sets_for_describe_network_interface_attributes_output',
+    'PrivateIpSetsForDescribeNetworkInterfacesOutput': 'byteplussdkvpc.models.private_ip_sets_for_describe_network_interfaces_output',
+    'ReleaseEipAddressRequest': 'byteplussdkvpc.models.release_eip_address_request',
+    'ReleaseEipAddressResponse': 'byteplussdkvpc.models.release_eip_address_response',
+    'ReleaseIpv6AddressBandwidthRequest': 'byteplussdkvpc.models.release_ipv6_address_bandwidth_request',
+    'ReleaseIpv6AddressBandwidthResponse': 'byteplussdkvpc.models.release_ipv6_address_bandwidth_response',
+    'RemoveBandwidthPackageIpRequest': 'byteplussdkvpc.models.remove_bandwidth_package_ip_request',
+    'RemoveBandwidthPackageIpResponse': 'byteplussdkvpc.models.remove_bandwidth_package_ip_response',
+    'RemoveMemberForModifyInstanceGroupMembersInput': 'byteplussdkvpc.models.remove_member_for_modify_instance_group_members_input',
+    'RemovePrefixListEntryForModifyPrefixListInput': 'byteplussdkvpc.models.remove_prefix_list_entry_for_modify_prefix_list_input',
+    'ResourceForAssociateNetworkAclInput': 'byteplussdkvpc.models.resource_for_associate_network_acl_input',
+    'ResourceForDescribeNetworkAclAttributesOutput': 'byteplussdkvpc.models.resource_for_describe_network_acl_attributes_output',
+    'ResourceForDescribeNetworkAclsOutput': 'byteplussdkvpc.models.resource_for_describe_network_acls_output',
+    'ResourceForDisassociateNetworkAclInput': 'byteplussdkvpc.models.resource_for_disassociate_network_acl_input',
+    'ResourceTagForListTagsForResourcesOutput': 'byteplussdkvpc.models.resource_tag_for_list_tags_for_resources_output',
+    'RevokeSecurityGroupEgressRequest': 'byteplussdkvpc.models.revoke_security_group_egress_request',
+    'RevokeSecurityGroupEgressResponse': 'byteplussdkvpc.models.revoke_security_group_egress_response',
+    'RevokeSecurityGroupIngressRequest': 'byteplussdkvpc.models.revoke_security_group_ingress_request',
+    'RevokeSecurityGroupIngressResponse': 'byteplussdkvpc.models.revoke_security_group_ingress_response',
+    'RouteEntryForDescribeRouteEntryListOutput': 'byteplussdkvpc.models.route_entry_for_describe_route_entry_list_output',
+    'RouteTableForDescribeSubnetAttributesOutput': 'byteplussdkvpc.models.route_table_for_describe_subnet_attributes_output',
+    'RouteTableForDescribeSubnetsOutput': 'byteplussdkvpc.models.route_table_for_describe_subnets_output',
+    'RouterTableListForDescribeRouteTableListOutput': 'byteplussdkvpc.models.router_table_list_for_describe_route_table_list_output',
+    'SecurityGroupForDescribeSecurityGroupsOutput': 'byteplussdkvpc.models.security_group_for_describe_security_groups_output',
+    'SubnetForDescribeSubnetsOutput': 'byteplussdkvpc.models.subnet_for_describe_subnets_output',
+    'TagFilterForDescribeBandwidthPackagesInput': 'byteplussdkvpc.models.tag_filter_for_describe_bandwidth_packages_input',
+    'TagFilterForDescribeEipAddressesInput': 'byteplussdkvpc.models.tag_filter_for_describe_eip_addresses_input',
+    'TagFilterForDescribeFlowLogsInput': 'byteplussdkvpc.models.tag_filter_for_describe_flow_logs_input',
+    'TagFilterForDescribeHaVipsInput': 'byteplussdkvpc.models.tag_filter_for_describe_ha_vips_input',
+    'TagFilterForDescribeIpAddressPoolsInput': 'byteplussdkvpc.models.tag_filter_for_describe_ip_address_pools_input',
+    'TagFilterForDescribeIpv6GatewaysInput': 'byteplussdkvpc.models.tag_filter_for_describe_ipv6_gateways_input',
+    'TagFilterForDescribeNetworkAclsInput': 'byteplussdkvpc.models.tag_filter_for_describe_network_acls_input',
+    'TagFilterForDescribeNetworkInterfacesInput': 'byteplussdkvpc.models.tag_filter_for_describe_network_interfaces_input',
+    'TagFilterForDescribePrefixListsInput': 'byteplussdkvpc.models.tag_filter_for_describe_prefix_lists_input',
+    'TagFilterForDescribeRouteTableListInput': 'byteplussdkvpc.models.tag_filter_for_describe_route_table_list_input',
+    'TagFilterForDescribeSecurityGroupsInput': 'byteplussdkvpc.models.tag_filter_for_describe_security_groups_input',
+    'TagFilterForDescribeSubnetsInput': 'byteplussdkvpc.models.tag_filter_for_describe_subnets_input',
+    'TagFilterForDescribeTrafficMirrorFiltersInput': 'byteplussdkvpc.models.tag_filter_for_describe_traffic_mirror_filters_input',
+    'TagFilterForDescribeTrafficMirrorSessionsInput': 'byteplussdkvpc.models.tag_filter_for_describe_traffic_mirror_sessions_input',
+    'TagFilterForDescribeTrafficMirrorTargetsInput': 'byteplussdkvpc.models.tag_filter_for_describe_traffic_mirror_targets_input',
+    'TagFilterForDescribeVpcsInput': 'byteplussdkvpc.models.tag_filter_for_describe_vpcs_input',
+    'TagFilterForListTagsForResourcesInput': 'byteplussdkvpc.models.tag_filter_for_list_tags_for_resources_input',
+    'TagForAllocateEipAddressInput': 'byteplussdkvpc.models.tag_for_allocate_eip_address_input',
+    'TagForCreateBandwidthPackageInput': 'byteplussdkvpc.models.tag_for_create_bandwidth_package_input',
+    'TagForCreateFlowLogInput': 'byteplussdkvpc.models.tag_for_create_flow_log_input',
+    'TagForCreateHaVipInput': 'byteplussdkvpc.models.tag_for_create_ha_vip_input',
+    'TagForCreateIpAddressPoolInput': 'byteplussdkvpc.models.tag_for_create_ip_address_pool_input',
+    'TagForCreateNetworkAclInput': 'byteplussdkvpc.models.tag_for_create_network_acl_input',
+    'TagForCreateNetworkInterfaceInput': 'byteplussdkvpc.models.tag_for_create_network_interface_input',
+    'TagForCreatePrefixListInput': 'byteplussdkvpc.models.tag_for_create_prefix_list_input',
+    'TagForCreateRouteTableInput': 'byteplussdkvpc.models.tag_for_create_route_table_input',
+    'TagForCreateSecurityGroupInput': 'byteplussdkvpc.models.tag_for_create_security_group_input',
+    'TagForCreateSubnetInput': 'byteplussdkvpc.models.tag_for_create_subnet_input',
+    'TagForCreateTrafficMirrorFilterInput': 'byteplussdkvpc.models.tag_for_create_traffic_mirror_filter_input',
+    'TagForCreateTrafficMirrorSessionInput': 'byteplussdkvpc.models.tag_for_create_traffic_mirror_session_input',
+    'TagForCreateTrafficMirrorTargetInput': 'byteplussdkvpc.models.tag_for_create_traffic_mirror_target_input',
+    'TagForCreateVpcInput': 'byteplussdkvpc.models.tag_for_create_vpc_input',
+    'TagForDescribeBandwidthPackagesOutput': 'byteplussdkvpc.models.tag_for_describe_bandwidth_packages_output',
+    'TagForDescribeEipAddressAttributesOutput': 'byteplussdkvpc.models.tag_for_describe_eip_address_attributes_output',
+    'TagForDescribeEipAddressesOutput': 'byteplussdkvpc.models.tag_for_describe_eip_addresses_output',
+    'TagForDescribeFlowLogsOutput': 'byteplussdkvpc.models.tag_for_describe_flow_logs_output',
+    'TagForDescribeHaVipsOutput': 'byteplussdkvpc.models.tag_for_describe_ha_vips_output',
+    'TagForDescribeIpAddressPoolAttributesOutput': 'byteplussdkvpc.models.tag_for_describe_ip_address_pool_attributes_output',
+    'TagForDescribeIpAddressPoolsOutput': 'byteplussdkvpc.models.tag_for_describe_ip_address_pools_output',
+    'TagForDescribeNetworkAclAttributesOutput': 'byteplussdkvpc.models.tag_for_describe_network_acl_attributes_output',
+    'TagForDescribeNetworkAclsOutput': 'byteplussdkvpc.models.tag_for_describe_network_acls_output',
+    'TagForDescribeNetworkInterfaceAttributesOutput': 'byteplussdkvpc.models.tag_for_describe_network_interface_attributes_output',
+    'TagForDescribeNetworkInterfacesOutput': 'byteplussdkvpc.models.tag_for_describe_network_interfaces_output',
+    'TagForDescribePrefixListsOutput': 'byteplussdkvpc.models.tag_for_describe_prefix_lists_output',
+    'TagForDescribeRouteTableListOutput': 'byteplussdkvpc.models.tag_for_describe_route_table_list_output',
+    'TagForDescribeSecurityGroupAttributesOutput': 'byteplussdkvpc.models.tag_for_describe_security_group_attributes_output',
+    'TagForDescribeSecurityGroupsOutput': 'byteplussdkvpc.models.tag_for_describe_security_groups_output',
+    'TagForDescribeSubnetAttributesOutput': 'byteplussdkvpc.models.tag_for_describe_subnet_attributes_output',
+    'TagForDescribeSubnetsOutput': 'byteplussdkvpc.models.tag_for_describe_subnets_output',
+    'TagForDescribeTrafficMirrorFiltersOutput': 'byteplussdkvpc.models.tag_for_describe_traffic_mirror_filters_output',
+    'TagForDescribeTrafficMirrorSessionsOutput': 'byteplussdkvpc.models.tag_for_describe_traffic_mirror_sessions_output',
+    'TagForDescribeTrafficMirrorTargetsOutput': 'byteplussdkvpc.models.tag_for_describe_traffic_mirror_targets_output',
+    'TagForDescribeVpcAttributesOutput': 'byteplussdkvpc.models.tag_for_describe_vpc_attributes_output',
+    'TagForDescribeVpcsOutput': 'byteplussdkvpc.models.tag_for_describe_vpcs_output',
+    'TagForTagResourcesInput': 'byteplussdkvpc.models.tag_for_tag_resources_input',
+    'TagResourcesRequest': 'byteplussdkvpc.models.tag_resources_request',
+    'TagResourcesResponse': 'byteplussdkvpc.models.tag_resources_response',
+    'TemporaryUpgradeEipAddressRequest': 'byteplussdkvpc.models.temporary_upgrade_eip_address_request',
+    'TemporaryUpgradeEipAddressResponse': 'byteplussdkvpc.models.temporary_upgrade_eip_address_response',
+    'TrafficMirrorFilterForDescribeTrafficMirrorFiltersOutput': 'byteplussdkvpc.models.traffic_mirror_filter_for_describe_traffic_mirror_filters_output',
+    'TrafficMirrorSessionForDescribeTrafficMirrorSessionsOutput': 'byteplussdkvpc.models.traffic_mirror_session_for_describe_traffic_mirror_sessions_output',
+    'TrafficMirrorTargetForDescribeTrafficMirrorTargetsOutput': 'byteplussdkvpc.models.traffic_mirror_target_for_describe_traffic_mirror_targets_output',
+    'UnassignIpv6AddressesRequest': 'byteplussdkvpc.models.unassign_ipv6_addresses_request',
+    'UnassignIpv6AddressesResponse': 'byteplussdkvpc.models.unassign_ipv6_addresses_response',
+    'UnassignPrivateIpAddressesRequest': 'byteplussdkvpc.models.unassign_private_ip_addresses_request',
+    'UnassignPrivateIpAddressesResponse': 'byteplussdkvpc.models.unassign_private_ip_addresses_response',
+    'UntagResourcesRequest': 'byteplussdkvpc.models.untag_resources_request',
+    'UntagResourcesResponse': 'byteplussdkvpc.models.untag_resources_response',
+    'UpdateNetworkAclEntriesRequest': 'byteplussdkvpc.models.update_network_acl_entries_request',
+    'UpdateNetworkAclEntriesResponse': 'byteplussdkvpc.models.update_network_acl_entries_response',
+    'VpcForDescribeVpcsOutput': 'byteplussdkvpc.models.vpc_for_describe_vpcs_output',
+})
+
+__all__ = _importer.names
+__getattr__ = _importer.getattr
+__dir__ = _importer.dir
+_importer.load_all_if_unsupported()
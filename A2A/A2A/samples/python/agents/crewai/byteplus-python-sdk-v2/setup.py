@@ -30,6 +30,9 @@ setup(
     extras_require={
         "ark": [
             "cryptography>=43.0.3, <43.0.4"
+        ],
+        "async": [
+            "httpx>=0.23.0"
         ]
     },
 )
@@ -0,0 +1,116 @@
+# coding: utf-8
+
+"""Local stand-in for the billing ListBillDetail API, for trying the exporter offline.
+
+Serves `rows` generated bill detail rows through Offset/Limit pages. Like
+the real API it may return a row again on a later page, and some rows
+have an empty BillDetailId. With `fail_after` set the server answers 500
+once that many pages were served, which interrupts an export so that
+resuming it can be checked.
+
+Usage:
+    python tests/mock_billing_server.py --port 8766 --rows 2000
+    BYTEPLUS_ACCESSKEY=mock BYTEPLUS_SECRETKEY=mock python -m byteplussdkbilling.exporter \\
+        --bill-period 2024-05 --output exports/2024-05 --format csv --host 127.0.0.1:8766 --scheme http
+"""
+
+import argparse
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+
+def bill_rows(count, duplicate_every=50, empty_key_every=40):
+    """Rows served in order: every `duplicate_every`-th repeats the previous
+    row and every `empty_key_every`-th has an empty BillDetailId."""
+    rows = []
+    for i in range(count):
+        if duplicate_every and i and i % duplicate_every == 0:
+            rows.append(dict(rows[-1]))
+            continue
+        rows.append({
+            'BillDetailId': '' if empty_key_every and i % empty_key_every == 7 else 'bd-%06d' % i,
+            'BillPeriod': '2024-05',
+            'Product': 'ECS',
+            'PretaxAmount': '%.2f' % (i * 0.37),
+            'Region': 'ap-singapore-1',
+        })
+    return rows
+
+
+class MockState(object):
+    """Rows served by one server, plus counters for checks."""
+
+    def __init__(self, rows, fail_after=None):
+        self.rows = rows
+        self.fail_after = fail_after
+        self.pages = 0
+        self.offsets = []
+        self.lock = threading.Lock()
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, status, payload):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        raw = self.rfile.read(length) if length else b''
+        params = {k: v[0] for k, v in parse_qs(urlsplit(self.path).query).items()}
+        if raw:
+            body = json.loads(raw)
+            params.update(body if isinstance(body, dict) else {})
+        meta = {'RequestId': 'mock', 'Action': params.get('Action'), 'Version': params.get('Version'),
+                'Service': 'billing', 'Region': 'ap-singapore-1'}
+        if params.get('Action') != 'ListBillDetail':
+            meta['Error'] = {'Code': 'InvalidAction', 'Message': 'only ListBillDetail is mocked'}
+            self._reply(404, {'ResponseMetadata': meta})
+            return
+
+        state = self.server.state
+        offset, limit = int(params.get('Offset', 0)), int(params.get('Limit', 10))
+        with state.lock:
+            if state.fail_after is not None and state.pages >= state.fail_after:
+                meta['Error'] = {'Code': 'InternalError', 'Message': 'mock failure'}
+                self._reply(500, {'ResponseMetadata': meta})
+                return
+            state.pages += 1
+            state.offsets.append(offset)
+        page = state.rows[offset:offset + limit]
+        self._reply(200, {'ResponseMetadata': meta,
+                          'Result': {'List': page, 'Offset': offset, 'Limit': limit, 'Total': len(state.rows)}})
+
+
+def serve(rows, port=0, fail_after=None):
+    """Starts a server on a daemon thread and returns it, `server.state` holds its counters."""
+    server = ThreadingHTTPServer(('127.0.0.1', port), Handler)
+    server.state = MockState(rows, fail_after)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Serve a local mock of the billing ListBillDetail API.')
+    parser.add_argument('--port', type=int, default=8766)
+    parser.add_argument('--rows', type=int, default=2000)
+    parser.add_argument('--fail-after', type=int, default=None, help='pages served before answering 500')
+    args = parser.parse_args()
+    server = ThreadingHTTPServer(('127.0.0.1', args.port), Handler)
+    server.state = MockState(bill_rows(args.rows), args.fail_after)
+    print('Mock billing API on http://127.0.0.1:%d' % args.port)
+    server.serve_forever()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+# coding: utf-8
+
+import csv
+import json
+import os
+
+import pytest
+
+from byteplussdkbilling import BILLINGApi, ListBillDetailRequest
+from byteplussdkbilling.exporter import CSV, PARQUET, BillExporter
+from byteplussdkcore import ApiClient, Configuration
+from byteplussdkcore.rest import ApiException
+from mock_billing_server import bill_rows, serve
+
+ROWS = bill_rows(1000)
+# an empty-key row served again on a later page
+ROWS[300] = dict(ROWS[287])
+
+
+def expected_keys():
+    """(BillDetailId, PayableAmount) of every distinct row, each empty-key row included."""
+    keys, seen = [], set()
+    for row in ROWS:
+        identity = row['BillDetailId'] or tuple(sorted(row.items()))
+        if identity not in seen:
+            seen.add(identity)
+            keys.append((row['BillDetailId'], row['PretaxAmount']))
+    return keys
+
+
+@pytest.fixture
+def server():
+    server = serve(ROWS)
+    yield server
+    server.shutdown()
+
+
+def exporter(server, output_dir, output_format=CSV, **kwargs):
+    configuration = Configuration()
+    configuration.ak = configuration.sk = 'mock'
+    configuration.region = 'ap-singapore-1'
+    configuration.scheme = 'http'
+    configuration.host = '127.0.0.1:%d' % server.server_address[1]
+    api = BILLINGApi(ApiClient(configuration))
+    request = ListBillDetailRequest(bill_period='2024-05', limit=50, offset=0, group_period=1, group_term=0,
+                                    ignore_zero=0, need_record_num=1)
+    kwargs.setdefault('rows_per_file', 200)
+    return BillExporter(api.list_bill_detail, request, str(output_dir), output_format=output_format,
+                        max_workers=4, rate_limit=1000, **kwargs)
+
+
+def exported_keys(output_dir, files):
+    keys = []
+    for name in files:
+        path = os.path.join(str(output_dir), name)
+        if name.endswith('.parquet'):
+            import pyarrow.parquet
+            rows = pyarrow.parquet.read_table(path).to_pylist()
+        else:
+            with open(path, newline='', encoding='utf-8') as f:
+                rows = list(csv.DictReader(f))
+        keys.extend((row['BillDetailId'] or '', row['PretaxAmount']) for row in rows)
+    return keys
+
+
+def test_full_export_deduplicates(server, tmp_path):
+    result = exporter(server, tmp_path).run()
+    assert exported_keys(tmp_path, result.files) == expected_keys()
+    assert sum(1 for key, _ in expected_keys() if not key) == 25
+    assert result.rows_written + result.duplicates == len(ROWS)
+
+
+def test_checkpoints_do_not_wait_for_a_full_part(server, tmp_path):
+    server.state.fail_after = 9
+    with pytest.raises(ApiException):
+        exporter(server, tmp_path, rows_per_file=100000, checkpoint_rows=100).run()
+    with open(os.path.join(str(tmp_path), '_checkpoint.json')) as f:
+        checkpoint = json.load(f)
+    assert checkpoint['files'] == [] and checkpoint['part']['rows'] >= 100
+
+    server.state.fail_after = None
+    result = exporter(server, tmp_path, rows_per_file=100000, checkpoint_rows=100).run()
+    assert result.resumed_from == checkpoint['offset'] > 0
+    assert result.files == ['part-00000.csv']
+    assert exported_keys(tmp_path, result.files) == expected_keys()
+
+
+def test_interrupted_export_resumes_without_duplicates(server, tmp_path):
+    server.state.fail_after = 9
+    with pytest.raises(ApiException):
+        exporter(server, tmp_path).run()
+
+    server.state.fail_after = None
+    served_before = len(server.state.offsets)
+    result = exporter(server, tmp_path).run()
+    assert result.resumed_from > 0
+    # pages before the checkpoint are not requested again
+    assert min(server.state.offsets[served_before:]) == result.resumed_from
+    assert exported_keys(tmp_path, result.files) == expected_keys()
+
+    # a finished export is not run again
+    assert exporter(server, tmp_path).run().rows_written == result.rows_written
+    assert len(server.state.offsets) == served_before + (len(ROWS) - result.resumed_from) // 50
+
+
+def test_parquet_export_resumes(server, tmp_path):
+    pytest.importorskip('pyarrow')
+    server.state.fail_after = 9
+    with pytest.raises(ApiException):
+        exporter(server, tmp_path, PARQUET, checkpoint_rows=100).run()
+
+    server.state.fail_after = None
+    result = exporter(server, tmp_path, PARQUET, checkpoint_rows=100).run()
+    assert result.resumed_from > 0
+    assert all(name.endswith('.parquet') for name in result.files)
+    assert exported_keys(tmp_path, result.files) == expected_keys()
@@ -0,0 +1,103 @@
+# coding: utf-8
+
+import pytest
+
+from byteplussdkcore import Configuration
+from byteplussdkcore.interceptor import BuildRequestInterceptor, InterceptorContext, Request
+from byteplussdkcore.interceptor.interceptors.build_request_interceptor import (
+    dict_to_params, model_to_params, sanitize_for_serialization)
+from byteplussdkecs.models import (
+    DescribeInstancesRequest, NetworkInterfaceForRunInstancesInput, PlacementForRunInstancesInput,
+    RunInstancesRequest, TagFilterForDescribeInstancesInput, TagForRunInstancesInput,
+    VolumeForRunInstancesInput)
+
+
+def previous_params(req, prefix="", params=None):
+    """BuildRequestInterceptor.__req_to_params as it was before model_to_params, applied to
+    the output of sanitize_for_serialization."""
+    if params is None:
+        params = []
+
+    for key, value in req.items():
+        if value is None:
+            continue
+        if isinstance(value, list):
+            for index in range(len(value)):
+                if isinstance(value[index], dict):
+                    previous_params(value[index], prefix + key + "." + str((index + 1)) + ".", params)
+                else:
+                    params.append((prefix + key + "." + str((index + 1)), value[index]))
+        elif isinstance(value, dict):
+            previous_params(value, prefix + key + ".", params)
+        else:
+            params.append((prefix + key, value))
+
+    return params
+
+
+MODELS = {
+    'empty': DescribeInstancesRequest(),
+    'nested lists': DescribeInstancesRequest(
+        instance_ids=['i-1', 'i-2'], max_results=10, vpc_id=None,
+        tag_filters=[TagFilterForDescribeInstancesInput(key='team', values=['a', 'b']),
+                     TagFilterForDescribeInstancesInput(key='env', values=None),
+                     TagFilterForDescribeInstancesInput(key=None, values=[])]),
+    'nested models': RunInstancesRequest(
+        image_id='image-1', instance_type='ecs.g3il.large', count=2, dry_run=False, description=None,
+        placement=PlacementForRunInstancesInput(dedicated_host_id='dh-1', tenancy=None),
+        network_interfaces=[NetworkInterfaceForRunInstancesInput(
+            subnet_id='subnet-%d' % i, security_group_ids=['sg-1', 'sg-2'], private_ip_addresses=None)
+            for i in range(2)],
+        volumes=[VolumeForRunInstancesInput(size=40, volume_type='ESSD_PL0', delete_with_instance=True)],
+        tags=[TagForRunInstancesInput(key='k', value=None)]),
+}
+
+
+@pytest.mark.parametrize('name', sorted(MODELS))
+def test_model_to_params_matches_previous_flattening(name):
+    model = MODELS[name]
+    expected = previous_params(sanitize_for_serialization(model))
+    assert model_to_params(model) == expected
+    assert dict_to_params(sanitize_for_serialization(model)) == expected
+
+
+def test_flattened_names():
+    params = dict(model_to_params(MODELS['nested models']))
+    assert params['Placement.DedicatedHostId'] == 'dh-1'
+    assert params['NetworkInterfaces.2.SecurityGroupIds.1'] == 'sg-1'
+    assert params['Volumes.1.DeleteWithInstance'] is True
+    assert params['Tags.1.Key'] == 'k'
+    assert 'Tags.1.Value' not in params and 'Description' not in params and 'Placement.Tenancy' not in params
+    assert dict(model_to_params(MODELS['nested lists']))['TagFilters.1.Values.2'] == 'b'
+
+
+def intercept(interceptor, body, method='GET', content_type='text/plain'):
+    request = Request(Configuration(), '/DescribeInstances/2020-04-01/ecs/get/text_plain/', method,
+                      path_params={}, query_params=[], header_params={'Content-Type': content_type},
+                      body=body, post_params=[], collection_formats={})
+    return interceptor.intercept(InterceptorContext(request=request)).request
+
+
+@pytest.mark.parametrize('name', sorted(MODELS))
+def test_get_query_matches_previous_interceptor(name):
+    model = MODELS[name]
+    expected = previous_params(sanitize_for_serialization(model)) + [
+        ('Action', 'DescribeInstances'), ('Version', '2020-04-01')]
+    query = intercept(BuildRequestInterceptor(), model).query_params
+    # sorted once, in the order the signer canonicalizes them
+    assert query == sorted(expected, key=lambda param: param[0])
+    assert sorted(intercept(BuildRequestInterceptor(use_plans=False), model).query_params) == sorted(expected)
+
+
+def test_form_post_matches_previous_interceptor():
+    model = MODELS['nested models']
+    request = intercept(BuildRequestInterceptor(), model, 'POST', 'application/x-www-form-urlencoded')
+    assert request.post_params == previous_params(sanitize_for_serialization(model))
+    assert request.body is None
+
+
+def test_dict_bodies_are_flattened():
+    body = {'Filters': [{'Name': 'a', 'Values': ['x', 'y']}], 'Limit': 5, 'Skip': None}
+    query = intercept(BuildRequestInterceptor(), body).query_params
+    assert query == [('Action', 'DescribeInstances'), ('Filters.1.Name', 'a'), ('Filters.1.Values.1', 'x'),
+                     ('Filters.1.Values.2', 'y'), ('Limit', 5), ('Version', '2020-04-01')]
@@ -0,0 +1,136 @@
+# coding: utf-8
+
+import gc
+import json
+import threading
+import weakref
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from byteplussdkcore import Configuration
+from byteplussdkcore.auth import Credential, CredentialCache, StaticCredentialProvider, StsCredentialProvider
+from byteplussdkcore.auth.providers.provider import CredentialValue, Provider
+
+
+class AssumeRoleHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        self.server.requests += 1
+        body = json.dumps({
+            'ResponseMetadata': {'RequestId': 'r', 'Action': 'AssumeRole', 'Version': '2018-01-01',
+                                 'Service': 'sts', 'Region': 'ap-singapore-1'},
+            'Result': {'Credentials': {'AccessKeyId': 'sts-ak', 'SecretAccessKey': 'sts-sk',
+                                       'SessionToken': 'token', 'ExpiredTime': '2099-01-01T00:00:00Z'}},
+        }).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture(autouse=True)
+def clean_state():
+    CredentialCache.clear_shared()
+    default = Configuration()
+    yield
+    Configuration.set_default(default)
+    CredentialCache.clear_shared()
+
+
+def run_with_timeout(target, seconds=10):
+    result = {}
+
+    def run():
+        try:
+            result['value'] = target()
+        except Exception as e:
+            result['error'] = e
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    thread.join(seconds)
+    assert not thread.is_alive(), 'deadlocked'
+    return result
+
+
+def test_sts_credential_on_the_default_configuration():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), AssumeRoleHandler)
+    server.requests = 0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        configuration = Configuration()
+        configuration.credential = Credential(StsCredentialProvider(
+            'ak', 'sk', 'role', '1234', scheme='http', host='127.0.0.1:%d' % server.server_address[1]))
+        Configuration.set_default(configuration)
+
+        result = run_with_timeout(configuration.credential.get)
+        assert result['value'].ak == 'sts-ak'
+        assert server.requests == 1
+    finally:
+        server.shutdown()
+
+
+class SelfReferencingProvider(Provider):
+    """Needs its own credential to refresh it, like an STS client using the default configuration."""
+
+    def __init__(self):
+        self.credential = Credential(self)
+
+    def retrieve(self):
+        return CredentialValue('ak', 'sk')
+
+    def is_expired(self):
+        return True
+
+    def refresh(self):
+        self.credential.get()
+
+
+def test_reentrant_refresh_raises_instead_of_hanging():
+    result = run_with_timeout(SelfReferencingProvider().credential.get)
+    assert isinstance(result.get('error'), RuntimeError)
+
+
+def test_static_providers_with_different_secrets_do_not_share():
+    first = Credential(StaticCredentialProvider('ak', 'sk-1')).get()
+    second = Credential(StaticCredentialProvider('ak', 'sk-2')).get()
+    assert (first.sk, second.sk) == ('sk-1', 'sk-2')
+    assert Credential(StaticCredentialProvider('ak', 'sk-1')).cache is Credential(
+        StaticCredentialProvider('ak', 'sk-1')).cache
+
+
+def test_sts_cache_key_depends_on_the_secret():
+    assert StsCredentialProvider('ak', 'sk-1', 'role', '1').cache_key() != \
+        StsCredentialProvider('ak', 'sk-2', 'role', '1').cache_key()
+    assert 'sk-1' not in StsCredentialProvider('ak', 'sk-1', 'role', '1').cache_key()
+
+
+class AnonymousProvider(Provider):
+    def retrieve(self):
+        return CredentialValue('ak', str(id(self)))
+
+    def is_expired(self):
+        return False
+
+    def refresh(self):
+        pass
+
+
+def test_caches_of_providers_without_key_are_freed_with_them():
+    before = len(CredentialCache._shared)
+    provider = AnonymousProvider()
+    credential = Credential(provider)
+    assert Credential(provider).cache is credential.cache
+    assert credential.get().sk == str(id(provider))
+    assert len(CredentialCache._shared) == before
+
+    freed = weakref.ref(provider)
+    del provider, credential
+    gc.collect()
+    assert freed() is None
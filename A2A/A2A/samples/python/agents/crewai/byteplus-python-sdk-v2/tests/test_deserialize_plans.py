@@ -0,0 +1,69 @@
+# coding: utf-8
+
+import threading
+
+import pytest
+
+from byteplussdkcore.interceptor import DeserializedResponseInterceptor
+from byteplussdkcore.interceptor.interceptors import deserialized_response_interceptor as module
+
+DATA = {
+    "Instances": [{"InstanceId": "i-1", "Cpus": 2, "Tags": [{"Key": "k", "Value": "v"}]}],
+    "NextToken": "t",
+}
+
+
+class CheckedPlans(dict):
+    """Fails when a model plan is visible to other threads before its fields are compiled."""
+
+    def _check(self, plan):
+        if isinstance(plan, module._ModelPlan):
+            assert len(plan.fields) == len(plan.klass.swagger_types)
+
+    def __setitem__(self, key, plan):
+        self._check(plan)
+        dict.__setitem__(self, key, plan)
+
+    def update(self, plans):
+        for plan in plans.values():
+            self._check(plan)
+        dict.update(self, plans)
+
+
+@pytest.fixture
+def plans(monkeypatch):
+    checked = CheckedPlans()
+    monkeypatch.setattr(module, "_plans", checked)
+    return checked
+
+
+def test_plans_are_published_complete(plans):
+    result = DeserializedResponseInterceptor().deserialize_data(DATA, "DescribeInstancesResponse", "byteplussdkecs")
+    assert result.instances[0].tags[0].value == "v"
+    assert plans
+
+
+def test_matches_legacy_path(plans):
+    planned = DeserializedResponseInterceptor().deserialize_data(DATA, "DescribeInstancesResponse", "byteplussdkecs")
+    legacy = DeserializedResponseInterceptor(use_plans=False).deserialize_data(
+        DATA, "DescribeInstancesResponse", "byteplussdkecs")
+    assert planned.to_dict() == legacy.to_dict()
+
+
+def test_concurrent_first_use(plans):
+    for _ in range(20):
+        plans.clear()
+        barrier = threading.Barrier(8)
+        results = []
+
+        def run():
+            barrier.wait()
+            results.append(DeserializedResponseInterceptor().deserialize_data(
+                DATA, "DescribeInstancesResponse", "byteplussdkecs"))
+
+        threads = [threading.Thread(target=run) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert [r.instances[0].instance_id for r in results] == ["i-1"] * 8
@@ -0,0 +1,172 @@
+# coding: utf-8
+
+import threading
+
+import pytest
+
+from byteplussdkcore.endpoint.providers.default_provider import (DefaultEndpointProvider, HostEndpointProvider,
+                                                                 ServiceEndpointInfo, fallback_endpoint)
+from byteplussdkcore.interceptor import InterceptorChain, LatencyHistogram, RequestInterceptor, ResponseInterceptor
+from byteplussdkcore.interceptor.metrics import _BOUNDS
+
+
+def custom(host):
+    return ServiceEndpointInfo(service='ecs', is_global=True, global_endpoint=host, region_endpoint_map={})
+
+
+def test_default_provider_memoises_per_service_and_region():
+    provider = DefaultEndpointProvider()
+
+    first = provider.endpoint_for('ecs', 'ap-southeast-1')
+    assert first.host == fallback_endpoint
+    assert provider.endpoint_for('ecs', 'ap-southeast-1') is first
+    assert provider.endpoint_for('billing', 'ap-southeast-1').host == 'open.byteplusapi.com'
+    assert provider.endpoint_for('ecs', 'cn-beijing') is not first
+
+
+def test_default_provider_follows_custom_endpoints_without_clear_cache():
+    provider = DefaultEndpointProvider()
+    assert provider.endpoint_for('ecs', 'ap-southeast-1').host == fallback_endpoint
+
+    provider.custom_endpoints['ecs'] = custom('ecs.example.com')
+    assert provider.endpoint_for('ecs', 'ap-southeast-1').host == 'ecs.example.com'
+
+    provider.custom_endpoints = {'ecs': custom('other.example.com')}
+    assert provider.endpoint_for('ecs', 'ap-southeast-1').host == 'other.example.com'
+
+    del provider.custom_endpoints['ecs']
+    assert provider.endpoint_for('ecs', 'ap-southeast-1').host == fallback_endpoint
+
+
+def test_default_provider_clear_cache_picks_up_edited_info():
+    info = custom('ecs.example.com')
+    provider = DefaultEndpointProvider({'ecs': info})
+    assert provider.endpoint_for('ecs', 'ap-southeast-1').host == 'ecs.example.com'
+
+    info.global_endpoint = 'edited.example.com'
+    provider.clear_cache()
+    assert provider.endpoint_for('ecs', 'ap-southeast-1').host == 'edited.example.com'
+
+
+def test_host_provider_follows_host():
+    provider = HostEndpointProvider('a.example.com')
+    first = provider.endpoint_for('ecs', 'r')
+    assert provider.endpoint_for('vpc', 'r') is first
+    assert first.url_for('https') == 'https://a.example.com'
+
+    provider.host = 'b.example.com'
+    assert provider.endpoint_for('ecs', 'r').url_for('http') == 'http://b.example.com'
+
+
+def test_histogram_percentiles_are_bucket_bounds():
+    histogram = LatencyHistogram()
+    for i in range(1, 101):
+        histogram.record('sign', i * 1e-5)
+
+    assert histogram.count('sign') == 100
+    assert histogram.mean('sign') == pytest.approx(50.5e-5)
+    for p in (1, 50, 90, 99):
+        real = p * 1e-5
+        got = histogram.percentile('sign', p)
+        assert real <= got <= real * 2 ** 0.25
+        assert got in _BOUNDS
+    assert histogram.percentile('sign', 100) >= 1e-3
+
+
+def test_histogram_beyond_last_bucket_reports_max():
+    histogram = LatencyHistogram()
+    histogram.record('slow', 500.0)
+    histogram.record('slow', 1e-6)
+
+    assert histogram.percentile('slow', 50) == _BOUNDS[0]
+    assert histogram.percentile('slow', 99) == 500.0
+
+
+def test_histogram_stages_summary_and_reset():
+    histogram = LatencyHistogram()
+    histogram.record('b', 0.001)
+    histogram.record('a', 0.002)
+    histogram.record('b', 0.003)
+
+    assert histogram.stages() == ['b', 'a']
+    lines = histogram.summary().splitlines()
+    assert lines[0].split()[0] == 'stage'
+    assert [line.split()[0] for line in lines[1:]] == ['b', 'a']
+    assert lines[1].split()[1] == '2'
+
+    histogram.reset()
+    assert histogram.stages() == []
+
+
+def test_histogram_is_thread_safe():
+    histogram = LatencyHistogram()
+
+    def work():
+        for _ in range(1000):
+            histogram.record('stage', 1e-4)
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert histogram.count('stage') == 8000
+
+
+class Step(RequestInterceptor):
+    def __init__(self, name):
+        self._name = name
+
+    def name(self):
+        return self._name
+
+    def intercept(self, context):
+        context.append(self._name)
+        return context
+
+
+class ResponseStep(ResponseInterceptor):
+    def name(self):
+        return 'response'
+
+    def intercept(self, context):
+        context.append('response')
+        return context
+
+
+class Recorder(object):
+    def __init__(self):
+        self.calls = []
+
+    def record(self, stage, seconds):
+        self.calls.append((stage, seconds))
+
+
+def chain():
+    return (InterceptorChain()
+            .append_request_interceptor(Step('build'))
+            .append_request_interceptor(Step('sign'))
+            .append_response_interceptor(ResponseStep()))
+
+
+def test_stage_observer_times_every_interceptor_in_order():
+    recorder = Recorder()
+    c = chain().set_stage_observer(recorder)
+
+    assert c.execute_request([]) == ['build', 'sign']
+    assert c.execute_response([]) == ['response']
+    assert [stage for stage, _ in recorder.calls] == ['build', 'sign', 'response']
+    assert all(seconds >= 0 for _, seconds in recorder.calls)
+
+
+def test_stage_observer_feeds_histogram_and_can_be_removed():
+    histogram = LatencyHistogram()
+    c = chain().set_stage_observer(histogram)
+    c.execute_request([])
+    c.execute_request([])
+    assert histogram.stages() == ['build', 'sign']
+    assert histogram.count('sign') == 2
+
+    c.set_stage_observer(None)
+    assert c.execute_request([]) == ['build', 'sign']
+    assert histogram.count('sign') == 2
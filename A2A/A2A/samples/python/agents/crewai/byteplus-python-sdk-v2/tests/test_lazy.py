@@ -0,0 +1,25 @@
+# coding: utf-8
+
+import pytest
+
+import byteplussdkbilling
+import byteplussdkecs
+import byteplussdkvpc
+
+
+@pytest.mark.parametrize("package", [byteplussdkecs, byteplussdkvpc, byteplussdkbilling])
+def test_subpackages_resolve(package):
+    assert package.models.__name__ == package.__name__ + ".models"
+    assert package.api.__name__ == package.__name__ + ".api"
+
+
+def test_lazy_names_resolve_and_are_bound():
+    api = byteplussdkecs.ECSApi
+    assert api.__name__ == "ECSApi"
+    assert vars(byteplussdkecs)["ECSApi"] is api
+
+
+def test_unknown_name_raises_attribute_error():
+    with pytest.raises(AttributeError):
+        byteplussdkecs.NoSuchModel
+    assert not hasattr(byteplussdkecs, "no_such_module")
@@ -0,0 +1,81 @@
+# coding: utf-8
+
+import threading
+import time
+
+import pytest
+
+from byteplussdkcore.paginator import PAGE_NUMBER, TOKEN, Paginator, pagination_style
+from byteplussdkvpc.models import DescribeVpcsRequest, DescribeVpcsResponse
+
+TOTAL = 23
+
+
+class FakeVpcApi(object):
+    """DescribeVpcs over TOTAL vpcs, honouring tokens and page numbers like the service."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def describe_vpcs(self, request):
+        with self.lock:
+            self.calls.append((request.next_token, request.page_number, request.page_size, request.max_results))
+        time.sleep(self.delay)
+        if request.next_token is not None or request.max_results is not None:
+            start = int(request.next_token or 0)
+            size = request.max_results or 10
+            end = min(start + size, TOTAL)
+            # token mode reports no total
+            return DescribeVpcsResponse(vpcs=list(range(start, end)), next_token=str(end) if end < TOTAL else "")
+        number = request.page_number or 1
+        size = request.page_size or 10
+        start = (number - 1) * size
+        return DescribeVpcsResponse(vpcs=list(range(start, min(start + size, TOTAL))), page_number=number,
+                                    page_size=size, total_count=TOTAL, next_token="")
+
+
+def test_style_follows_fields_set():
+    assert pagination_style(DescribeVpcsRequest()) == TOKEN
+    assert pagination_style(DescribeVpcsRequest(max_results=5)) == TOKEN
+    assert pagination_style(DescribeVpcsRequest(page_number=1)) == PAGE_NUMBER
+    assert pagination_style(DescribeVpcsRequest(page_size=5)) == PAGE_NUMBER
+
+
+def test_page_number_callers_get_every_page():
+    api = FakeVpcApi()
+    items = list(Paginator(api.describe_vpcs, DescribeVpcsRequest(page_size=5), items_attr="vpcs"))
+    assert items == list(range(TOTAL))
+    assert all(call[0] is None for call in api.calls)
+
+
+def test_token_callers_follow_tokens():
+    api = FakeVpcApi()
+    items = list(Paginator(api.describe_vpcs, DescribeVpcsRequest(max_results=5), items_attr="vpcs"))
+    assert items == list(range(TOTAL))
+    assert len(api.calls) == 5
+
+
+def test_unset_request_switches_to_numbered_pages_when_total_is_reported():
+    api = FakeVpcApi()
+    items = list(Paginator(api.describe_vpcs, DescribeVpcsRequest(), items_attr="vpcs"))
+    assert items == list(range(TOTAL))
+    assert [call[1] for call in api.calls[1:]] == [2, 3]
+
+
+def test_read_ahead_is_bounded():
+    api = FakeVpcApi(delay=0.01)
+    pages = Paginator(api.describe_vpcs, DescribeVpcsRequest(page_size=1), items_attr="vpcs", max_workers=2).pages()
+    next(pages)
+    next(pages)
+    time.sleep(0.1)
+    # the first page, the one yielded and at most max_workers requested ahead
+    assert len(api.calls) <= 4
+    pages.close()
+
+
+def test_request_without_paging_fields_is_rejected():
+    from byteplussdkvpc.models import CreateVpcRequest
+    with pytest.raises(ValueError):
+        Paginator(lambda request: None, CreateVpcRequest())
@@ -0,0 +1,106 @@
+# coding: utf-8
+
+import datetime
+import io
+
+import pytest
+
+from byteplussdkcore import signv4
+from byteplussdkcore.signv4 import SignerV4, SigningKeyCache
+
+# signatures produced by the signer before signing keys were cached
+POST_AUTHORIZATION = (
+    'HMAC-SHA256 Credential=AKTEST/20240531/ap-singapore-1/vpc/request, '
+    'SignedHeaders=content-type;host;x-content-sha256;x-custom;x-date;x-security-token, '
+    'Signature=352719926a605826127b34d104f7b901d50a58a44117360b0e8cc2ed650cd610')
+GET_AUTHORIZATION = (
+    'HMAC-SHA256 Credential=AKTEST/20240531/ap-singapore-1/ecs/request, '
+    'SignedHeaders=x-content-sha256;x-date, '
+    'Signature=1234ded446f5488d1df20d5e6bcc3a05c13ea01bcf8e40c989a3d55457763919')
+BODY = u'{"Limit":10,"Name":"vpc é"}'
+
+
+@pytest.fixture
+def now(monkeypatch):
+    clock = {'now': datetime.datetime(2024, 5, 31, 23, 59, 58)}
+    monkeypatch.setattr(signv4, '_utcnow', lambda: clock['now'])
+    SignerV4.signing_key_cache.clear()
+    yield clock
+    SignerV4.signing_key_cache.clear()
+
+
+def sign_post(body=BODY):
+    headers = {'Host': 'open.byteplusapi.com:443', 'Content-Type': 'application/json', 'X-Custom': 'a b'}
+    SignerV4.sign('/', 'POST', headers, body, [],
+                  [('Action', 'DescribeVpcs'), ('Version', '2020-04-01'), ('Filter.1', 'a/b c')],
+                  'AKTEST', 'SKTEST', 'ap-singapore-1', 'vpc', session_token='tok')
+    return headers
+
+
+def test_known_answer(now):
+    headers = sign_post()
+    assert headers['X-Date'] == '20240531T235958Z'
+    assert headers['X-Content-Sha256'] == '95017fcb0a577ec12bed6ff40e71bee14ad92bc35b4f2bf097580805a6f678c6'
+    assert headers['Authorization'] == POST_AUTHORIZATION
+
+    headers = {}
+    SignerV4.sign('', 'GET', headers, '', [], [('Action', 'DescribeRegions')],
+                  'AKTEST', 'SKTEST', 'ap-singapore-1', 'ecs')
+    assert headers['Authorization'] == GET_AUTHORIZATION
+
+
+def test_cached_key_gives_the_same_signature(now):
+    assert sign_post()['Authorization'] == POST_AUTHORIZATION
+    assert sign_post()['Authorization'] == POST_AUTHORIZATION
+
+
+@pytest.mark.parametrize('body', [BODY.encode('utf-8'), bytearray(BODY.encode('utf-8')),
+                                  io.BytesIO(BODY.encode('utf-8')), io.StringIO(BODY)])
+def test_body_types_hash_alike(now, body):
+    assert sign_post(body)['Authorization'] == POST_AUTHORIZATION
+
+
+def test_file_body_position_is_restored():
+    body = io.BytesIO(b'skip' + BODY.encode('utf-8'))
+    body.seek(4)
+    assert SignerV4.hash_body(body) == SignerV4.hash_body(BODY)
+    assert body.tell() == 4
+
+
+def test_large_text_bodies_are_hashed_in_chunks(monkeypatch):
+    body = u'é' * 1000
+    expected = SignerV4.hash_body(body)
+    monkeypatch.setattr(signv4, '_HASH_CHUNK_SIZE', 7)
+    assert SignerV4.hash_body(body) == expected
+
+
+def test_key_rolls_over_at_utc_midnight(now):
+    sign_post()
+    cache = SignerV4.signing_key_cache
+    assert cache._date == '20240531'
+
+    now['now'] = datetime.datetime(2024, 6, 1, 0, 0, 1)
+    headers = sign_post()
+    assert cache._date == '20240601'
+    assert 'AKTEST/20240601/ap-singapore-1/vpc/request' in headers['Authorization']
+    assert list(cache._keys.values()) == [
+        SignerV4.get_signing_secret_key_v4('SKTEST', '20240601', 'ap-singapore-1', 'vpc')]
+
+
+def test_late_request_does_not_roll_the_cache_back():
+    cache = SigningKeyCache()
+    cache.get('sk', '20240601', 'r', 's')
+    key = cache.get('sk', '20240531', 'r', 's')
+    assert key == SignerV4.get_signing_secret_key_v4('sk', '20240531', 'r', 's')
+    assert cache._date == '20240601'
+
+
+def test_cache_size_is_bounded():
+    cache = SigningKeyCache(max_size=2)
+    for sk in ('a', 'b', 'c'):
+        cache.get(sk, '20240601', 'r', 's')
+    assert len(cache._keys) <= 2
+
+
+def test_now_is_timezone_aware():
+    assert signv4._utcnow().utcoffset() == datetime.timedelta(0)
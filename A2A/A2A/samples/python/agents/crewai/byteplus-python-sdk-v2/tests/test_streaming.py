@@ -0,0 +1,49 @@
+# coding: utf-8
+
+import io
+import json
+
+import pytest
+
+from byteplussdkcore.streaming import JsonArrayStream
+
+ITEMS = [
+    1.5e10, 3, -0.25, 1.25, 2E-7, 0, -12, 1e300, True, False, None, "x,]}", "é 中",
+    {"Amount": 12.5e3, "Nested": [1.0, {"k": -3e-2}], "Empty": {}},
+    [], [1e5, 2.75],
+]
+DOCUMENT = json.dumps({
+    "ResponseMetadata": {"RequestId": "r", "Cost": 1.5e10},
+    "Result": {"Total": 12345.678e2, "List": ITEMS, "Offset": 10},
+}, ensure_ascii=False)
+
+
+def read(document, chunk_size, path=("Result", "List")):
+    stream = JsonArrayStream(io.BytesIO(document.encode("utf-8")), path, capture=("ResponseMetadata",),
+                             chunk_size=chunk_size)
+    return list(stream), stream.captured
+
+
+@pytest.mark.parametrize("chunk_size", list(range(1, 40)) + [64, 1024])
+def test_any_chunk_size(chunk_size):
+    items, captured = read(DOCUMENT, chunk_size)
+    assert items == ITEMS
+    assert captured["ResponseMetadata"]["Cost"] == 1.5e10
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 11])
+def test_float_split_across_chunks(chunk_size):
+    assert read('{"Result": {"List": [1.5e10, 3]}}', chunk_size)[0] == [1.5e10, 3]
+
+
+def test_number_at_document_end_is_not_cut():
+    assert read('{"Result": {"List": [1.5e10]}, "N": 1.25}', 1)[0] == [1.5e10]
+
+
+def test_missing_array_yields_nothing():
+    assert read('{"Result": {"List": null}}', 2)[0] == []
+
+
+def test_truncated_document_raises():
+    with pytest.raises(ValueError):
+        read('{"Result": {"List": [1, 2', 4)
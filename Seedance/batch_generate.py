@@ -0,0 +1,278 @@
+"""Headless batch video generation for Seedance.
+
+Reads a CSV or JSONL manifest with one video per row:
+
+    prompt,image,ratio,duration
+    "A perfume bottle on a rotating stand",https://.../perfume.jpeg,16:9,5
+    "Slow pan across the product",images/sku-1042.jpg,9:16,5
+
+``image`` may be empty, a URL or a local path, an optional ``id`` column
+names the row. Tasks are submitted with bounded concurrency and a rate
+limit, all of them are tracked by the TaskEngine polling loop, finished
+MP4s are streamed to disk by the VideoPipeline, resuming broken downloads,
+and every finished row is appended to ``results.jsonl`` in the output
+directory. ``--previews`` adds a poster frame and a GIF preview per video,
+``--upload`` copies the files to TOS.
+
+Run it again after a crash with the same arguments: rows already downloaded
+are skipped and rows already submitted are picked up by task id, nothing is
+submitted twice. Rows whose video was generated but not downloaded are only
+downloaded again. ``--retry-failed`` submits failed rows as a new attempt,
+numbered from the last one in ``results.jsonl`` so an interrupted retry run
+picks up its own tasks too.
+
+Usage:
+    python batch_generate.py manifest.csv --out videos/ --concurrency 10 --rate 2 --previews --upload
+"""
+
+import argparse
+import asyncio
+import csv
+import hashlib
+import json
+import logging
+import mimetypes
+import os
+import sys
+import time
+
+import httpx
+
+# image_tools lives at the repository root, next to this demo
+root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if root_dir not in sys.path:
+    sys.path.insert(0, root_dir)
+
+from task_engine import TERMINAL_STATUSES, TaskEngine, TaskError
+from video_pipeline import PipelineError, Transcoder, TosUploader, VideoPipeline
+from image_tools import Base64Field
+
+TEXT_TO_VIDEO_MODEL = os.getenv("TEXT_TO_VIDEO_MODEL", "ep-20250609151607-f8djs")
+IMAGE_TO_VIDEO_MODEL = os.getenv("IMAGE_TO_VIDEO_MODEL", "ep-20250609155925-vfg9s")
+
+RESULTS_FILE = "results.jsonl"
+
+logger = logging.getLogger(__name__)
+
+
+def read_manifest(path):
+    """Reads manifest rows from a .csv or .jsonl file.
+
+    Returns:
+        list: Dicts with prompt, image, ratio, duration and a stable ``id``.
+    """
+    with open(path, newline="", encoding="utf-8") as f:
+        if path.endswith(".jsonl"):
+            rows = [json.loads(line) for line in f if line.strip()]
+        else:
+            rows = list(csv.DictReader(f))
+
+    for row in rows:
+        for column in ("prompt", "image", "ratio", "duration"):
+            row[column] = str(row.get(column) or "").strip()
+        if not row.get("id"):
+            # content based, so reordering the manifest keeps ids stable
+            source = json.dumps([row["prompt"], row["image"], row["ratio"], row["duration"]])
+            row["id"] = hashlib.sha1(source.encode("utf-8")).hexdigest()[:16]
+    return rows
+
+
+def build_prompt(row):
+    """Appends --ratio/--duration parameters unless the prompt already has them."""
+    prompt = row["prompt"]
+    if row["ratio"] and "--ratio" not in prompt:
+        prompt += f" --ratio {row['ratio']}"
+    if row["duration"] and "--duration" not in prompt:
+        prompt += f" --duration {row['duration']}"
+    return prompt.strip()
+
+
+def image_reference(image, base_dir):
+    """Returns a URL for the image column, local files become data URL fields."""
+    if not image or image.startswith(("http://", "https://", "data:")):
+        return image or None
+    path = image if os.path.isabs(image) else os.path.join(base_dir, image)
+    mime = mimetypes.guess_type(path)[0] or "image/jpeg"
+    with open(path, "rb") as f:
+        return Base64Field(f.read(), prefix=f"data:{mime};base64,")
+
+
+def load_results(path):
+    """Returns the last result line written for every row id."""
+    results = {}
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    result = json.loads(line)
+                    results[result["id"]] = result
+    return results
+
+
+class BatchRunner:
+    """Drives one manifest through a TaskEngine.
+
+    Args:
+        engine (TaskEngine): Engine whose loop runs the batch.
+        out_dir (str): Directory receiving the MP4 files and results.jsonl.
+        concurrency (int): Maximum tasks generating at the same time.
+        rate (float): Maximum task submissions per second.
+        retry_failed (bool): Submit rows whose previous task failed again.
+        pipeline (VideoPipeline): Keeps the videos, downloads only by default.
+    """
+
+    def __init__(self, engine, out_dir, concurrency=10, rate=2.0, retry_failed=False, pipeline=None):
+        self.engine = engine
+        self.out_dir = out_dir
+        self.pipeline = pipeline or VideoPipeline(out_dir)
+        self.concurrency = concurrency
+        self.rate = rate
+        self.retry_failed = retry_failed
+        self.results_path = os.path.join(out_dir, RESULTS_FILE)
+        self.stats = {"skipped": 0, "succeeded": 0, "failed": 0}
+
+    def run(self, rows, base_dir="."):
+        os.makedirs(self.out_dir, exist_ok=True)
+        return self.engine.run(self._run(rows, base_dir))
+
+    async def _run(self, rows, base_dir):
+        done = load_results(self.results_path)
+        todo = []
+        for row in rows:
+            previous = done.get(row["id"])
+            if previous and previous["status"] == "succeeded" and os.path.exists(previous["video_path"]):
+                self.stats["skipped"] += 1
+            elif previous and previous["status"] != "succeeded" and not self.retry_failed \
+                    and not self._generated(previous):
+                self.stats["skipped"] += 1
+            else:
+                todo.append((row, previous))
+
+        self._slots = asyncio.Semaphore(self.concurrency)
+        self._next_submit = 0.0
+        self._submit_lock = asyncio.Lock()
+        self._waiters = {}
+        unsubscribe = self.engine.subscribe(self._on_job)
+        try:
+            async with httpx.AsyncClient(timeout=httpx.Timeout(60.0), follow_redirects=True) as downloads:
+                with open(self.results_path, "a", encoding="utf-8") as results:
+                    await asyncio.gather(*[self._process(row, previous, base_dir, downloads, results)
+                                           for row, previous in todo])
+        finally:
+            unsubscribe()
+        return self.stats
+
+    def _generated(self, previous):
+        """Whether the task of a previous result succeeded, so only its download is missing."""
+        job = self.engine.job(previous["task_id"]) if previous.get("task_id") else None
+        return job is not None and job["status"] == "succeeded" and bool(job["video_url"])
+
+    def _attempt(self, previous):
+        """Attempt number of the task a row uses, derived from its previous result.
+
+        The same attempt is kept while its task can still be downloaded, a
+        failed one is followed by the next attempt. Runs interrupted before
+        writing their result compute the same number again, and so find the
+        task they submitted under its job key.
+        """
+        if previous is None:
+            return 0
+        attempt = previous.get("attempt", 0)
+        if previous["status"] == "succeeded" or self._generated(previous):
+            return attempt
+        return attempt + 1
+
+    def _on_job(self, job):
+        # called on the engine loop, the same thread as the waiters
+        waiter = self._waiters.get(job["task_id"])
+        if waiter is not None and job["status"] in TERMINAL_STATUSES and not waiter.done():
+            waiter.set_result(job)
+
+    async def _throttle_submit(self):
+        async with self._submit_lock:
+            delay = self._next_submit - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._next_submit = time.monotonic() + 1.0 / self.rate
+
+    async def _process(self, row, previous, base_dir, downloads, results):
+        started = time.time()
+        attempt = self._attempt(previous)
+        result = {"id": row["id"], "prompt": row["prompt"], "image": row["image"], "task_id": None,
+                  "attempt": attempt, "status": "failed", "video_path": None, "video_url": None, "error": None}
+        async with self._slots:
+            try:
+                job_key = f"batch:{row['id']}" if attempt == 0 else f"batch:{row['id']}#{attempt}"
+                existing = self.engine.store.by_key(job_key)
+                if existing is None:
+                    await self._throttle_submit()
+                image = image_reference(row["image"], base_dir)
+                model = IMAGE_TO_VIDEO_MODEL if image else TEXT_TO_VIDEO_MODEL
+                job = await self.engine.create(build_prompt(row), model, image, owner="batch", job_key=job_key)
+                result["task_id"] = job["task_id"]
+
+                if job["status"] not in TERMINAL_STATUSES:
+                    waiter = self._waiters[job["task_id"]] = asyncio.get_running_loop().create_future()
+                    # the job may have finished between create() and registering the waiter
+                    job = self.engine.job(job["task_id"])
+                    if job["status"] not in TERMINAL_STATUSES:
+                        job = await waiter
+                    del self._waiters[job["task_id"]]
+
+                result["status"] = job["status"]
+                result["video_url"] = job["video_url"]
+                if job["status"] == "succeeded" and job["video_url"]:
+                    kept = await self.pipeline.process(job["video_url"], row["id"], downloads)
+                    for field in ("video_path", "poster_path", "preview_path", "video_tos_url"):
+                        if field in kept:
+                            result[field] = kept[field]
+                    if kept["errors"]:
+                        result["error"] = "; ".join(kept["errors"])
+                else:
+                    result["status"] = "failed"
+                    result["error"] = job["error"] or job["status"]
+            except (TaskError, PipelineError, httpx.HTTPError, OSError) as e:
+                result["status"] = "failed"
+                result["error"] = str(e)
+            except Exception as e:
+                # a bug or bad row must not cancel the rest of the batch
+                logger.exception("Row %s failed", row["id"])
+                result["status"] = "failed"
+                result["error"] = f"{type(e).__name__}: {e}"
+
+        result["seconds"] = round(time.time() - started, 1)
+        self.stats[result["status"]] += 1
+        results.write(json.dumps(result) + "\n")
+        results.flush()
+        print(f"[{result['status']}] {row['id']} {result['video_path'] or result['error']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate Seedance videos for every row of a manifest.")
+    parser.add_argument("manifest", help="CSV or JSONL with prompt, image, ratio, duration columns")
+    parser.add_argument("--out", default="videos", help="output directory for MP4s and results.jsonl")
+    parser.add_argument("--concurrency", type=int, default=10, help="tasks generating at the same time")
+    parser.add_argument("--rate", type=float, default=2.0, help="task submissions per second")
+    parser.add_argument("--retry-failed", action="store_true", help="submit rows that failed before again")
+    parser.add_argument("--db", default=None, help="job table, defaults to <out>/jobs.db")
+    parser.add_argument("--previews", action="store_true", help="make a poster JPEG and a GIF preview with ffmpeg")
+    parser.add_argument("--upload", action="store_true", help="upload the files to TOS, see the TOS_* variables")
+    args = parser.parse_args()
+
+    rows = read_manifest(args.manifest)
+    os.makedirs(args.out, exist_ok=True)
+    pipeline = VideoPipeline(args.out, Transcoder() if args.previews else None,
+                             TosUploader() if args.upload else None)
+    engine = TaskEngine(db_path=args.db or os.path.join(args.out, "jobs.db"))
+    started = time.time()
+    try:
+        stats = BatchRunner(engine, args.out, args.concurrency, args.rate, args.retry_failed, pipeline).run(
+            rows, base_dir=os.path.dirname(os.path.abspath(args.manifest)))
+    finally:
+        engine.close()
+    print(f"{len(rows)} rows in {time.time() - started:.0f}s: {stats['succeeded']} succeeded, "
+          f"{stats['failed']} failed, {stats['skipped']} skipped. Results in {os.path.join(args.out, RESULTS_FILE)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,474 @@
+"""Background engine for Seedance video generation tasks.
+
+The engine owns one asyncio event loop on a daemon thread and one pooled
+``httpx.AsyncClient``. Every submitted task is stored in a local SQLite
+table keyed by task id, and a single scheduler loop polls all unfinished
+tasks: quickly right after submission, then less and less often, and never
+sooner than a ``Retry-After`` sent by the server. Unfinished tasks are picked
+up again when the engine restarts, so a page reload or a crash does not lose
+them.
+
+Callers never sleep: they read job snapshots, ``subscribe`` to changes or
+wait on ``wait_for_change``.
+
+Requires ``httpx`` in addition to the app's requirements.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import sys
+import threading
+import time
+
+import httpx
+from dotenv import load_dotenv
+
+# image_tools lives at the repository root, next to this demo
+root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if root_dir not in sys.path:
+    sys.path.insert(0, root_dir)
+
+from image_tools import Base64Field, build_json_body
+
+# Load environment variables
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+API_BASE = os.getenv("ARK_API_BASE", "https://ark.ap-southeast.bytepluses.com/api/v3")
+TASKS_PATH = "/contents/generations/tasks"
+DEFAULT_DB_PATH = os.getenv("SEEDANCE_JOBS_DB", os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                                              "seedance_jobs.db"))
+
+TERMINAL_STATUSES = ("succeeded", "failed", "cancelled")
+
+# Seconds between polls of one task: fast at first, slower as it keeps running
+POLL_INTERVALS = (2, 3, 5, 8, 13, 20)
+MAX_POLL_INTERVAL = 30
+# Longest wait after consecutive failed polls, doubled from the normal interval
+MAX_ERROR_BACKOFF = 300
+
+# Client errors that go away by polling again, any other 4xx fails the job
+RETRYABLE_CLIENT_ERRORS = (408, 409, 425, 429)
+
+_COLUMNS = ("task_id", "job_key", "owner", "prompt", "model", "image", "status", "video_url",
+            "error", "result", "polls", "next_poll_at", "created_at", "updated_at")
+
+
+class TaskError(Exception):
+    """Raised when the API refuses to create a task.
+
+    Attributes:
+        detail (dict): The error body returned by the API.
+    """
+
+    def __init__(self, detail):
+        super().__init__(detail.get("error", detail) if isinstance(detail, dict) else detail)
+        self.detail = detail
+
+
+def build_content(prompt, image_url=None):
+    """Builds the ``content`` list of a generation request.
+
+    Args:
+        prompt (str): Text prompt, may be empty for image-to-video.
+        image_url (str or Base64Field): Public URL, ``data:image/...;base64,``
+            URL or the image bytes with a data URL prefix.
+
+    Returns:
+        list: The request content.
+    """
+    content = []
+    if prompt:
+        content.append({"type": "text", "text": prompt})
+    if image_url:
+        content.append({"type": "image_url", "image_url": {"url": image_url}})
+    return content
+
+
+def next_poll_delay(polls, retry_after=None, errors=0):
+    """Returns the seconds to wait before polling a task again.
+
+    Args:
+        polls (int): Number of polls already made for the task.
+        retry_after (float): Delay requested by the server, if any.
+        errors (int): Consecutive polls that failed, each doubles the delay
+            up to ``MAX_ERROR_BACKOFF``.
+    """
+    delay = POLL_INTERVALS[polls] if polls < len(POLL_INTERVALS) else MAX_POLL_INTERVAL
+    if errors:
+        delay = min(MAX_ERROR_BACKOFF, delay * 2 ** errors)
+    if retry_after is not None:
+        delay = max(delay, retry_after)
+    return delay
+
+
+def _retry_after(response):
+    value = response.headers.get("Retry-After")
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+class JobStore:
+    """SQLite table of generation jobs, safe to use from several threads."""
+
+    def __init__(self, path=DEFAULT_DB_PATH):
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    task_id TEXT PRIMARY KEY,
+                    job_key TEXT UNIQUE,
+                    owner TEXT,
+                    prompt TEXT,
+                    model TEXT,
+                    image TEXT,
+                    status TEXT,
+                    video_url TEXT,
+                    error TEXT,
+                    result TEXT,
+                    polls INTEGER DEFAULT 0,
+                    next_poll_at REAL,
+                    created_at REAL,
+                    updated_at REAL
+                )""")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS jobs_owner ON jobs (owner, created_at)")
+
+    def add(self, job):
+        columns = [c for c in _COLUMNS if c in job]
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO jobs (%s) VALUES (%s)" % (", ".join(columns), ", ".join("?" * len(columns))),
+                [job[c] for c in columns])
+
+    def update(self, task_id, **fields):
+        fields["updated_at"] = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE jobs SET %s WHERE task_id = ?" % ", ".join("%s = ?" % c for c in fields),
+                list(fields.values()) + [task_id])
+
+    def get(self, task_id):
+        return self._one("SELECT * FROM jobs WHERE task_id = ?", (task_id,))
+
+    def by_key(self, job_key):
+        return self._one("SELECT * FROM jobs WHERE job_key = ?", (job_key,))
+
+    def list(self, owner=None, limit=50):
+        """Returns the most recent jobs, newest first."""
+        if owner is None:
+            return self._all("SELECT * FROM jobs ORDER BY created_at DESC LIMIT ?", (limit,))
+        return self._all("SELECT * FROM jobs WHERE owner = ? ORDER BY created_at DESC LIMIT ?", (owner, limit))
+
+    def pending(self):
+        """Returns every job that has not reached a terminal status."""
+        return self._all("SELECT * FROM jobs WHERE status NOT IN (?, ?, ?)", TERMINAL_STATUSES)
+
+    def _one(self, sql, args):
+        with self._lock:
+            row = self._conn.execute(sql, args).fetchone()
+        return dict(row) if row is not None else None
+
+    def _all(self, sql, args):
+        with self._lock:
+            return [dict(row) for row in self._conn.execute(sql, args).fetchall()]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class TaskEngine:
+    """Creates Seedance tasks and tracks them all from one background loop.
+
+    Args:
+        api_key (str): ModelArk API key, defaults to ``ARK_API_KEY``.
+        db_path (str): SQLite file holding the job table.
+        base_url (str): API base URL.
+        max_connections (int): Size of the HTTP connection pool, which is
+            also the number of polls in flight at once.
+    """
+
+    def __init__(self, api_key=None, db_path=DEFAULT_DB_PATH, base_url=API_BASE, max_connections=8):
+        self.api_key = api_key or os.getenv("ARK_API_KEY")
+        self.base_url = base_url
+        self.max_connections = max_connections
+        self.store = JobStore(db_path)
+
+        self._listeners = []
+        self._changed = threading.Condition()
+        self._version = 0
+
+        # task_id -> next poll time, only touched on the loop thread
+        self._schedule = {}
+        # task_id -> consecutive failed polls
+        self._errors = {}
+        # job_key -> future of the create call in progress, so a key is submitted once
+        self._creating = {}
+        self._loop = asyncio.new_event_loop()
+        self._ready = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="seedance-task-engine", daemon=True)
+        self._thread.start()
+        self._ready.wait()
+
+    # ----- public API, callable from any thread -----
+
+    def submit(self, prompt, model, image_url=None, owner=None, job_key=None, timeout=60):
+        """Creates a generation task and returns its job record.
+
+        When ``job_key`` is given and a job with that key exists, the existing
+        job is returned and nothing is submitted.
+
+        Raises:
+            TaskError: If the API rejects the request.
+        """
+        future = asyncio.run_coroutine_threadsafe(
+            self.create(prompt, model, image_url, owner=owner, job_key=job_key), self._loop)
+        return future.result(timeout)
+
+    def run(self, coro, timeout=None):
+        """Runs a coroutine on the engine loop and returns its result."""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result(timeout)
+
+    def spawn(self, coro):
+        """Starts a coroutine on the engine loop without waiting, returns its concurrent Future."""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    def job(self, task_id):
+        return self.store.get(task_id)
+
+    def jobs(self, owner=None, limit=50):
+        return self.store.list(owner, limit)
+
+    @property
+    def version(self):
+        """Increases every time a job changes."""
+        return self._version
+
+    def subscribe(self, callback):
+        """Calls ``callback(job)`` on the engine thread after every job change.
+
+        Returns:
+            A function that removes the subscription.
+        """
+        self._listeners.append(callback)
+        return lambda: self._listeners.remove(callback)
+
+    def wait_for_change(self, since, timeout=None):
+        """Blocks until ``version`` differs from ``since`` or the timeout passes.
+
+        Returns:
+            int: The current version.
+        """
+        with self._changed:
+            self._changed.wait_for(lambda: self._version != since, timeout)
+            return self._version
+
+    def close(self):
+        """Stops the loop, tasks still running are resumed by the next engine."""
+        if self._loop.is_running():
+            self.run(self._shutdown())
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
+        self.store.close()
+
+    # ----- coroutines, run on the engine loop -----
+
+    async def _shutdown(self):
+        # the poll loop and in-flight polls never finish on their own
+        tasks = [task for task in asyncio.all_tasks(self._loop) if task is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await self._client.aclose()
+
+    async def create(self, prompt, model, image_url=None, owner=None, job_key=None):
+        """Coroutine behind ``submit``, for callers already on the engine loop."""
+        if job_key is None:
+            return await self._create(prompt, model, image_url, owner, None)
+        existing = self.store.by_key(job_key)
+        if existing is not None:
+            return existing
+        # a second caller with the same key waits for the first one's task
+        creating = self._creating.get(job_key)
+        if creating is not None:
+            return await asyncio.shield(creating)
+        creating = self._creating[job_key] = self._loop.create_future()
+        try:
+            job = await self._create(prompt, model, image_url, owner, job_key)
+        except BaseException as e:
+            creating.set_exception(e)
+            # retrieved here so an unawaited failure is not reported as never retrieved
+            creating.exception()
+            raise
+        else:
+            creating.set_result(job)
+            return job
+        finally:
+            del self._creating[job_key]
+
+    async def _create(self, prompt, model, image_url, owner, job_key):
+        # image bytes are base64 encoded straight into the body buffer
+        body = build_json_body({"model": model, "content": build_content(prompt, image_url)})
+        try:
+            response = await self._client.post(TASKS_PATH, content=body.stream(), headers=body.headers())
+        except httpx.HTTPError as e:
+            raise TaskError({"error": str(e)})
+        if response.status_code != 200:
+            try:
+                raise TaskError(response.json())
+            except ValueError:
+                raise TaskError({"error": response.text})
+        result = response.json()
+        if "id" not in result:
+            raise TaskError({"error": "Unexpected response: %s" % result})
+
+        now = time.time()
+        job = {
+            "task_id": result["id"],
+            "job_key": job_key,
+            "owner": owner,
+            "prompt": prompt,
+            "model": model,
+            # uploaded images are data URLs of several MB, keep only a marker
+            "image": "uploaded" if isinstance(image_url, Base64Field) or (image_url or "").startswith("data:")
+            else image_url,
+            "status": "queued",
+            "polls": 0,
+            "next_poll_at": now + next_poll_delay(0),
+            "created_at": now,
+            "updated_at": now,
+        }
+        try:
+            self.store.add(job)
+        except sqlite3.IntegrityError:
+            # another engine on the same database stored this key first
+            existing = self.store.by_key(job_key) if job_key is not None else None
+            if existing is None:
+                raise
+            logger.warning("Task %s duplicates job %s, keeping %s", job["task_id"], job_key, existing["task_id"])
+            return existing
+        self._schedule[job["task_id"]] = job["next_poll_at"]
+        self._wake.set()
+        self._notify(job)
+        return job
+
+    def _run(self):
+        asyncio.set_event_loop(self._loop)
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers={"Content-Type": "application/json", "Authorization": "Bearer %s" % self.api_key},
+            timeout=httpx.Timeout(30.0),
+            limits=httpx.Limits(max_connections=self.max_connections,
+                                max_keepalive_connections=self.max_connections))
+        self._wake = asyncio.Event()
+        self._polls = asyncio.Semaphore(self.max_connections)
+        # resume tasks left unfinished by a previous run
+        for job in self.store.pending():
+            self._schedule[job["task_id"]] = job["next_poll_at"] or time.time()
+        self._loop.create_task(self._poll_loop())
+        self._ready.set()
+        self._loop.run_forever()
+
+    async def _poll_loop(self):
+        in_flight = set()
+        while True:
+            now = time.time()
+            for task_id, due in list(self._schedule.items()):
+                if due <= now and task_id not in in_flight:
+                    in_flight.add(task_id)
+                    self._loop.create_task(self._poll(task_id, in_flight))
+
+            waiting = [due for task_id, due in self._schedule.items() if task_id not in in_flight]
+            timeout = max(0.0, min(waiting) - time.time()) if waiting else None
+            self._wake.clear()
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _poll(self, task_id, in_flight):
+        try:
+            await self._poll_once(task_id)
+        except Exception:
+            # e.g. the job store failed; never leave the task due in the past
+            errors = self._errors[task_id] = self._errors.get(task_id, 0) + 1
+            logger.exception("Polling %s failed", task_id)
+            if task_id in self._schedule:
+                self._schedule[task_id] = time.time() + next_poll_delay(0, errors=errors)
+        finally:
+            in_flight.discard(task_id)
+            self._wake.set()
+
+    async def _poll_once(self, task_id):
+        job = self.store.get(task_id)
+        if job is None:
+            self._schedule.pop(task_id, None)
+            return
+        polls = job["polls"] + 1
+        retry_after = None
+        failed = False
+        fields = {"polls": polls}
+        try:
+            async with self._polls:
+                response = await self._client.get("%s/%s" % (TASKS_PATH, task_id))
+            if response.status_code == 200:
+                result = response.json()
+                if not isinstance(result, dict):
+                    raise ValueError("Unexpected response: %r" % (result,))
+                fields["status"] = result.get("status", job["status"])
+                fields["result"] = json.dumps(result)
+                fields["video_url"] = (result.get("content") or {}).get("video_url")
+                if result.get("error"):
+                    fields["error"] = json.dumps(result["error"])
+            elif response.status_code == 404:
+                fields["status"] = "failed"
+                fields["error"] = "task not found"
+            elif 400 <= response.status_code < 500 and response.status_code not in RETRYABLE_CLIENT_ERRORS:
+                # e.g. 401 or 403, polling again will not help
+                fields["status"] = "failed"
+                fields["error"] = "HTTP %d: %s" % (response.status_code, response.text[:500])
+            else:
+                # throttled or server error, poll again later
+                retry_after = _retry_after(response)
+                failed = True
+        except (httpx.HTTPError, ValueError) as e:
+            # unreachable, or a body that is not the expected JSON
+            logger.warning("Polling %s failed: %s", task_id, e)
+            failed = True
+
+        errors = self._errors.get(task_id, 0) + 1 if failed else 0
+        status = fields.get("status", job["status"])
+        terminal = status in TERMINAL_STATUSES
+        fields["next_poll_at"] = None if terminal else time.time() + next_poll_delay(polls, retry_after, errors)
+        # stored first, _poll reschedules the task if this fails
+        self.store.update(task_id, **fields)
+        if terminal:
+            self._schedule.pop(task_id, None)
+            self._errors.pop(task_id, None)
+        else:
+            self._schedule[task_id] = fields["next_poll_at"]
+            self._errors[task_id] = errors
+
+        if status != job["status"] or "video_url" in fields and fields["video_url"] != job["video_url"]:
+            job.update(fields)
+            self._notify(job)
+
+    def _notify(self, job):
+        with self._changed:
+            self._version += 1
+            self._changed.notify_all()
+        for callback in list(self._listeners):
+            try:
+                callback(job)
+            except Exception:
+                logger.exception("Job listener failed")
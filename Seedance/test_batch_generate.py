@@ -0,0 +1,132 @@
+"""Tests for resuming and retrying batch runs, against an in-process mock of the tasks API."""
+
+import json
+import os
+
+import httpx
+import pytest
+
+import task_engine
+from batch_generate import RESULTS_FILE, BatchRunner
+from task_engine import TaskEngine
+from video_pipeline import PipelineError
+
+ROWS = [{"id": "row-%d" % i, "prompt": "video %d" % i, "image": "", "ratio": "", "duration": ""} for i in range(3)]
+
+
+class MockApi:
+    """Creates tasks that finish with ``status`` on their first poll."""
+
+    def __init__(self, status="succeeded"):
+        self.status = status
+        self.posts = 0
+
+    def __call__(self, request):
+        if request.method == "POST":
+            self.posts += 1
+            return httpx.Response(200, json={"id": "task-%d" % self.posts})
+        body = {"status": self.status}
+        if self.status == "succeeded":
+            body["content"] = {"video_url": "https://videos/%s.mp4" % request.url.path.rsplit("/", 1)[-1]}
+        else:
+            body["error"] = {"message": "generation failed"}
+        return httpx.Response(200, json=body)
+
+
+class FakePipeline:
+    """Stands in for VideoPipeline, ``fail`` makes downloads raise."""
+
+    def __init__(self, out_dir, fail=False, crash=()):
+        self.out_dir = out_dir
+        self.fail = fail
+        self.crash = crash
+        self.downloads = []
+
+    async def process(self, url, name, client=None):
+        self.downloads.append(url)
+        if self.fail:
+            raise PipelineError("download failed")
+        if name in self.crash:
+            raise ValueError("unexpected")
+        path = os.path.join(self.out_dir, name + ".mp4")
+        with open(path, "wb") as f:
+            f.write(b"mp4")
+        return {"video_path": path, "errors": []}
+
+
+@pytest.fixture(autouse=True)
+def fast_polls(monkeypatch):
+    monkeypatch.setattr(task_engine, "POLL_INTERVALS", (0.02,))
+    monkeypatch.setattr(task_engine, "MAX_POLL_INTERVAL", 0.02)
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = TaskEngine("key", db_path=str(tmp_path / "jobs.db"))
+    engine.api = MockApi()
+
+    async def use_mock():
+        await engine._client.aclose()
+        engine._client = httpx.AsyncClient(base_url="https://mock",
+                                           transport=httpx.MockTransport(lambda r: engine.api(r)))
+
+    engine.run(use_mock())
+    yield engine
+    engine.close()
+
+
+def run(engine, out_dir, pipeline, retry_failed=False):
+    return BatchRunner(engine, str(out_dir), concurrency=3, rate=1000, retry_failed=retry_failed,
+                       pipeline=pipeline).run(ROWS)
+
+
+def results(out_dir):
+    with open(os.path.join(str(out_dir), RESULTS_FILE)) as f:
+        return [json.loads(line) for line in f]
+
+
+def test_failed_downloads_are_only_downloaded_again(engine, tmp_path):
+    assert run(engine, tmp_path, FakePipeline(str(tmp_path), fail=True))["failed"] == 3
+    assert engine.api.posts == 3
+
+    pipeline = FakePipeline(str(tmp_path))
+    assert run(engine, tmp_path, pipeline)["succeeded"] == 3
+    assert engine.api.posts == 3
+    assert len(pipeline.downloads) == 3
+
+
+def test_retry_run_interrupted_before_its_results_resubmits_nothing(engine, tmp_path):
+    engine.api.status = "failed"
+    assert run(engine, tmp_path, FakePipeline(str(tmp_path)))["failed"] == 3
+
+    engine.api.status = "succeeded"
+    assert run(engine, tmp_path, FakePipeline(str(tmp_path)), retry_failed=True)["succeeded"] == 3
+    assert engine.api.posts == 6
+    assert {r["attempt"] for r in results(tmp_path)[3:]} == {1}
+
+    # as if the retry run crashed before writing its results
+    with open(os.path.join(str(tmp_path), RESULTS_FILE)) as f:
+        lines = f.readlines()[:3]
+    with open(os.path.join(str(tmp_path), RESULTS_FILE), "w") as f:
+        f.writelines(lines)
+    for row in ROWS:
+        os.remove(os.path.join(str(tmp_path), row["id"] + ".mp4"))
+    assert run(engine, tmp_path, FakePipeline(str(tmp_path)), retry_failed=True)["succeeded"] == 3
+    assert engine.api.posts == 6
+
+
+def test_failed_rows_are_skipped_without_retry_flag(engine, tmp_path):
+    engine.api.status = "failed"
+    run(engine, tmp_path, FakePipeline(str(tmp_path)))
+    assert run(engine, tmp_path, FakePipeline(str(tmp_path)))["skipped"] == 3
+    assert engine.api.posts == 3
+
+
+def test_unexpected_error_fails_only_its_row(engine, tmp_path):
+    stats = run(engine, tmp_path, FakePipeline(str(tmp_path), crash={"row-1"}))
+    assert stats["succeeded"] == 2
+    assert stats["failed"] == 1
+    by_id = {r["id"]: r for r in results(tmp_path)}
+    assert by_id["row-1"]["status"] == "failed"
+    assert by_id["row-1"]["error"] == "ValueError: unexpected"
+    assert by_id["row-1"]["task_id"]
@@ -0,0 +1,148 @@
+"""Tests for the Seedance task engine, against an in-process mock of the tasks API."""
+
+import asyncio
+import sqlite3
+import threading
+import time
+
+import httpx
+import pytest
+
+import task_engine
+from task_engine import TaskEngine
+
+
+class MockApi:
+    """Answers task creation with new ids and polls with ``poll_response``."""
+
+    def __init__(self, poll_response):
+        self.poll_response = poll_response
+        self.posts = 0
+        self.polls = 0
+        self.lock = threading.Lock()
+
+    async def __call__(self, request):
+        if request.method == "POST":
+            with self.lock:
+                self.posts += 1
+                task_id = "task-%d" % self.posts
+            await request.aread()
+            # slow enough for concurrent creates to overlap
+            await asyncio.sleep(0.05)
+            return httpx.Response(200, json={"id": task_id})
+        with self.lock:
+            self.polls += 1
+        return self.poll_response()
+
+
+@pytest.fixture(autouse=True)
+def fast_polls(monkeypatch):
+    monkeypatch.setattr(task_engine, "POLL_INTERVALS", (0.05,))
+    monkeypatch.setattr(task_engine, "MAX_POLL_INTERVAL", 0.05)
+    monkeypatch.setattr(task_engine, "MAX_ERROR_BACKOFF", 0.4)
+
+
+@pytest.fixture
+def make_engine(tmp_path):
+    """Builds engines that talk to a mock API and closes them after the test."""
+    engines = []
+
+    def make(api):
+        engine = TaskEngine("key", db_path=str(tmp_path / "jobs.db"))
+        engines.append(engine)
+
+        async def use_mock():
+            await engine._client.aclose()
+            engine._client = httpx.AsyncClient(base_url="https://mock", transport=httpx.MockTransport(api))
+
+        engine.run(use_mock())
+        return engine
+
+    yield make
+    for engine in engines:
+        engine.close()
+
+
+def wait_for(condition, timeout=3.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if condition():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+def test_non_json_response_backs_off(make_engine):
+    api = MockApi(lambda: httpx.Response(200, text="<html>busy</html>"))
+    engine = make_engine(api)
+    job = engine.submit("a cat", "model")
+    time.sleep(1.0)
+    # 0.1, 0.2, 0.4, 0.4 ... seconds apart, not a tight loop
+    assert 2 <= api.polls <= 8
+    assert engine.job(job["task_id"])["status"] == "queued"
+
+
+def test_permanent_client_error_fails_the_job(make_engine):
+    api = MockApi(lambda: httpx.Response(401, json={"error": {"code": "AuthenticationError"}}))
+    engine = make_engine(api)
+    job = engine.submit("a cat", "model")
+    assert wait_for(lambda: engine.job(job["task_id"])["status"] == "failed")
+    assert "401" in engine.job(job["task_id"])["error"]
+    polls = api.polls
+    time.sleep(0.3)
+    assert api.polls == polls
+
+
+def test_store_errors_reschedule_the_poll(make_engine, monkeypatch):
+    api = MockApi(lambda: httpx.Response(200, json={"status": "running"}))
+    engine = make_engine(api)
+    job = engine.submit("a cat", "model")
+
+    def broken_update(task_id, **fields):
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(engine.store, "update", broken_update)
+    polls = api.polls
+    time.sleep(1.0)
+    assert api.polls - polls <= 8
+    monkeypatch.undo()
+    assert engine.job(job["task_id"])["status"] == "queued"
+
+
+def test_succeeded_task_stops_polling(make_engine):
+    api = MockApi(lambda: httpx.Response(200, json={"status": "succeeded", "content": {"video_url": "https://v"}}))
+    engine = make_engine(api)
+    job = engine.submit("a cat", "model")
+    assert wait_for(lambda: engine.job(job["task_id"])["video_url"] == "https://v")
+    assert engine.job(job["task_id"])["status"] == "succeeded"
+
+
+def test_concurrent_creates_with_one_key_submit_once(make_engine):
+    api = MockApi(lambda: httpx.Response(200, json={"status": "running"}))
+    engine = make_engine(api)
+
+    async def create_twice():
+        return await asyncio.gather(engine.create("a cat", "model", job_key="row-1"),
+                                    engine.create("a cat", "model", job_key="row-1"))
+
+    first, second = engine.run(create_twice())
+    assert first["task_id"] == second["task_id"]
+    assert api.posts == 1
+
+
+def test_jobs_are_listed_per_owner(make_engine):
+    api = MockApi(lambda: httpx.Response(200, json={"status": "running"}))
+    engine = make_engine(api)
+    engine.submit("mine", "model", owner="session-a")
+    engine.submit("theirs", "model", owner="session-b")
+    assert [job["prompt"] for job in engine.jobs(owner="session-a")] == ["mine"]
+
+
+def test_close_cancels_the_poll_loop(make_engine):
+    api = MockApi(lambda: httpx.Response(200, json={"status": "running"}))
+    engine = make_engine(api)
+    engine.submit("a cat", "model")
+    assert wait_for(lambda: api.polls >= 1)
+    engine.close()
+    assert engine._loop.is_closed()
+    assert not asyncio.all_tasks(engine._loop)
@@ -0,0 +1,138 @@
+"""Tests for downloads and for recording and retrying failed pipeline steps."""
+
+import asyncio
+import json
+import logging
+
+import httpx
+import pytest
+
+import video_pipeline
+from video_pipeline import PipelineError, VideoPipeline, download
+
+VIDEO = b"\x00\x00\x00\x18ftypmp42" + bytes(range(256)) * 8
+
+
+def client(handler):
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+async def fetch(handler, path, **kwargs):
+    async with client(handler) as c:
+        return await download(c, "https://videos/a.mp4", path, **kwargs)
+
+
+def serve_video(request):
+    return httpx.Response(200, content=VIDEO, headers={"ETag": '"v1"'})
+
+
+class FlakyUploader:
+    """Fails the first ``failures`` uploads."""
+
+    def __init__(self, failures=1):
+        self.failures = failures
+        self.uploads = []
+
+    def upload(self, path, name):
+        self.uploads.append(name)
+        if len(self.uploads) <= self.failures:
+            raise PipelineError(f"Failed to upload {name} to TOS: slow down")
+        return f"https://bucket/{name}"
+
+
+def test_download_writes_the_file(tmp_path):
+    path = str(tmp_path / "a.mp4")
+    assert asyncio.run(fetch(serve_video, path)) == len(VIDEO)
+    with open(path, "rb") as f:
+        assert f.read() == VIDEO
+
+
+def test_interrupted_download_is_logged_and_resumed(tmp_path, monkeypatch, caplog):
+    monkeypatch.setattr(video_pipeline, "RETRY_DELAYS", (0,))
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        if len(calls) == 1:
+            raise httpx.ConnectError("connection reset")
+        return serve_video(request)
+
+    path = str(tmp_path / "a.mp4")
+    with caplog.at_level(logging.WARNING, logger="video_pipeline"):
+        assert asyncio.run(fetch(handler, path)) == len(VIDEO)
+    assert len(calls) == 2
+    assert [r.getMessage() for r in caplog.records] == [
+        "Download of a.mp4 interrupted (connection reset), resuming in 0s"]
+
+
+def test_416_on_the_last_attempt_raises_pipeline_error(tmp_path):
+    path = str(tmp_path / "a.mp4")
+    with open(path + ".part", "wb") as f:
+        f.write(VIDEO[:100])
+    with open(path + ".part.json", "w") as f:
+        json.dump({"etag": '"v0"', "total": 5000}, f)
+
+    def handler(request):
+        return httpx.Response(416, headers={"Content-Range": "bytes */%d" % len(VIDEO)})
+
+    with pytest.raises(PipelineError, match="range not satisfiable"):
+        asyncio.run(fetch(handler, path, attempts=1))
+
+
+def test_failed_download_is_recorded_and_run_again(tmp_path):
+    pipeline = VideoPipeline(str(tmp_path))
+
+    async def run(handler):
+        async with client(handler) as c:
+            return await pipeline.process("https://videos/a.mp4", "task-1", c)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(run(lambda request: httpx.Response(503)))
+    record = pipeline.load("task-1")
+    assert record["video_path"] is None
+    assert record["errors"] and record["errors"][0].startswith("video_path:")
+    assert "task-1" not in pipeline.active
+    assert not pipeline.should_process("task-1")
+    assert pipeline.should_process("task-1", retry_after=0)
+
+    record = asyncio.run(run(serve_video))
+    assert record["errors"] == []
+    with open(record["video_path"], "rb") as f:
+        assert f.read() == VIDEO
+    assert not pipeline.should_process("task-1", retry_after=0)
+
+
+def test_failed_upload_is_retried(tmp_path):
+    uploader = FlakyUploader()
+    pipeline = VideoPipeline(str(tmp_path), uploader=uploader)
+
+    async def run():
+        async with client(serve_video) as c:
+            return await pipeline.process("https://videos/a.mp4", "task-1", c)
+
+    record = asyncio.run(run())
+    assert record["errors"] == ["video_tos_url: Failed to upload task-1.mp4 to TOS: slow down"]
+    assert pipeline.should_process("task-1", retry_after=0)
+
+    record = asyncio.run(run())
+    assert record["errors"] == []
+    assert record["video_tos_url"] == "https://bucket/task-1.mp4"
+    assert uploader.uploads == ["task-1.mp4", "task-1.mp4"]
+    assert "failed_at" not in pipeline.load("task-1")
+
+
+def test_retries_back_off_after_each_failed_run(tmp_path, monkeypatch):
+    pipeline = VideoPipeline(str(tmp_path), uploader=FlakyUploader(failures=10))
+
+    async def run():
+        async with client(serve_video) as c:
+            return await pipeline.process("https://videos/a.mp4", "task-1", c)
+
+    for _ in range(3):
+        asyncio.run(run())
+    record = pipeline.load("task-1")
+    assert record["failures"] == 3
+    monkeypatch.setattr("video_pipeline.time.time", lambda: record["failed_at"] + 3 * 60)
+    assert not pipeline.should_process("task-1")
+    monkeypatch.setattr("video_pipeline.time.time", lambda: record["failed_at"] + 4 * 60)
+    assert pipeline.should_process("task-1")
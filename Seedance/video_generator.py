@@ -1,16 +1,24 @@
 """Streamlit application for BytePlus video generation."""
 
 import os
+import sys
 import json
-import time
-import requests
+import logging
+import uuid
 import streamlit as st
 from dotenv import load_dotenv
-import base64
-from io import BytesIO
-from PIL import Image
 import re
 
+from task_engine import TaskEngine, TaskError
+from video_pipeline import Transcoder, TosUploader, VideoPipeline
+
+# image_tools lives at the repository root, next to this demo
+root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if root_dir not in sys.path:
+    sys.path.insert(0, root_dir)
+
+from image_tools import load_image, prepare_image, probe_image
+
 # Load environment variables
 load_dotenv()
 
@@ -51,7 +59,8 @@ IMAGE_URLS = {
 
 # Helper function to validate image
 def validate_image(image):
-    # Check image format
+    # image is an ImageInfo from probe_image: the rules are checked on the
+    # header, before any pixel is decoded, and size is the upright size
     valid_formats = ['JPEG', 'JPG', 'PNG', 'WEBP', 'BMP', 'TIFF', 'GIF']
     if image.format not in valid_formats:
         return False, f"Invalid image format. Supported formats: {', '.join(valid_formats)}"
@@ -72,38 +81,10 @@ def validate_image(image):
 
 # Helper function to convert image to base64
 def image_to_base64(image, format="JPEG"):
-    # Convert image to RGB mode if it has an alpha channel
-    if image.mode == 'RGBA':
-        # Create a white background
-        background = Image.new('RGB', image.size, (255, 255, 255))
-        # Paste the image using alpha channel as mask
-        background.paste(image, mask=image.split()[3])
-        image = background
-    elif image.mode != 'RGB':
-        image = image.convert('RGB')
-        
-    # Standardize format to uppercase
-    format = format.upper()
-    if format == 'JPG':
-        format = 'JPEG'
-        
-    # Resize image if it's too large (optional)
-    max_dimension = 2048  # Reasonable size for API
-    width, height = image.size
-    if width > max_dimension or height > max_dimension:
-        if width > height:
-            new_width = max_dimension
-            new_height = int(height * (max_dimension / width))
-        else:
-            new_height = max_dimension
-            new_width = int(width * (max_dimension / height))
-        image = image.resize((new_width, new_height), Image.LANCZOS)
-    
-    # Convert to base64
-    buffered = BytesIO()
-    image.save(buffered, format=format, quality=90)  # Adjust quality for JPEG
-    img_str = base64.b64encode(buffered.getvalue()).decode()
-    return f"data:image/{format.lower()};base64,{img_str}"
+    # Flattens transparency for JPEG and keeps the long side within 2048px,
+    # the raw upload bytes let an image that already fits go out unchanged.
+    # The data URL is only encoded when the task engine builds the request.
+    return prepare_image(image, format=format, max_dimension=2048, max_quality=90).field(data_url=True)
 
 # Sidebar for sample prompts
 st.sidebar.title("Sample Prompts")
@@ -123,6 +104,10 @@ def set_prompt_text(prompt_text):
 if 'prompt_text' not in st.session_state:
     st.session_state.prompt_text = ""
 
+# Jobs are listed only to the browser session that submitted them
+if 'owner' not in st.session_state:
+    st.session_state.owner = uuid.uuid4().hex
+
 # Display each prompt with a copy button
 for i, prompt_text in enumerate(sample_prompts):
     col1, col2 = st.sidebar.columns([4, 1])
@@ -136,106 +121,33 @@ for i, prompt_text in enumerate(sample_prompts):
 text_to_video_model = TEXT_TO_VIDEO_MODEL
 image_to_video_model = IMAGE_TO_VIDEO_MODEL
 
-# Helper function to create video generation task
-def create_video_task(prompt, model_id, image_url=None, uploaded_image_base64=None):
-    # Prepare content list for the request payload
-    content = []
-    
-    # Add text prompt if provided
-    if prompt:
-        content.append({
-            "type": "text",
-            "text": prompt
-        })
-    
-    # Add image URL if provided from dropdown
-    if image_url:
-        content.append({
-            "type": "image_url",
-            "image_url": {
-                "url": image_url
-            }
-        })
-    # Add base64 encoded image if uploaded
-    elif uploaded_image_base64:
-        content.append({
-            "type": "image_url",
-            "image_url": {
-                "url": uploaded_image_base64
-            }
-        })
-    
-    # Prepare request payload
-    payload = {
-        "model": model_id,
-        "content": content
-    }
-    
-    # Set headers
-    headers = {
-        "Content-Type": "application/json",
-        "Authorization": f"Bearer {API_KEY}"
-    }
-    
-    # Debug payload size
-    payload_size = len(json.dumps(payload))
-    print(f"Payload size: {payload_size} bytes")
-    
-    # Make API request
-    try:
-        response = requests.post(
-            CREATE_TASK_ENDPOINT,
-            headers=headers,
-            json=payload,
-            timeout=30  # Add timeout
-        )
-        
-        # Add debugging for error cases
-        if response.status_code != 200:
-            try:
-                error_detail = response.json()
-                print(f"API Error: {error_detail}")
-                # Return error details for UI display
-                return None, error_detail
-            except:
-                error_text = response.text
-                print(f"API Error: {error_text}")
-                return None, {"error": error_text}
-        
-        # Check for successful response
-        if response.status_code == 200:
-            result = response.json()
-            if "id" in result:
-                return result["id"], None
-        
-        # Fallback error
-        return None, {"error": f"Unexpected response: {response.status_code}"}
-    
-    except Exception as e:
-        print(f"Request exception: {str(e)}")
-        return None, {"error": str(e)}
-
-# Helper function to check video generation task status
-def check_video_task(task_id):
-    # Set headers
-    headers = {
-        "Content-Type": "application/json",
-        "Authorization": f"Bearer {API_KEY}"
-    }
-    
-    # Make API request
-    response = requests.get(
-        f"{QUERY_TASK_ENDPOINT}{task_id}",
-        headers=headers
-    )
-    
-    # Check for successful response
-    if response.status_code == 200:
-        return response.json()
-    
-    # Raise exception if task query failed
-    response.raise_for_status()
-    return None
+# One engine per Streamlit server: it keeps polling every task in the background,
+# across reruns and page reloads, and remembers them in a local SQLite table
+@st.cache_resource
+def get_task_engine():
+    return TaskEngine(API_KEY)
+
+# Finished videos are kept in videos/ next to this app with a poster and a GIF
+# preview, and copied to TOS when TOS_ACCESS_KEY and TOS_SECRET_KEY are set
+@st.cache_resource
+def get_video_pipeline():
+    out_dir = os.getenv("SEEDANCE_VIDEO_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "videos"))
+    return VideoPipeline(out_dir, Transcoder(), TosUploader.from_env())
+
+# The pipeline runs on the engine loop, its errors are in the record and logged here
+def log_pipeline_failure(future):
+    if not future.cancelled() and future.exception() is not None:
+        logging.getLogger(__name__).error("Keeping a video failed", exc_info=future.exception())
+
+# Returns the saved copy of a finished job, starting the pipeline on the engine loop the first
+# time and again a while after a step failed
+def keep_video(job):
+    pipeline = get_video_pipeline()
+    if pipeline.should_process(job["task_id"]):
+        pipeline.active.add(job["task_id"])
+        future = get_task_engine().spawn(pipeline.process(job["video_url"], job["task_id"]))
+        future.add_done_callback(log_pipeline_failure)
+    return pipeline.load(job["task_id"])
 
 # Main input area
 prompt = st.text_area("Enter your prompt here", 
@@ -271,19 +183,23 @@ with image_tab2:
     
     if uploaded_file is not None:
         try:
-            # Read the image
-            image = Image.open(uploaded_file)
+            # Read the header only, the pixels are decoded once the image is accepted
+            data = uploaded_file.getvalue()
+            image = probe_image(data)
             
             # Validate the image
             is_valid, message = validate_image(image)
             
             if is_valid:
                 # Convert to base64
-                uploaded_image_base64 = image_to_base64(image, format=image.format)
+                uploaded_image_base64 = image_to_base64(data, format=image.format)
                 uploaded_image = image
                 
-                # Display the uploaded image
-                st.image(image, caption="Uploaded image", width=400)
+                # Display the uploaded image, browsers show these formats as they are
+                if image.format in ('JPEG', 'PNG', 'WEBP', 'GIF'):
+                    st.image(data, caption="Uploaded image", width=400)
+                else:
+                    st.image(load_image(data, max_dimension=800), caption="Uploaded image", width=400)
                 st.success(message)
                 
                 # Display image details
@@ -332,80 +248,21 @@ if st.button("Generate Video"):
                     st.write("No image selected")
 
             # Create the task with the appropriate image source
-            image_url_to_use = selected_image_url if using_library_image else None
-            task_id, error_details = create_video_task(prompt, selected_model, image_url_to_use, uploaded_image_base64)
-            
-            if not task_id:
+            image_url_to_use = selected_image_url if using_library_image else uploaded_image_base64
+            try:
+                job = get_task_engine().submit(prompt, selected_model, image_url_to_use,
+                                               owner=st.session_state.owner)
+            except TaskError as e:
                 st.error("Failed to create video generation task.")
-                if error_details:
-                    with st.expander("Error Details"):
-                        st.json(error_details)
+                with st.expander("Error Details"):
+                    st.json(e.detail)
             else:
-                # Continue with existing task polling code...
-                st.success(f"Video generation task created successfully! Task ID: {task_id}")
-                
-                # Step 2: Poll for task completion
-                progress_bar = st.progress(0)
-                status_placeholder.info("Processing video generation task... This may take several minutes.")
-                
-                # Initialize variables for polling
-                max_attempts = 60  # Maximum number of polling attempts
-                poll_interval = 10  # Seconds between polling attempts
-                attempts = 0
-                task_completed = False
-                
-                while attempts < max_attempts and not task_completed:
-                    # Update progress bar
-                    progress = min(0.95, attempts / max_attempts)
-                    progress_bar.progress(progress)
-                    
-                    # Check task status
-                    task_result = check_video_task(task_id)
-                    
-                    if task_result and "status" in task_result:
-                        status = task_result["status"]
-                        status_placeholder.info(f"Task status: {status}. Please wait...")
-                        
-                        if status.lower() == "succeeded":
-                            task_completed = True
-                            progress_bar.progress(1.0)
-                            
-                            # Extract video URL
-                            if "content" in task_result and "video_url" in task_result["content"]:
-                                video_url = task_result["content"]["video_url"]
-                                
-                                # Display success message
-                                status_placeholder.success("Video generated successfully!")
-                                
-                                # Display video
-                                st.video(video_url)
-                                
-                                # Display video URL
-                                st.markdown(f"**Video URL:** {video_url}")
-                                
-                                # Display API response details
-                                with st.expander("API Response Details"):
-                                    st.json(task_result)
-                                    
-                                # Clear the prompt text after successful generation
-                                st.session_state.prompt_text = ""
-                            else:
-                                st.error("No video URL found in the API response.")
-                                st.json(task_result)
-                        elif status.lower() in ["failed", "error"]:
-                            st.error(f"Video generation task failed: {task_result.get('error', 'Unknown error')}")
-                            break
-                    
-                    # Wait before next polling attempt if task not completed
-                    if not task_completed:
-                        time.sleep(poll_interval)
-                        attempts += 1
-                
-                # Check if maximum attempts reached
-                if attempts >= max_attempts and not task_completed:
-                    status_placeholder.warning("Maximum polling time reached. The video may still be processing.")
-                    st.markdown(f"You can manually check the status later using task ID: **{task_id}**")
-        
+                status_placeholder.success(
+                    f"Video generation task created successfully! Task ID: {job['task_id']}. "
+                    "It is tracked below, you can queue more videos meanwhile.")
+                # Clear the prompt text after successful submission
+                st.session_state.prompt_text = ""
+
         except Exception as e:
             st.error(f"An error occurred: {str(e)}")
             # Add more detailed error information
@@ -416,6 +273,51 @@ if st.button("Generate Video"):
                 except:
                     st.error(f"API Response: {e.response.text}")
 
+# Video jobs, refreshed from the task engine without blocking the script
+def render_jobs():
+    engine = get_task_engine()
+    jobs = engine.jobs(owner=st.session_state.owner, limit=10)
+    if not jobs:
+        st.caption("No video jobs yet.")
+        return
+    for job in jobs:
+        status = job["status"]
+        title = job["prompt"][:80] if job["prompt"] else f"Image to video ({job['image']})"
+        with st.expander(f"{status.upper()} · {title}", expanded=status == "succeeded"):
+            st.write(f"Task ID: {job['task_id']}")
+            if status == "succeeded" and job["video_url"]:
+                record = keep_video(job)
+                video_url = (record or {}).get("video_tos_url") or job["video_url"]
+                st.video(video_url)
+                st.markdown(f"**Video URL:** {video_url}")
+                if record is None:
+                    st.caption("Saving a copy of the video...")
+                else:
+                    if record.get("preview_path"):
+                        st.image(record["preview_path"], caption="Preview", width=320)
+                    if record.get("video_path"):
+                        st.caption(f"Saved to {record['video_path']}")
+                    for error in record["errors"]:
+                        st.warning(error)
+                    if record["errors"]:
+                        st.caption("Failed steps are tried again in a while.")
+            elif status in ("failed", "cancelled"):
+                st.error(f"Video generation task failed: {job['error'] or 'Unknown error'}")
+            else:
+                st.info(f"Task status: {status}. Checked {job['polls']} times so far.")
+            if job["result"]:
+                st.json(json.loads(job["result"]), expanded=False)
+
+st.markdown("---")
+st.markdown("### Your Videos")
+# st.fragment reruns only this section on a timer, older Streamlit versions get a refresh button
+fragment = getattr(st, "fragment", None)
+if fragment is not None:
+    fragment(run_every=3)(render_jobs)()
+else:
+    st.button("Refresh videos")
+    render_jobs()
+
 # Display usage instructions
 st.markdown("---")
 st.markdown("### Usage Instructions")
@@ -424,7 +326,7 @@ st.markdown("""
 2. Select an image from the dropdown for image-to-video generation (optional if using text prompt)
 3. Adjust the model ID in the sidebar if needed
 4. Click the 'Generate Video' button
-5. Wait for the video to be generated and displayed (this may take several minutes)
+5. Follow the task under "Your Videos" (this may take several minutes), you can queue more videos meanwhile
 
 **Prompt Tips:**
 - Include style descriptions (e.g., photorealistic, cartoon, anime)
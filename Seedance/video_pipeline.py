@@ -0,0 +1,416 @@
+"""Keeps generated Seedance videos: download, poster and preview, TOS upload.
+
+Seedance hands back a ``video_url`` that expires. ``VideoPipeline.process``
+turns it into files we own, with memory bounded by a few chunks whatever
+the size of the video:
+
+* the MP4 is streamed to disk in 1 MB chunks. An interrupted download is
+  resumed with a ``Range`` request, guarded by ``If-Range`` so a changed
+  file is downloaded again from the start;
+* a JPEG poster frame and a small looping GIF preview are made by ffmpeg
+  subprocesses, a bounded number at a time;
+* when TOS credentials are configured the MP4, poster and preview are
+  uploaded to TOS, large files as a multipart upload whose parts are read
+  from disk and sent in parallel.
+
+Every step writes its result to ``<name>.json`` next to the files, so a
+second ``process`` call only does what is missing. Steps that failed are
+listed in the record, ``should_process`` tells when to try them again.
+
+Requires ``ffmpeg`` on the PATH (or ``FFMPEG``) for posters and previews,
+and the ``tos`` SDK for uploads.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+FFMPEG = os.getenv("FFMPEG", "ffmpeg")
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+DOWNLOAD_ATTEMPTS = 5
+# Seconds to wait before resuming an interrupted download, one entry per retry
+RETRY_DELAYS = (1, 2, 4, 8)
+# Seconds before the failed steps of a video are run again, doubled after every
+# failed run up to MAX_RETRY_AFTER
+RETRY_FAILED_AFTER = 60
+MAX_RETRY_AFTER = 60 * 60
+
+POSTER_AT = 1.0
+POSTER_WIDTH = 1280
+PREVIEW_SECONDS = 3
+PREVIEW_FPS = 10
+PREVIEW_WIDTH = 320
+
+# TOS multipart parts must be at least 5 MB, except the last one
+TOS_PART_SIZE = 8 * 1024 * 1024
+TOS_UPLOAD_WORKERS = 4
+
+
+class PipelineError(Exception):
+    """Raised when a video cannot be downloaded, transcoded or uploaded."""
+
+
+def _content_range(header):
+    """Returns (start, total) from a ``Content-Range`` header, total None when unknown."""
+    match = re.match(r"bytes (?:(\d+)-\d+|\*)/(\d+|\*)", header or "")
+    if match is None:
+        return None, None
+    start, total = match.groups()
+    return int(start) if start else None, int(total) if total != "*" else None
+
+
+def _partial_name(path):
+    """``poster.jpg`` -> ``poster.part.jpg``, ffmpeg picks the format from the extension."""
+    base, ext = os.path.splitext(path)
+    return f"{base}.part{ext}"
+
+
+def _read_json(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+def _write_json(path, data):
+    partial = path + ".part"
+    with open(partial, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    os.replace(partial, path)
+
+
+async def download(client, url, path, attempts=DOWNLOAD_ATTEMPTS, chunk_size=DOWNLOAD_CHUNK_SIZE):
+    """Streams ``url`` to ``path``, resuming with Range requests when the transfer breaks.
+
+    The partial file survives crashes as ``<path>.part``, with the validators
+    of the response in ``<path>.part.json``. Calling again continues it.
+
+    Returns:
+        int: Size of the file.
+
+    Raises:
+        httpx.HTTPError: The server refused the request or every attempt failed.
+        PipelineError: The server kept answering the resumed request with 416.
+    """
+    partial = path + ".part"
+    state_path = partial + ".json"
+    for attempt in range(attempts):
+        state = _read_json(state_path) if os.path.exists(partial) else None
+        offset = os.path.getsize(partial) if state else 0
+        headers = {}
+        if offset:
+            headers["Range"] = f"bytes={offset}-"
+            validator = state.get("etag") or state.get("last_modified")
+            if validator:
+                headers["If-Range"] = validator
+
+        try:
+            async with client.stream("GET", url, headers=headers) as response:
+                if response.status_code == 416:
+                    # asked for bytes past the end: complete if the size matches
+                    _, total = _content_range(response.headers.get("Content-Range"))
+                    if total == offset:
+                        break
+                    os.remove(partial)
+                    continue
+                response.raise_for_status()
+
+                start, total = _content_range(response.headers.get("Content-Range"))
+                if response.status_code == 206 and start == offset:
+                    mode = "ab"
+                else:
+                    # the full body, the server ignored the range or the file changed
+                    mode = "wb"
+                    length = response.headers.get("Content-Length")
+                    total = int(length) if length and "Content-Encoding" not in response.headers else None
+                    _write_json(state_path, {"etag": response.headers.get("ETag"),
+                                             "last_modified": response.headers.get("Last-Modified"),
+                                             "total": total})
+                if total is None:
+                    total = (state or {}).get("total")
+
+                with open(partial, mode) as f:
+                    async for chunk in response.aiter_bytes(chunk_size):
+                        f.write(chunk)
+        except httpx.TransportError as e:
+            error = e
+        else:
+            size = os.path.getsize(partial)
+            if total is None or size == total:
+                break
+            error = httpx.TransportError(f"Download stopped at {size} of {total} bytes")
+
+        if attempt == attempts - 1:
+            raise error
+        delay = RETRY_DELAYS[min(attempt, len(RETRY_DELAYS) - 1)]
+        logger.warning("Download of %s interrupted (%s), resuming in %ss", os.path.basename(path), error, delay)
+        await asyncio.sleep(delay)
+    else:
+        # the last attempt got a 416 and dropped the partial file
+        raise PipelineError(f"Download of {os.path.basename(path)} failed: range not satisfiable "
+                            f"after {attempts} attempts")
+
+    os.replace(partial, path)
+    if os.path.exists(state_path):
+        os.remove(state_path)
+    return os.path.getsize(path)
+
+
+class Transcoder:
+    """Runs ffmpeg subprocesses, at most ``workers`` at a time.
+
+    Args:
+        workers (int): ffmpeg processes running at once, the CPU count by default.
+        ffmpeg (str): ffmpeg executable.
+    """
+
+    def __init__(self, workers=None, ffmpeg=FFMPEG):
+        self.workers = workers or os.cpu_count() or 1
+        self.ffmpeg = ffmpeg
+        self._slots = None
+
+    async def poster(self, video_path, path, at=POSTER_AT, width=POSTER_WIDTH):
+        """Writes the frame at ``at`` seconds, or the first one of shorter videos, as a JPEG."""
+        partial = _partial_name(path)
+        # -ss before -i seeks without decoding what comes before
+        await self._run("-ss", str(at), "-i", video_path, "-frames:v", "1",
+                        "-vf", f"scale='min({width},iw)':-2", "-q:v", "3", partial)
+        if not os.path.exists(partial) or not os.path.getsize(partial):
+            await self._run("-i", video_path, "-frames:v", "1", "-vf", f"scale='min({width},iw)':-2",
+                            "-q:v", "3", partial)
+        os.replace(partial, path)
+
+    async def preview(self, video_path, path, seconds=PREVIEW_SECONDS, fps=PREVIEW_FPS, width=PREVIEW_WIDTH):
+        """Writes the first ``seconds`` as a small looping GIF with its own palette."""
+        partial = _partial_name(path)
+        await self._run("-t", str(seconds), "-i", video_path, "-vf",
+                        f"fps={fps},scale={width}:-2:flags=lanczos,split[a][b];[a]palettegen[p];[b][p]paletteuse",
+                        "-loop", "0", partial)
+        os.replace(partial, path)
+
+    async def _run(self, *args):
+        if self._slots is None:
+            # created lazily, on the loop that runs the transcodes
+            self._slots = asyncio.Semaphore(self.workers)
+        async with self._slots:
+            try:
+                process = await asyncio.create_subprocess_exec(
+                    self.ffmpeg, "-y", "-v", "error", *args,
+                    stdin=asyncio.subprocess.DEVNULL, stdout=asyncio.subprocess.DEVNULL,
+                    stderr=asyncio.subprocess.PIPE)
+            except FileNotFoundError:
+                raise PipelineError(f"{self.ffmpeg} was not found, install ffmpeg or set FFMPEG") from None
+            _, stderr = await process.communicate()
+        if process.returncode != 0:
+            raise PipelineError(f"ffmpeg failed: {stderr.decode(errors='replace').strip()[-500:]}")
+
+
+class TosUploader:
+    """Uploads files to TOS, large ones as parallel multipart uploads.
+
+    Credentials and bucket default to the TOS_* environment variables used by
+    the other demos.
+
+    Args:
+        bucket (str): Bucket name.
+        prefix (str): Prepended to every object key.
+        part_size (int): Bytes per multipart part, files up to this size are
+            sent with one put.
+        workers (int): Parts uploaded at once. Each part is read from disk
+            by the SDK as it is sent.
+    """
+
+    def __init__(self, access_key=None, secret_key=None, endpoint=None, region=None, bucket=None, prefix=None,
+                 part_size=TOS_PART_SIZE, workers=TOS_UPLOAD_WORKERS):
+        try:
+            import tos
+        except ImportError:
+            raise PipelineError("The TOS SDK is required for uploads, install it with pip install tos") from None
+        self.access_key = access_key or os.getenv("TOS_ACCESS_KEY")
+        self.secret_key = secret_key or os.getenv("TOS_SECRET_KEY")
+        if not self.access_key or not self.secret_key:
+            raise ValueError("Missing TOS_ACCESS_KEY or TOS_SECRET_KEY for BytePlus Object Storage")
+        self.endpoint = endpoint or os.getenv("TOS_ENDPOINT", "tos-ap-southeast-1.bytepluses.com")
+        self.region = region or os.getenv("TOS_REGION", "ap-southeast-1")
+        self.bucket = bucket or os.getenv("TOS_BUCKET_NAME", "ankurdemo")
+        self.prefix = prefix if prefix is not None else os.getenv("TOS_OBJECT_KEY_PREFIX", "seedance")
+        self.part_size = part_size
+        self.workers = workers
+        self._tos = tos
+        self.client = tos.TosClientV2(self.access_key, self.secret_key, self.endpoint, self.region)
+
+    @classmethod
+    def from_env(cls):
+        """Returns an uploader when TOS credentials are configured, else None."""
+        if not (os.getenv("TOS_ACCESS_KEY") and os.getenv("TOS_SECRET_KEY")):
+            return None
+        return cls()
+
+    def url(self, key):
+        return f"https://{self.bucket}.{self.endpoint}/{key}"
+
+    def upload(self, path, name):
+        """Uploads ``path`` as ``<prefix>/<name>`` and returns its URL."""
+        key = f"{self.prefix}/{name}" if self.prefix else name
+        size = os.path.getsize(path)
+        try:
+            if size <= self.part_size:
+                self.client.put_object_from_file(self.bucket, key, path)
+            else:
+                self._multipart(path, key, size)
+        except (self._tos.exceptions.TosClientError, self._tos.exceptions.TosServerError) as e:
+            raise PipelineError(f"Failed to upload {name} to TOS: {e.message}") from e
+        return self.url(key)
+
+    def _multipart(self, path, key, size):
+        upload_id = self.client.create_multipart_upload(self.bucket, key).upload_id
+        offsets = range(0, size, self.part_size)
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="tos-part") as pool:
+                outputs = list(pool.map(
+                    lambda part: self.client.upload_part_from_file(
+                        self.bucket, key, upload_id, part[0] + 1, path, offset=part[1],
+                        part_size=min(self.part_size, size - part[1])),
+                    enumerate(offsets)))
+            # the outputs carry the part numbers and ETags, in part order
+            self.client.complete_multipart_upload(self.bucket, key, upload_id, outputs)
+        except BaseException:
+            self.client.abort_multipart_upload(self.bucket, key, upload_id)
+            raise
+
+
+class VideoPipeline:
+    """Downloads, transcodes and uploads generated videos into ``out_dir``.
+
+    Args:
+        out_dir (str): Directory receiving ``<name>.mp4``, ``.jpg``, ``.gif``
+            and ``.json`` files.
+        transcoder (Transcoder): Runs the ffmpeg steps, None skips them.
+        uploader (TosUploader): Uploads the files, None keeps them local only.
+        timeout (float): Seconds allowed for connecting and for each read.
+    """
+
+    def __init__(self, out_dir, transcoder=None, uploader=None, timeout=60):
+        self.out_dir = out_dir
+        self.transcoder = transcoder
+        self.uploader = uploader
+        self.timeout = timeout
+        # names being processed right now
+        self.active = set()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="video-upload")
+        os.makedirs(out_dir, exist_ok=True)
+
+    def paths(self, name):
+        base = os.path.join(self.out_dir, name)
+        return {"video_path": base + ".mp4", "poster_path": base + ".jpg", "preview_path": base + ".gif"}
+
+    def load(self, name):
+        """Returns the record of ``name`` written by ``process``, None before it ran."""
+        return _read_json(os.path.join(self.out_dir, name + ".json"))
+
+    def should_process(self, name, retry_after=RETRY_FAILED_AFTER):
+        """True when ``process`` has work left for ``name``.
+
+        That is when it never ran, or when a step failed in its last run and
+        ``retry_after`` seconds, doubled per failed run, have passed since.
+        False while it is running.
+        """
+        if name in self.active:
+            return False
+        record = self.load(name)
+        if record is None:
+            return True
+        if not record.get("errors"):
+            return False
+        delay = min(MAX_RETRY_AFTER, retry_after * 2 ** (record.get("failures", 1) - 1))
+        return time.time() - record.get("failed_at", 0) >= delay
+
+    async def process(self, url, name, client=None):
+        """Runs the missing steps for the video at ``url`` and returns its record.
+
+        Args:
+            url (str): The generated video.
+            name (str): File name stem, e.g. the task id.
+            client (httpx.AsyncClient): Client for the download, a new one by default.
+
+        Returns:
+            dict: ``video_path``, ``poster_path``, ``preview_path`` (None when
+            not made), ``*_tos_url`` for uploaded files, ``bytes`` and
+            ``errors``, a list of the steps that failed.
+
+        Raises:
+            PipelineError, httpx.HTTPError, OSError: The download failed. The
+            record is written first, with the error in ``errors``.
+        """
+        self.active.add(name)
+        try:
+            record = self.load(name) or {"name": name, "video_url": url}
+            record["errors"] = []
+            paths = self.paths(name)
+
+            if not os.path.exists(paths["video_path"]):
+                try:
+                    if client is None:
+                        async with httpx.AsyncClient(timeout=httpx.Timeout(self.timeout),
+                                                     follow_redirects=True) as client:
+                            record["bytes"] = await download(client, url, paths["video_path"])
+                    else:
+                        record["bytes"] = await download(client, url, paths["video_path"])
+                except Exception as e:
+                    record["video_path"] = None
+                    record["errors"].append(f"video_path: {str(e) or type(e).__name__}")
+                    self._save(name, record)
+                    raise
+            record["video_path"] = paths["video_path"]
+
+            if self.transcoder is not None:
+                steps = [("poster_path", self.transcoder.poster), ("preview_path", self.transcoder.preview)]
+                steps = [(field, step) for field, step in steps if not os.path.exists(paths[field])]
+                outcomes = await asyncio.gather(*[step(paths["video_path"], paths[field]) for field, step in steps],
+                                                return_exceptions=True)
+                for (field, _), outcome in zip(steps, outcomes):
+                    if isinstance(outcome, Exception):
+                        record["errors"].append(f"{field}: {outcome}")
+                for field in ("poster_path", "preview_path"):
+                    record[field] = paths[field] if os.path.exists(paths[field]) else None
+
+            if self.uploader is not None:
+                loop = asyncio.get_running_loop()
+                for field in ("video_path", "poster_path", "preview_path"):
+                    path = record.get(field)
+                    url_field = field.replace("_path", "_tos_url")
+                    if not path or record.get(url_field):
+                        continue
+                    try:
+                        # the SDK is blocking, uploads go one file at a time, in parallel parts
+                        record[url_field] = await loop.run_in_executor(
+                            self._executor, self.uploader.upload, path, os.path.basename(path))
+                    except PipelineError as e:
+                        record["errors"].append(f"{url_field}: {e}")
+
+            self._save(name, record)
+            return record
+        finally:
+            self.active.discard(name)
+
+    def _save(self, name, record):
+        if record["errors"]:
+            record["failed_at"] = time.time()
+            record["failures"] = record.get("failures", 0) + 1
+        else:
+            record.pop("failed_at", None)
+            record.pop("failures", None)
+        _write_json(os.path.join(self.out_dir, name + ".json"), record)
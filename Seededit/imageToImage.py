@@ -1,155 +1,31 @@
-import json
 import sys
 import os
 import base64
-import datetime
-import hashlib
-import hmac
-import requests
 import streamlit as st
-from PIL import Image
-import io
 from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
-
-# API Configuration from environment variables
-method = 'POST'
-host = os.getenv('API_HOST', 'visual.volcengineapi.com')
-region = os.getenv('API_REGION', 'cn-north-1')
-endpoint = os.getenv('API_ENDPOINT', 'https://visual.volcengineapi.com')
-service = os.getenv('API_SERVICE', 'cv')
-
-# Signing functions
-def sign(key, msg):
-    return hmac.new(key, msg.encode('utf-8'), hashlib.sha256).digest()
-
-def getSignatureKey(key, dateStamp, regionName, serviceName):
-    kDate = sign(key.encode('utf-8'), dateStamp)
-    kRegion = sign(kDate, regionName)
-    kService = sign(kRegion, serviceName)
-    kSigning = sign(kService, 'request')
-    return kSigning
+# image_tools lives at the repository root, next to this demo
+root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if root_dir not in sys.path:
+    sys.path.insert(0, root_dir)
 
-def formatQuery(parameters):
-    request_parameters_init = ''
-    for key in sorted(parameters):
-        request_parameters_init += key + '=' + parameters[key] + '&'
-    request_parameters = request_parameters_init[:-1]
-    return request_parameters
-
-def signV4Request(access_key, secret_key, service, req_query, req_body):
-    if access_key is None or secret_key is None:
-        st.error('No access key is available.')
-        return None
-
-    t = datetime.datetime.utcnow()
-    current_date = t.strftime('%Y%m%dT%H%M%SZ')
-    datestamp = t.strftime('%Y%m%d')  # Date w/o time, used in credential scope
-    canonical_uri = '/'
-    canonical_querystring = req_query
-    signed_headers = 'content-type;host;x-content-sha256;x-date'
-    payload_hash = hashlib.sha256(req_body.encode('utf-8')).hexdigest()
-    content_type = 'application/json'
-    canonical_headers = 'content-type:' + content_type + '\n' + 'host:' + host + \
-        '\n' + 'x-content-sha256:' + payload_hash + \
-        '\n' + 'x-date:' + current_date + '\n'
-    canonical_request = method + '\n' + canonical_uri + '\n' + canonical_querystring + \
-        '\n' + canonical_headers + '\n' + signed_headers + '\n' + payload_hash
-    
-    algorithm = 'HMAC-SHA256'
-    credential_scope = datestamp + '/' + region + '/' + service + '/' + 'request'
-    string_to_sign = algorithm + '\n' + current_date + '\n' + credential_scope + '\n' + hashlib.sha256(
-        canonical_request.encode('utf-8')).hexdigest()
-    
-    signing_key = getSignatureKey(secret_key, datestamp, region, service)
-    signature = hmac.new(signing_key, (string_to_sign).encode(
-        'utf-8'), hashlib.sha256).hexdigest()
+from image_tools import ImageStore, encode_image
+from visual_client import VisualApiClient, VisualApiError
 
-    authorization_header = algorithm + ' ' + 'Credential=' + access_key + '/' + \
-        credential_scope + ', ' + 'SignedHeaders=' + \
-        signed_headers + ', ' + 'Signature=' + signature
-    
-    headers = {'X-Date': current_date,
-               'Authorization': authorization_header,
-               'X-Content-Sha256': payload_hash,
-               'Content-Type': content_type
-               }
+# Load environment variables from .env file
+load_dotenv()
 
-    # Send the request
-    request_url = endpoint + '?' + canonical_querystring
+# One pooled, signed client per key pair, shared across reruns. Endpoint,
+# host, region and service come from the API_* environment variables.
+@st.cache_resource
+def get_visual_client(access_key, secret_key):
+    return VisualApiClient(access_key, secret_key)
 
-    try:
-        r = requests.post(request_url, headers=headers, data=req_body)
-        # Use the replace method to replace \u0026 with &
-        resp_str = r.text.replace("\\u0026", "&")
-        return r.status_code, resp_str
-    except Exception as err:
-        st.error(f'Error occurred: {err}')
-        return None, None
-
-# Function to encode image to base64
-def encode_image(image):
-    # Check image dimensions and ratio
-    width, height = image.size
-    max_dimension = max(width, height)
-    min_dimension = min(width, height)
-    aspect_ratio = max_dimension / min_dimension
-    
-    # Check if aspect ratio exceeds API requirements
-    if aspect_ratio > 3:
-        raise ValueError(f"Image aspect ratio ({aspect_ratio:.2f}) exceeds the maximum allowed ratio of 3.0")
-    
-    # Check if image dimensions exceed maximum allowed
-    if width > 4096 or height > 4096:
-        raise ValueError(f"Image dimensions ({width}x{height}) exceed the maximum allowed size of 4096x4096")
-    
-    # Convert RGBA to RGB if needed
-    if image.mode == 'RGBA':
-        # Create a white background image
-        background = Image.new('RGB', image.size, (255, 255, 255))
-        # Paste the image on the background
-        background.paste(image, mask=image.split()[3])  # 3 is the alpha channel
-        image = background
-    
-    # Save as JPEG with quality setting to control file size
-    buffered = io.BytesIO()
-    image.save(buffered, format="JPEG", quality=95)
-    
-    # Check file size
-    file_size = buffered.getbuffer().nbytes
-    max_size = 4.7 * 1024 * 1024  # 4.7 MB in bytes
-    
-    # If file size exceeds limit, reduce quality until it fits
-    if file_size > max_size:
-        quality = 90
-        while file_size > max_size and quality >= 70:
-            buffered = io.BytesIO()
-            image.save(buffered, format="JPEG", quality=quality)
-            file_size = buffered.getbuffer().nbytes
-            quality -= 5
-        
-        if file_size > max_size:
-            # If still too large, resize the image
-            scale_factor = 0.9
-            while file_size > max_size and scale_factor >= 0.5:
-                new_width = int(width * scale_factor)
-                new_height = int(height * scale_factor)
-                resized_img = image.resize((new_width, new_height), Image.LANCZOS)
-                
-                buffered = io.BytesIO()
-                resized_img.save(buffered, format="JPEG", quality=85)
-                file_size = buffered.getbuffer().nbytes
-                scale_factor -= 0.1
-            
-            if file_size > max_size:
-                raise ValueError(f"Unable to reduce image size below the maximum allowed size of 4.7 MB")
-    
-    # Get base64 string
-    buffered.seek(0)
-    img_str = base64.b64encode(buffered.getvalue()).decode()
-    return img_str
+# Generated images are downloaded once into a local cache, shared across reruns
+# and sessions. IMAGE_CACHE_DIR sets where, the oldest images go past 512 MB.
+@st.cache_resource
+def get_image_store():
+    return ImageStore()
 
 # Function to upload image to a temporary server and get URL
 # Note: In a real application, you would need to implement this
@@ -196,8 +72,8 @@ with tab1:
     uploaded_file = st.file_uploader("Choose an image...", type=["jpg", "jpeg", "png"], key="image_edit_uploader")
 
     if uploaded_file is not None:
-        # Display the uploaded image
-        image = Image.open(uploaded_file)
+        # Display the uploaded bytes, they are only decoded if they have to be re-encoded
+        image = uploaded_file.getvalue()
         st.image(image, caption="Uploaded Image", use_container_width=True)
         
         # Get editing prompt from user
@@ -236,7 +112,6 @@ with tab1:
                         'Action': os.getenv('API_ACTION', 'CVProcess'),
                         'Version': os.getenv('API_VERSION', '2022-08-31'),
                     }
-                    formatted_query = formatQuery(query_params)
                     
                     # Get image URL or use base64
                     image_url = upload_image_and_get_url(image)
@@ -268,74 +143,60 @@ with tab1:
                             st.error(f"Image validation error: {str(e)}")
                             st.stop()  # Stop processing if validation fails
                     
-                    formatted_body = json.dumps(body_params)
-                    
-                    # Make API request
-                    status_code, response = signV4Request(access_key, secret_key, service,
-                                                        formatted_query, formatted_body)
-                    
-                    if status_code == 200:
-                        try:
-                            response_json = json.loads(response)
-                            if response_json.get("code") == 10000:
-                                # Success
-                                result_data = response_json.get("data", {})
+                    # Make API request over the shared, signed session
+                    try:
+                        response_json = get_visual_client(access_key, secret_key).call(
+                            query_params['Action'], body_params, query_params['Version'])
+                    except (ValueError, VisualApiError) as e:
+                        st.error(str(e))
+                        response_json = None
+
+                    if response_json is not None:
+                        # Success
+                        result_data = response_json.get("data", {})
                                 
-                                # Check if we have image URLs or base64 data
-                                if result_data.get("image_urls") and len(result_data["image_urls"]) > 0:
-                                    st.success("Image successfully edited!")
+                        # Check if we have image URLs or base64 data
+                        if result_data.get("image_urls") and len(result_data["image_urls"]) > 0:
+                            st.success("Image successfully edited!")
                                     
-                                    # Clean the URL by removing any backticks or extra whitespace
-                                    image_url = result_data["image_urls"][0]
-                                    if isinstance(image_url, str):
-                                        # More aggressive cleaning of the URL
-                                        image_url = image_url.strip().strip('`').strip('"').strip()
+                            # Clean the URL by removing any backticks or extra whitespace
+                            image_url = result_data["image_urls"][0]
+                            if isinstance(image_url, str):
+                                # More aggressive cleaning of the URL
+                                image_url = image_url.strip().strip('`').strip('"').strip()
                                     
-                                    # Display the cleaned URL for debugging
-                                    st.write("Image URL (for debugging):", image_url)
+                            # Display the cleaned URL for debugging
+                            st.write("Image URL (for debugging):", image_url)
                                     
-                                    # Try to display the image
-                                    try:
-                                        # Method 1: Direct Streamlit image display
-                                        st.image(image_url, caption="Edited Image (Method 1)")
-                                    except Exception as e:
-                                        st.error(f"Error displaying image with method 1: {str(e)}")
+                            # Try to display the image
+                            try:
+                                # Method 1: Direct Streamlit image display
+                                st.image(image_url, caption="Edited Image (Method 1)")
+                            except Exception as e:
+                                st.error(f"Error displaying image with method 1: {str(e)}")
                                     
-                                    # Method 2: Alternative approach using HTML
-                                    st.markdown(f"<img src='{image_url}' alt='Edited Image (Method 2)' style='width:100%'>\n\n[Download Image]({image_url})", unsafe_allow_html=True)
+                            # Method 2: Alternative approach using HTML
+                            st.markdown(f"<img src='{image_url}' alt='Edited Image (Method 2)' style='width:100%'>\n\n[Download Image]({image_url})", unsafe_allow_html=True)
                                     
-                                    # Method 3: Try downloading and displaying locally
-                                    try:
-                                        response = requests.get(image_url)
-                                        if response.status_code == 200:
-                                            img = Image.open(io.BytesIO(response.content))
-                                            st.image(img, caption="Edited Image (Method 3 - Downloaded)")
-                                        else:
-                                            st.error(f"Failed to download image: HTTP {response.status_code}")
-                                    except Exception as e:
-                                        st.error(f"Error downloading image: {str(e)}")
+                            # Method 3: Download once into the local cache and display the file
+                            try:
+                                st.image(get_image_store().fetch(image_url).path, caption="Edited Image (Method 3 - Downloaded)")
+                            except Exception as e:
+                                st.error(f"Error downloading image: {str(e)}")
                                     
-                                    # Display additional information
-                                    with st.expander("Response Details"):
-                                        st.json(response_json)
-                                elif result_data.get("binary_data_base64") and len(result_data["binary_data_base64"]) > 0:
-                                    st.success("Image successfully edited!")
-                                    img_data = base64.b64decode(result_data["binary_data_base64"][0])
-                                    result_image = Image.open(io.BytesIO(img_data))
-                                    st.image(result_image, caption="Edited Image")
+                            # Display additional information
+                            with st.expander("Response Details"):
+                                st.json(response_json)
+                        elif result_data.get("binary_data_base64") and len(result_data["binary_data_base64"]) > 0:
+                            st.success("Image successfully edited!")
+                            img_data = base64.b64decode(result_data["binary_data_base64"][0])
+                            st.image(get_image_store().put(img_data).path, caption="Edited Image")
                                     
-                                    # Display additional information
-                                    with st.expander("Response Details"):
-                                        st.json(response_json)
-                                else:
-                                    st.error("No image data found in the response")
-                            else:
-                                st.error(f"API Error: {response_json.get('message', 'Unknown error')}")
-                        except json.JSONDecodeError:
-                            st.error("Failed to parse API response")
-                            st.text(response)
-                    else:
-                        st.error(f"API request failed with status code: {status_code}")
+                            # Display additional information
+                            with st.expander("Response Details"):
+                                st.json(response_json)
+                        else:
+                            st.error("No image data found in the response")
         else:
             if not prompt and st.button("Generate Edited Image", key="generate_button_edit_warning"):
                 st.warning("Please enter a prompt for editing the image")
@@ -351,8 +212,8 @@ with tab2:
     uploaded_file_cr = st.file_uploader("Choose an image...", type=["jpg", "jpeg", "png"], key="char_retention_uploader")
 
     if uploaded_file_cr is not None:
-        # Display the uploaded image
-        image_cr = Image.open(uploaded_file_cr)
+        # Display the uploaded bytes, they are only decoded if they have to be re-encoded
+        image_cr = uploaded_file_cr.getvalue()
         st.image(image_cr, caption="Uploaded Image", use_container_width=True)
         
         # Get prompt from user
@@ -424,7 +285,6 @@ with tab2:
                         'Action': os.getenv('API_ACTION', 'CVProcess'),
                         'Version': os.getenv('API_VERSION', '2022-08-31'),
                     }
-                    formatted_query = formatQuery(query_params)
                     
                     # Get image URL or use base64
                     image_url_cr = upload_image_and_get_url(image_cr)
@@ -465,74 +325,60 @@ with tab2:
                             st.error(f"Image validation error: {str(e)}")
                             st.stop()  # Stop processing if validation fails
                     
-                    formatted_body_cr = json.dumps(body_params_cr)
-                    
-                    # Make API request
-                    status_code_cr, response_cr = signV4Request(access_key, secret_key, service,
-                                                             formatted_query, formatted_body_cr)
-                    
-                    if status_code_cr == 200:
-                        try:
-                            response_json_cr = json.loads(response_cr)
-                            if response_json_cr.get("code") == 10000:
-                                # Success
-                                result_data_cr = response_json_cr.get("data", {})
+                    # Make API request over the shared, signed session
+                    try:
+                        response_json_cr = get_visual_client(access_key, secret_key).call(
+                            query_params['Action'], body_params_cr, query_params['Version'])
+                    except (ValueError, VisualApiError) as e:
+                        st.error(str(e))
+                        response_json_cr = None
+
+                    if response_json_cr is not None:
+                        # Success
+                        result_data_cr = response_json_cr.get("data", {})
                                 
-                                # Check if we have image URLs or base64 data
-                                if result_data_cr.get("image_urls") and len(result_data_cr["image_urls"]) > 0:
-                                    st.success("Image successfully generated with character retention!")
+                        # Check if we have image URLs or base64 data
+                        if result_data_cr.get("image_urls") and len(result_data_cr["image_urls"]) > 0:
+                            st.success("Image successfully generated with character retention!")
                                     
-                                    # Clean the URL by removing any backticks or extra whitespace
-                                    image_url_result = result_data_cr["image_urls"][0]
-                                    if isinstance(image_url_result, str):
-                                        # More aggressive cleaning of the URL
-                                        image_url_result = image_url_result.strip().strip('`').strip('"').strip()
+                            # Clean the URL by removing any backticks or extra whitespace
+                            image_url_result = result_data_cr["image_urls"][0]
+                            if isinstance(image_url_result, str):
+                                # More aggressive cleaning of the URL
+                                image_url_result = image_url_result.strip().strip('`').strip('"').strip()
                                     
-                                    # Display the cleaned URL for debugging
-                                    st.write("Image URL (for debugging):", image_url_result)
+                            # Display the cleaned URL for debugging
+                            st.write("Image URL (for debugging):", image_url_result)
                                     
-                                    # Try to display the image
-                                    try:
-                                        # Method 1: Direct Streamlit image display
-                                        st.image(image_url_result, caption="Generated Image with Character Retention (Method 1)")
-                                    except Exception as e:
-                                        st.error(f"Error displaying image with method 1: {str(e)}")
+                            # Try to display the image
+                            try:
+                                # Method 1: Direct Streamlit image display
+                                st.image(image_url_result, caption="Generated Image with Character Retention (Method 1)")
+                            except Exception as e:
+                                st.error(f"Error displaying image with method 1: {str(e)}")
                                     
-                                    # Method 2: Alternative approach using HTML
-                                    st.markdown(f"<img src='{image_url_result}' alt='Generated Image (Method 2)' style='width:100%'>\n\n[Download Image]({image_url_result})", unsafe_allow_html=True)
+                            # Method 2: Alternative approach using HTML
+                            st.markdown(f"<img src='{image_url_result}' alt='Generated Image (Method 2)' style='width:100%'>\n\n[Download Image]({image_url_result})", unsafe_allow_html=True)
                                     
-                                    # Method 3: Try downloading and displaying locally
-                                    try:
-                                        response = requests.get(image_url_result)
-                                        if response.status_code == 200:
-                                            img = Image.open(io.BytesIO(response.content))
-                                            st.image(img, caption="Generated Image (Method 3 - Downloaded)")
-                                        else:
-                                            st.error(f"Failed to download image: HTTP {response.status_code}")
-                                    except Exception as e:
-                                        st.error(f"Error downloading image: {str(e)}")
+                            # Method 3: Download once into the local cache and display the file
+                            try:
+                                st.image(get_image_store().fetch(image_url_result).path, caption="Generated Image (Method 3 - Downloaded)")
+                            except Exception as e:
+                                st.error(f"Error downloading image: {str(e)}")
                                     
-                                    # Display additional information
-                                    with st.expander("Response Details"):
-                                        st.json(response_json_cr)
-                                elif result_data_cr.get("binary_data_base64") and len(result_data_cr["binary_data_base64"]) > 0:
-                                    st.success("Image successfully generated with character retention!")
-                                    img_data_cr = base64.b64decode(result_data_cr["binary_data_base64"][0])
-                                    result_image_cr = Image.open(io.BytesIO(img_data_cr))
-                                    st.image(result_image_cr, caption="Generated Image with Character Retention")
+                            # Display additional information
+                            with st.expander("Response Details"):
+                                st.json(response_json_cr)
+                        elif result_data_cr.get("binary_data_base64") and len(result_data_cr["binary_data_base64"]) > 0:
+                            st.success("Image successfully generated with character retention!")
+                            img_data_cr = base64.b64decode(result_data_cr["binary_data_base64"][0])
+                            st.image(get_image_store().put(img_data_cr).path, caption="Generated Image with Character Retention")
                                     
-                                    # Display additional information
-                                    with st.expander("Response Details"):
-                                        st.json(response_json_cr)
-                                else:
-                                    st.error("No image data found in the response")
-                            else:
-                                st.error(f"API Error: {response_json_cr.get('message', 'Unknown error')}")
-                        except json.JSONDecodeError:
-                            st.error("Failed to parse API response")
-                            st.text(response_cr)
-                    else:
-                        st.error(f"API request failed with status code: {status_code_cr}")
+                            # Display additional information
+                            with st.expander("Response Details"):
+                                st.json(response_json_cr)
+                        else:
+                            st.error("No image data found in the response")
         # Remove the else block with the duplicate button
     else:
         st.info("Please upload an image to get started")
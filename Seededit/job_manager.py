@@ -0,0 +1,437 @@
+"""Background job manager for Seededit edits.
+
+One ``JobManager`` per Streamlit server (per key pair) submits edits and
+tracks them from a single scheduler thread, so a script run never sleeps
+and a user can queue several edits at once:
+
+* CVSync2AsyncSubmitTask edits are polled with CVSync2AsyncGetResult on an
+  exponential schedule: quickly at first, less and less often later;
+* synchronous CVProcess edits (character retention) run on the worker pool;
+* jobs live in a local SQLite table, so they survive reruns, page reloads
+  and server restarts, and are listed per access key and browser session;
+* finished edits are cached by image hash, req_key, prompt, seed, scale and
+  the remaining options: submitting the same edit again returns the
+  finished job without an API call, and an identical edit still running is
+  shared instead of submitted twice. Edits with a random seed (-1) are
+  never cached, and jobs are only shared between sessions of one access key.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from visual_client import VisualApiError
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DB_PATH = os.getenv("SEEDEDIT_JOBS_DB", os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                                              "seededit_jobs.db"))
+
+TERMINAL_STATUSES = ("done", "failed", "not_found", "expired")
+
+# Seconds between result polls of one task: fast at first, slower as it keeps running
+POLL_INTERVALS = (1, 2, 3, 5, 8, 13)
+MAX_POLL_INTERVAL = 20
+# Give up on a task that has not finished after this many seconds
+MAX_JOB_SECONDS = 15 * 60
+# Consecutive transient poll errors tolerated before a job fails
+MAX_POLL_ERRORS = 5
+# Longest wait between polls once they keep failing
+MAX_ERROR_BACKOFF = 120
+# Result URLs are signed and expire, cached results are only reused this long
+RESULT_TTL = 60 * 60
+
+_COLUMNS = ("job_id", "access_key", "owner", "kind", "req_key", "task_id", "cache_key", "prompt", "req_json",
+            "status", "result", "error", "polls", "errors", "next_poll_at", "created_at", "updated_at")
+
+
+def next_poll_delay(polls, errors=0):
+    """Seconds to wait before poll number ``polls + 1`` of a task.
+
+    After ``errors`` consecutive failed polls the delay is doubled as many
+    times, up to ``MAX_ERROR_BACKOFF``.
+    """
+    delay = POLL_INTERVALS[polls] if polls < len(POLL_INTERVALS) else MAX_POLL_INTERVAL
+    if errors:
+        delay = min(MAX_ERROR_BACKOFF, max(delay, delay * 2 ** errors))
+    return delay
+
+
+def edit_cache_key(req_key, params, req_json=None, image_hash=None):
+    """Identifies an edit by its input image and every option that changes the output.
+
+    Args:
+        req_key (str): Model, e.g. ``seededit_v3.0``.
+        params (dict): Request body without the image, with prompt, seed, scale...
+        req_json (dict): Options sent with the result query, e.g. ``logo_info``.
+        image_hash (str): Hash of the input image, see ``image_hash``.
+
+    Returns:
+        str: A hex digest, None for random-seed edits which are not cacheable.
+    """
+    if params.get("seed", -1) == -1:
+        return None
+    source = json.dumps([image_hash, req_key, params, req_json], sort_keys=True, default=str)
+    return hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+
+def image_hash(fields):
+    """SHA-256 over the bytes of the Base64Field images of a request."""
+    digest = hashlib.sha256()
+    for field in fields:
+        digest.update(field.data)
+    return digest.hexdigest()
+
+
+def _is_transient(error):
+    return error.status_code is None or error.status_code == 429 or error.status_code >= 500
+
+
+class JobStore:
+    """SQLite table of Seededit jobs, safe to use from several threads."""
+
+    def __init__(self, path=DEFAULT_DB_PATH):
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    job_id TEXT PRIMARY KEY,
+                    access_key TEXT,
+                    owner TEXT,
+                    kind TEXT,
+                    req_key TEXT,
+                    task_id TEXT,
+                    cache_key TEXT,
+                    prompt TEXT,
+                    req_json TEXT,
+                    status TEXT,
+                    result TEXT,
+                    error TEXT,
+                    polls INTEGER DEFAULT 0,
+                    errors INTEGER DEFAULT 0,
+                    next_poll_at REAL,
+                    created_at REAL,
+                    updated_at REAL
+                )""")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS jobs_owner ON jobs (owner, created_at)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS jobs_cache_key ON jobs (cache_key, status)")
+
+    def add(self, job):
+        columns = [c for c in _COLUMNS if c in job]
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO jobs (%s) VALUES (%s)" % (", ".join(columns), ", ".join("?" * len(columns))),
+                [job[c] for c in columns])
+
+    def update(self, job_id, **fields):
+        fields["updated_at"] = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE jobs SET %s WHERE job_id = ?" % ", ".join("%s = ?" % c for c in fields),
+                list(fields.values()) + [job_id])
+
+    def get(self, job_id):
+        return self._one("SELECT * FROM jobs WHERE job_id = ?", (job_id,))
+
+    def cached(self, access_key, cache_key, since):
+        """Returns the newest finished job of ``access_key`` for ``cache_key`` updated after ``since``."""
+        return self._one("SELECT * FROM jobs WHERE access_key = ? AND cache_key = ? AND status = 'done' "
+                         "AND updated_at > ? ORDER BY updated_at DESC LIMIT 1", (access_key, cache_key, since))
+
+    def running(self, access_key, cache_key):
+        """Returns an unfinished job of ``access_key`` for ``cache_key``."""
+        return self._one("SELECT * FROM jobs WHERE access_key = ? AND cache_key = ? AND status NOT IN (?, ?, ?, ?) "
+                         "LIMIT 1", (access_key, cache_key) + TERMINAL_STATUSES)
+
+    def list(self, access_key, owner=None, limit=50):
+        """Returns the most recent jobs of ``access_key``, newest first."""
+        if owner is None:
+            return self._all("SELECT * FROM jobs WHERE access_key = ? ORDER BY created_at DESC LIMIT ?",
+                             (access_key, limit))
+        return self._all("SELECT * FROM jobs WHERE access_key = ? AND owner = ? ORDER BY created_at DESC LIMIT ?",
+                         (access_key, owner, limit))
+
+    def pending(self, access_key):
+        """Returns every job of ``access_key`` that has not reached a terminal status."""
+        return self._all("SELECT * FROM jobs WHERE access_key = ? AND status NOT IN (?, ?, ?, ?)",
+                         (access_key,) + TERMINAL_STATUSES)
+
+    def _one(self, sql, args):
+        with self._lock:
+            row = self._conn.execute(sql, args).fetchone()
+        return dict(row) if row is not None else None
+
+    def _all(self, sql, args):
+        with self._lock:
+            return [dict(row) for row in self._conn.execute(sql, args).fetchall()]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class JobManager:
+    """Submits Seededit edits and tracks them all from one background thread.
+
+    Args:
+        client (VisualApiClient): Client used for every call of this manager.
+        db_path (str): SQLite file holding the job table.
+        workers (int): Calls (submits, polls, CVProcess edits) in flight at once.
+    """
+
+    def __init__(self, client, db_path=DEFAULT_DB_PATH, workers=4):
+        self.client = client
+        self.store = JobStore(db_path)
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="seededit-job")
+
+        self._changed = threading.Condition()
+        self._version = 0
+        # job_id -> next poll time, guarded by _changed
+        self._schedule = {}
+        self._in_flight = set()
+        # job_id -> consecutive polls that raised, guarded by _changed
+        self._errors = {}
+        self._closed = False
+
+        # tasks left unfinished by a previous run; edits that were never
+        # submitted cannot be resumed, their image only lived in memory
+        for job in self.store.pending(client.access_key):
+            if job["task_id"]:
+                self._schedule[job["job_id"]] = job["next_poll_at"] or time.time()
+            else:
+                self.store.update(job["job_id"], status="failed", error="Interrupted before it was submitted")
+
+        self._thread = threading.Thread(target=self._run, name="seededit-jobs", daemon=True)
+        self._thread.start()
+
+    # ----- public API, safe to call from any thread -----
+
+    def submit(self, req_key, params, req_json=None, owner=None, sync=False):
+        """Queues an edit and returns its job without waiting for the API.
+
+        Args:
+            req_key (str): Model, e.g. ``seededit_v3.0``.
+            params (dict): Request body without ``req_key``. Images go in
+                ``binary_data_base64`` as Base64Field values.
+            req_json (dict): Options of the result query (``return_url``,
+                ``logo_info``), ignored for ``sync`` edits.
+            owner (str): Tag used to list the jobs of one browser session,
+                e.g. a uuid kept in ``st.session_state``.
+            sync (bool): Run a single CVProcess call instead of submit and poll.
+
+        Returns:
+            dict: The job. ``cached`` is True when it is a finished copy of an
+            identical edit.
+        """
+        image_fields = params.get("binary_data_base64") or []
+        options = {k: v for k, v in params.items() if k != "binary_data_base64"}
+        cache_key = edit_cache_key(req_key, options, req_json, image_hash(image_fields))
+        if cache_key is not None:
+            access_key = self.client.access_key
+            job = self.store.cached(access_key, cache_key, time.time() - RESULT_TTL) or \
+                self.store.running(access_key, cache_key)
+            if job is not None and job["owner"] != owner:
+                job = self._share(job, owner)
+            if job is not None:
+                job["cached"] = job["status"] == "done"
+                return job
+
+        now = time.time()
+        job = {
+            "job_id": uuid.uuid4().hex,
+            "access_key": self.client.access_key,
+            "owner": owner,
+            "kind": "sync" if sync else "async",
+            "req_key": req_key,
+            "cache_key": cache_key,
+            "prompt": params.get("prompt"),
+            "req_json": json.dumps(req_json) if req_json is not None else None,
+            "status": "submitting",
+            "polls": 0,
+            "errors": 0,
+            "created_at": now,
+            "updated_at": now,
+        }
+        self.store.add(job)
+        self._executor.submit(self._process if sync else self._submit, job["job_id"], req_key, params)
+        self._notify()
+        job["cached"] = False
+        return job
+
+    def job(self, job_id):
+        return self.store.get(job_id)
+
+    def jobs(self, owner=None, limit=50):
+        """Returns the most recent jobs of this manager's access key, of ``owner`` only when given."""
+        return self.store.list(self.client.access_key, owner, limit)
+
+    @property
+    def version(self):
+        """Counter bumped on every job change, cheap to compare between reruns."""
+        return self._version
+
+    def wait_for_change(self, since, timeout=None):
+        """Blocks until ``version`` differs from ``since``, returns the new version."""
+        with self._changed:
+            self._changed.wait_for(lambda: self._version != since, timeout)
+            return self._version
+
+    def close(self):
+        with self._changed:
+            self._closed = True
+            self._changed.notify_all()
+        self._thread.join()
+        self._executor.shutdown(wait=True)
+        self.store.close()
+
+    # ----- background work -----
+
+    def _share(self, job, owner):
+        """Copies a job of another session to ``owner``, so it shows in that session's list.
+
+        A finished job is copied with its result and a running task is polled
+        for the copy as well. None when the job cannot be followed: a
+        synchronous edit or one not submitted yet is submitted again.
+        """
+        if job["status"] != "done" and not job["task_id"]:
+            return None
+        now = time.time()
+        copy = dict(job, job_id=uuid.uuid4().hex, owner=owner, errors=0, created_at=now, updated_at=now)
+        if copy["status"] != "done":
+            copy["next_poll_at"] = now
+        self.store.add(copy)
+        if copy["status"] != "done":
+            self._schedule_poll(copy["job_id"], now)
+        else:
+            self._notify()
+        return copy
+
+    def _notify(self):
+        with self._changed:
+            self._version += 1
+            self._changed.notify_all()
+
+    def _schedule_poll(self, job_id, due):
+        with self._changed:
+            self._schedule[job_id] = due
+            self._version += 1
+            self._changed.notify_all()
+
+    def _run(self):
+        while True:
+            with self._changed:
+                if self._closed:
+                    return
+                now = time.time()
+                due = [job_id for job_id, at in self._schedule.items() if at <= now and job_id not in self._in_flight]
+                self._in_flight.update(due)
+                waiting = [at for job_id, at in self._schedule.items() if job_id not in self._in_flight]
+                if not due:
+                    self._changed.wait(max(0.0, min(waiting) - now) if waiting else None)
+            for job_id in due:
+                self._executor.submit(self._poll, job_id)
+
+    def _fail(self, job_id, error):
+        # runs on the worker pool, where an exception would only end up in an unread future
+        if not isinstance(error, VisualApiError):
+            logger.error("Seededit job %s failed", job_id, exc_info=error)
+        try:
+            self.store.update(job_id, status="failed", error=str(error) or type(error).__name__, next_poll_at=None)
+        except Exception:
+            logger.exception("Could not record the failure of Seededit job %s", job_id)
+        self._notify()
+
+    def _submit(self, job_id, req_key, params):
+        try:
+            task_id = self.client.submit_task(req_key, **params)
+            next_poll_at = time.time() + next_poll_delay(0)
+            self.store.update(job_id, task_id=task_id, status="in_queue", next_poll_at=next_poll_at)
+        except Exception as e:
+            self._fail(job_id, e)
+            return
+        self._schedule_poll(job_id, next_poll_at)
+
+    def _process(self, job_id, req_key, params):
+        try:
+            self.store.update(job_id, status="generating")
+            self._notify()
+            data = self.client.process(req_key, **params)
+            self.store.update(job_id, status="done", result=json.dumps(data))
+        except Exception as e:
+            self._fail(job_id, e)
+            return
+        self._notify()
+
+    def _poll(self, job_id):
+        try:
+            self._poll_once(job_id)
+            with self._changed:
+                self._errors.pop(job_id, None)
+        except Exception as e:
+            self._poll_failed(job_id, e)
+        finally:
+            with self._changed:
+                self._in_flight.discard(job_id)
+                self._changed.notify_all()
+
+    def _poll_failed(self, job_id, error):
+        # the job would otherwise stay due and be polled again at once, in a loop
+        with self._changed:
+            errors = self._errors[job_id] = self._errors.get(job_id, 0) + 1
+        if errors < MAX_POLL_ERRORS:
+            logger.warning("Polling Seededit job %s failed (%d in a row)", job_id, errors, exc_info=error)
+            self._schedule_poll(job_id, time.time() + next_poll_delay(len(POLL_INTERVALS), errors))
+            return
+        with self._changed:
+            self._schedule.pop(job_id, None)
+            self._errors.pop(job_id, None)
+        self._fail(job_id, error)
+
+    def _poll_once(self, job_id):
+        job = self.store.get(job_id)
+        if job is None:
+            with self._changed:
+                self._schedule.pop(job_id, None)
+            return
+
+        polls = job["polls"] + 1
+        fields = {"polls": polls}
+        req_json = json.loads(job["req_json"]) if job["req_json"] else None
+        try:
+            data = self.client.get_result(job["req_key"], job["task_id"], req_json)
+            fields["status"] = data.get("status") or job["status"]
+            fields["errors"] = 0
+            if fields["status"] == "done":
+                fields["result"] = json.dumps(data)
+        except VisualApiError as e:
+            fields["errors"] = job["errors"] + 1
+            if not _is_transient(e) or fields["errors"] >= MAX_POLL_ERRORS:
+                fields["status"] = "failed"
+                fields["error"] = str(e)
+            else:
+                logger.warning("Polling Seededit task %s failed: %s", job["task_id"], e)
+
+        status = fields.get("status", job["status"])
+        if status not in TERMINAL_STATUSES and time.time() - job["created_at"] > MAX_JOB_SECONDS:
+            status = fields["status"] = "failed"
+            fields["error"] = "Timed out waiting for the result. The task may still be processing."
+        if status in TERMINAL_STATUSES:
+            fields["next_poll_at"] = None
+            with self._changed:
+                self._schedule.pop(job_id, None)
+        else:
+            fields["next_poll_at"] = time.time() + next_poll_delay(polls, fields["errors"])
+            with self._changed:
+                self._schedule[job_id] = fields["next_poll_at"]
+        self.store.update(job_id, **fields)
+        if status != job["status"]:
+            self._notify()
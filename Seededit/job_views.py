@@ -0,0 +1,57 @@
+"""Streamlit views of the JobManager jobs, shared by the Seededit apps."""
+
+import json
+import uuid
+
+import streamlit as st
+
+
+def session_owner(name):
+    """Owner tag of the jobs of this browser session, ``name`` keeps the lists of one page apart.
+
+    Every session gets its own uuid, so users of one server only see their own edits.
+    """
+    if "job_owner" not in st.session_state:
+        st.session_state.job_owner = uuid.uuid4().hex
+    return f"{st.session_state.job_owner}:{name}"
+
+
+# Edits of one list, refreshed from the job manager without blocking the script
+def render_jobs(manager, owner, show_result, caption):
+    if manager is None:
+        return
+    jobs = manager.jobs(owner, limit=10)
+    if not jobs:
+        st.caption("No edits yet.")
+        return
+    for job in jobs:
+        status = job["status"]
+        with st.expander(f"{status.upper()} · {(job['prompt'] or '')[:80]}", expanded=status == "done"):
+            if job["task_id"]:
+                st.write(f"Task ID: {job['task_id']}")
+            if status == "done":
+                show_result(json.loads(job["result"]), caption)
+            elif status == "failed":
+                st.error(job["error"] or "Unknown error")
+            elif status in ("not_found", "expired"):
+                st.error(f"Task {status}. Please try again.")
+            else:
+                st.info(f"Task status: {status}. Checked {job['polls']} times so far.")
+
+
+# st.fragment reruns only the job list on a timer, older Streamlit versions get a refresh button
+fragment = getattr(st, "fragment", None)
+
+
+def show_jobs(manager, owner, show_result, caption):
+    """Shows the jobs of ``owner``, finished ones through ``show_result(result_data, caption)``.
+
+    Pass None as ``manager`` while the credentials are missing.
+    """
+    st.markdown("---")
+    st.markdown("### Your Edits")
+    if fragment is not None:
+        fragment(run_every=2)(render_jobs)(manager, owner, show_result, caption)
+    else:
+        st.button("Refresh edits", key=f"refresh_{owner}")
+        render_jobs(manager, owner, show_result, caption)
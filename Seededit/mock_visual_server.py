@@ -0,0 +1,181 @@
+"""Local stand-in for the Visual API, for trying the Seededit apps offline.
+
+Checks the request signature the way the real service does, with its own
+HMAC-SHA256 derivation rather than visual_client's, and answers
+CVProcess, CVSync2AsyncSubmitTask and CVSync2AsyncGetResult. Submitted tasks
+go through in_queue and generating before they are done. Result images are
+the uploaded image, tinted, and are served by this server through URLs with
+``\\u0026``-escaped query strings, like the real ones.
+
+Usage:
+    python mock_visual_server.py --port 8765
+    API_ENDPOINT=http://127.0.0.1:8765 API_HOST=127.0.0.1:8765 \\
+        ACCESS_KEY=mock SECRET_KEY=mock streamlit run seededit_v3.py
+"""
+
+import argparse
+import base64
+import hashlib
+import hmac
+import io
+import itertools
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from PIL import Image, ImageOps
+
+ACCESS_KEY = "mock"
+SECRET_KEY = "mock"
+SUCCESS_CODE = 10000
+
+
+def derive_signing_key(secret_key, datestamp, region, service):
+    """HMAC-SHA256 chain over the credential scope, kept apart from the client under test."""
+    key = secret_key.encode("utf-8")
+    for part in (datestamp, region, service, "request"):
+        key = hmac.new(key, part.encode("utf-8"), hashlib.sha256).digest()
+    return key
+
+
+class MockState:
+    """Tasks and images held by one server, plus counters for checks."""
+
+    def __init__(self, polls_until_done=2):
+        self.polls_until_done = polls_until_done
+        self.tasks = {}
+        self.images = {}
+        self.counter = itertools.count(1)
+        self.requests = 0
+        self.connections = set()
+        self.lock = threading.Lock()
+
+
+def _edit(binary_data_base64):
+    """Returns the first input image inverted, or a grey square without one."""
+    if binary_data_base64:
+        image = Image.open(io.BytesIO(base64.b64decode(binary_data_base64[0]))).convert("RGB")
+        image = ImageOps.invert(image)
+    else:
+        image = Image.new("RGB", (512, 512), (128, 128, 128))
+    buffered = io.BytesIO()
+    image.save(buffered, format="JPEG", quality=85)
+    return buffered.getvalue()
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, so connection reuse is observable
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, status, payload, content_type="application/json"):
+        body = payload if isinstance(payload, bytes) else json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _verify(self, query, body):
+        try:
+            scheme, fields = self.headers["Authorization"].split(" ", 1)
+            fields = dict(part.strip().split("=", 1) for part in fields.split(","))
+            access_key, datestamp, region, service, _ = fields["Credential"].split("/")
+        except (AttributeError, KeyError, ValueError):
+            return "Missing or malformed Authorization header"
+        if access_key != ACCESS_KEY:
+            return "Unknown access key"
+        payload_hash = hashlib.sha256(body).hexdigest()
+        if payload_hash != self.headers.get("X-Content-Sha256"):
+            return "X-Content-Sha256 does not match the body"
+        current_date = self.headers.get("X-Date", "")
+        canonical_headers = (f"content-type:{self.headers.get('Content-Type')}\nhost:{self.headers.get('Host')}\n"
+                             f"x-content-sha256:{payload_hash}\nx-date:{current_date}\n")
+        canonical_request = f"POST\n/\n{query}\n{canonical_headers}\n{fields['SignedHeaders']}\n{payload_hash}"
+        string_to_sign = (f"{scheme}\n{current_date}\n{datestamp}/{region}/{service}/request\n"
+                          f"{hashlib.sha256(canonical_request.encode()).hexdigest()}")
+        expected = hmac.new(derive_signing_key(SECRET_KEY, datestamp, region, service),
+                            string_to_sign.encode(), hashlib.sha256).hexdigest()
+        if not hmac.compare_digest(expected, fields["Signature"]):
+            return "Signature does not match"
+        return None
+
+    def _image_url(self, image_id):
+        return f"http://{self.headers.get('Host')}/images/{image_id}.jpeg?x-expires=3600&x-signature=mock"
+
+    def do_GET(self):
+        state = self.server.state
+        path = urlsplit(self.path).path
+        image = state.images.get(path.rsplit("/", 1)[-1].split(".")[0])
+        if path.startswith("/images/") and image is not None:
+            return self._reply(200, image, "image/jpeg")
+        self._reply(404, {"code": 404, "message": "not found"})
+
+    def do_POST(self):
+        state = self.server.state
+        with state.lock:
+            state.requests += 1
+            state.connections.add(self.client_address)
+        query = urlsplit(self.path).query
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        error = self._verify(query, body)
+        if error:
+            return self._reply(401, {"code": 50400, "message": error})
+
+        action = parse_qs(query).get("Action", [""])[0]
+        params = json.loads(body)
+        if action == "CVProcess":
+            image_id = f"img-{next(state.counter)}"
+            state.images[image_id] = _edit(params.get("binary_data_base64"))
+            data = {"image_urls": [self._image_url(image_id)]} if params.get("return_url") else {
+                "binary_data_base64": [base64.b64encode(state.images[image_id]).decode()]}
+        elif action == "CVSync2AsyncSubmitTask":
+            task_id = str(next(state.counter))
+            state.tasks[task_id] = {"polls": 0, "image": _edit(params.get("binary_data_base64"))}
+            data = {"task_id": task_id}
+        elif action == "CVSync2AsyncGetResult":
+            task = state.tasks.get(params.get("task_id"))
+            if task is None:
+                data = {"status": "not_found"}
+            else:
+                task["polls"] += 1
+                if task["polls"] == 1:
+                    data = {"status": "in_queue"}
+                elif task["polls"] < state.polls_until_done:
+                    data = {"status": "generating"}
+                else:
+                    state.images[params["task_id"]] = task["image"]
+                    data = {"status": "done", "image_urls": [self._image_url(params["task_id"])]}
+        else:
+            return self._reply(400, {"code": 50400, "message": f"Unsupported action {action}"})
+
+        response = json.dumps({"code": SUCCESS_CODE, "message": "Success", "request_id": "mock",
+                               "data": data})
+        # the real service escapes & in URLs
+        self._reply(200, response.replace("&", "\\u0026").encode())
+
+
+def serve(port=0, polls_until_done=2):
+    """Starts a server on a daemon thread and returns it, ``server.state`` holds its counters."""
+    server = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+    server.state = MockState(polls_until_done)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a local mock of the Visual API.")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--polls", type=int, default=3, help="result polls before a task is done")
+    args = parser.parse_args()
+    server = ThreadingHTTPServer(("127.0.0.1", args.port), Handler)
+    server.state = MockState(args.polls)
+    print(f"Mock Visual API on http://127.0.0.1:{args.port} (access key {ACCESS_KEY!r}, "
+          f"secret key {SECRET_KEY!r})")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
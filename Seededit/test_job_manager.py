@@ -0,0 +1,145 @@
+import io
+import os
+import sys
+import threading
+import time
+
+import pytest
+from PIL import Image
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import job_manager  # noqa: E402
+from image_tools import Base64Field  # noqa: E402
+from job_manager import JobManager  # noqa: E402
+from mock_visual_server import ACCESS_KEY, SECRET_KEY, serve  # noqa: E402
+from visual_client import VisualApiClient  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def fast_polls(monkeypatch):
+    monkeypatch.setattr(job_manager, "POLL_INTERVALS", (0.05,))
+    monkeypatch.setattr(job_manager, "MAX_POLL_INTERVAL", 0.05)
+    monkeypatch.setattr(job_manager, "MAX_ERROR_BACKOFF", 0.4)
+
+
+class FakeClient:
+    """Client whose calls are counted and can be made to raise."""
+
+    def __init__(self, access_key="ak", error=None):
+        self.access_key = access_key
+        self.error = error
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def _call(self, name, result):
+        with self.lock:
+            self.calls.append((name, time.monotonic()))
+        if self.error is not None:
+            raise self.error
+        return result
+
+    def submit_task(self, req_key, **params):
+        return self._call("submit", f"task-{len(self.calls)}")
+
+    def get_result(self, req_key, task_id, req_json=None):
+        return self._call("poll", {"status": "done", "image_urls": ["http://example.invalid/a.jpg"]})
+
+    def process(self, req_key, **params):
+        return self._call("process", {"binary_data_base64": []})
+
+
+def wait_for(manager, job_id, timeout=5):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        job = manager.job(job_id)
+        if job["status"] in job_manager.TERMINAL_STATUSES:
+            return job
+        time.sleep(0.02)
+    raise AssertionError(f"job {job_id} still {job['status']}")
+
+
+def jpeg():
+    buffer = io.BytesIO()
+    Image.new("RGB", (64, 48), (200, 40, 40)).save(buffer, "JPEG")
+    return buffer.getvalue()
+
+
+def edit(seed=7):
+    return {"prompt": "make it blue", "seed": seed, "scale": 0.5, "binary_data_base64": [Base64Field(jpeg())]}
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "jobs.db")
+
+
+def test_jobs_and_cache_are_scoped_by_access_key(db_path):
+    first = JobManager(FakeClient("ak-1"), db_path)
+    second = JobManager(FakeClient("ak-2"), db_path)
+    try:
+        mine = first.submit("seededit_v3.0", edit(), owner="session")
+        wait_for(first, mine["job_id"])
+        theirs = second.submit("seededit_v3.0", edit(), owner="session")
+        assert not theirs["cached"]
+        assert theirs["job_id"] != mine["job_id"]
+        assert [job["job_id"] for job in first.jobs("session")] == [mine["job_id"]]
+        assert [job["job_id"] for job in second.jobs()] == [theirs["job_id"]]
+    finally:
+        first.close()
+        second.close()
+
+
+def test_finished_edit_is_copied_to_another_session():
+    server = serve(polls_until_done=1)
+    endpoint = f"http://127.0.0.1:{server.server_address[1]}"
+    client = VisualApiClient(ACCESS_KEY, SECRET_KEY, endpoint=endpoint, host=endpoint[len("http://"):])
+    manager = JobManager(client, ":memory:")
+    try:
+        first = manager.submit("seededit_v3.0", edit(), {"return_url": True}, owner="session-a")
+        done = wait_for(manager, first["job_id"])
+        assert done["status"] == "done"
+
+        again = manager.submit("seededit_v3.0", edit(), {"return_url": True}, owner="session-b")
+        assert again["cached"]
+        assert again["result"] == done["result"]
+        assert [job["job_id"] for job in manager.jobs("session-b")] == [again["job_id"]]
+        assert [job["job_id"] for job in manager.jobs("session-a")] == [first["job_id"]]
+        assert len(server.state.tasks) == 1
+    finally:
+        manager.close()
+        client.close()
+        server.shutdown()
+
+
+@pytest.mark.parametrize("sync", [False, True])
+def test_unexpected_exception_fails_the_job(db_path, sync):
+    manager = JobManager(FakeClient(error=RuntimeError("connection reset")), db_path)
+    try:
+        job = manager.submit("seededit_v3.0", edit(), owner="session", sync=sync)
+        failed = wait_for(manager, job["job_id"])
+        assert failed["status"] == "failed"
+        assert "connection reset" in failed["error"]
+    finally:
+        manager.close()
+
+
+def test_failing_polls_back_off_and_fail_the_job(db_path):
+    client = FakeClient()
+    manager = JobManager(client, db_path)
+    try:
+        job = manager.submit("seededit_v3.0", edit(), owner="session")
+        while not any(name == "submit" for name, _ in client.calls):
+            time.sleep(0.01)
+        client.error = RuntimeError("bad gateway body")
+        failed = wait_for(manager, job["job_id"])
+    finally:
+        manager.close()
+    polls = [at for name, at in client.calls if name == "poll"]
+    assert failed["status"] == "failed"
+    assert "bad gateway body" in failed["error"]
+    assert len(polls) == job_manager.MAX_POLL_ERRORS
+    gaps = [b - a for a, b in zip(polls, polls[1:])]
+    # the last gaps are all MAX_ERROR_BACKOFF, give or take scheduling jitter
+    assert all(later >= earlier - 0.05 for earlier, later in zip(gaps, gaps[1:]))
+    assert gaps[-1] >= 0.35
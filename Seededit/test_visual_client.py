@@ -0,0 +1,141 @@
+import base64
+import datetime
+import io
+import json
+import os
+import re
+import socket
+import sys
+
+import pytest
+from PIL import Image
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from image_tools import Base64Field, build_json_body  # noqa: E402
+from mock_visual_server import ACCESS_KEY, SECRET_KEY, derive_signing_key, serve  # noqa: E402
+from visual_client import VisualApiClient, VisualApiError, get_signature_key  # noqa: E402
+
+# a submit signed at a fixed time, computed outside visual_client from the signing steps
+SIGNED_AT = datetime.datetime(2024, 5, 31, 23, 59, 58)
+SIGNED_QUERY = "Action=CVSync2AsyncSubmitTask&Version=2022-08-31"
+SIGNED_BODY = {"req_key": "seededit_v3.0", "prompt": "make it blue"}
+SIGNING_KEY = "b4bd6c6a213df10ae3ebe8f51c513772599a720696ef84ec789404b2284f0d4d"
+SIGNED_HEADERS = {
+    "X-Date": "20240531T235958Z",
+    "Authorization": "HMAC-SHA256 Credential=AKID/20240531/cn-north-1/cv/request, "
+                     "SignedHeaders=content-type;host;x-content-sha256;x-date, "
+                     "Signature=ba26affa288250cc281badc90d1921ef01e7211ab040441f74e45060d2bdadab",
+    "X-Content-Sha256": "c6df234faccc9ef37b7a2df3076dd13088d2abba4d2d498e501e81c8f95738ae",
+    "Content-Type": "application/json",
+}
+
+
+@pytest.fixture(scope="module")
+def server():
+    server = serve(polls_until_done=3)
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def client_for(server, secret_key=SECRET_KEY):
+    host = f"127.0.0.1:{server.server_address[1]}"
+    return VisualApiClient(ACCESS_KEY, secret_key, endpoint=f"http://{host}", host=host)
+
+
+def jpeg():
+    buffer = io.BytesIO()
+    Image.new("RGB", (32, 32), (10, 20, 30)).save(buffer, "JPEG")
+    return Base64Field(buffer.getvalue())
+
+
+def test_signing_key_and_headers_match_the_known_answer():
+    assert get_signature_key("secret", "20240531", "cn-north-1", "cv").hex() == SIGNING_KEY
+    assert derive_signing_key("secret", "20240531", "cn-north-1", "cv").hex() == SIGNING_KEY
+
+    client = VisualApiClient("AKID", "secret", host="visual.volcengineapi.com", region="cn-north-1", service="cv")
+    assert client.sign_headers(SIGNED_QUERY, build_json_body(SIGNED_BODY), now=SIGNED_AT) == SIGNED_HEADERS
+    # the cached key is replaced when the date changes
+    next_day = client.sign_headers(SIGNED_QUERY, build_json_body(SIGNED_BODY), now=SIGNED_AT.replace(day=30))
+    assert "20240530" in next_day["Authorization"]
+    assert client.signing_key("20240531").hex() == SIGNING_KEY
+
+
+def test_call_returns_the_whole_response_with_unescaped_urls(server):
+    client = client_for(server)
+    response = client.call("CVProcess", {"req_key": "seededit_v3.0", "return_url": True,
+                                         "binary_data_base64": [jpeg()]})
+    assert response["code"] == 10000
+    url = response["data"]["image_urls"][0]
+    assert "?x-expires=3600&x-signature=mock" in url
+    assert client.session.get(url).headers["Content-Type"] == "image/jpeg"
+
+    data = client.process("seededit_v3.0", binary_data_base64=[jpeg()])
+    with Image.open(io.BytesIO(base64.b64decode(data["binary_data_base64"][0]))) as image:
+        assert image.size == (32, 32)
+
+
+def test_submit_task_and_get_result_follow_the_task(server):
+    client = client_for(server)
+    task_id = client.submit_task("seededit_v3.0", prompt="make it blue", binary_data_base64=[jpeg()])
+    assert task_id
+
+    statuses = [client.get_result("seededit_v3.0", task_id, req_json={"return_url": True})
+                for _ in range(3)]
+    assert [data["status"] for data in statuses] == ["in_queue", "generating", "done"]
+    assert statuses[-1]["image_urls"][0].endswith(".jpeg?x-expires=3600&x-signature=mock")
+    assert client.get_result("seededit_v3.0", "no-such-task") == {"status": "not_found"}
+
+
+def test_requests_reuse_one_connection(server):
+    client = client_for(server)
+    before = len(server.state.connections)
+    for _ in range(3):
+        client.submit_task("seededit_v3.0", prompt="p")
+    assert len(server.state.connections) == before + 1
+
+
+def test_a_bad_signature_is_an_error(server):
+    with pytest.raises(VisualApiError) as error:
+        client_for(server, secret_key="wrong").submit_task("seededit_v3.0", prompt="p")
+    assert (error.value.status_code, error.value.code) == (401, 50400)
+    assert "Signature does not match" in str(error.value)
+
+
+def test_an_unsupported_action_is_an_error(server):
+    with pytest.raises(VisualApiError) as error:
+        client_for(server).call("CVNothing", {"req_key": "seededit_v3.0"})
+    assert error.value.status_code == 400
+    assert error.value.response["message"] == "Unsupported action CVNothing"
+
+
+class FakeResponse:
+    def __init__(self, status_code, body):
+        self.status_code = status_code
+        self.text = body
+
+    def json(self):
+        return json.loads(self.text)
+
+
+@pytest.mark.parametrize("status, body, message", [
+    (200, '{"code": 50411, "message": "Pre Img Risk Not Pass"}', "API Error: Pre Img Risk Not Pass"),
+    (502, "<html>bad gateway</html>", "Failed to parse API response (HTTP 502)"),
+])
+def test_failure_codes_and_unreadable_bodies_are_errors(status, body, message):
+    client = VisualApiClient("ak", "sk")
+    client.session.post = lambda *args, **kwargs: FakeResponse(status, body)
+    with pytest.raises(VisualApiError, match=re.escape(message)) as error:
+        client.submit_task("seededit_v3.0", prompt="p")
+    assert error.value.status_code == status
+
+
+def test_transport_errors_are_wrapped():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    client = VisualApiClient("ak", "sk", endpoint=f"http://127.0.0.1:{port}", host=f"127.0.0.1:{port}", timeout=2)
+    with pytest.raises(VisualApiError) as error:
+        client.process("seededit_v3.0")
+    assert error.value.status_code is None
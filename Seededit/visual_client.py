@@ -0,0 +1,200 @@
+"""Signed client for the BytePlus Visual (CV) API used by the Seededit apps.
+
+One ``VisualApiClient`` keeps a pooled ``requests.Session`` so consecutive
+calls (a submit followed by a dozen result polls) reuse one TLS connection,
+and caches the HMAC signing key for the current day instead of deriving it
+on every request.
+
+    client = VisualApiClient(access_key, secret_key)
+    task_id = client.submit_task("seededit_v3.0", prompt="...", binary_data_base64=[field])
+    data = client.get_result("seededit_v3.0", task_id, req_json={"return_url": True})
+
+Point ``endpoint``/``host`` (or the API_ENDPOINT/API_HOST environment
+variables) at ``mock_visual_server.py`` to try the apps without credentials.
+"""
+
+import datetime
+import hashlib
+import hmac
+import json
+import os
+import sys
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# image_tools lives at the repository root, next to this demo
+root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if root_dir not in sys.path:
+    sys.path.insert(0, root_dir)
+
+from image_tools import JsonBody, build_json_body
+
+API_VERSION = "2022-08-31"
+SUCCESS_CODE = 10000
+
+
+class VisualApiError(Exception):
+    """A failed Visual API call.
+
+    Attributes:
+        status_code (int): HTTP status, None when the request did not complete.
+        code (int): Business code from the response body, when there is one.
+        response (dict): The decoded response body, when there is one.
+    """
+
+    def __init__(self, message, status_code=None, code=None, response=None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.code = code
+        self.response = response
+
+
+def sign(key, msg):
+    return hmac.new(key, msg.encode("utf-8"), hashlib.sha256).digest()
+
+
+def get_signature_key(key, date_stamp, region_name, service_name):
+    k_date = sign(key.encode("utf-8"), date_stamp)
+    k_region = sign(k_date, region_name)
+    k_service = sign(k_region, service_name)
+    return sign(k_service, "request")
+
+
+def format_query(parameters):
+    return "&".join(f"{key}={parameters[key]}" for key in sorted(parameters))
+
+
+class VisualApiClient:
+    """Signs and sends Visual API requests over a pooled session.
+
+    Args:
+        access_key (str): Access key id.
+        secret_key (str): Secret access key.
+        endpoint (str): Base URL, defaults to API_ENDPOINT or the public endpoint.
+        host (str): Host used in the signature, defaults to API_HOST.
+        region (str): Signing region, defaults to API_REGION.
+        service (str): Signing service, defaults to API_SERVICE.
+        timeout (float): Seconds to wait for each response.
+        pool_size (int): Connections kept open to the endpoint.
+    """
+
+    def __init__(self, access_key, secret_key, endpoint=None, host=None, region=None, service=None,
+                 timeout=60, pool_size=10):
+        if not access_key or not secret_key:
+            raise ValueError("No access key is available.")
+        self.access_key = access_key
+        self.secret_key = secret_key
+        self.endpoint = endpoint or os.getenv("API_ENDPOINT", "https://visual.volcengineapi.com")
+        self.host = host or os.getenv("API_HOST", "visual.volcengineapi.com")
+        self.region = region or os.getenv("API_REGION", "cn-north-1")
+        self.service = service or os.getenv("API_SERVICE", "cv")
+        self.timeout = timeout
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        # (datestamp, signing key), the key only changes with the UTC date
+        self._signing_key = (None, None)
+        self._lock = threading.Lock()
+
+    def signing_key(self, datestamp):
+        cached_date, key = self._signing_key
+        if cached_date != datestamp:
+            with self._lock:
+                key = get_signature_key(self.secret_key, datestamp, self.region, self.service)
+                self._signing_key = (datestamp, key)
+        return key
+
+    def sign_headers(self, query, body, now=None):
+        """Returns the headers signing a POST of ``body`` (a JsonBody) to ``?query``."""
+        t = now or datetime.datetime.utcnow()
+        current_date = t.strftime("%Y%m%dT%H%M%SZ")
+        datestamp = t.strftime("%Y%m%d")  # Date w/o time, used in credential scope
+        content_type = "application/json"
+        signed_headers = "content-type;host;x-content-sha256;x-date"
+        canonical_headers = (f"content-type:{content_type}\nhost:{self.host}\n"
+                             f"x-content-sha256:{body.sha256}\nx-date:{current_date}\n")
+        canonical_request = f"POST\n/\n{query}\n{canonical_headers}\n{signed_headers}\n{body.sha256}"
+
+        credential_scope = f"{datestamp}/{self.region}/{self.service}/request"
+        string_to_sign = (f"HMAC-SHA256\n{current_date}\n{credential_scope}\n"
+                          f"{hashlib.sha256(canonical_request.encode('utf-8')).hexdigest()}")
+        signature = hmac.new(self.signing_key(datestamp), string_to_sign.encode("utf-8"),
+                             hashlib.sha256).hexdigest()
+        return {
+            "X-Date": current_date,
+            "Authorization": f"HMAC-SHA256 Credential={self.access_key}/{credential_scope}, "
+                             f"SignedHeaders={signed_headers}, Signature={signature}",
+            "X-Content-Sha256": body.sha256,
+            "Content-Type": content_type,
+        }
+
+    def call(self, action, body, version=API_VERSION):
+        """Sends one action and returns the decoded response.
+
+        Args:
+            action (str): API action, e.g. ``CVProcess``.
+            body (dict or JsonBody): Request body, Base64Field values allowed.
+            version (str): API version.
+
+        Returns:
+            dict: The whole response, its ``code`` is 10000.
+
+        Raises:
+            VisualApiError: On a transport error, an HTTP error or a failure code.
+        """
+        if not isinstance(body, JsonBody):
+            body = build_json_body(body)
+        query = format_query({"Action": action, "Version": version})
+        try:
+            r = self.session.post(f"{self.endpoint}?{query}", headers=self.sign_headers(query, body),
+                                  data=body.body, timeout=self.timeout)
+        except requests.RequestException as err:
+            raise VisualApiError(f"Error occurred: {err}")
+
+        try:
+            # the JSON decoder turns escapes such as \u0026 in result URLs back into &
+            response = r.json()
+        except ValueError:
+            raise VisualApiError(f"Failed to parse API response (HTTP {r.status_code}): {r.text[:500]}",
+                                 status_code=r.status_code)
+        if r.status_code != 200:
+            raise VisualApiError(f"API request failed with status code: {r.status_code} "
+                                 f"({response.get('message', 'Unknown error')})",
+                                 status_code=r.status_code, code=response.get("code"), response=response)
+        if response.get("code") != SUCCESS_CODE:
+            raise VisualApiError(f"API Error: {response.get('message', 'Unknown error')}",
+                                 status_code=r.status_code, code=response.get("code"), response=response)
+        return response
+
+    def process(self, req_key, version=API_VERSION, **params):
+        """Runs a synchronous CVProcess request and returns its ``data``."""
+        return self.call("CVProcess", {"req_key": req_key, **params}, version).get("data") or {}
+
+    def submit_task(self, req_key, version=API_VERSION, **params):
+        """Submits a CVSync2AsyncSubmitTask request and returns the task id."""
+        data = self.call("CVSync2AsyncSubmitTask", {"req_key": req_key, **params}, version).get("data") or {}
+        return data.get("task_id")
+
+    def get_result(self, req_key, task_id, req_json=None, version=API_VERSION):
+        """Fetches a CVSync2AsyncGetResult and returns its ``data``.
+
+        Args:
+            req_key (str): The req_key the task was submitted with.
+            task_id (str): Id returned by ``submit_task``.
+            req_json (dict): Options such as ``return_url`` and ``logo_info``.
+
+        Returns:
+            dict: Includes ``status`` (in_queue, generating, done, not_found,
+            expired) and, once done, ``image_urls`` or ``binary_data_base64``.
+        """
+        body = {"req_key": req_key, "task_id": task_id}
+        if req_json is not None:
+            body["req_json"] = json.dumps(req_json)
+        return self.call("CVSync2AsyncGetResult", body, version).get("data") or {}
+
+    def close(self):
+        self.session.close()
@@ -1,12 +1,12 @@
 """Streamlit application for BytePlus image generation."""
 
 import os
-import json
-import requests
+import time
 import streamlit as st
 from dotenv import load_dotenv
-from PIL import Image
-from io import BytesIO
+
+from image_service import (API_ENDPOINT, DEFAULT_GUIDANCE_SCALE, DEFAULT_MODEL, RANDOM_SEED, GenerationCache,
+                           ImageGenerator, build_grid)
 
 # Load environment variables
 load_dotenv()
@@ -22,13 +22,8 @@ st.markdown(
 )
 
 # API configuration
-API_ENDPOINT = "https://ark.ap-southeast.bytepluses.com/api/v3/images/generations"
 API_KEY = os.getenv("ARK_API_KEY")
 
-# Default parameters
-DEFAULT_MODEL = os.getenv("IMAGE_MODEL", "ep-20250606195130-bmvt2")
-DEFAULT_SIZE = "1024x1024"
-DEFAULT_GUIDANCE_SCALE = 3
 model = DEFAULT_MODEL
 # Sidebar for advanced options
 st.sidebar.title("Advanced Options")
@@ -37,6 +32,23 @@ size = st.sidebar.selectbox("Image Size", ["256x256", "512x512", "1024x1024"], i
 guidance_scale = st.sidebar.slider("Guidance Scale", 1, 10, DEFAULT_GUIDANCE_SCALE)
 watermark = st.sidebar.checkbox("Add Watermark", value=True)
 
+# Batch options, every prompt is generated with every seed
+st.sidebar.title("Batch Options")
+multi_prompt = st.sidebar.checkbox("One prompt per line", value=False,
+                                   help="Generate every line of the prompt box as a separate prompt")
+seeds_text = st.sidebar.text_input("Seeds", value="",
+                                   help="Comma separated, e.g. 1, 2, 3. Leave empty for random seeds. "
+                                        "Images with a fixed seed are cached and not generated twice.")
+variants = st.sidebar.number_input("Variants per prompt", min_value=1, max_value=8, value=1,
+                                   help="Random-seed images per prompt, used when no seed is given")
+concurrency = st.sidebar.slider("Parallel requests", 1, 8, 4)
+
+# One generator per Streamlit server and concurrency: pooled connections and
+# the local result cache are shared by every rerun and session
+@st.cache_resource
+def get_generator(concurrency):
+    return ImageGenerator(API_KEY, concurrency, cache=GenerationCache())
+
 # Main input area
 # Initialize session state for prompt text if not exists
 if 'prompt_text' not in st.session_state:
@@ -52,62 +64,63 @@ prompt = st.text_area("Enter your prompt here or copy prompts given below",
 
 # Generate button
 if st.button("Generate Image"):
+    try:
+        seeds = [int(seed) for seed in seeds_text.replace(",", " ").split()] or [RANDOM_SEED]
+    except ValueError:
+        seeds = None
     if not prompt:
         st.error("Please enter a prompt to generate an image.")
     elif not API_KEY:
         st.error("API key not found. Please set the ARK_API_KEY environment variable.")
+    elif seeds is None:
+        st.error("Seeds must be whole numbers separated by commas.")
     else:
-        with st.spinner("Generating image..."): 
-            # Prepare request payload
-            payload = {
-                "model": model,
-                "prompt": prompt,
-                "response_format": "url",
-                "size": size,
-                "guidance_scale": guidance_scale,
-                "watermark": watermark
-            }
-            
-            # Set headers
-            headers = {
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {API_KEY}"
-            }
-            
-            try:
-                # Make API request
-                response = requests.post(
-                    API_ENDPOINT,
-                    headers=headers,
-                    json=payload
-                )
-                
-                # Check for successful response
-                if response.status_code == 200:
-                    result = response.json()
-                    
-                    # Display the generated image
-                    if "data" in result and len(result["data"]) > 0 and "url" in result["data"][0]:
-                        image_url = result["data"][0]["url"]
-                        st.success("Image generated successfully!")
-                        
-                        # Display image
-                        st.image(image_url, caption="Generated Image", use_container_width=True)
-                        
-                        # Display image URL
-                        st.markdown(f"**Image URL:** {image_url}")
-                        
-                        # Display API response details
-                        with st.expander("API Response Details"):
-                            st.json(result)
-                    else:
-                        st.error("No image URL found in the API response.")
-                        st.json(result)
+        prompts = prompt.splitlines() if multi_prompt else [prompt]
+        grid = build_grid(prompts, seeds, variants, size, guidance_scale, watermark, model)
+        if not grid:
+            # e.g. only blank lines in multi-prompt mode
+            st.error("Please enter a prompt to generate an image.")
+            st.stop()
+        status = st.info(f"Generating {len(grid)} image(s), {concurrency} at a time...")
+        started = time.time()
+        
+        # One placeholder per image, filled in as soon as that image is ready
+        columns = st.columns(min(len(grid), 4))
+        slots = [columns[i % len(columns)].empty() for i in range(len(grid))]
+        waiting = {}
+        for i, request in enumerate(grid):
+            slots[i].info(f"Waiting... seed {request.seed if request.seed != RANDOM_SEED else 'random'}")
+            waiting.setdefault(request, []).append(i)
+        
+        results = []
+        for result in get_generator(concurrency).generate_many(grid):
+            results.append(result)
+            request = result.request
+            seed = request.seed if request.seed != RANDOM_SEED else "random"
+            with slots[waiting[request].pop(0)].container():
+                if result.ok:
+                    st.image(result.image.path, use_container_width=True,
+                             caption=f"{request.prompt[:60]} · seed {seed} · {result.latency:.1f}s"
+                                     f"{' · cached' if result.cached else ''}")
+                    st.markdown(f"[Image URL]({result.url})")
                 else:
-                    st.error(f"API request failed with status code {response.status_code}")
-                    st.text(response.text)
-            except Exception as e:
-                st.error(f"An error occurred: {str(e)}")
+                    st.error(f"Seed {seed}: {result.error}")
+        
+        succeeded = sum(result.ok for result in results)
+        cached = sum(result.cached for result in results)
+        latencies = [result.latency for result in results if result.ok]
+        summary = (f"{succeeded} of {len(grid)} image(s) generated in {time.time() - started:.1f}s"
+                   f"{f', {cached} from cache' if cached else ''}")
+        if latencies:
+            summary += f", latency {min(latencies):.1f}s to {max(latencies):.1f}s per image"
+        if succeeded:
+            status.success(summary)
+        else:
+            status.error(summary)
+        
+        # Display API response details
+        with st.expander("API Response Details"):
+            st.json([result.response for result in results])
 
 # Sample Prompts
 st.markdown("---")
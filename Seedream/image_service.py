@@ -0,0 +1,339 @@
+"""Seedream image generation service, for the Streamlit app and the command line.
+
+``ImageGenerator`` sends generation requests through one pooled
+``requests.Session``, at most ``concurrency`` at a time, and yields every
+image as soon as it is ready, so a grid of prompts and seeds fills in while
+the slower images are still generating:
+
+* identical requests in one batch are sent once;
+* results of requests with a fixed seed are cached in a local SQLite table,
+  the images themselves in an ``image_tools.ImageStore``, so asking for the
+  same prompt, size, guidance scale and seed again costs nothing. Requests
+  with a random seed are never cached;
+* every result carries its latency, from the start of its request to the
+  image being on disk;
+* 429 and 5xx answers are retried a few times, honouring ``Retry-After``.
+
+Usage:
+    python image_service.py "A red fox in the snow" "A lighthouse at dusk" \\
+        --seeds 1 2 3 --size 1024x1024 --concurrency 4 --out images/
+"""
+
+import argparse
+import hashlib
+import itertools
+import json
+import logging
+import os
+import shutil
+import sqlite3
+import sys
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import requests
+from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+
+# image_tools lives at the repository root, next to this demo
+root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if root_dir not in sys.path:
+    sys.path.insert(0, root_dir)
+
+from image_tools import ImageStore
+
+# Load environment variables
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+API_ENDPOINT = os.getenv("IMAGE_API_ENDPOINT", "https://ark.ap-southeast.bytepluses.com/api/v3/images/generations")
+DEFAULT_MODEL = os.getenv("IMAGE_MODEL", "ep-20250606195130-bmvt2")
+DEFAULT_SIZE = "1024x1024"
+DEFAULT_GUIDANCE_SCALE = 3
+DEFAULT_CACHE_PATH = os.getenv("SEEDREAM_CACHE_DB", os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                                                  "seedream_cache.db"))
+RANDOM_SEED = -1
+
+# Seconds to wait before retrying a 429 or 5xx answer, one entry per retry
+RETRY_DELAYS = (1, 2, 4)
+MAX_RETRY_DELAY = 30
+
+
+class GenerationError(Exception):
+    """Raised when the API does not return an image.
+
+    Attributes:
+        status_code (int): HTTP status, None when the request did not complete.
+        detail: The error body returned by the API, or its text.
+    """
+
+    def __init__(self, message, status_code=None, detail=None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.detail = detail
+
+
+class GenerationRequest(namedtuple("GenerationRequest", "prompt size guidance_scale seed watermark model")):
+    """One image to generate, ``seed`` -1 lets the service pick one."""
+
+    __slots__ = ()
+
+    def payload(self):
+        payload = {
+            "model": self.model,
+            "prompt": self.prompt,
+            "response_format": "url",
+            "size": self.size,
+            "guidance_scale": self.guidance_scale,
+            "watermark": self.watermark,
+        }
+        if self.seed != RANDOM_SEED:
+            payload["seed"] = self.seed
+        return payload
+
+    def cache_key(self):
+        """Hex digest identifying the image, None when the seed is random."""
+        if self.seed == RANDOM_SEED:
+            return None
+        key = self._replace(guidance_scale=float(self.guidance_scale))
+        return hashlib.sha256(json.dumps(list(key)).encode("utf-8")).hexdigest()
+
+
+class GenerationResult(namedtuple("GenerationResult", "request image url latency cached error response")):
+    """Outcome of one request.
+
+    ``image`` is an ``image_tools.CachedImage`` (its ``path`` is a local file),
+    ``latency`` the seconds until it was on disk, ``error`` the exception when
+    the request failed, in which case ``image`` is None.
+    """
+
+    __slots__ = ()
+
+    @property
+    def ok(self):
+        return self.error is None
+
+
+def build_grid(prompts, seeds=(RANDOM_SEED,), variants=1, size=DEFAULT_SIZE, guidance_scale=DEFAULT_GUIDANCE_SCALE,
+               watermark=True, model=DEFAULT_MODEL):
+    """Requests for every prompt and seed, prompt-major.
+
+    Args:
+        prompts (list): Prompts, blank ones are skipped.
+        seeds (list): Seeds to try for every prompt, -1 for a random one.
+        variants (int): Random-seed variants per prompt, used when ``seeds``
+            holds only the random seed.
+    """
+    seeds = list(seeds) or [RANDOM_SEED]
+    if seeds == [RANDOM_SEED]:
+        seeds = seeds * max(1, variants)
+    return [GenerationRequest(prompt.strip(), size, guidance_scale, seed, watermark, model)
+            for prompt, seed in itertools.product(prompts, seeds) if prompt.strip()]
+
+
+class GenerationCache:
+    """SQLite table mapping request cache keys to stored images, safe to use from several threads."""
+
+    def __init__(self, path=DEFAULT_CACHE_PATH):
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS images (
+                    cache_key TEXT PRIMARY KEY,
+                    digest TEXT,
+                    url TEXT,
+                    response TEXT,
+                    created_at REAL
+                )""")
+
+    def get(self, cache_key):
+        """Returns (digest, url, response) for ``cache_key``, None when it is unknown."""
+        with self._lock:
+            row = self._conn.execute("SELECT digest, url, response FROM images WHERE cache_key = ?",
+                                     (cache_key,)).fetchone()
+        if row is None:
+            return None
+        return row[0], row[1], json.loads(row[2])
+
+    def put(self, cache_key, digest, url, response):
+        with self._lock, self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO images VALUES (?, ?, ?, ?, ?)",
+                               (cache_key, digest, url, json.dumps(response), time.time()))
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class ImageGenerator:
+    """Generates Seedream images concurrently through one pooled session.
+
+    Args:
+        api_key (str): Ark API key, ``ARK_API_KEY`` by default.
+        concurrency (int): Requests in flight at the same time.
+        endpoint (str): Image generation endpoint.
+        timeout (float): Seconds allowed for connecting and for each read.
+        cache (GenerationCache): Results of fixed-seed requests, None disables caching.
+        store (ImageStore): Local copies of the generated images.
+    """
+
+    def __init__(self, api_key=None, concurrency=4, endpoint=API_ENDPOINT, timeout=120, cache=None, store=None):
+        self.api_key = api_key or os.getenv("ARK_API_KEY")
+        if not self.api_key:
+            raise ValueError("API key not found. Please set the ARK_API_KEY environment variable.")
+        self.concurrency = max(1, concurrency)
+        self.endpoint = endpoint
+        self.timeout = timeout
+        self.cache = cache
+        # shared by the API calls and the image downloads, the key is only sent to the API
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_maxsize=self.concurrency))
+        self.session.mount("http://", HTTPAdapter(pool_maxsize=self.concurrency))
+        self.headers = {"Content-Type": "application/json", "Authorization": f"Bearer {self.api_key}"}
+        self.store = store or ImageStore(session=self.session)
+
+    def generate(self, request):
+        """Generates one image, raising GenerationError when it fails.
+
+        Returns:
+            GenerationResult: With ``cached`` True when no request was sent.
+        """
+        started = time.perf_counter()
+        cache_key = request.cache_key() if self.cache is not None else None
+        if cache_key is not None:
+            hit = self.cache.get(cache_key)
+            image = self.store.get(hit[0]) if hit is not None else None
+            if image is not None:
+                return GenerationResult(request, image, hit[1], time.perf_counter() - started, True, None, hit[2])
+
+        response = self._post(request.payload())
+        data = response.get("data") or []
+        if not data or not data[0].get("url"):
+            raise GenerationError("No image URL found in the API response.", 200, response)
+        url = data[0]["url"]
+        try:
+            image = self.store.fetch(url)
+        except (requests.RequestException, OSError) as e:
+            raise GenerationError(f"Failed to download the generated image: {e}", detail=response) from e
+        if cache_key is not None:
+            self.cache.put(cache_key, image.digest, url, response)
+        return GenerationResult(request, image, url, time.perf_counter() - started, False, None, response)
+
+    def generate_many(self, batch):
+        """Generates every request of ``batch``, ``concurrency`` at a time.
+
+        Yields:
+            GenerationResult: One per request, in completion order. Failed
+            requests are yielded with ``error`` set instead of raising.
+        """
+        # identical fixed-seed requests share one call, random-seed ones are variants
+        copies = {}
+        for i, request in enumerate(batch):
+            key = i if request.seed == RANDOM_SEED else request
+            copies[key] = copies.get(key, 0) + 1
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="seedream") as pool:
+            futures = {pool.submit(self._generate_timed, batch[key] if isinstance(key, int) else key): count
+                       for key, count in copies.items()}
+            for future in as_completed(futures):
+                result = future.result()
+                yield result
+                for _ in range(futures[future] - 1):
+                    yield result._replace(cached=True)
+
+    def close(self):
+        self.session.close()
+
+    def _generate_timed(self, request):
+        started = time.perf_counter()
+        try:
+            return self.generate(request)
+        except GenerationError as e:
+            return GenerationResult(request, None, None, time.perf_counter() - started, False, e, e.detail)
+        except Exception as e:
+            # e.g. the cache or the image store failed, must not end generate_many for the other requests
+            logger.exception("Generating %r failed", request.prompt[:60])
+            return GenerationResult(request, None, None, time.perf_counter() - started, False, e, None)
+
+    def _post(self, payload):
+        for attempt in itertools.count():
+            try:
+                r = self.session.post(self.endpoint, json=payload, headers=self.headers, timeout=self.timeout)
+            except requests.RequestException as e:
+                raise GenerationError(f"API request failed: {e}") from e
+            retryable = r.status_code == 429 or r.status_code >= 500
+            if not retryable or attempt >= len(RETRY_DELAYS):
+                break
+            delay = RETRY_DELAYS[attempt]
+            retry_after = r.headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                delay = min(max(delay, int(retry_after)), MAX_RETRY_DELAY)
+            logger.warning("Image generation returned %s, retrying in %ss", r.status_code, delay)
+            time.sleep(delay)
+
+        try:
+            body = r.json()
+        except ValueError:
+            body = r.text
+        if r.status_code != 200:
+            raise GenerationError(f"API request failed with status code {r.status_code}", r.status_code, body)
+        return body
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate Seedream images for every prompt and seed.")
+    parser.add_argument("prompts", nargs="*", help="prompts to generate")
+    parser.add_argument("--prompts-file", help="text file with one prompt per line")
+    parser.add_argument("--seeds", type=int, nargs="+", default=[RANDOM_SEED], help="seeds to try for every prompt")
+    parser.add_argument("--variants", type=int, default=1, help="random-seed images per prompt when no seed is given")
+    parser.add_argument("--size", default=DEFAULT_SIZE)
+    parser.add_argument("--guidance-scale", type=float, default=DEFAULT_GUIDANCE_SCALE)
+    parser.add_argument("--no-watermark", action="store_true")
+    parser.add_argument("--model", default=DEFAULT_MODEL)
+    parser.add_argument("--concurrency", type=int, default=4, help="requests in flight at the same time")
+    parser.add_argument("--out", default="images", help="directory receiving the images and results.jsonl")
+    args = parser.parse_args()
+
+    prompts = list(args.prompts)
+    if args.prompts_file:
+        with open(args.prompts_file, encoding="utf-8") as f:
+            prompts += f.read().splitlines()
+    grid = build_grid(prompts, args.seeds, args.variants, args.size, args.guidance_scale, not args.no_watermark,
+                      args.model)
+    if not grid:
+        parser.error("no prompts given")
+
+    os.makedirs(args.out, exist_ok=True)
+    generator = ImageGenerator(concurrency=args.concurrency, cache=GenerationCache())
+    started = time.time()
+    failed = 0
+    try:
+        with open(os.path.join(args.out, "results.jsonl"), "a", encoding="utf-8") as results:
+            for result in generator.generate_many(grid):
+                request = result.request
+                path = None
+                if result.ok:
+                    path = os.path.join(args.out, f"{result.image.digest[:16]}.{result.image.format.lower()}")
+                    shutil.copyfile(result.image.path, path)
+                else:
+                    failed += 1
+                results.write(json.dumps({"prompt": request.prompt, "seed": request.seed, "size": request.size,
+                                          "guidance_scale": request.guidance_scale, "path": path, "url": result.url,
+                                          "latency": round(result.latency, 3), "cached": result.cached,
+                                          "error": str(result.error) if result.error else None}) + "\n")
+                results.flush()
+                status = "cached" if result.cached else "ok" if result.ok else "failed"
+                print(f"[{status}] {result.latency:6.2f}s seed {request.seed} {path or result.error} "
+                      f"{request.prompt[:60]}")
+    finally:
+        generator.close()
+    print(f"{len(grid)} images in {time.time() - started:.1f}s: {len(grid) - failed} succeeded, {failed} failed. "
+          f"Results in {os.path.join(args.out, 'results.jsonl')}")
+
+
+if __name__ == "__main__":
+    main()
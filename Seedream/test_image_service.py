@@ -0,0 +1,62 @@
+"""Tests for error handling in the Seedream generation service, with the API and image store faked."""
+
+import logging
+from types import SimpleNamespace
+
+import image_service
+from image_service import ImageGenerator, build_grid
+
+
+class FakeResponse:
+    def __init__(self, status_code, body, headers=None):
+        self.status_code = status_code
+        self.body = body
+        self.headers = headers or {}
+
+    def json(self):
+        return self.body
+
+
+class FakeStore:
+    """Stores every URL except those in ``broken``, which raise a non-network error."""
+
+    def __init__(self, broken=()):
+        self.broken = broken
+
+    def fetch(self, url):
+        if url in self.broken:
+            raise RuntimeError("disk full")
+        return SimpleNamespace(path="/tmp/" + url, digest=url, format="PNG")
+
+
+def generator(responses, store):
+    g = ImageGenerator(api_key="key", concurrency=2, store=store)
+
+    def post(endpoint, json, headers, timeout):
+        return responses(json)
+
+    g.session.post = post
+    return g
+
+
+def test_unexpected_errors_are_yielded_as_failed_results():
+    def respond(payload):
+        return FakeResponse(200, {"data": [{"url": payload["prompt"]}]})
+
+    g = generator(respond, FakeStore(broken={"bad"}))
+    results = {r.request.prompt: r for r in g.generate_many(build_grid(["good", "bad", "fine"]))}
+
+    assert results["good"].ok and results["fine"].ok
+    assert not results["bad"].ok
+    assert isinstance(results["bad"].error, RuntimeError)
+    assert results["bad"].image is None
+
+
+def test_retries_are_logged(monkeypatch, caplog):
+    monkeypatch.setattr(image_service, "RETRY_DELAYS", (0,))
+    answers = [FakeResponse(503, {}), FakeResponse(200, {"data": [{"url": "u"}]})]
+    g = generator(lambda payload: answers.pop(0), FakeStore())
+
+    with caplog.at_level(logging.WARNING, logger="image_service"):
+        assert g.generate(build_grid(["a fox"])[0]).ok
+    assert [r.getMessage() for r in caplog.records] == ["Image generation returned 503, retrying in 0s"]
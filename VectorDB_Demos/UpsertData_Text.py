@@ -2,10 +2,11 @@ from volcengine.viking_db import *
 import random
 import asyncio
 import pandas as pd
-import math
 import os
 from dotenv import load_dotenv
 
+from vikingdb_ingest import IngestEngine, Ledger, build_rows
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -23,49 +24,48 @@ vikingdb_service.set_sk(vikingdb_sk)
 def gen_random_vector(dim):    
     return [random.random() - 0.5 for _ in range(dim)] 
 
-async def batch_upsert_data(df, batch_size=100):
+# Columns uploaded and their types
+SONG_SCHEMA = {
+    "artist": str,
+    "song": str,
+    "vector": list,
+    "duration_ms": int,
+    "explicit": bool,
+    "year": int,
+    "popularity": int,
+    "danceability": float,
+    "energy": float,
+    "key": int,
+    "loudness": float,
+    "mode": int,
+    "speechiness": float,
+    "acousticness": float,
+    "instrumentalness": float,
+    "liveness": float,
+    "valence": float,
+    "tempo": float,
+    "genre": str,
+}
+
+async def batch_upsert_data(df, batch_size=100, ledger=None):
     collection = await vikingdb_service.async_get_collection("Ankur_Music_Collection")
-    total_records = len(df)
-    num_batches = math.ceil(total_records / batch_size)
+    df = df.assign(vector=[gen_random_vector(12) for _ in range(len(df))])
+    rows = build_rows(df, SONG_SCHEMA)
     
-    for i in range(num_batches):
-        start_idx = i * batch_size
-        end_idx = min((i + 1) * batch_size, total_records)
-        batch_df = df[start_idx:end_idx]
-        
-        data_batch = []
-        for _, row in batch_df.iterrows():
-            field = {
-                "artist": str(row['artist']),
-                "song": str(row['song']),
-                "vector": gen_random_vector(12),
-                "duration_ms": int(row['duration_ms']),
-                "explicit": bool(row['explicit']),
-                "year": int(row['year']),
-                "popularity": int(row['popularity']),
-                "danceability": float(row['danceability']),
-                "energy": float(row['energy']),
-                "key": int(row['key']),
-                "loudness": float(row['loudness']),
-                "mode": int(row['mode']),
-                "speechiness": float(row['speechiness']),
-                "acousticness": float(row['acousticness']),
-                "instrumentalness": float(row['instrumentalness']),
-                "liveness": float(row['liveness']),
-                "valence": float(row['valence']),
-                "tempo": float(row['tempo']),
-                "genre": str(row['genre'])
-            }
-            data_batch.append(Data(field))
-        
-        await collection.async_upsert_data(data_batch)
-        print(f"Batch {i+1}/{num_batches} completed. Records {start_idx+1} to {end_idx} processed.")
+    # Several batches in flight, sizes adapted to throttling
+    engine = IngestEngine(collection, batch_size=batch_size, max_batch_size=max(batch_size, 100))
+    stats = await engine.ingest(rows, ledger)
+    print(f"Upload finished: {stats}")
+    return stats
 
 async def main():
     # Read the CSV file
     df = pd.read_csv('/Users/bytedance/Documents/ByteDance/ModelArkDemo/VectorDB/songs_normalize.csv')
-    await batch_upsert_data(df)
-    print("All data has been uploaded successfully!")
+    # The collection generates its keys, so songs are known by their content:
+    # a rerun only sends the rows that were not uploaded yet
+    stats = await batch_upsert_data(df, ledger=Ledger("Ankur_Music_Collection", key=None))
+    if not stats.failed:
+        print("All data has been uploaded successfully!")
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    asyncio.run(main())
@@ -3,6 +3,9 @@ from volcengine.viking_db import *
 import os
 from dotenv import load_dotenv
 
+from vikingdb_cache import DEFAULT_CACHE_PATH, SearchCache
+from vikingdb_query import Query
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -14,10 +17,19 @@ vikingdb_service.set_sk(os.getenv("VIKINGDB_SK"))
 # Get the index (do this once during initialization)
 index = vikingdb_service.get_index("Ankur_Music_Collection", "Ankur_Music_Index")
 
+# One search cache per server, shared by every rerun and session, so moving
+# a widget does not send the same searches again
+@st.cache_resource
+def get_search_cache():
+    return SearchCache("music_search", path=DEFAULT_CACHE_PATH)
+
+search_cache = get_search_cache()
+
 def search_similar_songs(song_name):
     try:
         # Search for similar songs using multimodal search
-        results = index.search_with_multi_modal(
+        results = search_cache.search(
+            index,
             text=song_name,  # Use the input song name as search text
             limit=5,  # Get top 5 similar songs
             need_instruction=False,
@@ -30,22 +42,17 @@ def search_similar_songs(song_name):
 
 def search_similar_energy_songs(energy_value, song_name):
     try:
-        # Search for songs with similar energy levels
-        results = index.search_with_multi_modal(
+        # Search for songs with similar energy levels, VikingDB applies the
+        # energy range so the top 5 are exact
+        query = Query(
             text=song_name,  # We need to provide text parameter
-            limit=20,  # Get more results initially to filter
             need_instruction=False,
             output_fields=["song", "artist", "year", "genre", "popularity", "energy"]
-        )
-        
-        # Filter results manually for similar energy
-        filtered_results = []
-        for result in results:
-            if abs(result.fields['energy'] - energy_value) <= 0.1:
-                filtered_results.append(result)
+        ).between("energy", energy_value - 0.1, energy_value + 0.1)
         
-        # Return only top 5 filtered results
-        return filtered_results[:5]
+        # Skip the searched song itself, the search grows its limit if needed
+        return query.search(index, 5, accept=lambda result: result.fields['song'] != song_name, limit=6,
+                            cache=search_cache)
         
     except Exception as e:
         st.error(f"Error searching for similar energy songs: {str(e)}")
@@ -93,10 +100,6 @@ if song_name:
                 st.subheader("You May Also Like (Songs with Similar Energy):")
                 for j, energy_result in enumerate(energy_results, 1):
                     e_fields = energy_result.fields
-                    # Skip if it's the same song as the search result
-                    if e_fields['song'] == song_name:
-                        continue
-                    
                     with st.container():
                         st.markdown(f"""
                         #### {j}. {e_fields['song']}
@@ -108,4 +111,6 @@ if song_name:
                         """)
                         st.write("---")
         else:
-            st.warning("No similar songs found.")
\ No newline at end of file
+            st.warning("No similar songs found.")
+
+st.sidebar.caption(str(search_cache.stats()))
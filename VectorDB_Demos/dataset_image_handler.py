@@ -1,31 +1,130 @@
+"""Copies the images of a Hugging Face dataset to BytePlus Object Storage.
+
+Images stream through three bounded stages, each with its own pool:
+
+1. download, with one pooled ``requests.Session`` that retries transient
+   errors (images embedded in the dataset skip this stage);
+2. optional resize and re-encode in a process pool, through
+   ``image_tools.prepare_image``;
+3. upload to TOS from memory, multipart for large objects, with the
+   extension and content type of the format read from the image header.
+
+No temporary files are written, and at most ``max_in_flight`` images are
+held in memory at once. The TOS paths are joined back to the DataFrame by
+product ID.
+"""
+
 import os
-import io
-import tempfile
-import shutil
-from PIL import Image
-from datasets import load_dataset
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import pandas as pd
-import tos
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import traceback  # For detailed error tracking
 from dotenv import load_dotenv  # Add this import
 
+# image_tools lives at the repository root, next to this demo
+root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if root_dir not in sys.path:
+    sys.path.insert(0, root_dir)
+
+from image_tools import prepare_image, probe_image
+
 # Load environment variables from .env file
 load_dotenv()
 
+OBJECT_PREFIX = "fashion_products"
+# Objects larger than this are sent as a multipart upload of parts this size
+TOS_PART_SIZE = 8 * 1024 * 1024
+# Pillow format -> object key extension and content type
+IMAGE_TYPES = {
+    "JPEG": ("jpg", "image/jpeg"),
+    "PNG": ("png", "image/png"),
+    "WEBP": ("webp", "image/webp"),
+    "GIF": ("gif", "image/gif"),
+    "BMP": ("bmp", "image/bmp"),
+    "TIFF": ("tif", "image/tiff"),
+}
+
+
+def _reencode(data, max_dimension, quality):
+    """Resizes and re-encodes one image as JPEG, runs in a worker process."""
+    return prepare_image(data, cache=None, max_dimension=max_dimension, max_quality=quality).data
+
+
+def image_type(data):
+    """Returns (extension, content type) of encoded image bytes, read from their header.
+
+    Raises:
+        ValueError: If ``data`` is not an image, e.g. an HTML error page.
+    """
+    format = probe_image(data).format
+    return IMAGE_TYPES.get(format, (format.lower(), f"image/{format.lower()}"))
+
+
+class TransferStats:
+    """Counters of one image transfer, safe to update from several threads."""
+
+    def __init__(self, total):
+        self.total = total
+        self.downloaded = 0
+        self.resized = 0
+        self.uploaded = 0
+        self.failed = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.started = time.monotonic()
+        self.finished = None
+        self._lock = threading.Lock()
+
+    def add(self, **counts):
+        with self._lock:
+            for name, value in counts.items():
+                setattr(self, name, getattr(self, name) + value)
+
+    @property
+    def elapsed(self):
+        return (self.finished or time.monotonic()) - self.started
+
+    def __str__(self):
+        elapsed = max(self.elapsed, 1e-9)
+        return (f"{self.uploaded + self.failed}/{self.total} images in {elapsed:.1f}s: "
+                f"{self.downloaded} downloaded ({self.bytes_in / elapsed / 1e6:.1f} MB/s), "
+                f"{self.resized} resized, {self.uploaded} uploaded "
+                f"({self.uploaded / elapsed:.1f} images/s, {self.bytes_out / elapsed / 1e6:.1f} MB/s), "
+                f"{self.failed} failed")
+
 
 class DatasetImageHandler:
     """Class for handling dataset download and image upload to BytePlus Object Storage"""
     
-    def __init__(self, tos_access_key, tos_secret_key, tos_endpoint, tos_region, tos_bucket):
+    def __init__(self, tos_access_key, tos_secret_key, tos_endpoint, tos_region, tos_bucket,
+                 download_workers=16, upload_workers=16, resize_workers=None, max_in_flight=64):
         self.tos_access_key = tos_access_key
         self.tos_secret_key = tos_secret_key
         self.tos_endpoint = tos_endpoint
         self.tos_region = tos_region
         self.tos_bucket = tos_bucket
+        self.download_workers = download_workers
+        self.upload_workers = upload_workers
+        self.resize_workers = resize_workers
+        self.max_in_flight = max_in_flight
+        
+        # One pool of connections for all downloads, transient errors are retried
+        self.session = requests.Session()
+        retry = Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504))
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=download_workers, max_retries=retry)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.tos_client = None
         
     def load_dataset(self, dataset_name, split="train"):
         """Load dataset from Hugging Face"""
+        from datasets import load_dataset  # imported here like tos, the transfer itself does not need it
+        
         try:
             print(f"Loading dataset {dataset_name} from Hugging Face...")
             dataset = load_dataset(dataset_name, split=split)
@@ -44,212 +143,197 @@ class DatasetImageHandler:
             traceback.print_exc()
             return pd.DataFrame()
     
-    def download_images_to_local(self, df, output_dir):
-        """Download images from URLs in the dataset to a local folder"""
-        # Create output directory if it doesn't exist
-        os.makedirs(output_dir, exist_ok=True)
+    def iter_images(self, df):
+        """Yields (product ID, image) for every row, the image being a URL or bytes"""
+        if 'image' not in df.columns:
+            print("ERROR: Dataset has no 'image' column")
+            return
+        ids = df['id'] if 'id' in df.columns else pd.Series(df.index, index=df.index)
+        for product_id, image in zip(ids.tolist(), df['image'].tolist()):
+            # Images embedded in the dataset come as {'bytes': ..., 'path': ...}
+            if isinstance(image, dict):
+                image = image.get('bytes')
+            if isinstance(image, (str, bytes)) and image:
+                yield product_id, image
+            else:
+                print(f"Product {product_id} has no usable image value, skipping")
+    
+    def fetch_image(self, image):
+        """Returns the bytes of an image URL, or the image itself when it is already bytes"""
+        if isinstance(image, bytes):
+            return image
+        response = self.session.get(image, timeout=10)
+        response.raise_for_status()
+        return response.content
+    
+    def connect_tos(self):
+        """Creates the TOS client and checks bucket access, returns False when it fails"""
+        import tos  # only needed to talk to TOS, the pipeline runs with any client
+        
+        print(f"Initializing TOS client with endpoint {self.tos_endpoint}, region {self.tos_region}")
+        self.tos_client = tos.TosClientV2(self.tos_access_key, self.tos_secret_key,
+                                          self.tos_endpoint, self.tos_region)
+        try:
+            print(f"Testing access to bucket {self.tos_bucket}")
+            # Try to list objects to verify bucket access
+            self.tos_client.list_objects(self.tos_bucket, max_keys=1)
+            print(f"Successfully accessed bucket {self.tos_bucket}")
+            return True
+        except Exception as e:
+            print(f"ERROR accessing bucket {self.tos_bucket}: {e}")
+            traceback.print_exc()
+            return False
+    
+    def upload_bytes(self, object_key, data, content_type=None):
+        """Uploads image bytes to TOS, large ones in parallel parts, and returns the TOS path"""
+        if len(data) <= TOS_PART_SIZE:
+            self.tos_client.put_object(self.tos_bucket, object_key, content_type=content_type, content=data)
+        else:
+            upload_id = self.tos_client.create_multipart_upload(self.tos_bucket, object_key,
+                                                                content_type=content_type).upload_id
+            offsets = range(0, len(data), TOS_PART_SIZE)
+            try:
+                with ThreadPoolExecutor(max_workers=4, thread_name_prefix="tos-part") as pool:
+                    outputs = list(pool.map(
+                        lambda part: self.tos_client.upload_part(
+                            self.tos_bucket, object_key, upload_id, part[0] + 1,
+                            content=data[part[1]:part[1] + TOS_PART_SIZE]),
+                        enumerate(offsets)))
+                # the outputs carry the part numbers and ETags, in part order
+                self.tos_client.complete_multipart_upload(self.tos_bucket, object_key, upload_id, outputs)
+            except BaseException:
+                self.tos_client.abort_multipart_upload(self.tos_bucket, object_key, upload_id)
+                raise
+        return f"tos://{self.tos_bucket}/{object_key}"
+    
+    def transfer_images(self, df, max_dimension=None, quality=90, progress_every=100):
+        """Streams every image of the dataset to TOS
+        
+        Args:
+            df: Dataset with an 'image' column of URLs or embedded images.
+            max_dimension: Longest side kept, the images are re-encoded as JPEG
+                in a process pool. None uploads them unchanged.
+            quality: Highest JPEG quality used when re-encoding.
+            progress_every: Images between two progress lines.
+        
+        Returns:
+            tuple: ({product ID: TOS path}, TransferStats)
+        """
+        items = list(self.iter_images(df))
+        stats = TransferStats(len(items))
+        tos_paths = {}
+        if not items:
+            return tos_paths, stats
+        if self.tos_client is None and not self.connect_tos():
+            return tos_paths, stats
         
-        # Create a mapping of image paths to product IDs
-        image_paths = {}
+        # Taken before an image enters the pipeline and given back when it leaves,
+        # so downloads never run more than max_in_flight images ahead of the uploads
+        slots = threading.BoundedSemaphore(self.max_in_flight)
+        all_done = threading.Event()
+        remaining = [len(items)]
+        lock = threading.Lock()
         
-        for idx, row in df.iterrows():
+        downloads = ThreadPoolExecutor(max_workers=self.download_workers, thread_name_prefix="image-download")
+        uploads = ThreadPoolExecutor(max_workers=self.upload_workers, thread_name_prefix="image-upload")
+        resizes = ProcessPoolExecutor(max_workers=self.resize_workers) if max_dimension else None
+        
+        def finish(product_id, stage=None, error=None):
+            if error is not None:
+                stats.add(failed=1)
+                print(f"ERROR {stage} image of product {product_id}: {error}")
+            with lock:
+                remaining[0] -= 1
+                finished = stats.total - remaining[0]
+                if remaining[0] == 0:
+                    all_done.set()
+            slots.release()
+            if finished % progress_every == 0:
+                print(f"Progress: {stats}")
+        
+        def upload(product_id, data):
             try:
-                if 'image' not in row:
-                    print(f"Row {idx} does not have 'image' column")
-                    continue
-                    
-                if row['image'] is None:
-                    print(f"Row {idx} has None value for 'image'")
-                    continue
-                
-                # Print the type and value of the image field for debugging
-                print(f"Row {idx} image type: {type(row['image'])}, value: {row['image'][:100] if isinstance(row['image'], str) else 'non-string'}")
-                
-                # Handle string URLs
-                if isinstance(row['image'], str):
-                    # Create a unique filename for each image
-                    product_id = row.get('id', idx)
-                    filename = f"product_{product_id}.jpg"
-                    filepath = os.path.join(output_dir, filename)
-                    
-                    # Download image from URL
-                    print(f"Downloading from URL: {row['image']}")
-                    response = requests.get(row['image'], timeout=10)
-                    if response.status_code == 200:
-                        # Save the image to file
-                        with open(filepath, 'wb') as f:
-                            f.write(response.content)
-                        
-                        # Store the mapping of image path to product ID
-                        image_paths[filepath] = product_id
-                        
-                        print(f"Downloaded image to {filepath}")
-                    else:
-                        print(f"Failed to download image: HTTP {response.status_code}")
-                else:
-                    print(f"Row {idx} has non-string image value, skipping")
+                extension, content_type = image_type(data)
+                tos_path = self.upload_bytes(f"{OBJECT_PREFIX}/product_{product_id}.{extension}", data,
+                                             content_type)
             except Exception as e:
-                print(f"ERROR in download_images_to_local for row {idx}: {e}")
-                traceback.print_exc()
+                return finish(product_id, "uploading", e)
+            with lock:
+                tos_paths[product_id] = tos_path
+            stats.add(uploaded=1, bytes_out=len(data))
+            finish(product_id)
         
-        print(f"Downloaded {len(image_paths)} images successfully")
-        return image_paths
-    
-    def upload_images_to_tos(self, local_dir):
-        """Upload images from local directory to BytePlus Object Storage"""
-        # Dictionary to store TOS paths
-        tos_paths = {}
+        def resized(product_id, future):
+            error = future.exception()
+            if error is not None:
+                return finish(product_id, "resizing", error)
+            stats.add(resized=1)
+            uploads.submit(upload, product_id, future.result())
         
-        try:
-            # Check if directory exists and has files
-            if not os.path.exists(local_dir):
-                print(f"ERROR: Local directory {local_dir} does not exist")
-                return {}
-                
-            files = os.listdir(local_dir)
-            print(f"Found {len(files)} files in {local_dir}")
-            
-            if len(files) == 0:
-                print(f"ERROR: No files found in {local_dir}")
-                return {}
-            
-            # Initialize TOS client
-            print(f"Initializing TOS client with endpoint {self.tos_endpoint}, region {self.tos_region}")
-            tos_client = tos.TosClientV2(self.tos_access_key, self.tos_secret_key, 
-                                         self.tos_endpoint, self.tos_region)
-            
-            # Test bucket access
+        def download(product_id, image):
             try:
-                print(f"Testing access to bucket {self.tos_bucket}")
-                # Try to list objects to verify bucket access
-                tos_client.list_objects(self.tos_bucket, max_keys=1)
-                print(f"Successfully accessed bucket {self.tos_bucket}")
+                data = self.fetch_image(image)
             except Exception as e:
-                print(f"ERROR accessing bucket {self.tos_bucket}: {e}")
-                traceback.print_exc()
-                return {}
-            
-            def upload_dir(root_dir):
-                file_list = os.listdir(root_dir)
-                for item in file_list:
-                    path = os.path.join(root_dir, item)
-                    if os.path.isdir(path):
-                        upload_dir(path)
-                    
-                    if os.path.isfile(path):
-                        # Create object key (relative path from local_dir)
-                        rel_path = os.path.relpath(path, local_dir)
-                        object_key = f"fashion_products/{rel_path}"
-                        
-                        # Upload file to TOS
-                        try:
-                            print(f"Uploading {path} to {object_key}")
-                            tos_client.put_object_from_file(self.tos_bucket, object_key, path)
-                            
-                            # Store TOS path
-                            tos_path = f"tos://{self.tos_bucket}/{object_key}"
-                            tos_paths[path] = tos_path
-                            
-                            print(f"Uploaded {path} to {tos_path}")
-                        except Exception as e:
-                            print(f"ERROR uploading {path}: {e}")
-                            traceback.print_exc()
-            
-            upload_dir(local_dir)
-            print(f"Uploaded {len(tos_paths)} files to TOS")
-            return tos_paths
-            
-        except tos.exceptions.TosClientError as e:
-            print(f'Failed with TOS client error, message: {e.message}, cause: {e.cause}')
-            traceback.print_exc()
-        except tos.exceptions.TosServerError as e:
-            print(f'Failed with TOS server error, code: {e.code}')
-            print(f'Error with request id: {e.request_id}')
-            print(f'Error with message: {e.message}')
-            print(f'Error with http code: {e.status_code}')
-            print(f'Error with ec: {e.ec}')
-            print(f'Error with request url: {e.request_url}')
-            traceback.print_exc()
-        except Exception as e:
-            print(f'Failed with unknown error: {e}')
-            traceback.print_exc()
+                return finish(product_id, "downloading", e)
+            stats.add(downloaded=1, bytes_in=len(data))
+            if resizes is None:
+                uploads.submit(upload, product_id, data)
+                return
+            try:
+                future = resizes.submit(_reencode, data, max_dimension, quality)
+            except Exception as e:  # the process pool broke
+                return finish(product_id, "resizing", e)
+            future.add_done_callback(lambda f: resized(product_id, f))
         
-        return {}
+        try:
+            for product_id, image in items:
+                slots.acquire()
+                downloads.submit(download, product_id, image)
+            all_done.wait()
+        finally:
+            downloads.shutdown(wait=True)
+            uploads.shutdown(wait=True)
+            if resizes is not None:
+                resizes.shutdown(wait=True)
+        
+        stats.finished = time.monotonic()
+        print(f"Transfer finished: {stats}")
+        return tos_paths, stats
     
     def update_dataframe_with_tos_paths(self, df, image_tos_paths):
         """Update dataframe with TOS paths for images"""
-        try:
-            # Create a new column for TOS paths
-            df['image_tos_path'] = None
-            
-            if len(image_tos_paths) == 0:
-                print("WARNING: No TOS paths to update in dataframe")
-                return df
-            
-            updated_count = 0
-            for idx, row in df.iterrows():
-                product_id = row.get('id', idx)
-                
-                # Look for the TOS path in our mapping
-                for local_path, tos_path in image_tos_paths.items():
-                    if f"product_{product_id}.jpg" in local_path:
-                        df.at[idx, 'image_tos_path'] = tos_path
-                        updated_count += 1
-                        break
-            
-            print(f"Updated {updated_count} rows with TOS paths")
-            return df
-        except Exception as e:
-            print(f"ERROR in update_dataframe_with_tos_paths: {e}")
-            traceback.print_exc()
-            return df
+        ids = df['id'] if 'id' in df.columns else pd.Series(df.index, index=df.index)
+        # One dict lookup per row
+        df['image_tos_path'] = ids.map(image_tos_paths)
+        print(f"Updated {df['image_tos_path'].notna().sum()} rows with TOS paths")
+        return df
     
-    def process_dataset(self, dataset_name, temp_dir=None):
-        """Process the dataset: download, upload to TOS, and update dataframe"""
-        # Create a temporary directory if not provided
-        if temp_dir is None:
-            temp_dir = os.path.join(os.getcwd(), "fashion_images_temp")
+    def process_dataset(self, dataset_name, max_dimension=None):
+        """Process the dataset: copy its images to TOS and update dataframe"""
+        print(f"=== STEP 1: LOADING DATASET ===")
+        # Load dataset
+        df = self.load_dataset(dataset_name)
+        if df.empty:
+            print("ERROR: Failed to load dataset, exiting")
+            return None
         
-        try:
-            print(f"=== STEP 1: LOADING DATASET ===")
-            # Load dataset
-            df = self.load_dataset(dataset_name)
-            if df.empty:
-                print("ERROR: Failed to load dataset, exiting")
-                return None
-            
-            print(f"\n=== STEP 2: DOWNLOADING IMAGES ===")
-            # Download images to local folder
-            print(f"Downloading images to {temp_dir}...")
-            image_paths = self.download_images_to_local(df, temp_dir)
-            if not image_paths:
-                print("ERROR: Failed to download any images, exiting")
-                return None
-            
-            print(f"\n=== STEP 3: UPLOADING IMAGES TO TOS ===")
-            # Upload images to BytePlus Object Storage
-            print(f"Uploading images to BytePlus Object Storage...")
-            image_tos_paths = self.upload_images_to_tos(temp_dir)
-            if not image_tos_paths:
-                print("ERROR: Failed to upload images to TOS, exiting")
-                return None
-            
-            print(f"\n=== STEP 4: UPDATING DATAFRAME ===")
-            # Update dataframe with TOS paths
-            df = self.update_dataframe_with_tos_paths(df, image_tos_paths)
-            
-            # Save the processed dataframe to CSV
-            output_csv = "fashion_products_with_tos_paths.csv"
-            df.to_csv(output_csv, index=False)
-            print(f"Saved processed dataset to {output_csv}")
-            
-            return df
-            
-        finally:
-            # Clean up temporary directory
-            if os.path.exists(temp_dir):
-                print(f"Cleaning up temporary directory {temp_dir}...")
-                shutil.rmtree(temp_dir)
+        print(f"\n=== STEP 2: COPYING IMAGES TO TOS ===")
+        # Download, optionally resize, and upload the images in one pipeline
+        image_tos_paths, stats = self.transfer_images(df, max_dimension=max_dimension)
+        if not image_tos_paths:
+            print("ERROR: Failed to upload any images to TOS, exiting")
+            return None
+        
+        print(f"\n=== STEP 3: UPDATING DATAFRAME ===")
+        # Update dataframe with TOS paths
+        df = self.update_dataframe_with_tos_paths(df, image_tos_paths)
+        
+        # Save the processed dataframe to CSV
+        output_csv = "fashion_products_with_tos_paths.csv"
+        df.to_csv(output_csv, index=False)
+        print(f"Saved processed dataset to {output_csv}")
+        
+        return df
 
 if __name__ == "__main__":
     # BytePlus Object Storage credentials from .env file
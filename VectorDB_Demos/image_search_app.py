@@ -1,5 +1,4 @@
 import streamlit as st
-import base64
 from io import BytesIO
 import pandas as pd
 from PIL import Image
@@ -8,6 +7,16 @@ import requests
 import json
 from volcengine.viking_db import *
 from dotenv import load_dotenv
+import sys
+
+# image_tools lives at the repository root, next to this demo
+root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if root_dir not in sys.path:
+    sys.path.insert(0, root_dir)
+
+from image_tools import prepare_image
+from vikingdb_cache import DEFAULT_CACHE_PATH, SearchCache, TranslationCache
+from vikingdb_query import Query
 
 # Load environment variables from .env file
 load_dotenv()
@@ -25,7 +34,17 @@ SKYLARK_API_URL = os.getenv("SKYLARK_API_URL")
 SKYLARK_API_KEY = os.getenv("SKYLARK_API_KEY")
 SKYLARK_MODEL = os.getenv("SKYLARK_MODEL")
 
-def translate_to_english(text):
+# Translations and search results are cached once per server, shared by every
+# rerun and session, so widget interactions do not repeat LLM calls or searches
+@st.cache_resource
+def get_caches():
+    return TranslationCache(path=DEFAULT_CACHE_PATH), SearchCache("product_search", path=DEFAULT_CACHE_PATH)
+
+translation_cache, search_cache = get_caches()
+
+PRODUCT_FIELDS = ["productDisplayName", "baseColour", "image"]
+
+def request_translation(text):
     """
     Translate non-English or mixed language text to English using Skylark LLM
     """
@@ -42,12 +61,23 @@ def translate_to_english(text):
         ]
     }
     
+    response = requests.post(SKYLARK_API_URL, headers=headers, json=payload)
+    response.raise_for_status()  # Raise an exception for HTTP errors
+    
+    result = response.json()
+    choices = result.get("choices") or [{}]
+    translated_text = ((choices[0].get("message") or {}).get("content") or "").strip()
+    # an empty answer would be cached for a week and searched for instead of the query
+    if not translated_text:
+        raise ValueError("The translation service returned an empty translation")
+    return translated_text
+
+def translate_to_english(text):
+    """
+    Translate text to English, failed translations are not cached
+    """
     try:
-        response = requests.post(SKYLARK_API_URL, headers=headers, json=payload)
-        response.raise_for_status()  # Raise an exception for HTTP errors
-        
-        result = response.json()
-        translated_text = result.get("choices", [{}])[0].get("message", {}).get("content", "")
+        translated_text = translation_cache.translate(text, request_translation)
         
         # Log the translation for debugging
         st.session_state.translation_log = f"Original: '{text}' → Translated: '{translated_text}'"
@@ -81,12 +111,8 @@ def search_with_text(text_query):
         english_query = translate_to_english(text_query)
         
         # Use the translated query for search
-        results = index.search_with_multi_modal(
-            text=english_query,
-            limit=10,  # Get top 10 similar images
-            need_instruction=False,
-            output_fields=["productDisplayName", "baseColour", "image"]
-        )
+        results = Query(text=english_query, need_instruction=False, output_fields=PRODUCT_FIELDS) \
+            .search(index, 10, cache=search_cache)  # Get top 10 similar images
         return results, english_query
     except Exception as e:
         st.error(f"Error searching with text: {str(e)}")
@@ -98,16 +124,16 @@ def search_with_image(image_file):
         # Read the image file
         image_bytes = image_file.getvalue()
         
-        # Convert to base64 for API
-        image_base64 = base64.b64encode(image_bytes).decode('utf-8')
+        # Convert to base64 for API, large photos are downscaled first since
+        # the embedding model works on far fewer pixels anyway
+        image_base64 = prepare_image(image_bytes, max_dimension=2048).base64()
         
         # Search using the image - add the required "base64://" prefix
-        results = index.search_with_multi_modal(
+        results = Query(
             image=f"base64://{image_base64}",  # Add the required prefix
-            limit=10,  # Get top 10 similar images
             need_instruction=False,
-            output_fields=["productDisplayName", "baseColour", "image"]
-        )
+            output_fields=PRODUCT_FIELDS
+        ).search(index, 10, cache=search_cache)  # Get top 10 similar images
         return results
     except Exception as e:
         st.error(f"Error searching with image: {str(e)}")
@@ -205,4 +231,6 @@ with tab2:
 
 # Add a collapsible section for debugging translation
 with st.expander("Debug Information", expanded=False):
-    st.write(st.session_state.translation_log)
\ No newline at end of file
+    st.write(st.session_state.translation_log)
+    st.write(str(translation_cache.stats()))
+    st.write(str(search_cache.stats()))
\ No newline at end of file
@@ -3,6 +3,15 @@ from volcengine.viking_db import *
 import os
 from dotenv import load_dotenv
 import re
+import sys
+
+# vikingdb_query lives in VectorDB_Demos, one level up
+demos_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if demos_dir not in sys.path:
+    sys.path.insert(0, demos_dir)
+
+from vikingdb_cache import DEFAULT_CACHE_PATH, SearchCache
+from vikingdb_query import Query
 
 # Load environment variables from .env file
 load_dotenv()
@@ -15,6 +24,14 @@ vikingdb_service.set_sk(os.getenv("VIKINGDB_SK"))
 # Get the index (do this once during initialization)
 index = vikingdb_service.get_index("Ankur_NewsRAG_Collection", "Ankur_NewsRAG_Index")
 
+# One search cache per server, shared by every rerun and session, so widget
+# interactions do not send the same searches again
+@st.cache_resource
+def get_search_cache():
+    return SearchCache("news_search", path=DEFAULT_CACHE_PATH)
+
+search_cache = get_search_cache()
+
 # Define available categories
 CATEGORIES = ["business", "sports", "international", "politics", "bollywood"]
 
@@ -40,106 +57,59 @@ def search_news_articles(query, limit=3, language=None, category=None):
     #if language == 'hindi':
      #   query = re.sub(r'[़-ॿ]', lambda x: x.group().normalize('NFKD'), query)  # Normalize diacritics
     try:
+        language = language if language and language != "all" else None
+        output_fields = ["id", "headline", "summary", "category", "url", "imageurl", "language", "publishdate"]
+
         # Scenario 1: Category button clicked (category-based filtering)
         if category and not query:
-            search_params = {
-                "text": category,
-                "limit": limit,
-                "filter": {
-                    "op": "and",
-                    "conds": [
-                        {"op": "must", "field": "language", "conds": [language]},
-                        {"op": "must", "field": "category", "conds": [category]}
-                    ]
-                } if language and language != "all" else {
-                    "op": "must",
-                    "field": "category",
-                    "conds": [category]
-                },
-                "need_instruction": False,
-                "output_fields": ["id", "headline", "summary", "category", "url", "imageurl", "language", "publishdate"]
-            }
-        
-        # Scenario 2: User typed query (semantic search)
-        else:
-            search_params = {
-                "text": query,
-                "limit": 50,
-                "dense_weight": 0.7,  # Increased from default 0.5 <mcreference link="https://docs.byteplus.com/en/docs/VikingDB/pysdk_search_with_multi_modal#request-parameters" index="0">0</mcreference>
-                "filter": {
-                    "op": "must",
-                    "field": "language",
-                    "conds": [language]
-                } if language and language != "all" else None,
-                "need_instruction": False,
-                "output_fields": ["id", "headline", "summary", "category", "url", "imageurl", "language", "publishdate"]
-            }
-        
-        # Search for articles using multimodal search
-        results = index.search_with_multi_modal(**search_params)
-        
-        # Log the search results for debugging
-        if results:
-            print(f"Found {len(results)} results for query: {query or category}")
-            
-            # Scenario 2: Post-process results for semantic search
-            if not category and query:
-                # Group results by category while preserving relevance order
-                category_groups = {}
-                for result in results:
-                    cat = result.fields.get('category', 'unknown')
-                    if cat not in category_groups:
-                        category_groups[cat] = []
-                    category_groups[cat].append(result)
-                
-                # Sort each category group by relevance score (highest first)
-                for cat in category_groups:
-                    category_groups[cat].sort(
-                        key=lambda x: x.score, 
-                        reverse=True
-                    )
-                
-                # Calculate category relevance (average score of top 3 results per category)
-                category_relevance = {}
-                for cat, cat_results in category_groups.items():
-                    top_results = cat_results[:3]
-                    avg_score = sum(r.score for r in top_results) / len(top_results)
-                    category_relevance[cat] = avg_score
-                
-                # Sort categories by relevance
-                sorted_categories = sorted(category_relevance.keys(), 
-                                         key=lambda x: category_relevance[x], 
-                                         reverse=True)
-                
-                # Select up to 3 results per category, prioritizing most relevant categories
-                final_results = []
-                max_results_per_category = 3
-                
-                for cat in sorted_categories:
-                    if len(final_results) >= limit:
-                        break
-                    
-                    cat_results = category_groups[cat][:max_results_per_category]
-                    remaining_slots = limit - len(final_results)
-                    
-                    # Add results from this category
-                    for result in cat_results[:remaining_slots]:
-                        final_results.append(result)
-                        if len(final_results) >= limit:
-                            break
-                
-                print(f"Final results distribution: {[(r.fields.get('category'), r.fields.get('id'), r.score) for r in final_results]}")
-                return final_results
-            
-            # Scenario 1: Sort by publishdate for category search
-            else:
-                results.sort(
-                    key=lambda x: x.fields.get('publishdate', ''), 
-                    reverse=True
-                )
-        
-        # Return only the top 'limit' results
-        return results[:limit]
+            results = Query(text=category, need_instruction=False, output_fields=output_fields) \
+                .where("language", language).where("category", category).search(index, limit, cache=search_cache)
+            print(f"Found {len(results)} results for category: {category}")
+            # Sort by publishdate for category search
+            results.sort(key=lambda x: x.fields.get('publishdate', ''), reverse=True)
+            return results
+
+        # Scenario 2: User typed query (semantic search), language and category
+        # filters run in VikingDB so only the hits we show are fetched
+        search = Query(
+            text=query,
+            dense_weight=0.7,  # Increased from default 0.5 <mcreference link="https://docs.byteplus.com/en/docs/VikingDB/pysdk_search_with_multi_modal#request-parameters" index="0">0</mcreference>
+            need_instruction=False,
+            output_fields=output_fields,
+        ).where("language", language).where("category", category)
+        if category:
+            return search.search(index, limit, cache=search_cache)
+
+        # Rank categories by the average score of their top 3 hits among a few
+        # candidates per slot
+        max_results_per_category = 3
+        results = search.search(index, limit * max_results_per_category, cache=search_cache)
+        print(f"Found {len(results)} results for query: {query}")
+
+        # Group results by category while preserving relevance order
+        category_groups = {}
+        for result in results:
+            category_groups.setdefault(result.fields.get('category', 'unknown'), []).append(result)
+        category_relevance = {
+            cat: sum(r.score for r in cat_results[:3]) / len(cat_results[:3])
+            for cat, cat_results in category_groups.items()
+        }
+        sorted_categories = sorted(category_relevance, key=category_relevance.get, reverse=True)
+
+        # Select up to 3 results per category, prioritizing most relevant categories
+        final_results = []
+        for cat in sorted_categories:
+            if len(final_results) >= limit:
+                break
+            wanted = min(max_results_per_category, limit - len(final_results))
+            cat_results = category_groups[cat][:wanted]
+            if len(cat_results) < wanted and cat != 'unknown':
+                # the candidates hold too few, ask VikingDB for the category's best
+                cat_results = search.where("category", cat).search(index, wanted, cache=search_cache)
+            final_results.extend(cat_results)
+
+        print(f"Final results distribution: {[(r.fields.get('category'), r.fields.get('id'), r.score) for r in final_results]}")
+        return final_results
     except Exception as e:
         st.error(f"Error searching for news articles: {str(e)}")
         print(f"ERROR - {str(e)}")
@@ -303,4 +273,6 @@ for message in st.session_state.chat_history:
 # Display news article cards if we have results from the current query
 if user_query or selected_category:
     st.write("### Relevant News Articles")
-    display_news_cards(results)
\ No newline at end of file
+    display_news_cards(results)
+
+st.sidebar.caption(str(search_cache.stats()))
@@ -1,75 +1,48 @@
 from volcengine.viking_db import *
 import asyncio
+import os
+import sys
 import pandas as pd
-import math
-import random
-import time
+
+# vikingdb_ingest lives in VectorDB_Demos, one level up
+demos_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if demos_dir not in sys.path:
+    sys.path.insert(0, demos_dir)
+
+from vikingdb_ingest import IngestEngine, Ledger, build_rows, stable_id
 
 # Initialize VikingDB service
 vikingdb_service = VikingDBService("api-vikingdb.mlp.ap-mya.byteplus.com", "ap-southeast-1")
 vikingdb_service.set_ak("<BytePlus API Key>")
 vikingdb_service.set_sk("<BytePlus Secret Key>")
 
-async def batch_upsert_data(df, batch_size=10, delay_seconds=2):
+# Fields of the news collection and their types,
+# no vector field as BytePlus VectorDB will handle vectorization
+NEWS_SCHEMA = {
+    "id": int,  # stable_id(language code, original ID), as in upload_news_dataset.py
+    "headline": str,
+    "summary": str,
+    "category": str,
+    "url": str,
+    "imageurl": str,
+    "language": str,
+    "original_id": int,  # Keep the original ID as a reference
+}
+
+async def batch_upsert_data(df, batch_size=10, concurrency=4, ledger=None):
     # Get the collection
     collection = await vikingdb_service.async_get_collection("Ankur_NewsRAG_Collection")
-    total_records = len(df)
-    num_batches = math.ceil(total_records / batch_size)
     
-    for i in range(num_batches):
-        start_idx = i * batch_size
-        end_idx = min((i + 1) * batch_size, total_records)
-        batch_df = df[start_idx:end_idx]
-        
-        data_batch = []
-        for idx, row in batch_df.iterrows():
-            # Create field dictionary with all required fields
-            field = {
-                "id": int(idx),  # Using index as ID
-                "headline": str(row['headline']),
-                "summary": str(row['summary']),
-                "category": str(row['category']),
-                "url": str(row['url']),
-                "imageurl": str(row['imageurl']),
-                "language": str(row['language'])
-                # No need to add vector field as BytePlus VectorDB will handle vectorization
-            }
-            data_batch.append(Data(field))
-        
-        # Implement retry logic with exponential backoff
-        max_retries = 5
-        retry_count = 0
-        retry_delay = delay_seconds
-        
-        while retry_count < max_retries:
-            try:
-                # Upload batch to VectorDB
-                await collection.async_upsert_data(data_batch)
-                print(f"Batch {i+1}/{num_batches} completed. Records {start_idx+1} to {end_idx} processed.")
-                
-                # Add delay between batches to avoid rate limiting
-                if i < num_batches - 1:  # No need to delay after the last batch
-                    print(f"Waiting {delay_seconds} seconds before next batch...")
-                    await asyncio.sleep(delay_seconds)
-                
-                # If successful, break out of retry loop
-                break
-                
-            except Exception as e:
-                if "token usage has reached the maximum limit" in str(e):
-                    retry_count += 1
-                    print(f"Rate limit exceeded. Retry {retry_count}/{max_retries} after {retry_delay} seconds...")
-                    await asyncio.sleep(retry_delay)
-                    # Exponential backoff
-                    retry_delay *= 2
-                else:
-                    # If it's not a rate limit error, print it and continue
-                    print(f"Error processing batch {i+1}: {str(e)}")
-                    break
-        
-        # If we've exhausted all retries, report the error
-        if retry_count >= max_retries:
-            print(f"Failed to process batch {i+1} after {max_retries} retries. Continuing with next batch.")
+    # IDs derive from the language and the original ID, not the row position, so
+    # a reordered or filtered file keeps every record on its key
+    ids = [stable_id(language, original_id) for language, original_id in zip(df["language"], df["id"])]
+    rows = build_rows(df.assign(original_id=df["id"], id=ids), NEWS_SCHEMA)
+    
+    # Batch size and concurrency adapt to throttling instead of sleeping between batches
+    engine = IngestEngine(collection, batch_size=batch_size, concurrency=concurrency)
+    stats = await engine.ingest(rows, ledger)
+    print(f"Upload finished: {stats}")
+    return stats
 
 async def main():
     # Read the CSV file with UTF-8-SIG encoding
@@ -80,23 +53,28 @@ async def main():
     # Ask user for confirmation before proceeding
     print(f"\nWARNING: You are about to upload {len(df)} records to VectorDB.")
     print("This operation may be rate-limited by the service.")
-    print("Recommended settings:")
-    print("- Batch size: 10 (smaller to reduce load)")
-    print("- Delay between batches: 5 seconds (to avoid rate limiting)")
+    print("Batch size and concurrency are adjusted automatically when the service throttles.")
+    print("Recommended starting settings:")
+    print("- Batch size: 10")
+    print("- Concurrent batches: 4")
     
-    # Get user input for batch size and delay
+    # Get user input for batch size and concurrency
     try:
         batch_size = int(input("Enter batch size (default: 10): ") or 10)
-        delay = float(input("Enter delay between batches in seconds (default: 5): ") or 5)
+        concurrency = int(input("Enter concurrent batches (default: 4): ") or 4)
     except ValueError:
-        print("Invalid input. Using default values: batch_size=10, delay=5")
+        print("Invalid input. Using default values: batch_size=10, concurrency=4")
         batch_size = 10
-        delay = 5
+        concurrency = 4
     
-    # Process and upload the data
-    print(f"Uploading {len(df)} records to VectorDB with batch size {batch_size} and {delay}s delay")
-    await batch_upsert_data(df, batch_size=batch_size, delay_seconds=delay)
-    print("All data has been uploaded successfully!")
+    # Process and upload the data, records already uploaded unchanged are skipped
+    print(f"Uploading {len(df)} records to VectorDB, batch size {batch_size}, {concurrency} batches in flight")
+    ledger = Ledger("Ankur_NewsRAG_Collection", key="id")
+    stats = await batch_upsert_data(df, batch_size=batch_size, concurrency=concurrency, ledger=ledger)
+    if stats.failed:
+        print(f"{stats.failed} records failed, run the script again to retry them.")
+    else:
+        print("All data has been uploaded successfully!")
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
@@ -0,0 +1,166 @@
+"""Tests for the dataset image transfer, with the download session and the TOS client faked."""
+
+import io
+import os
+import threading
+
+import pandas as pd
+import pytest
+import requests
+from PIL import Image
+
+import dataset_image_handler
+from dataset_image_handler import DatasetImageHandler, image_type
+
+
+def encode(format, size=(64, 48), **params):
+    buffer = io.BytesIO()
+    Image.new("RGB", size, (200, 30, 60)).save(buffer, format, **params)
+    return buffer.getvalue()
+
+
+JPEG = encode("JPEG")
+PNG = encode("PNG")
+WEBP = encode("WEBP")
+
+
+def large_png():
+    # random pixels, so the PNG stays large enough for a multipart upload
+    buffer = io.BytesIO()
+    Image.frombytes("RGB", (128, 128), os.urandom(128 * 128 * 3)).save(buffer, "PNG")
+    return buffer.getvalue()
+
+
+class FakeResponse:
+    def __init__(self, status_code, content=b""):
+        self.status_code = status_code
+        self.content = content
+
+    def raise_for_status(self):
+        if self.status_code != 200:
+            raise requests.HTTPError(f"{self.status_code} error")
+
+
+class FakeSession:
+    """Serves ``images`` by URL, anything else is a 404."""
+
+    def __init__(self, images):
+        self.images = images
+
+    def get(self, url, timeout=None):
+        if url in self.images:
+            return FakeResponse(200, self.images[url])
+        return FakeResponse(404)
+
+
+class FakeTosClient:
+    """Keeps uploaded objects with their content type, multipart parts in memory."""
+
+    def __init__(self):
+        self.objects = {}
+        self.content_types = {}
+        self.multipart = []
+        self.lock = threading.Lock()
+
+    def put_object(self, bucket, key, content_type=None, content=None):
+        with self.lock:
+            self.objects[key] = content
+            self.content_types[key] = content_type
+
+    def create_multipart_upload(self, bucket, key, content_type=None):
+        with self.lock:
+            self.multipart.append(key)
+            self.content_types[key] = content_type
+        return type("Upload", (), {"upload_id": "upload-%s" % key})()
+
+    def upload_part(self, bucket, key, upload_id, part_number, content=None):
+        return part_number, content
+
+    def complete_multipart_upload(self, bucket, key, upload_id, parts):
+        assert [number for number, _ in parts] == list(range(1, len(parts) + 1))
+        with self.lock:
+            self.objects[key] = b"".join(content for _, content in parts)
+
+    def abort_multipart_upload(self, bucket, key, upload_id):
+        raise AssertionError("no upload should be aborted")
+
+
+def handler(images):
+    h = DatasetImageHandler("ak", "sk", "endpoint", "region", "bucket", download_workers=4, upload_workers=4,
+                            resize_workers=1, max_in_flight=2)
+    h.session = FakeSession(images)
+    h.tos_client = FakeTosClient()
+    return h
+
+
+def key(product_id, extension):
+    return f"{dataset_image_handler.OBJECT_PREFIX}/product_{product_id}.{extension}"
+
+
+def test_image_type_comes_from_the_header():
+    assert image_type(JPEG) == ("jpg", "image/jpeg")
+    assert image_type(PNG) == ("png", "image/png")
+    assert image_type(WEBP) == ("webp", "image/webp")
+    with pytest.raises(ValueError):
+        image_type(b"<html>not found</html>")
+
+
+def test_transfer_keeps_the_real_format_and_reports_failures():
+    h = handler({"https://img/1": JPEG, "https://img/2": PNG, "https://img/4": b"<html>oops</html>"})
+    df = pd.DataFrame({"id": [1, 2, 3, 4, 5],
+                       "image": ["https://img/1", "https://img/2", "https://img/3", "https://img/4",
+                                 {"bytes": WEBP, "path": "5.webp"}]})
+
+    paths, stats = h.transfer_images(df, progress_every=1000)
+
+    assert paths == {1: "tos://bucket/" + key(1, "jpg"), 2: "tos://bucket/" + key(2, "png"),
+                     5: "tos://bucket/" + key(5, "webp")}
+    objects = h.tos_client.objects
+    assert objects[key(1, "jpg")] == JPEG and objects[key(2, "png")] == PNG and objects[key(5, "webp")] == WEBP
+    assert h.tos_client.content_types[key(2, "png")] == "image/png"
+    # 3 failed to download, 4 is not an image
+    assert (stats.downloaded, stats.uploaded, stats.failed) == (4, 3, 2)
+    assert stats.finished is not None
+
+
+def test_resized_images_are_uploaded_as_jpeg_and_resize_failures_counted():
+    h = handler({"https://img/1": PNG, "https://img/2": b"not an image"})
+    df = pd.DataFrame({"id": [1, 2], "image": ["https://img/1", "https://img/2"]})
+
+    paths, stats = h.transfer_images(df, max_dimension=32, progress_every=1000)
+
+    assert list(paths) == [1]
+    data = h.tos_client.objects[key(1, "jpg")]
+    with Image.open(io.BytesIO(data)) as image:
+        assert image.format == "JPEG"
+        assert max(image.size) == 32
+    assert h.tos_client.content_types[key(1, "jpg")] == "image/jpeg"
+    assert (stats.resized, stats.uploaded, stats.failed) == (1, 1, 1)
+
+
+def test_large_images_use_a_multipart_upload(monkeypatch):
+    monkeypatch.setattr(dataset_image_handler, "TOS_PART_SIZE", 4096)
+    data = large_png()
+    assert len(data) > 3 * 4096
+    h = handler({"https://img/1": data})
+    df = pd.DataFrame({"id": [1], "image": ["https://img/1"]})
+
+    paths, stats = h.transfer_images(df, progress_every=1000)
+
+    assert paths == {1: "tos://bucket/" + key(1, "png")}
+    assert h.tos_client.multipart == [key(1, "png")]
+    assert h.tos_client.objects[key(1, "png")] == data
+    assert h.tos_client.content_types[key(1, "png")] == "image/png"
+
+
+def test_tos_paths_are_joined_by_product_id():
+    h = handler({})
+    df = pd.DataFrame({"id": [3, 1, 2], "name": ["c", "a", "b"]})
+    df = h.update_dataframe_with_tos_paths(df, {1: "tos://bucket/a.jpg", 3: "tos://bucket/c.png"})
+    assert df["image_tos_path"].tolist()[:2] == ["tos://bucket/c.png", "tos://bucket/a.jpg"]
+    assert pd.isna(df["image_tos_path"].iloc[2])
+
+    # without an id column the index is the product ID
+    df = h.update_dataframe_with_tos_paths(pd.DataFrame({"name": ["a", "b"]}), {1: "tos://bucket/b.webp"})
+    assert pd.isna(df["image_tos_path"].iloc[0])
+    assert df["image_tos_path"].iloc[1] == "tos://bucket/b.webp"
@@ -0,0 +1,186 @@
+"""Tests for the query, translation and search caches."""
+
+import sqlite3
+
+import pytest
+
+import vikingdb_cache
+from vikingdb_cache import QueryCache, SearchCache, TranslationCache, normalize_text, search_key
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(vikingdb_cache.time, "time", clock)
+    return clock
+
+
+class FakeIndex:
+    collection_name = "music"
+    index_name = "music_index"
+
+    def __init__(self):
+        self.calls = 0
+
+    def search_with_multi_modal(self, **arguments):
+        self.calls += 1
+        return [{"song": arguments.get("text"), "limit": arguments["limit"]}]
+
+
+def test_normalize_text():
+    assert normalize_text("  Calm\tPIANO  music ") == "calm piano music"
+    assert normalize_text("ｃａｌｍ") == "calm"
+
+
+def test_lru_evicts_the_least_recently_used(clock):
+    cache = QueryCache("test", max_entries=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == (1, 3)
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.evictions, stats.size) == (3, 1, 1, 2)
+
+
+def test_entries_expire_after_ttl(clock):
+    cache = QueryCache("test", ttl=10)
+    cache.put("a", 1)
+    clock.now += 10
+    assert cache.get("a") == 1
+    clock.now += 1
+    assert cache.get("a") is None
+    assert cache.stats().expired == 1
+
+
+def test_entries_persist_across_instances(clock, tmp_path):
+    path = str(tmp_path / "cache.db")
+    cache = QueryCache("test", ttl=60, path=path)
+    cache.put("a", {"hits": [1, 2]})
+    cache.put("lock", vikingdb_cache.threading.Lock())  # not picklable, memory only
+    cache.close()
+
+    warm = QueryCache("test", ttl=60, path=path)
+    assert warm.get("a") == {"hits": [1, 2]}
+    assert warm.get("lock") is None
+    assert QueryCache("other", path=path).get("a") is None
+    clock.now += 61
+    assert QueryCache("test", ttl=60, path=path).get("a") is None
+
+
+def persisted(path, name="test"):
+    conn = sqlite3.connect(path)
+    try:
+        return sorted(row[0] for row in conn.execute("SELECT cache_key FROM entries WHERE cache = ?", (name,)))
+    finally:
+        conn.close()
+
+
+def test_expired_entries_are_counted_once_and_deleted_from_the_file(clock, tmp_path):
+    path = str(tmp_path / "cache.db")
+    cache = QueryCache("test", ttl=10, path=path)
+    cache.put("a", 1)
+    clock.now += 11
+    assert cache.get("a") is None
+    stats = cache.stats()
+    assert (stats.expired, stats.misses) == (1, 1)
+    assert persisted(path) == []
+
+    cache.put("b", 2)
+    cache.close()
+    # only in the file this time
+    cold = QueryCache("test", ttl=10, path=path)
+    clock.now += 11
+    assert cold.get("b") is None
+    assert cold.stats().expired == 1
+    assert persisted(path) == []
+
+
+def test_evicted_entries_are_deleted_from_the_file(clock, tmp_path):
+    path = str(tmp_path / "cache.db")
+    cache = QueryCache("test", max_entries=2, path=path)
+    for key in "abc":
+        cache.put(key, key)
+    assert persisted(path) == ["b", "c"]
+    assert cache.get("a") is None
+
+    assert cache.get("b") == "b"
+    cache.put("d", "d")
+    assert persisted(path) == ["b", "d"]
+
+
+def test_opening_trims_the_file_to_max_entries(clock, tmp_path):
+    path = str(tmp_path / "cache.db")
+    cache = QueryCache("test", max_entries=10, path=path)
+    for i in range(5):
+        clock.now += 1
+        cache.put(str(i), i)
+    cache.close()
+
+    small = QueryCache("test", max_entries=2, path=path)
+    assert persisted(path) == ["3", "4"]
+    assert small.get("4") == 4
+
+
+def test_unpicklable_put_removes_the_persisted_value(tmp_path):
+    path = str(tmp_path / "cache.db")
+    cache = QueryCache("test", path=path)
+    cache.put("a", 1)
+    cache.put("a", vikingdb_cache.threading.Lock())
+    assert persisted(path) == []
+
+
+def test_get_or_compute_does_not_cache_errors():
+    cache = QueryCache("test")
+
+    def fail():
+        raise ValueError("empty translation")
+
+    with pytest.raises(ValueError):
+        cache.get_or_compute("a", fail)
+    assert cache.get_or_compute("a", lambda: 2) == 2
+    assert cache.get_or_compute("a", fail) == 2
+
+
+def test_translations_are_keyed_by_normalised_text_and_language():
+    calls = []
+
+    def translate(text):
+        calls.append(text)
+        return "calm piano"
+
+    cache = TranslationCache()
+    assert cache.translate("Piano  tranquille", translate) == "calm piano"
+    assert cache.translate("piano tranquille ", translate) == "calm piano"
+    cache.translate("piano tranquille", translate, language="de")
+    assert len(calls) == 2
+
+
+def test_search_key_ignores_text_case_and_field_order_but_not_the_filter():
+    index = FakeIndex()
+    key = search_key(index, {"text": "Calm  Piano", "limit": 5, "output_fields": ["b", "a"]})
+    assert key == search_key(index, {"text": "calm piano", "limit": 5, "output_fields": ["a", "b"]})
+    assert key != search_key(index, {"text": "calm piano", "limit": 10, "output_fields": ["a", "b"]})
+    assert key != search_key(index, {"text": "calm piano", "limit": 5, "output_fields": ["a", "b"],
+                                     "filter": {"op": "must", "field": "genre", "conds": ["jazz"]}})
+    image_key = search_key(index, {"image": "aGVsbG8=" * 1000, "limit": 5})
+    assert "aGVsbG8=" not in image_key
+
+
+def test_search_cache_answers_repeated_searches():
+    index = FakeIndex()
+    cache = SearchCache()
+    first = cache.search(index, text="calm piano", limit=5)
+    assert cache.search(index, text="Calm Piano", limit=5) == first
+    cache.search(index, text="calm piano", limit=10)
+    assert index.calls == 2
+    assert cache.stats().hit_rate == pytest.approx(1 / 3)
@@ -0,0 +1,114 @@
+"""Tests for the ingest ledger and engine, against an in-memory collection."""
+
+import asyncio
+
+import pandas as pd
+import pytest
+
+from vikingdb_ingest import IngestEngine, Ledger, build_rows, stable_id
+
+SCHEMA = {"id": int, "headline": str, "language": str, "original_id": int}
+
+
+class FakeCollection:
+    """Keeps upserted rows by id.
+
+    ``errors`` are raised by the next calls in order, batches holding one of
+    the ``rejected`` ids always fail.
+    """
+
+    def __init__(self, errors=(), rejected=()):
+        self.rows = {}
+        self.calls = []
+        self.errors = list(errors)
+        self.rejected = set(rejected)
+
+    async def async_upsert_data(self, data):
+        fields = [getattr(d, "fields", d) for d in data]
+        self.calls.append([row["id"] for row in fields])
+        await asyncio.sleep(0)
+        if self.errors:
+            raise self.errors.pop(0)
+        if self.rejected.intersection(self.calls[-1]):
+            raise ValueError("invalid field value")
+        for row in fields:
+            self.rows[row["id"]] = row
+
+
+def news(count, language="hi"):
+    return pd.DataFrame({"id": range(100, 100 + count), "headline": ["headline %d" % i for i in range(count)],
+                         "language": language})
+
+
+def keyed(df):
+    ids = [stable_id(language, original_id) for language, original_id in zip(df["language"], df["id"])]
+    return build_rows(df.assign(original_id=df["id"], id=ids), SCHEMA)
+
+
+def make_engine(collection, **kwargs):
+    # plain dicts stand in for volcengine Data, which FakeCollection unwraps
+    return IngestEngine(collection, data_factory=dict, **kwargs)
+
+
+def ingest(engine, rows, ledger):
+    return asyncio.run(engine.ingest(rows, ledger, progress=None))
+
+
+@pytest.fixture
+def ledger(tmp_path):
+    ledger = Ledger("news", key="id", path=str(tmp_path / "ledger.db"))
+    yield ledger
+    ledger.close()
+
+
+def test_stable_id_is_a_positive_63_bit_key_of_its_parts():
+    assert stable_id("hi", 7) == stable_id("hi", "7")
+    assert stable_id("hi", 7) != stable_id("ta", 7)
+    assert all(0 <= stable_id("hi", i) < 2 ** 63 for i in range(100))
+
+
+def test_build_rows_converts_columns_and_drops_missing_values():
+    df = pd.DataFrame({"id": ["1", None], "headline": ["a", None], "extra": [1, 2]})
+    assert build_rows(df, {"id": int, "headline": str}) == [{"id": 1, "headline": "a"}, {}]
+
+
+def test_rerun_sends_only_new_and_changed_rows(ledger):
+    collection = FakeCollection()
+    engine = make_engine(collection, batch_size=4)
+    assert ingest(engine, keyed(news(10)), ledger).rows == 10
+
+    df = news(12)
+    df.loc[3, "headline"] = "changed"
+    # reordered, the stable keys still match the uploaded rows
+    stats = ingest(engine, keyed(df.iloc[::-1]), ledger)
+    assert (stats.rows, stats.skipped) == (3, 9)
+    assert ledger.counts() == {"done": 12}
+    assert collection.rows[stable_id("hi", 103)]["headline"] == "changed"
+
+
+def test_throttled_batches_slow_down_and_are_sent_again(ledger):
+    collection = FakeCollection([RuntimeError("Too Many Requests")])
+    engine = make_engine(collection, batch_size=4, concurrency=2, backoff=0.01)
+    stats = ingest(engine, keyed(news(8)), ledger)
+    assert (stats.rows, stats.throttled, stats.failed) == (8, 1, 0)
+    # the batch size was halved, the throttled rows go out in smaller batches
+    assert [len(call) for call in collection.calls[:2]] == [4, 4]
+    assert max(len(call) for call in collection.calls[2:]) < 4
+    assert len(collection.rows) == 8
+
+
+def test_failed_rows_are_retried_first_on_the_next_run(ledger):
+    rows = keyed(news(6))
+    collection = FakeCollection(rejected=[rows[4]["id"]])
+    engine = make_engine(collection, batch_size=3, concurrency=1, max_retries=3)
+    stats = ingest(engine, rows, ledger)
+    assert (stats.rows, stats.retries, stats.failed) == (3, 2, 3)
+    assert ledger.counts() == {"done": 3, "failed": 3}
+    failed = collection.calls[-1]
+
+    collection.calls = []
+    collection.rejected.clear()
+    stats = ingest(engine, rows, ledger)
+    assert (stats.rows, stats.skipped) == (3, 3)
+    assert collection.calls[0] == failed
+    assert ledger.counts() == {"done": 6}
@@ -0,0 +1,98 @@
+"""Tests for Query filters and adaptive limits, against an in-memory index."""
+
+from vikingdb_query import Query, all_of, any_of, in_range, must
+
+
+class FakeIndex:
+    """Answers searches from ``hits``, applying must and range filters like VikingDB."""
+
+    collection_name = "music"
+    index_name = "music_index"
+
+    def __init__(self, hits):
+        self.hits = hits
+        self.calls = []
+
+    def search_with_multi_modal(self, limit, filter=None, **arguments):
+        self.calls.append(dict(arguments, limit=limit, filter=filter))
+        return [hit for hit in self.hits if self._matches(hit, filter)][:limit]
+
+    def _matches(self, hit, cond):
+        if cond is None:
+            return True
+        if cond["op"] == "and":
+            return all(self._matches(hit, c) for c in cond["conds"])
+        if cond["op"] == "or":
+            return any(self._matches(hit, c) for c in cond["conds"])
+        value = hit[cond["field"]]
+        if cond["op"] == "must":
+            return value in cond["conds"]
+        if cond["op"] == "must_not":
+            return value not in cond["conds"]
+        return cond.get("gte", value) <= value <= cond.get("lte", value)
+
+
+SONGS = [{"song": "song-%d" % i, "energy": i / 100, "genre": "rock" if i % 2 else "jazz"} for i in range(100)]
+
+
+def test_condition_helpers():
+    assert in_range("energy", gte=0.2, lt=0.4) == {"op": "range", "field": "energy", "gte": 0.2, "lt": 0.4}
+    assert all_of([None, must("genre", ["rock"])]) == must("genre", ["rock"])
+    assert any_of([]) is None
+    assert all_of([must("a", [1]), must("b", [2])])["op"] == "and"
+
+
+def test_conditions_return_new_queries():
+    base = Query(text="calm piano", output_fields=["song"])
+    narrowed = base.where("genre", "jazz").between("energy", 0.2, 0.4)
+    assert base.filter is None
+    assert "filter" not in base.arguments(5)
+    assert narrowed.arguments(5) == {
+        "text": "calm piano", "output_fields": ["song"], "limit": 5,
+        "filter": {"op": "and", "conds": [must("genre", ["jazz"]),
+                                          in_range("energy", gte=0.2, lte=0.4)]}}
+    assert base.where("genre") is base
+    assert base.between("energy") is base
+
+
+def test_search_filters_on_the_server_with_one_request():
+    index = FakeIndex(SONGS)
+    query = Query(text="calm").between("energy", 0.2, 0.4).exclude("genre", "rock")
+    hits = query.search(index, 5)
+    assert [hit["song"] for hit in hits] == ["song-20", "song-22", "song-24", "song-26", "song-28"]
+    assert query.requests == 1
+    assert index.calls[0]["limit"] == 5
+
+
+def test_search_grows_the_limit_while_accept_rejects_hits():
+    index = FakeIndex(SONGS)
+    query = Query(text="calm")
+    hits = query.search(index, 5, accept=lambda hit: hit["energy"] >= 0.3)
+    assert [hit["song"] for hit in hits] == ["song-30", "song-31", "song-32", "song-33", "song-34"]
+    assert query.requests > 1
+    assert [call["limit"] for call in index.calls] == sorted(call["limit"] for call in index.calls)
+
+
+def test_search_stops_at_max_limit_or_when_the_index_runs_out():
+    index = FakeIndex(SONGS)
+    query = Query(text="calm")
+    assert query.search(index, 5, accept=lambda hit: False, max_limit=40) == []
+    assert index.calls[-1]["limit"] == 40
+
+    few = FakeIndex(SONGS[:3])
+    assert len(query.search(few, 5)) == 3
+    assert query.requests == 1
+
+
+def test_search_goes_through_the_cache():
+    class Cache:
+        def __init__(self):
+            self.searches = []
+
+        def search(self, index, **arguments):
+            self.searches.append(arguments)
+            return index.search_with_multi_modal(**arguments)
+
+    cache = Cache()
+    Query(text="calm").where("genre", "jazz").search(FakeIndex(SONGS), 3, cache=cache)
+    assert cache.searches == [{"text": "calm", "limit": 3, "filter": must("genre", ["jazz"])}]
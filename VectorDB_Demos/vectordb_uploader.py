@@ -2,14 +2,31 @@ from volcengine.viking_db import *
 import random
 import asyncio
 import pandas as pd
-import math
 import os
 import time
 from dotenv import load_dotenv
 
+from vikingdb_ingest import IngestEngine, Ledger, build_rows
+
 # Load environment variables from .env file
 load_dotenv()
 
+# Columns uploaded and their types, rows missing a value leave the field out
+PRODUCT_SCHEMA = {
+    "vector": list,
+    "image": str,
+    "id": int,
+    "productDisplayName": str,
+    "gender": str,
+    "masterCategory": str,
+    "subCategory": str,
+    "articleType": str,
+    "baseColour": str,
+    "season": str,
+    "year": int,
+    "usage": str,
+}
+
 class VectorDBUploader:
     """Class for uploading data to VectorDB"""
     
@@ -21,76 +38,20 @@ class VectorDBUploader:
         """Generate a random vector of specified dimension"""
         return [random.random() - 0.5 for _ in range(dim)]
     
-    async def batch_upsert_data(self, df, batch_size=10, vector_dim=512, delay_seconds=2):
-        """Insert data into VikingDB with TOS image paths"""
-        collection = await self.vikingdb_service.async_get_collection(self.collection_name)
-        total_records = len(df)
-        num_batches = math.ceil(total_records / batch_size)
-        
-        for i in range(num_batches):
-            start_idx = i * batch_size
-            end_idx = min((i + 1) * batch_size, total_records)
-            batch_df = df[start_idx:end_idx]
-            
-            data_batch = []
-            for idx, row in batch_df.iterrows():
-                # Create field dictionary with all available columns
-                field = {
-                    "vector": self.gen_random_vector(vector_dim),
-                }
-                
-                # Add image path if available
-                if 'image' in row and pd.notna(row['image']):
-                    field['image'] = row['image']
-                
-                # Add all available text fields from the dataset
-                for col in row.index:
-                    if col in ['image']:
-                        continue  # Skip the image column, we've already handled it
-                    elif col in ['id', 'productDisplayName', 'gender', 'masterCategory', 
-                               'subCategory', 'articleType', 'baseColour', 'season', 
-                               'year', 'usage']:
-                        if pd.notna(row[col]):
-                            # Convert to appropriate type based on the column
-                            if col in ['id', 'year']:
-                                field[col] = int(row[col]) if isinstance(row[col], (int, float)) else 0
-                            else:
-                                field[col] = str(row[col])
-                
-                data_batch.append(Data(field))
-            
-            # Implement retry logic with exponential backoff
-            max_retries = 5
-            retry_count = 0
-            retry_delay = delay_seconds
-            
-            while retry_count < max_retries:
-                try:
-                    await collection.async_upsert_data(data_batch)
-                    print(f"Batch {i+1}/{num_batches} completed. Records {start_idx+1} to {end_idx} processed.")
-                    
-                    # Add delay between batches to avoid rate limiting
-                    if i < num_batches - 1:  # No need to delay after the last batch
-                        print(f"Waiting {delay_seconds} seconds before next batch...")
-                        await asyncio.sleep(delay_seconds)
-                    
-                    # If successful, break out of retry loop
-                    break
-                    
-                except Exception as e:
-                    if "token usage has reached the maximum limit" in str(e):
-                        retry_count += 1
-                        print(f"Rate limit exceeded. Retry {retry_count}/{max_retries} after {retry_delay} seconds...")
-                        await asyncio.sleep(retry_delay)
-                        # Exponential backoff
-                        retry_delay *= 2
-                    else:
-                        # If it's not a rate limit error, re-raise it
-                        raise
+    async def batch_upsert_data(self, df, batch_size=10, vector_dim=512, concurrency=4, ledger=None):
+        """Insert data into VikingDB with TOS image paths
 
-            # If we've exhausted all retries, report the error
-            if retry_count >= max_retries:
-                print(f"Failed to process batch {i+1} after {max_retries} retries. Continuing with next batch.")
+        Batch size and concurrency are starting points, the engine adapts
+        them to throttling. With a ``Ledger`` only new, changed or failed
+        records are sent.
+        """
+        collection = await self.vikingdb_service.async_get_collection(self.collection_name)
+        df = df.assign(vector=[self.gen_random_vector(vector_dim) for _ in range(len(df))])
+        rows = build_rows(df, PRODUCT_SCHEMA)
+        engine = IngestEngine(collection, batch_size=batch_size, concurrency=concurrency)
+        stats = await engine.ingest(rows, ledger)
+        print(f"Upload finished: {stats}")
+        return stats
 
 async def main():
     # Get VikingDB credentials from environment variables
@@ -121,23 +82,28 @@ async def main():
     # Ask user for confirmation before proceeding
     print("\nWARNING: You are about to upload data to VectorDB.")
     print("This operation may be rate-limited by the service.")
-    print("Recommended settings:")
-    print("- Batch size: 10 (smaller to reduce load)")
-    print("- Delay between batches: 2 seconds (to avoid rate limiting)")
+    print("Batch size and concurrency are adjusted automatically when the service throttles.")
+    print("Recommended starting settings:")
+    print("- Batch size: 10")
+    print("- Concurrent batches: 4")
     
-    # Get user input for batch size and delay
+    # Get user input for batch size and concurrency
     try:
         batch_size = int(input("Enter batch size (default: 10): ") or 10)
-        delay = float(input("Enter delay between batches in seconds (default: 2): ") or 2)
+        concurrency = int(input("Enter concurrent batches (default: 4): ") or 4)
     except ValueError:
-        print("Invalid input. Using default values: batch_size=10, delay=2")
+        print("Invalid input. Using default values: batch_size=10, concurrency=4")
         batch_size = 10
-        delay = 2
+        concurrency = 4
     
-    # Upload the data to VectorDB with user-specified parameters
-    await uploader.batch_upsert_data(df, batch_size=batch_size, delay_seconds=delay)
+    # Upload the data to VectorDB, products already uploaded unchanged are skipped
+    ledger = Ledger(uploader.collection_name, key="id")
+    stats = await uploader.batch_upsert_data(df, batch_size=batch_size, concurrency=concurrency, ledger=ledger)
     
-    print("All data has been uploaded to VectorDB successfully!")
+    if stats.failed:
+        print(f"{stats.failed} records failed, run the script again to retry them.")
+    else:
+        print("All data has been uploaded to VectorDB successfully!")
 
 if __name__ == "__main__":
     # Run the main function
@@ -0,0 +1,242 @@
+"""Caches for the VikingDB search apps.
+
+Streamlit reruns the whole script on every widget interaction, so the apps
+sent the same search to VikingDB, and ``image_search_app`` the same query to
+the LLM for translation, each time a slider moved. ``QueryCache`` keeps
+recent answers in memory, in LRU order and for ``ttl`` seconds, and can
+persist them to SQLite so a restarted app starts warm. A repeated query is
+answered from a dict lookup, in microseconds:
+
+    searches = SearchCache("music", path=DEFAULT_CACHE_PATH)
+    hits = Query(text="calm piano").search(index, 5, cache=searches)
+    print(searches.stats())
+
+Search keys hold the index, the normalised text or the hash of the image,
+the filter, the limit, the output fields and the other search arguments.
+Create the caches once per server, e.g. in a ``st.cache_resource`` function,
+module globals of a Streamlit script are rebuilt on every rerun.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict, namedtuple
+
+DEFAULT_CACHE_PATH = os.getenv("VIKINGDB_CACHE_DB", os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                                                  "vikingdb_cache.db"))
+
+_MISSING = object()
+_EXPIRED = object()
+
+
+def normalize_text(text):
+    """Unicode NFKC, case folded, whitespace collapsed."""
+    return " ".join(unicodedata.normalize("NFKC", text).casefold().split())
+
+
+class CacheStats(namedtuple("CacheStats", "name hits misses expired evictions size")):
+    __slots__ = ()
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def __str__(self):
+        return (f"{self.name}: {self.hits} hits / {self.hits + self.misses} lookups ({self.hit_rate:.0%}), "
+                f"{self.size} entries, {self.expired} expired, {self.evictions} evicted")
+
+
+class QueryCache:
+    """Thread-safe LRU with a time to live, optionally backed by SQLite.
+
+    Memory is looked up first. With a ``path`` misses fall back to the file,
+    which mirrors the memory: entries evicted or found expired are deleted
+    from it too, so it does not outgrow ``max_entries``. Values that cannot
+    be pickled are kept in memory only.
+
+    Args:
+        name (str): Cache name, caches of several apps share one file.
+        max_entries (int): Entries kept in memory before the oldest are evicted.
+        ttl (float): Seconds an entry is served, None keeps it until evicted.
+        path (str): SQLite file to persist entries to, None keeps them in memory.
+    """
+
+    def __init__(self, name, max_entries=1024, ttl=3600, path=None):
+        self.name = name
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = self._misses = self._expired = self._evictions = 0
+
+        self._conn = None
+        if path:
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+            with self._lock, self._conn:
+                self._conn.execute("PRAGMA journal_mode=WAL")
+                self._conn.execute("""
+                    CREATE TABLE IF NOT EXISTS entries (
+                        cache TEXT,
+                        cache_key TEXT,
+                        value BLOB,
+                        expires_at REAL,
+                        PRIMARY KEY (cache, cache_key)
+                    )""")
+                self._conn.execute("DELETE FROM entries WHERE cache = ? AND expires_at < ?", (name, time.time()))
+                # e.g. written by an instance with a larger max_entries, the latest puts are kept
+                self._conn.execute("""
+                    DELETE FROM entries WHERE cache = ? AND cache_key NOT IN (
+                        SELECT cache_key FROM entries WHERE cache = ? ORDER BY expires_at DESC LIMIT ?
+                    )""", (name, name, max_entries))
+
+    def get(self, key, default=None):
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            expired = False
+            if entry is not None:
+                if entry[0] >= now:
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return entry[1]
+                del self._entries[key]
+                expired = True
+            # the file may hold a fresher value, put by another process
+            entry = self._load(key, now)
+            if entry is _EXPIRED:
+                expired = True
+                entry = None
+            if expired:
+                self._expired += 1
+            if entry is None:
+                self._misses += 1
+                return default
+            self._hits += 1
+            self._remember(key, entry)
+            return entry[1]
+
+    def put(self, key, value):
+        expires_at = time.time() + self.ttl if self.ttl is not None else float("inf")
+        with self._lock:
+            self._remember(key, (expires_at, value))
+            if self._conn is not None:
+                try:
+                    blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+                except (pickle.PicklingError, TypeError, AttributeError):
+                    # a value persisted earlier must not come back once this one is evicted
+                    with self._conn:
+                        self._conn.execute("DELETE FROM entries WHERE cache = ? AND cache_key = ?",
+                                           (self.name, key))
+                    return
+                with self._conn:
+                    self._conn.execute("INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?)",
+                                       (self.name, key, blob, expires_at))
+
+    def get_or_compute(self, key, compute):
+        """Returns the cached value of ``key``, or computes and caches it.
+
+        Exceptions of ``compute`` are raised and nothing is cached.
+        """
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def stats(self):
+        with self._lock:
+            return CacheStats(self.name, self._hits, self._misses, self._expired, self._evictions,
+                              len(self._entries))
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            if self._conn is not None:
+                with self._conn:
+                    self._conn.execute("DELETE FROM entries WHERE cache = ?", (self.name,))
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _remember(self, key, entry):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        evicted = []
+        while len(self._entries) > self.max_entries:
+            evicted.append(self._entries.popitem(last=False)[0])
+            self._evictions += 1
+        if evicted and self._conn is not None:
+            with self._conn:
+                self._conn.executemany("DELETE FROM entries WHERE cache = ? AND cache_key = ?",
+                                       [(self.name, k) for k in evicted])
+
+    def _load(self, key, now):
+        if self._conn is None:
+            return None
+        row = self._conn.execute("SELECT value, expires_at FROM entries WHERE cache = ? AND cache_key = ?",
+                                 (self.name, key)).fetchone()
+        if row is None:
+            return None
+        if row[1] < now:
+            with self._conn:
+                self._conn.execute("DELETE FROM entries WHERE cache = ? AND cache_key = ?", (self.name, key))
+            return _EXPIRED
+        try:
+            return row[1], pickle.loads(row[0])
+        except Exception:
+            # written by another version of the SDK, computed again
+            return None
+
+
+class TranslationCache(QueryCache):
+    """Translations keyed by the normalised source text and target language."""
+
+    def __init__(self, name="translation", max_entries=4096, ttl=7 * 24 * 3600, path=None):
+        super().__init__(name, max_entries, ttl, path)
+
+    def translate(self, text, translate, language="en"):
+        """Returns ``translate(text)``, cached by normalised ``text``."""
+        return self.get_or_compute(f"{language}:{normalize_text(text)}", lambda: translate(text))
+
+
+def search_key(index, arguments):
+    """Cache key of a ``search_with_multi_modal`` call on ``index``."""
+    arguments = dict(arguments)
+    text = arguments.pop("text", None)
+    image = arguments.pop("image", None)
+    fields = arguments.pop("output_fields", None)
+    key = {
+        "index": [getattr(index, "collection_name", None), getattr(index, "index_name", None)],
+        "text": normalize_text(text) if text is not None else None,
+        # base64 payloads are large, their hash is enough
+        "image": hashlib.sha256(image.encode()).hexdigest() if image is not None else None,
+        "filter": arguments.pop("filter", None),
+        "limit": arguments.pop("limit", None),
+        "output_fields": sorted(fields) if fields else None,
+        "params": arguments,
+    }
+    return json.dumps(key, sort_keys=True, ensure_ascii=False, default=str)
+
+
+class SearchCache(QueryCache):
+    """Results of ``search_with_multi_modal`` keyed by ``search_key``."""
+
+    def __init__(self, name="search", max_entries=1024, ttl=600, path=None):
+        super().__init__(name, max_entries, ttl, path)
+
+    def search(self, index, **arguments):
+        """``index.search_with_multi_modal(**arguments)``, answered from the cache when possible."""
+        return self.get_or_compute(search_key(index, arguments),
+                                   lambda: index.search_with_multi_modal(**arguments))
@@ -0,0 +1,399 @@
+"""Bulk ingestion of DataFrames into VikingDB collections.
+
+The upload scripts used to build rows with ``df.iterrows()``, send one batch
+at a time and sleep a fixed delay between batches, retrying only when the
+error message said the token limit was reached. ``IngestEngine`` replaces
+those loops:
+
+* rows are converted column by column from a ``{column: type}`` schema and
+  read out with ``to_dict("records")``;
+* several batches are in flight at once;
+* batch size and concurrency adapt to the service: both grow while batches
+  succeed and are halved when it throttles, with an exponential pause that
+  all batches respect, instead of a fixed sleep after every batch;
+* a SQLite ``Ledger`` records the key and content hash of every row that
+  landed, so a rerun only sends rows that are new, changed or failed.
+
+Usage::
+
+    rows = build_rows(df, {"id": int, "headline": str, "category": str})
+    engine = IngestEngine(collection)
+    stats = await engine.ingest(rows, Ledger("Ankur_NewsRAG_Collection", key="id"))
+    print(stats)   # rows, rows/s, retries, failed
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import struct
+import threading
+import time
+from collections import deque
+
+import pandas as pd
+
+DEFAULT_LEDGER_PATH = os.getenv("VIKINGDB_LEDGER_DB", os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                                                    "vikingdb_ledger.db"))
+
+# Errors whose message contains one of these mean "slow down", not "give up"
+THROTTLE_MARKERS = (
+    "token usage has reached the maximum limit",
+    "rate limit",
+    "too many requests",
+    "quota",
+    "qps",
+)
+
+
+def is_throttled(error):
+    """Whether ``error`` is the service asking us to send less."""
+    if getattr(error, "code", None) == 429 or getattr(error, "status_code", None) == 429:
+        return True
+    message = str(error).lower()
+    return any(marker in message for marker in THROTTLE_MARKERS)
+
+
+def stable_id(*parts):
+    """Positive 63-bit integer key derived from ``parts``, the same on every run."""
+    digest = hashlib.sha256("\x1f".join(str(part) for part in parts).encode()).digest()
+    return struct.unpack(">Q", digest[:8])[0] >> 1
+
+
+def _convert(series, kind):
+    """Converts a column to ``kind`` at once, missing values become None."""
+    if kind is int:
+        values = pd.to_numeric(series, errors="coerce").astype("Int64")
+    elif kind is float:
+        values = pd.to_numeric(series, errors="coerce")
+    elif kind is bool:
+        values = series.astype(bool)
+    elif kind is str:
+        values = series.where(series.isna(), series.astype(str))
+    else:
+        values = series.map(kind, na_action="ignore")
+    values = values.astype(object)
+    return values.where(values.notna(), None)
+
+
+def build_rows(df, schema, keep_missing=False):
+    """Turns a DataFrame into VikingDB field dicts.
+
+    Args:
+        df (pandas.DataFrame): The records to upload.
+        schema (dict): Column name -> ``int``, ``float``, ``bool``, ``str`` or
+            any callable applied to each value. Columns missing from ``df``
+            are ignored, columns not in ``schema`` are not uploaded.
+        keep_missing (bool): Send missing values as None instead of leaving
+            the field out of the row.
+
+    Returns:
+        list: One dict per row, in the order of ``df``.
+    """
+    columns = {name: _convert(df[name], kind) for name, kind in schema.items() if name in df.columns}
+    rows = pd.DataFrame(columns, index=df.index).to_dict("records")
+    if not keep_missing:
+        rows = [{k: v for k, v in row.items() if v is not None} for row in rows]
+    return rows
+
+
+class IngestStats:
+    """Counters of one ``IngestEngine.ingest`` run."""
+
+    def __init__(self, total):
+        self.total = total
+        self.skipped = 0
+        self.rows = 0
+        self.batches = 0
+        self.retries = 0
+        self.throttled = 0
+        self.failed = 0
+        self.started = time.monotonic()
+        self.finished = None
+
+    @property
+    def elapsed(self):
+        return (self.finished or time.monotonic()) - self.started
+
+    @property
+    def rows_per_second(self):
+        return self.rows / self.elapsed if self.elapsed > 0 else 0.0
+
+    def __str__(self):
+        return (f"{self.rows}/{self.total} rows in {self.elapsed:.1f}s ({self.rows_per_second:.1f} rows/s), "
+                f"{self.batches} batches, {self.skipped} unchanged, {self.throttled} throttled, "
+                f"{self.retries} retries, {self.failed} failed")
+
+
+class Ledger:
+    """SQLite record of what landed in one collection, safe to use from several threads.
+
+    Every row is stored under its key with the hash of its content and a
+    status, every batch sent with its status and error. ``pending`` returns
+    the rows that are new, changed or failed last time, so a rerun over a
+    mostly unchanged file only sends what differs.
+
+    Args:
+        collection (str): Collection name, ledgers of several collections
+            share one file.
+        key: Field holding the primary key, a callable returning the key of
+            a row, or None to key rows by their content hash, for collections
+            with auto-generated keys where a changed row is a new row.
+        path (str): SQLite file holding the ledger.
+        exclude (tuple): Fields left out of the content hash, e.g. placeholder
+            vectors generated on every run.
+    """
+
+    def __init__(self, collection, key="id", path=DEFAULT_LEDGER_PATH, exclude=("vector",)):
+        self.collection = collection
+        self.key = key
+        self.exclude = frozenset(exclude)
+        # keys and hashes of the rows given to the last pending call
+        self._keys = []
+        self._hashes = []
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS rows (
+                    collection TEXT,
+                    row_key TEXT,
+                    hash TEXT,
+                    status TEXT,
+                    batch_id INTEGER,
+                    updated_at REAL,
+                    PRIMARY KEY (collection, row_key)
+                )""")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS batches (
+                    batch_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    collection TEXT,
+                    status TEXT,
+                    size INTEGER,
+                    error TEXT,
+                    created_at REAL,
+                    updated_at REAL
+                )""")
+            # batches still marked as sent belong to a run that was interrupted
+            self._conn.execute("UPDATE batches SET status = 'interrupted' WHERE collection = ? AND status = 'sent'",
+                               (collection,))
+
+    def row_hash(self, row):
+        content = {k: v for k, v in row.items() if k not in self.exclude}
+        return hashlib.sha256(json.dumps(content, sort_keys=True, ensure_ascii=False, default=str).encode()).hexdigest()
+
+    def row_key(self, row, row_hash):
+        if self.key is None:
+            return row_hash
+        return str(self.key(row) if callable(self.key) else row.get(self.key))
+
+    def pending(self, rows):
+        """Positions of the rows to send, the retry queue first.
+
+        Rows already uploaded with the same content are left out. The others
+        are recorded as pending until a batch carrying them succeeds.
+        """
+        self._hashes = [self.row_hash(row) for row in rows]
+        self._keys = [self.row_key(row, h) for row, h in zip(rows, self._hashes)]
+        with self._lock:
+            known = {key: (row_hash, status) for key, row_hash, status in self._conn.execute(
+                "SELECT row_key, hash, status FROM rows WHERE collection = ?", (self.collection,))}
+        failed, fresh = [], []
+        for i, (key, row_hash) in enumerate(zip(self._keys, self._hashes)):
+            previous = known.get(key)
+            if previous == (row_hash, "done"):
+                continue
+            (failed if previous is not None and previous[1] == "failed" else fresh).append(i)
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT INTO rows (collection, row_key, hash, status, updated_at) VALUES (?, ?, ?, 'pending', ?) "
+                "ON CONFLICT (collection, row_key) DO UPDATE SET hash = excluded.hash, status = 'pending', "
+                "updated_at = excluded.updated_at",
+                [(self.collection, self._keys[i], self._hashes[i], now) for i in fresh])
+        return failed + fresh
+
+    def started(self, positions):
+        """Records a batch as sent and returns its id."""
+        now = time.time()
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "INSERT INTO batches (collection, status, size, created_at, updated_at) VALUES (?, 'sent', ?, ?, ?)",
+                (self.collection, len(positions), now, now))
+        return cursor.lastrowid
+
+    def finished(self, batch_id, positions, status, error=None):
+        """Records the outcome of a batch.
+
+        Args:
+            status (str): "done", "failed" once retries are exhausted, which
+                puts its rows in the retry queue, or "requeued" when the rows
+                were put back into the current run.
+        """
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute("UPDATE batches SET status = ?, error = ?, updated_at = ? WHERE batch_id = ?",
+                               (status, str(error) if error is not None else None, now, batch_id))
+            if status in ("done", "failed"):
+                self._conn.executemany(
+                    "UPDATE rows SET status = ?, hash = ?, batch_id = ?, updated_at = ? "
+                    "WHERE collection = ? AND row_key = ?",
+                    [(status, self._hashes[i], batch_id, now, self.collection, self._keys[i]) for i in positions])
+
+    def counts(self):
+        """Number of rows per status, e.g. {"done": 11000, "failed": 20}."""
+        with self._lock:
+            return dict(self._conn.execute(
+                "SELECT status, COUNT(*) FROM rows WHERE collection = ? GROUP BY status", (self.collection,)))
+
+    def failed_batches(self, limit=20):
+        """Most recent failed batches as (batch_id, size, error)."""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT batch_id, size, error FROM batches WHERE collection = ? AND status = 'failed' "
+                "ORDER BY batch_id DESC LIMIT ?", (self.collection, limit)).fetchall()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class IngestEngine:
+    """Upserts rows into a collection with adaptive batching and concurrency.
+
+    Args:
+        collection: VikingDB collection, from ``async_get_collection``.
+        batch_size (int): Rows per request to start with.
+        concurrency (int): Requests in flight to start with.
+        max_batch_size (int), max_concurrency (int): Upper bounds of the
+            adaptation. ``min_batch_size`` is the lower bound of the batch
+            size, concurrency never drops below 1.
+        max_retries (int): Attempts for a batch failing with an error that is
+            not throttling. Throttled batches are retried until they pass.
+        backoff (float), max_backoff (float): First and longest pause after
+            the service throttled, in seconds.
+        data_factory (callable): Wraps a row dict for ``async_upsert_data``,
+            ``volcengine.viking_db.Data`` by default.
+
+    The adapted batch size and concurrency carry over from one ``ingest``
+    call to the next.
+    """
+
+    def __init__(self, collection, batch_size=20, concurrency=4, max_batch_size=100, min_batch_size=1,
+                 max_concurrency=16, max_retries=3, backoff=1.0, max_backoff=60.0, data_factory=None):
+        if data_factory is None:
+            # imported here so the engine can be used and tested without the SDK
+            from volcengine.viking_db import Data as data_factory
+        self.collection = collection
+        self.data_factory = data_factory
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.max_batch_size = max_batch_size
+        self.min_batch_size = min_batch_size
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+
+        self._pause = backoff
+        self._paused_until = 0.0
+        # bumped on every slow-down, so one burst of throttled batches halves once
+        self._epoch = 0
+        self._successes = 0
+
+    async def ingest(self, rows, ledger=None, progress=print):
+        """Uploads ``rows`` and returns an IngestStats.
+
+        Args:
+            rows (list): Field dicts, e.g. from ``build_rows``.
+            ledger (Ledger): Record of the rows already uploaded, only the
+                others are sent. None sends everything.
+            progress (callable): Called with a status line after each batch,
+                None keeps quiet.
+        """
+        stats = IngestStats(len(rows))
+        positions = ledger.pending(rows) if ledger else list(range(len(rows)))
+        stats.skipped = len(rows) - len(positions)
+        queue = deque(positions)
+        # positions whose batch failed with an error and how many attempts they had
+        attempts = {}
+        in_flight = {}
+
+        try:
+            while queue or in_flight:
+                can_send = queue and len(in_flight) < self.concurrency
+                if can_send and time.monotonic() >= self._paused_until:
+                    batch = [queue.popleft() for _ in range(min(self.batch_size, len(queue)))]
+                    task = asyncio.ensure_future(self.collection.async_upsert_data([self.data_factory(rows[i]) for i in batch]))
+                    in_flight[task] = (batch, self._epoch, ledger.started(batch) if ledger else None)
+                    continue
+                # paused after throttling: wake up when the pause ends or a batch finishes
+                timeout = max(0.0, self._paused_until - time.monotonic()) if can_send else None
+                if not in_flight:
+                    await asyncio.sleep(timeout)
+                    continue
+                done, _ = await asyncio.wait(in_flight, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+
+                for task in done:
+                    batch, epoch, batch_id = in_flight.pop(task)
+                    error = task.exception()
+                    if error is None:
+                        status = "done"
+                        self._on_success()
+                        stats.rows += len(batch)
+                        stats.batches += 1
+                    elif is_throttled(error):
+                        status = "requeued"
+                        stats.throttled += 1
+                        self._on_throttle(epoch)
+                        queue.extendleft(reversed(batch))
+                    else:
+                        tries = max(attempts.get(i, 0) for i in batch) + 1
+                        if tries < self.max_retries:
+                            # to the back of the queue, the other batches go first
+                            status = "requeued"
+                            stats.retries += 1
+                            attempts.update((i, tries) for i in batch)
+                            queue.extend(batch)
+                        else:
+                            # left for the retry queue of the next run
+                            status = "failed"
+                            stats.failed += len(batch)
+                            if progress:
+                                progress(f"Giving up on rows {batch[0] + 1}-{batch[-1] + 1}: {error}")
+                    if ledger:
+                        ledger.finished(batch_id, batch, status, error)
+                    if progress:
+                        progress(f"{stats.rows + stats.skipped}/{stats.total} rows, "
+                                 f"{stats.rows_per_second:.1f} rows/s, batch size {self.batch_size}, "
+                                 f"concurrency {self.concurrency}")
+        finally:
+            # interrupted: do not leave requests running behind the caller
+            for task in in_flight:
+                task.cancel()
+
+        stats.finished = time.monotonic()
+        return stats
+
+    def _on_success(self):
+        self._pause = self.backoff
+        self._successes += 1
+        if self._successes >= self.concurrency:
+            # a full window went through, probe for more
+            self._successes = 0
+            self.concurrency = min(self.max_concurrency, self.concurrency + 1)
+            self.batch_size = min(self.max_batch_size, self.batch_size + max(1, self.batch_size // 4))
+
+    def _on_throttle(self, epoch):
+        self._successes = 0
+        if epoch != self._epoch:
+            # sent before the last slow-down, it says nothing new
+            return
+        self._epoch += 1
+        self.concurrency = max(1, self.concurrency // 2)
+        self.batch_size = max(self.min_batch_size, self.batch_size // 2)
+        self._paused_until = time.monotonic() + self._pause
+        self._pause = min(self.max_backoff, self._pause * 2)
@@ -0,0 +1,149 @@
+"""Filtered searches over VikingDB indexes.
+
+The search apps used to over-fetch and filter on the client: 20 songs were
+fetched to keep those within 0.1 of an energy level, often fewer than the 5
+wanted, and the news bot fetched 50 articles to regroup them by category.
+``Query`` builds the ``filter`` of ``index.search_with_multi_modal`` instead,
+so VikingDB applies it during the search and returns exactly the top hits
+that match:
+
+    query = Query(text="calm piano", output_fields=["song", "energy"])
+    hits = query.between("energy", 0.2, 0.4).where("genre", "classical").search(index, 5)
+
+Conditions the filter cannot express go into ``accept``, checked on the
+client. When it rejects too many hits the search is repeated with a limit
+grown from the observed acceptance rate, up to ``MAX_LIMIT``. Each round
+trip goes through the ``SearchCache`` passed as ``cache``, if any.
+"""
+
+import math
+
+# Largest limit a search grows to when ``accept`` rejects hits
+MAX_LIMIT = 200
+
+
+def must(field, values):
+    return {"op": "must", "field": field, "conds": list(values)}
+
+
+def must_not(field, values):
+    return {"op": "must_not", "field": field, "conds": list(values)}
+
+
+def in_range(field, gte=None, lte=None, gt=None, lt=None):
+    """Range condition on a numeric field, bounds left as None are open."""
+    bounds = {"gte": gte, "lte": lte, "gt": gt, "lt": lt}
+    return dict({"op": "range", "field": field}, **{k: v for k, v in bounds.items() if v is not None})
+
+
+def all_of(conds):
+    """Combines conditions with "and", None when there are none."""
+    conds = [c for c in conds if c]
+    if not conds:
+        return None
+    return conds[0] if len(conds) == 1 else {"op": "and", "conds": conds}
+
+
+def any_of(conds):
+    conds = [c for c in conds if c]
+    if not conds:
+        return None
+    return conds[0] if len(conds) == 1 else {"op": "or", "conds": conds}
+
+
+class Query:
+    """A multi-modal search and its filter conditions.
+
+    The condition methods return a new Query, so a base query can be
+    narrowed in several ways.
+
+    Args:
+        text (str): Text to search for.
+        image (str): Image to search for, as accepted by the SDK.
+        output_fields (list): Fields returned with each hit.
+        **params: Other ``search_with_multi_modal`` arguments, e.g.
+            ``dense_weight`` or ``need_instruction``.
+    """
+
+    def __init__(self, text=None, image=None, output_fields=None, **params):
+        self.text = text
+        self.image = image
+        self.output_fields = list(output_fields) if output_fields else None
+        self.params = params
+        self.conds = []
+        # searches made by the last call, answered from the cache or not
+        self.requests = 0
+
+    def _with(self, cond):
+        query = Query(self.text, self.image, self.output_fields, **self.params)
+        query.conds = self.conds + [cond]
+        return query
+
+    def where(self, field, *values):
+        """Keeps hits whose ``field`` is one of ``values``, no-op without values."""
+        values = [v for v in values if v is not None]
+        return self._with(must(field, values)) if values else self
+
+    def exclude(self, field, *values):
+        values = [v for v in values if v is not None]
+        return self._with(must_not(field, values)) if values else self
+
+    def between(self, field, low=None, high=None):
+        """Keeps hits with ``low <= field <= high``, a None bound is open."""
+        if low is None and high is None:
+            return self
+        return self._with(in_range(field, gte=low, lte=high))
+
+    def matching(self, cond):
+        """Adds a raw filter condition, e.g. built with ``any_of``."""
+        return self._with(cond) if cond else self
+
+    @property
+    def filter(self):
+        return all_of(self.conds)
+
+    def arguments(self, limit):
+        """Keyword arguments of ``search_with_multi_modal`` for ``limit`` hits."""
+        arguments = dict(self.params, limit=limit)
+        if self.text is not None:
+            arguments["text"] = self.text
+        if self.image is not None:
+            arguments["image"] = self.image
+        if self.output_fields:
+            arguments["output_fields"] = self.output_fields
+        if self.conds:
+            arguments["filter"] = self.filter
+        return arguments
+
+    def search(self, index, k, accept=None, limit=None, max_limit=MAX_LIMIT, cache=None):
+        """Returns the best ``k`` hits matching the filter and ``accept``.
+
+        Args:
+            index: VikingDB index, from ``get_index``.
+            k (int): Hits wanted.
+            accept (callable): Client-side check of a hit, for conditions the
+                filter cannot express. Searches are repeated with a larger
+                limit while it rejects too many hits.
+            limit (int): First limit tried, ``k`` by default. Pass a bit more
+                when ``accept`` is known to reject some hits.
+            max_limit (int): Largest limit tried.
+            cache (SearchCache): Answers repeated searches, see vikingdb_cache.
+
+        Returns:
+            list: Up to ``k`` hits in the order returned by VikingDB, fewer
+            only when no more hits match.
+        """
+        self.requests = 0
+        limit = min(max_limit, max(limit or k, k))
+        while True:
+            if cache is not None:
+                results = cache.search(index, **self.arguments(limit)) or []
+            else:
+                results = index.search_with_multi_modal(**self.arguments(limit)) or []
+            self.requests += 1
+            hits = [r for r in results if accept(r)] if accept else results
+            if len(hits) >= k or len(results) < limit or limit >= max_limit:
+                return hits[:k]
+            # grow by what the acceptance rate so far says is needed, with some margin
+            rate = max(len(hits), 1) / len(results)
+            limit = min(max_limit, max(limit * 2, math.ceil(k / rate * 1.5)))
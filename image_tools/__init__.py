@@ -0,0 +1,6 @@
+"""Helpers shared by the image and video demos."""
+
+from .preprocess import MAX_BYTES, PreparedImage, ResultCache, encode_image, prepare_image, prepare_many
+from .payload import Base64Field, JsonBody, build_json_body
+from .delivery import CachedImage, ImageStore
+from .probe import ImageInfo, load_image, probe_image
@@ -0,0 +1,72 @@
+"""Peak memory of building a signed JSON body around an image.
+
+Run from the repository root:
+
+    python -m image_tools.bench_payload --mb 4.7
+
+Compares the former Seededit path (b64encode, decode, json.dumps, encode to
+hash, encode again to send) with build_json_body. Peaks are measured with
+tracemalloc above the already encoded JPEG, which both paths start from.
+"""
+
+import argparse
+import base64
+import hashlib
+import json
+import os
+import time
+import tracemalloc
+
+from image_tools.payload import Base64Field, build_json_body
+
+
+def copying_body(data):
+    img_base64 = base64.b64encode(data).decode()
+    req_body = json.dumps({"req_key": "seededit_v3.0", "prompt": "make it blue",
+                           "binary_data_base64": [img_base64]})
+    payload_hash = hashlib.sha256(req_body.encode("utf-8")).hexdigest()
+    # requests/http.client encode a str body once more before sending
+    sent = req_body.encode("utf-8")
+    return sent, payload_hash
+
+
+def streamed_body(data):
+    body = build_json_body({"req_key": "seededit_v3.0", "prompt": "make it blue",
+                            "binary_data_base64": [Base64Field(data)]})
+    return body.body, body.sha256
+
+
+def measure(fn, data, rounds):
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline = tracemalloc.get_traced_memory()[0]
+    body, digest = fn(data)
+    peak = tracemalloc.get_traced_memory()[1] - baseline
+    del body
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn(data)
+    return peak, (time.perf_counter() - start) / rounds, digest
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mb", type=float, default=4.7, help="size of the image in MB")
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    data = os.urandom(int(args.mb * 1024 * 1024))
+    print(f"image {len(data) / 1e6:.1f} MB, body {len(Base64Field(data)) / 1e6:.1f} MB")
+    print(f"{'':24} {'peak MB':>9} {'x image':>8} {'ms':>8}")
+    digests = set()
+    for name, fn in (("json.dumps + encode", copying_body), ("build_json_body", streamed_body)):
+        peak, seconds, digest = measure(fn, data, args.rounds)
+        digests.add(digest)
+        print(f"{name:24} {peak / 1e6:9.1f} {peak / len(data):8.1f} {seconds * 1000:8.1f}")
+    assert len(digests) == 1, "bodies differ"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""Compares prepare_image with the stepped encode_image it replaced.
+
+Run from the repository root:
+
+    python -m image_tools.bench_preprocess                 # synthetic 4K corpus
+    python -m image_tools.bench_preprocess path/to/images  # your own images
+
+The synthetic corpus mixes photos that fit at high quality, photos that need
+a lower quality and noisy images that have to be scaled down, which are the
+three paths through both implementations.
+"""
+
+import argparse
+import io
+import os
+import sys
+import time
+
+from PIL import Image, ImageFilter
+
+from image_tools.preprocess import MAX_BYTES, ResultCache, prepare_image, prepare_many
+
+
+def stepped_encode(image):
+    """The encode_image loop formerly copied into the Seededit apps."""
+    if image.mode == "RGBA":
+        background = Image.new("RGB", image.size, (255, 255, 255))
+        background.paste(image, mask=image.split()[3])
+        image = background
+    width, height = image.size
+    buffered = io.BytesIO()
+    image.save(buffered, format="JPEG", quality=95)
+    file_size = buffered.getbuffer().nbytes
+    if file_size > MAX_BYTES:
+        quality = 90
+        while file_size > MAX_BYTES and quality >= 70:
+            buffered = io.BytesIO()
+            image.save(buffered, format="JPEG", quality=quality)
+            file_size = buffered.getbuffer().nbytes
+            quality -= 5
+        if file_size > MAX_BYTES:
+            scale_factor = 0.9
+            while file_size > MAX_BYTES and scale_factor >= 0.5:
+                resized = image.resize((int(width * scale_factor), int(height * scale_factor)), Image.LANCZOS)
+                buffered = io.BytesIO()
+                resized.save(buffered, format="JPEG", quality=85)
+                file_size = buffered.getbuffer().nbytes
+                scale_factor -= 0.1
+    return buffered.getvalue()
+
+
+def synthetic_corpus(count, size=(4096, 3072)):
+    """JPEG bytes of 4K images with increasing amounts of detail."""
+    corpus = []
+    for i in range(count):
+        detail = i % 3
+        base = Image.radial_gradient("L").resize(size).convert("RGB")
+        noise = Image.effect_noise(size, 20 + 40 * detail).convert("RGB")
+        image = Image.blend(base, noise, 0.2 + 0.3 * detail)
+        if detail == 0:
+            image = image.filter(ImageFilter.GaussianBlur(2))
+        buffered = io.BytesIO()
+        image.save(buffered, format="JPEG", quality=98)
+        corpus.append(buffered.getvalue())
+    return corpus
+
+
+def load_corpus(directory):
+    corpus = []
+    for name in sorted(os.listdir(directory)):
+        if name.lower().endswith((".jpg", ".jpeg", ".png", ".webp")):
+            with open(os.path.join(directory, name), "rb") as f:
+                corpus.append(f.read())
+    return corpus
+
+
+def timed(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("directory", nargs="?", help="folder of images, a synthetic 4K corpus otherwise")
+    parser.add_argument("--count", type=int, default=12, help="synthetic images to generate")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.directory) if args.directory else synthetic_corpus(args.count)
+    if not corpus:
+        sys.exit("no images found")
+    print(f"{len(corpus)} images, {sum(map(len, corpus)) / len(corpus) / 1e6:.1f} MB on average")
+
+    results = []
+    rows = [
+        ("stepped encode_image", timed(lambda: [stepped_encode(Image.open(io.BytesIO(d))) for d in corpus])),
+        ("prepare_image", timed(lambda: results.extend(prepare_image(d, cache=None) for d in corpus))),
+        ("prepare_image, max_dimension=2048",
+         timed(lambda: [prepare_image(d, cache=None, max_dimension=2048) for d in corpus])),
+        (f"prepare_many, {args.workers} workers",
+         timed(lambda: prepare_many(corpus, workers=args.workers, cache=None))),
+    ]
+    cache = ResultCache()
+    prepare_many(corpus, workers=args.workers, cache=cache)
+    rows.append(("prepare_image, cached", timed(lambda: [prepare_image(d, cache=cache) for d in corpus])))
+
+    print(f"{'':40} {'total s':>9} {'per image ms':>14}")
+    for name, seconds in rows:
+        print(f"{name:40} {seconds:9.2f} {seconds / len(corpus) * 1000:14.1f}")
+
+    print()
+    print(f"{'image':>5} {'size':>11} {'quality':>8} {'scale':>6} {'MB':>6}")
+    for i, result in enumerate(results):
+        print(f"{i:5} {result.width:5}x{result.height:<5} {str(result.quality):>8} {result.scale:6.2f} "
+              f"{len(result.data) / 1e6:6.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Compares header-only validation with the decode-first checks it replaced.
+
+Run from the repository root:
+
+    python -m image_tools.bench_probe                 # synthetic large PNG and TIFF uploads
+    python -m image_tools.bench_probe path/to/images  # your own images
+
+Each upload is validated the way Seedance does it: the old path opens and
+converts the image before checking format, aspect ratio and size, the new
+one checks the ImageInfo from probe_image. Accepted uploads are then turned
+into a 2048px JPEG payload, which is where the pixels get decoded.
+"""
+
+import argparse
+import io
+import os
+import sys
+import time
+
+from PIL import Image
+
+from image_tools.preprocess import prepare_image
+from image_tools.probe import load_image, probe_image
+
+FORMATS = ("JPEG", "PNG", "WEBP", "BMP", "TIFF", "GIF")
+
+
+def check(format, width, height):
+    """The Seedance upload rules."""
+    return format in FORMATS and 0.4 <= width / height <= 2.5 and min(width, height) >= 300 \
+        and max(width, height) <= 6000
+
+
+def decode_first(data):
+    image = Image.open(io.BytesIO(data)).convert("RGB")
+    return check(Image.open(io.BytesIO(data)).format, *image.size)
+
+
+def header_only(data):
+    info = probe_image(data)
+    return check(info.format, *info.size)
+
+
+def payload_from_image(data):
+    return prepare_image(Image.open(io.BytesIO(data)), cache=None, max_dimension=2048)
+
+
+def payload_from_bytes(data):
+    return prepare_image(data, cache=None, max_dimension=2048)
+
+
+def synthetic_corpus():
+    """Large PNG and TIFF uploads, half of them with a rejected aspect ratio."""
+    corpus = []
+    for size in ((5000, 4000), (6000, 1500), (4000, 3000), (7000, 2000)):
+        image = Image.effect_noise(size, 40).convert("RGB")
+        for format in ("PNG", "TIFF"):
+            buffered = io.BytesIO()
+            image.save(buffered, format=format, **({"compression": "tiff_lzw"} if format == "TIFF" else {}))
+            corpus.append((f"{size[0]}x{size[1]} {format}", buffered.getvalue()))
+    return corpus
+
+
+def load_corpus(directory):
+    corpus = []
+    for name in sorted(os.listdir(directory)):
+        if name.lower().endswith((".jpg", ".jpeg", ".png", ".webp", ".tif", ".tiff", ".bmp", ".gif")):
+            with open(os.path.join(directory, name), "rb") as f:
+                corpus.append((name, f.read()))
+    return corpus
+
+
+def timed(fn, data, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn(data)
+    return (time.perf_counter() - start) / repeat, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("directory", nargs="?", help="folder of images, synthetic PNG/TIFF uploads otherwise")
+    parser.add_argument("--repeat", type=int, default=200, help="header-only runs averaged per image")
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.directory) if args.directory else synthetic_corpus()
+    if not corpus:
+        sys.exit("no images found")
+
+    print(f"{'image':24} {'MB':>6} {'valid':>6} {'decode-first ms':>16} {'probe us':>9} "
+          f"{'payload old ms':>15} {'payload new ms':>15}")
+    for name, data in corpus:
+        old, valid = timed(decode_first, data, 1)
+        new, probed = timed(header_only, data, args.repeat)
+        assert valid == probed, name
+        old_payload = new_payload = ""
+        if valid:
+            old_payload = f"{timed(payload_from_image, data, 1)[0] * 1000:.0f}"
+            new_payload = f"{timed(payload_from_bytes, data, 1)[0] * 1000:.0f}"
+        print(f"{name:24} {len(data) / 1e6:6.1f} {str(valid):>6} {old * 1000:16.1f} {new * 1e6:9.1f} "
+              f"{old_payload:>15} {new_payload:>15}")
+
+    # the preview the apps show for formats a browser cannot display
+    name, data = corpus[0]
+    seconds, _ = timed(lambda d: load_image(d, max_dimension=800), data, 1)
+    print(f"\nload_image(max_dimension=800) of {name}: {seconds * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
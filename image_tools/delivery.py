@@ -0,0 +1,277 @@
+"""Local delivery of generated images.
+
+The visual APIs answer with short-lived signed URLs. Handing such a URL to
+``st.image`` makes the browser download the full image on every rerun, and
+the demos used to add a HEAD request to resolve redirects, or a full GET and
+a PIL decode, on top of that. ``ImageStore`` downloads each result once:
+
+* the response is streamed to disk while it is hashed, and the file is
+  named after its SHA-256, so a result fetched twice, or returned as base64
+  and as a URL, is stored once;
+* redirects are followed by that same GET, there is no separate HEAD;
+* thumbnails are made on first use and kept next to the original;
+* the total size is capped, least recently used images are evicted first.
+
+Streamlit takes the paths directly, ``st.image(store.fetch(url).thumbnail(800))``.
+"""
+
+import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict, namedtuple
+
+from PIL import Image
+
+DEFAULT_ROOT = os.getenv("IMAGE_CACHE_DIR", os.path.join(tempfile.gettempdir(), "image_tools_cache"))
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+CHUNK_SIZE = 64 * 1024
+# downloads and thumbnails of the same key wait for each other through one of these locks
+LOCK_STRIPES = 64
+
+
+class CachedImage(namedtuple("CachedImage", "digest path size format store")):
+    """An image held by an ImageStore, ``path`` is the original as downloaded."""
+
+    __slots__ = ()
+
+    def bytes(self):
+        with open(self.path, "rb") as f:
+            return f.read()
+
+    def thumbnail(self, max_size=400):
+        """Path of a copy no larger than ``max_size`` on either side, made on first use."""
+        return self.store.variant(self, max_size)
+
+
+class _Entry:
+    __slots__ = ("path", "format", "size", "variants")
+
+    def __init__(self, path, format, size):
+        self.path = path
+        self.format = format
+        self.size = size
+        # max_size -> (path, size)
+        self.variants = {}
+
+
+class ImageStore:
+    """Content-addressed, size-capped disk cache of result images.
+
+    Args:
+        root (str): Directory of the cache, created when missing.
+        max_bytes (int): Total size of originals and thumbnails kept.
+        session: ``requests.Session`` used for downloads, a new one by default.
+        timeout (float): Seconds allowed for connecting and for each read.
+    """
+
+    def __init__(self, root=DEFAULT_ROOT, max_bytes=DEFAULT_MAX_BYTES, session=None, timeout=60):
+        if session is None:
+            import requests
+            session = requests.Session()
+        self.root = root
+        self.max_bytes = max_bytes
+        self.session = session
+        self.timeout = timeout
+        self._objects = os.path.join(root, "objects")
+        self._variants = os.path.join(root, "variants")
+        os.makedirs(self._objects, exist_ok=True)
+        os.makedirs(self._variants, exist_ok=True)
+
+        self._lock = threading.Lock()
+        # digest -> _Entry, least recently used first
+        self._entries = OrderedDict()
+        self._size = 0
+        # url -> digest of what it returned
+        self._urls = {}
+        self._stripes = [threading.Lock() for _ in range(LOCK_STRIPES)]
+        self._load()
+
+    # ----- public API, safe to call from any thread -----
+
+    def fetch(self, url):
+        """Downloads ``url`` unless it was fetched before and returns the CachedImage.
+
+        Raises:
+            requests.RequestException: The download failed.
+            PIL.UnidentifiedImageError: The response is not an image.
+        """
+        with self._once(("url", url)):
+            image = self._lookup(self._urls.get(url))
+            if image is not None:
+                return image
+            with self.session.get(url, stream=True, timeout=self.timeout) as r:
+                r.raise_for_status()
+                image = self._store(r.iter_content(CHUNK_SIZE))
+            with self._lock:
+                self._urls[url] = image.digest
+            return image
+
+    def put(self, data):
+        """Stores image bytes, e.g. a decoded base64 result, and returns the CachedImage."""
+        return self._store([data])
+
+    def get(self, digest):
+        """Returns the CachedImage of ``digest``, None when it is not cached."""
+        return self._lookup(digest)
+
+    def variant(self, image, max_size):
+        """Path of ``image`` reduced to fit ``max_size``, the original when it already fits."""
+        with self._once(("variant", image.digest, max_size)):
+            with self._lock:
+                entry = self._entries.get(image.digest)
+                if entry is not None and max_size in entry.variants:
+                    return entry.variants[max_size][0]
+            return self._make_variant(image, max_size)
+
+    @property
+    def size(self):
+        return self._size
+
+    def clear(self):
+        with self._lock:
+            for digest in list(self._entries):
+                self._remove(digest)
+            self._urls.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+    # ----- internals -----
+
+    def _once(self, key):
+        """Lock held while ``key`` is downloaded or made, so it is done once."""
+        return self._stripes[hash(key) % LOCK_STRIPES]
+
+    def _load(self):
+        """Indexes the files of a previous run, least recently used first."""
+        found = []
+        for name in os.listdir(self._objects):
+            digest, ext = os.path.splitext(name)
+            path = os.path.join(self._objects, name)
+            if ext == ".part":
+                # an interrupted download
+                os.remove(path)
+                continue
+            stat = os.stat(path)
+            found.append((stat.st_mtime, digest, _Entry(path, ext[1:].upper(), stat.st_size)))
+        for _, digest, entry in sorted(found):
+            self._entries[digest] = entry
+            self._size += entry.size
+        for name in os.listdir(self._variants):
+            digest, _, max_size = os.path.splitext(name)[0].rpartition("-")
+            path = os.path.join(self._variants, name)
+            entry = self._entries.get(digest)
+            if entry is None or not max_size.isdigit():
+                os.remove(path)
+                continue
+            size = os.path.getsize(path)
+            entry.variants[int(max_size)] = (path, size)
+            self._size += size
+        with self._lock:
+            self._evict()
+
+    def _lookup(self, digest):
+        with self._lock:
+            entry = self._entries.get(digest) if digest is not None else None
+            if entry is None:
+                return None
+            self._entries.move_to_end(digest)
+        # the order survives restarts through the modification time
+        try:
+            os.utime(entry.path)
+        except FileNotFoundError:
+            pass
+        return CachedImage(digest, entry.path, entry.size, entry.format, self)
+
+    def _store(self, chunks):
+        digest = hashlib.sha256()
+        size = 0
+        fd, tmp_path = tempfile.mkstemp(dir=self._objects, suffix=".part")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                for chunk in chunks:
+                    digest.update(chunk)
+                    f.write(chunk)
+                    size += len(chunk)
+            digest = digest.hexdigest()
+            image = self._lookup(digest)
+            if image is not None:
+                os.remove(tmp_path)
+                return image
+            with Image.open(tmp_path) as im:
+                format = im.format
+            path = os.path.join(self._objects, f"{digest}.{format.lower()}")
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        with self._lock:
+            if digest not in self._entries:
+                self._entries[digest] = _Entry(path, format, size)
+                self._size += size
+            self._evict(keep=digest)
+        return CachedImage(digest, path, size, format, self)
+
+    def _make_variant(self, image, max_size):
+        with Image.open(image.path) as im:
+            if max(im.size) <= max_size:
+                # remembered, so the original is not opened again for this size
+                return self._add_variant(image, max_size, image.path, 0)
+            format = "PNG" if im.mode in ("RGBA", "LA", "P") else "JPEG"
+            # decode JPEGs at the smallest scale still above max_size
+            im.draft("RGB", (max_size, max_size))
+            im.thumbnail((max_size, max_size), Image.LANCZOS, reducing_gap=3.0)
+            if format == "JPEG" and im.mode != "RGB":
+                im = im.convert("RGB")
+            path = os.path.join(self._variants, f"{image.digest}-{max_size}.{format.lower()}")
+            fd, tmp_path = tempfile.mkstemp(dir=self._variants, suffix=".part")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    im.save(f, format=format, quality=90)
+            except BaseException:
+                _unlink(tmp_path)
+                raise
+        os.replace(tmp_path, path)
+        return self._add_variant(image, max_size, path, os.path.getsize(path))
+
+    def _add_variant(self, image, max_size, path, size):
+        with self._lock:
+            entry = self._entries.get(image.digest)
+            if entry is None:
+                # evicted meanwhile
+                if path != image.path:
+                    os.remove(path)
+                return image.path
+            entry.variants[max_size] = (path, size)
+            self._size += size
+            self._evict(keep=image.digest)
+        return path
+
+    def _evict(self, keep=None):
+        """Drops least recently used images until the cache fits, never ``keep``. Needs _lock."""
+        for digest in list(self._entries):
+            if self._size <= self.max_bytes:
+                break
+            if digest != keep:
+                self._remove(digest)
+
+    def _remove(self, digest):
+        entry = self._entries.pop(digest)
+        self._size -= entry.size
+        # originals that already fit are their own variant, unlinked once below
+        for path, size in entry.variants.values():
+            self._size -= size
+            if path != entry.path:
+                _unlink(path)
+        _unlink(entry.path)
+        for url in [u for u, d in self._urls.items() if d == digest]:
+            del self._urls[url]
+
+
+def _unlink(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
@@ -0,0 +1,381 @@
+"""Image preprocessing shared by the Seededit, Seedance and VectorDB demos.
+
+The visual APIs take base64 images below a size limit (4.7 MB for Seededit).
+``prepare_image`` turns an upload into such a payload with as few encodes as
+possible:
+
+* a JPEG that already fits and is upright is sent as is, without decoding it;
+* ``max_dimension`` is applied while decoding, through ``Image.draft``, so a
+  4K JPEG is decoded at half or quarter size when that is all that is kept;
+* when the image is too large, the JPEG quality and then the scale are
+  searched instead of stepped: the next setting is predicted from the sizes
+  already seen and the search stops within 5% of the limit;
+* results are cached by content hash and constraints, so Streamlit reruns
+  and repeated requests with the same upload cost nothing.
+
+``prepare_many`` runs the same pipeline in a process pool for batches.
+"""
+
+import base64
+import hashlib
+import io
+import math
+import threading
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from PIL import Image
+
+from .payload import Base64Field
+from .probe import _read, load_image, probe_image
+
+MAX_BYTES = int(4.7 * 1024 * 1024)
+FORMATS = ("JPEG", "PNG", "WEBP")
+# searches stop once an encoding uses this share of the size limit
+CLOSE_ENOUGH = 0.95
+
+
+class PreparedImage(namedtuple("PreparedImage", "data format width height quality scale")):
+    """An encoded image ready to be sent.
+
+    ``quality`` is None when the input bytes were passed through unchanged or
+    the format has no quality setting, ``scale`` is relative to the image
+    after ``max_dimension`` was applied.
+    """
+
+    __slots__ = ()
+
+    def base64(self):
+        return base64.b64encode(self.data).decode()
+
+    def data_url(self):
+        return f"data:image/{self.format.lower()};base64,{self.base64()}"
+
+    def field(self, data_url=False):
+        """The image as a Base64Field, encoded only when the body is built."""
+        return Base64Field(self.data, f"data:image/{self.format.lower()};base64," if data_url else "")
+
+
+class ResultCache:
+    """Thread-safe LRU of PreparedImage results bounded by their total size.
+
+    Args:
+        max_bytes (int): Total encoded bytes kept before the oldest are evicted.
+    """
+
+    def __init__(self, max_bytes=128 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+            return result
+
+    def put(self, key, result):
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous.data)
+            self._entries[key] = result
+            self._size += len(result.data)
+            while self._size > self.max_bytes and len(self._entries) > 1:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted.data)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+
+default_cache = ResultCache()
+
+
+def _cache_key(source, options):
+    digest = hashlib.sha256()
+    if isinstance(source, Image.Image):
+        digest.update(f"{source.mode}:{source.size}".encode())
+        digest.update(source.tobytes())
+    else:
+        digest.update(source)
+    return digest.hexdigest(), tuple(sorted(options.items()))
+
+
+def _normalize_format(format):
+    format = (format or "JPEG").upper()
+    if format in ("JPG", "MPO"):
+        return "JPEG"
+    return format if format in FORMATS else "JPEG"
+
+
+def _encode(image, format, quality):
+    buffered = io.BytesIO()
+    if format == "PNG":
+        image.save(buffered, format=format)
+    else:
+        image.save(buffered, format=format, quality=quality)
+    return buffered.getvalue()
+
+
+def _flatten(image, format, background):
+    """Composites transparency onto ``background`` unless the format keeps it."""
+    if image.mode in ("RGBA", "LA") or (image.mode == "P" and "transparency" in image.info):
+        if format != "JPEG":
+            return image.convert("RGBA")
+        rgba = image.convert("RGBA")
+        flat = Image.new("RGB", image.size, background)
+        flat.paste(rgba, mask=rgba.split()[3])
+        return flat
+    if image.mode not in ("RGB", "L"):
+        return image.convert("RGB")
+    return image
+
+
+def _passthrough(source, format, max_bytes, max_dimension):
+    """Returns the input unchanged when it is already a payload that fits."""
+    if isinstance(source, Image.Image) or len(source) > max_bytes:
+        return None
+    try:
+        info = probe_image(source)
+    except ValueError:
+        return None
+    if info.format != format or info.mode not in ("RGB", "L") or info.orientation != 1:
+        return None
+    if max_dimension and max(info.size) > max_dimension:
+        return None
+    return PreparedImage(source, format, info.width, info.height, None, 1.0)
+
+
+def _search(fits, fails, max_bytes, step, probe, guess):
+    """Narrows the bracket between a setting that fits and one that does not.
+
+    ``fits`` and ``fails`` are (setting, size, payload), ``probe(setting)``
+    encodes and returns (size, payload), ``guess(fits, fails)`` predicts the
+    setting hitting the target size. Two guesses are tried, then the bracket
+    is bisected. Returns the best ``fits`` found.
+    """
+    attempts = 0
+    while fails[0] - fits[0] > step and fits[1] < max_bytes * CLOSE_ENOUGH:
+        setting = guess(fits, fails) if attempts < 2 else (fits[0] + fails[0]) / 2
+        setting = round(round(setting / step) * step, 2)
+        setting = min(max(setting, fits[0] + step), fails[0] - step)
+        size, payload = probe(setting)
+        if size <= max_bytes:
+            fits = (setting, size, payload)
+        else:
+            fails = (setting, size, payload)
+        attempts += 1
+    return fits
+
+
+def _fit_quality(image, format, max_bytes, min_quality, max_quality):
+    """Highest quality in [min_quality, max_quality] that fits.
+
+    Returns:
+        tuple: ((quality, data) or None, size of the smallest encoding made).
+    """
+    data = _encode(image, format, max_quality)
+    if len(data) <= max_bytes:
+        return ((None if format == "PNG" else max_quality), data), len(data)
+    if format == "PNG":
+        return None, len(data)
+    fails = (max_quality, len(data), data)
+    data = _encode(image, format, min_quality)
+    if len(data) > max_bytes:
+        return None, len(data)
+
+    def probe(quality):
+        data = _encode(image, format, int(quality))
+        return len(data), data
+
+    def guess(fits, fails):
+        # size grows roughly exponentially with quality
+        position = math.log(_target(max_bytes) / fits[1]) / math.log(fails[1] / fits[1])
+        return fits[0] + (fails[0] - fits[0]) * position
+
+    quality, _, data = _search((min_quality, len(data), data), fails, max_bytes, 1, probe, guess)
+    return (int(quality), data), len(data)
+
+
+def _fit_scale(image, format, max_bytes, quality, min_scale, full_size):
+    """Largest scale down to ``min_scale`` that fits, as (scale, resized, data).
+
+    ``full_size`` is a lower bound for the encoded size at scale 1.
+    """
+    def probe(scale):
+        size = (max(1, int(image.width * scale)), max(1, int(image.height * scale)))
+        resized = image.resize(size, Image.LANCZOS, reducing_gap=3.0)
+        data = _encode(resized, format, quality)
+        return len(data), (resized, data)
+
+    def guess(fits, fails):
+        # size grows with the pixel count, extrapolate from the closest point
+        scale, size, _ = fits if fits is not None else fails
+        return scale * math.sqrt(_target(max_bytes) / size)
+
+    fails = (1.0, full_size, None)
+    while True:
+        scale = max(min_scale, math.floor(guess(None, fails) * 100) / 100)
+        size, payload = probe(scale)
+        if size <= max_bytes:
+            break
+        if scale <= min_scale:
+            return None
+        fails = (scale, size, payload)
+
+    scale, _, (resized, data) = _search((scale, size, payload), fails, max_bytes, 0.01, probe, guess)
+    return scale, resized, data
+
+
+def _target(max_bytes):
+    return max_bytes * (1 + CLOSE_ENOUGH) / 2
+
+
+def _prepare(source, format, max_bytes, max_dimension, min_quality, max_quality,
+             scale_quality, min_scale, background):
+    passed = _passthrough(source, format, max_bytes, max_dimension)
+    if passed is not None:
+        return passed
+
+    image = _flatten(load_image(source, max_dimension), format, background)
+    fitted, smallest = _fit_quality(image, format, max_bytes, min_quality, max_quality)
+    if fitted is not None:
+        quality, data = fitted
+        return PreparedImage(data, format, image.width, image.height, quality, 1.0)
+
+    fitted = _fit_scale(image, format, max_bytes, scale_quality, min_scale, smallest)
+    if fitted is None:
+        raise ValueError(f"Unable to reduce image size below the maximum allowed size of "
+                         f"{max_bytes / (1024 * 1024):.1f} MB")
+    scale, resized, data = fitted
+    return PreparedImage(data, format, resized.width, resized.height,
+                         None if format == "PNG" else scale_quality, scale)
+
+
+def _options(format="JPEG", max_bytes=MAX_BYTES, max_dimension=None, min_quality=70,
+             max_quality=95, scale_quality=85, min_scale=0.5, background=(255, 255, 255)):
+    return {"format": _normalize_format(format), "max_bytes": max_bytes, "max_dimension": max_dimension,
+            "min_quality": min_quality, "max_quality": max_quality, "scale_quality": scale_quality,
+            "min_scale": min_scale, "background": tuple(background)}
+
+
+def prepare_image(source, cache=default_cache, **options):
+    """Encodes an image so it fits the API size limit.
+
+    Args:
+        source: Bytes, a path, a file object / Streamlit upload or a PIL image.
+            Pass the raw bytes when you have them: they can be sent unchanged
+            and JPEGs can be decoded at reduced size.
+        cache (ResultCache): Cache consulted first, None disables it.
+        format (str): Output format, JPEG (default), PNG or WEBP.
+        max_bytes (int): Size limit of the encoded image, 4.7 MB by default.
+        max_dimension (int): Longest side kept, None keeps the image size.
+        min_quality (int), max_quality (int): Quality range searched first.
+        scale_quality (int): Quality used once the image has to be scaled down.
+        min_scale (float): Smallest scale tried before giving up.
+        background (tuple): RGB colour transparent pixels are flattened onto.
+
+    Returns:
+        PreparedImage: The encoded image, see ``base64()`` and ``data_url()``.
+
+    Raises:
+        ValueError: If the image cannot be brought under ``max_bytes``.
+    """
+    options = _options(**options)
+    source = _read(source)
+    key = _cache_key(source, options) if cache is not None else None
+    if key is not None:
+        result = cache.get(key)
+        if result is not None:
+            return result
+    result = _prepare(source, **options)
+    if key is not None:
+        cache.put(key, result)
+    return result
+
+
+def encode_image(source, max_aspect_ratio=3.0, max_side=4096, **options):
+    """Checks an upload against the Seededit input limits and prepares it.
+
+    The size is read from the header, nothing is decoded unless the checks
+    pass. Transparency is flattened and the JPEG brought under the size
+    limit by ``prepare_image``.
+
+    Args:
+        source: Anything ``prepare_image`` accepts, preferably the upload bytes.
+        max_aspect_ratio (float): Largest ratio of the long to the short side.
+        max_side (int): Largest width or height.
+        **options: Constraints, as for ``prepare_image``.
+
+    Returns:
+        Base64Field: The image, base64 encoded only when the request body is built.
+
+    Raises:
+        ValueError: If the image breaks a limit or cannot be brought under ``max_bytes``.
+    """
+    source = _read(source)
+    width, height = probe_image(source).size
+    aspect_ratio = max(width, height) / min(width, height)
+    if aspect_ratio > max_aspect_ratio:
+        raise ValueError(f"Image aspect ratio ({aspect_ratio:.2f}) exceeds the maximum allowed ratio "
+                         f"of {max_aspect_ratio:.1f}")
+    if width > max_side or height > max_side:
+        raise ValueError(f"Image dimensions ({width}x{height}) exceed the maximum allowed size "
+                         f"of {max_side}x{max_side}")
+    return prepare_image(source, **options).field()
+
+
+def prepare_many(sources, workers=None, cache=default_cache, return_exceptions=False, **options):
+    """Prepares a batch of images in a process pool.
+
+    Identical inputs are encoded once and cached results are reused without
+    starting a worker.
+
+    Args:
+        sources (list): Anything ``prepare_image`` accepts.
+        workers (int): Pool size, defaults to the number of CPUs.
+        cache (ResultCache): Cache consulted first and filled with the results.
+        return_exceptions (bool): Put the ValueError of an image that cannot be
+            reduced in its slot instead of raising it.
+        **options: Constraints, as for ``prepare_image``.
+
+    Returns:
+        list: A PreparedImage (or exception) per source, in order.
+    """
+    options = _options(**options)
+    results = [None] * len(sources)
+    pending = OrderedDict()
+    for index, source in enumerate(sources):
+        source = _read(source)
+        key = _cache_key(source, options)
+        result = cache.get(key) if cache is not None else None
+        if result is not None:
+            results[index] = result
+        else:
+            pending.setdefault(key, (source, []))[1].append(index)
+
+    if pending:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [(key, indexes, pool.submit(_prepare, source, **options))
+                       for key, (source, indexes) in pending.items()]
+            for key, indexes, future in futures:
+                try:
+                    result = future.result()
+                except ValueError as e:
+                    if not return_exceptions:
+                        raise
+                    result = e
+                else:
+                    if cache is not None:
+                        cache.put(key, result)
+                for index in indexes:
+                    results[index] = result
+    return results
@@ -0,0 +1,185 @@
+"""Header-only inspection of uploads.
+
+Uploads used to be decoded before they were checked: the apps called
+``Image.open`` and then converted or displayed the image, so a 6000x8000
+PNG was fully decoded only to be rejected for its aspect ratio.
+``probe_image`` reads the format, size, mode and EXIF orientation from the
+header, which takes tens of microseconds whatever the image size, and the
+pixels are decoded afterwards by ``load_image`` only for accepted images:
+
+* JPEGs are decoded at 1/2, 1/4 or 1/8 scale when ``max_dimension`` allows;
+* the EXIF orientation is applied to the decoded, already reduced image,
+  the full-size buffer is never copied to turn it upright.
+
+Pillow parses headers lazily for most formats. WebP is the exception, its
+plugin sets up a decoder on open, so its RIFF chunks are read here instead.
+"""
+
+import io
+import os
+import struct
+from collections import namedtuple
+
+from PIL import Image
+
+ORIENTATION_TAG = 0x0112
+# EXIF orientation -> transposition turning the image upright
+_TRANSPOSE = {
+    2: Image.FLIP_LEFT_RIGHT,
+    3: Image.ROTATE_180,
+    4: Image.FLIP_TOP_BOTTOM,
+    5: Image.TRANSPOSE,
+    6: Image.ROTATE_270,
+    7: Image.TRANSVERSE,
+    8: Image.ROTATE_90,
+}
+
+
+class ImageInfo(namedtuple("ImageInfo", "format width height mode orientation")):
+    """What the header says about an image.
+
+    ``width`` and ``height`` are stored as encoded, ``size`` and
+    ``aspect_ratio`` are those of the image turned upright.
+    """
+
+    __slots__ = ()
+
+    @property
+    def size(self):
+        if self.orientation in (5, 6, 7, 8):
+            return self.height, self.width
+        return self.width, self.height
+
+    @property
+    def aspect_ratio(self):
+        width, height = self.size
+        return width / height
+
+
+def _read(source):
+    """Returns bytes for paths, file objects and uploads, PIL images unchanged."""
+    if isinstance(source, Image.Image):
+        return source
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return bytes(source)
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as f:
+            return f.read()
+    if hasattr(source, "getvalue"):  # Streamlit UploadedFile, BytesIO
+        return source.getvalue()
+    if hasattr(source, "read"):
+        return source.read()
+    raise TypeError(f"Unsupported image source: {type(source).__name__}")
+
+
+def probe_image(source):
+    """Reads an image's header without decoding its pixels.
+
+    Args:
+        source: Bytes, a path, a file object / Streamlit upload or a PIL image.
+
+    Returns:
+        ImageInfo: Format as reported by Pillow ("JPEG", "PNG", ...), encoded
+        size, mode and EXIF orientation (1 when there is none).
+
+    Raises:
+        ValueError: If ``source`` is not an image Pillow can read.
+    """
+    data = _read(source)
+    if isinstance(data, Image.Image):
+        return ImageInfo(data.format, data.width, data.height, data.mode, _orientation(data))
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return _probe_webp(data)
+    try:
+        image = Image.open(io.BytesIO(data))
+    except (OSError, SyntaxError) as e:
+        raise ValueError("Unrecognized image format") from e
+    format = "JPEG" if image.format == "MPO" else image.format
+    return ImageInfo(format, image.width, image.height, image.mode, _orientation(image))
+
+
+def load_image(source, max_dimension=None):
+    """Decodes an image upright, at reduced size when ``max_dimension`` allows it.
+
+    Args:
+        source: Anything ``probe_image`` accepts. A PIL image is not modified.
+        max_dimension (int): Longest side kept, None keeps the image size.
+
+    Returns:
+        PIL.Image.Image: The decoded image with its EXIF orientation applied.
+    """
+    data = _read(source)
+    if isinstance(data, Image.Image):
+        image = data
+    else:
+        image = Image.open(io.BytesIO(data))
+        if max_dimension and max(image.size) > max_dimension and image.format in ("JPEG", "MPO"):
+            # decode at 1/2, 1/4 or 1/8 scale, never below the requested size
+            ratio = max_dimension / max(image.size)
+            image.draft("RGB", (int(image.width * ratio), int(image.height * ratio)))
+    orientation = _orientation(image)
+    if max_dimension and max(image.size) > max_dimension:
+        image = image.copy() if image is source else image
+        image.thumbnail((max_dimension, max_dimension), Image.LANCZOS, reducing_gap=3.0)
+    if orientation in _TRANSPOSE:
+        # on the reduced image, and the one we decoded is dropped right away
+        image = image.transpose(_TRANSPOSE[orientation])
+    return image
+
+
+def _orientation(image):
+    """EXIF orientation found in the header, 1 when there is none."""
+    if image.format == "TIFF":
+        if hasattr(image, "_tile_size"):
+            # recent Pillow versions already report and decode TIFFs upright
+            return 1
+        return image.tag_v2.get(ORIENTATION_TAG, 1)
+    if image.format == "PNG" and "exif" not in image.info:
+        # an eXIf chunk after the pixel data is only found by decoding them
+        return 1
+    if image.format in ("JPEG", "MPO", "PNG", "WEBP") or "exif" in image.info:
+        return image.getexif().get(ORIENTATION_TAG, 1)
+    return 1
+
+
+def _probe_webp(data):
+    """Reads the VP8X, VP8 or VP8L header and the EXIF chunk of a WebP file."""
+    view = memoryview(data)
+    offset = 12
+    width = height = None
+    alpha = has_exif = False
+    orientation = 1
+    while offset + 8 <= len(data):
+        chunk = bytes(view[offset:offset + 4])
+        length = struct.unpack_from("<I", data, offset + 4)[0]
+        payload = offset + 8
+        if chunk == b"VP8X" and length >= 10:
+            flags = data[payload]
+            alpha = bool(flags & 0x12)  # alpha or animation, which Pillow decodes as RGBA
+            has_exif = bool(flags & 0x08)
+            width = 1 + int.from_bytes(data[payload + 4:payload + 7], "little")
+            height = 1 + int.from_bytes(data[payload + 7:payload + 10], "little")
+            if not has_exif:
+                break
+        elif chunk == b"VP8 " and width is None and length >= 10:
+            if data[payload + 3:payload + 6] != b"\x9d\x01\x2a":
+                break
+            width, height = (v & 0x3FFF for v in struct.unpack_from("<HH", data, payload + 6))
+            break
+        elif chunk == b"VP8L" and width is None and length >= 5:
+            if data[payload] != 0x2F:
+                break
+            bits = struct.unpack_from("<I", data, payload + 1)[0]
+            width = (bits & 0x3FFF) + 1
+            height = ((bits >> 14) & 0x3FFF) + 1
+            alpha = bool(bits >> 28 & 1)
+            break
+        elif chunk == b"EXIF" and has_exif:
+            exif = Image.Exif()
+            exif.load(bytes(view[payload:payload + length]))
+            orientation = exif.get(ORIENTATION_TAG, 1)
+            break
+        offset = payload + length + (length & 1)
+    if width is None:
+        raise ValueError("Unrecognized image format")
+    return ImageInfo("WEBP", width, height, "RGBA" if alpha else "RGB", orientation)
@@ -0,0 +1,127 @@
+import io
+import os
+import sys
+
+import pytest
+from PIL import Image
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from image_tools import ImageStore  # noqa: E402
+
+
+def image(width, height, format="PNG", color=(200, 40, 40)):
+    buffer = io.BytesIO()
+    Image.new("RGB", (width, height), color).save(buffer, format)
+    return buffer.getvalue()
+
+
+class FakeResponse:
+    def __init__(self, data):
+        self.data = data
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size):
+        for i in range(0, len(self.data), chunk_size):
+            yield self.data[i:i + chunk_size]
+
+
+class FakeSession:
+    """Serves ``images`` by URL and counts the requests."""
+
+    def __init__(self, images):
+        self.images = images
+        self.requests = []
+
+    def get(self, url, stream=False, timeout=None):
+        self.requests.append(url)
+        return FakeResponse(self.images[url])
+
+
+def files(directory):
+    return sorted(os.listdir(directory))
+
+
+def test_fetch_downloads_a_url_once_and_stores_equal_content_once(tmp_path):
+    red = image(64, 48)
+    session = FakeSession({"https://a": red, "https://b": red})
+    store = ImageStore(str(tmp_path), session=session)
+
+    first = store.fetch("https://a")
+    assert store.fetch("https://a") == first
+    assert session.requests == ["https://a"]
+    assert store.fetch("https://b").path == first.path
+    assert (first.format, first.size) == ("PNG", len(red))
+    assert store.put(red).digest == first.digest
+    assert len(store) == 1 and store.size == len(red)
+    assert files(tmp_path / "objects") == [os.path.basename(first.path)]
+
+
+def test_least_recently_used_images_are_evicted_by_size(tmp_path):
+    blobs = [image(64, 48, color=(i * 60, 0, 0)) for i in range(3)]
+    store = ImageStore(str(tmp_path), max_bytes=sum(len(b) for b in blobs[:2]) + 10, session=FakeSession({}))
+    a, b = store.put(blobs[0]), store.put(blobs[1])
+    assert store.get(a.digest) is not None
+    c = store.put(blobs[2])
+
+    assert store.get(b.digest) is None
+    assert not os.path.exists(b.path)
+    assert store.get(a.digest) is not None and store.get(c.digest) is not None
+    assert store.size == len(blobs[0]) + len(blobs[2])
+
+    # the order and the contents survive a restart
+    assert len(ImageStore(str(tmp_path), session=FakeSession({}))) == 2
+
+
+def test_variants_are_made_once_and_kept(tmp_path):
+    store = ImageStore(str(tmp_path), session=FakeSession({}))
+    big = store.put(image(800, 400, "JPEG"))
+
+    path = big.thumbnail(200)
+    with Image.open(path) as im:
+        assert (im.format, im.size) == ("JPEG", (200, 100))
+    assert big.thumbnail(200) == path
+    assert store.size == big.size + os.path.getsize(path)
+
+    restarted = ImageStore(str(tmp_path), session=FakeSession({}))
+    assert restarted.get(big.digest).thumbnail(200) == path
+
+
+def test_a_variant_that_already_fits_is_the_original_and_remembered(tmp_path, monkeypatch):
+    store = ImageStore(str(tmp_path), session=FakeSession({}))
+    small = store.put(image(100, 50))
+    size = store.size
+
+    assert small.thumbnail(400) == small.path
+    opened = []
+    monkeypatch.setattr("image_tools.delivery.Image.open", lambda *a, **k: opened.append(a))
+    assert small.thumbnail(400) == small.path
+    assert opened == []
+    assert store.size == size
+
+    monkeypatch.undo()
+    store.clear()
+    assert len(store) == 0 and store.size == 0
+    assert files(tmp_path / "objects") == []
+
+
+def test_a_failed_variant_leaves_no_temporary_file(tmp_path, monkeypatch):
+    store = ImageStore(str(tmp_path), session=FakeSession({}))
+    big = store.put(image(800, 400))
+
+    def fail(self, *args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(Image.Image, "save", fail)
+    with pytest.raises(OSError):
+        big.thumbnail(200)
+    assert files(tmp_path / "variants") == []
+    assert store.size == big.size
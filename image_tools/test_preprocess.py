@@ -0,0 +1,42 @@
+import io
+import os
+import re
+import sys
+
+import pytest
+from PIL import Image
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from image_tools import Base64Field, encode_image, prepare_image  # noqa: E402
+
+
+def png(width, height, mode="RGB"):
+    buffer = io.BytesIO()
+    Image.new(mode, (width, height), (200, 40, 40, 128) if mode == "RGBA" else (200, 40, 40)).save(buffer, "PNG")
+    return buffer.getvalue()
+
+
+def test_encode_image_returns_prepared_jpeg():
+    data = png(640, 480, "RGBA")
+    field = encode_image(data, cache=None)
+    assert isinstance(field, Base64Field)
+    assert field.data == prepare_image(data, cache=None).data
+    assert Image.open(io.BytesIO(field.data)).format == "JPEG"
+
+
+def test_encode_image_reads_file_objects_once():
+    field = encode_image(io.BytesIO(png(300, 200)), cache=None)
+    assert Image.open(io.BytesIO(field.data)).size == (300, 200)
+
+
+@pytest.mark.parametrize("size, message", [
+    ((1300, 400), "aspect ratio (3.25) exceeds the maximum allowed ratio of 3.0"),
+    ((4100, 2000), "dimensions (4100x2000) exceed the maximum allowed size of 4096x4096"),
+])
+def test_encode_image_rejects_out_of_limits(size, message, monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("rejected images must not be encoded")
+    monkeypatch.setattr("image_tools.preprocess.prepare_image", fail)
+    with pytest.raises(ValueError, match=re.escape(message)):
+        encode_image(png(*size))
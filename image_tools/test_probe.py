@@ -0,0 +1,75 @@
+import io
+import os
+import sys
+
+import pytest
+from PIL import Image
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from image_tools import load_image, probe_image  # noqa: E402
+from image_tools.probe import ORIENTATION_TAG  # noqa: E402
+
+
+def encode(mode, size, format, orientation=None, **params):
+    image = Image.new(mode, size, (200, 40, 40, 128)[:len(mode)] if mode != "L" else 128)
+    if orientation is not None:
+        exif = Image.Exif()
+        exif[ORIENTATION_TAG] = orientation
+        params["exif"] = exif.tobytes()
+    buffer = io.BytesIO()
+    image.save(buffer, format, **params)
+    return buffer.getvalue()
+
+
+CASES = {
+    "png": encode("RGB", (300, 200), "PNG"),
+    "png-rgba": encode("RGBA", (120, 90), "PNG"),
+    "jpeg": encode("RGB", (640, 480), "JPEG"),
+    "jpeg-gray": encode("L", (64, 32), "JPEG"),
+    "jpeg-rotated": encode("RGB", (640, 480), "JPEG", orientation=6),
+    # VP8 chunk only
+    "webp-lossy": encode("RGB", (333, 111), "WEBP", quality=80),
+    # VP8L chunk
+    "webp-lossless": encode("RGBA", (257, 129), "WEBP", lossless=True),
+    "webp-lossless-opaque": encode("RGB", (100, 60), "WEBP", lossless=True),
+    # VP8X header followed by ALPH and VP8 chunks
+    "webp-lossy-alpha": encode("RGBA", (200, 150), "WEBP", quality=80),
+    # VP8X header with the EXIF flag, EXIF chunk after the image data
+    "webp-extended-exif": encode("RGB", (400, 300), "WEBP", orientation=8, quality=80),
+}
+
+
+@pytest.mark.parametrize("name", sorted(CASES))
+def test_probe_image_matches_pillow(name):
+    data = CASES[name]
+    info = probe_image(data)
+    with Image.open(io.BytesIO(data)) as image:
+        image.load()
+        assert (info.format, info.width, info.height, info.mode) == (image.format, image.width, image.height,
+                                                                     image.mode)
+        assert info.orientation == image.getexif().get(ORIENTATION_TAG, 1)
+
+
+def test_probe_image_reports_the_upright_size():
+    assert probe_image(CASES["jpeg-rotated"]).size == (480, 640)
+    assert probe_image(CASES["webp-extended-exif"]).orientation == 8
+    assert probe_image(CASES["webp-extended-exif"]).aspect_ratio == pytest.approx(300 / 400)
+
+
+def test_probe_image_accepts_paths_and_file_objects(tmp_path):
+    path = tmp_path / "a.png"
+    path.write_bytes(CASES["png"])
+    assert probe_image(str(path)) == probe_image(io.BytesIO(CASES["png"])) == probe_image(CASES["png"])
+
+
+@pytest.mark.parametrize("data", [b"", b"not an image", b"RIFF\x00\x00\x00\x00WEBPVP8 \x00\x00\x00\x00"])
+def test_probe_image_rejects_what_is_not_an_image(data):
+    with pytest.raises(ValueError):
+        probe_image(data)
+
+
+def test_load_image_turns_the_image_upright_and_reduces_it():
+    image = load_image(CASES["jpeg-rotated"], max_dimension=160)
+    assert image.size == (120, 160)
+    assert load_image(CASES["png"]).size == (300, 200)